@@ -0,0 +1,85 @@
+"""
+Microbenchmark of the per-operation overhead of the PyORlib algebra layer.
+
+Each operation is timed twice: once through the PyORlib `Element` wrappers and once directly on the raw solver
+objects they encapsulate. The difference is the cost added by PyORlib. Engines whose optional dependency is not
+installed are skipped.
+
+Usage:
+    python benchmarks/element_operators.py [--number 100000] [--repeat 5]
+"""
+
+import argparse
+import importlib
+from timeit import repeat
+from typing import Any, Callable, List, Tuple
+
+from pyorlib.algebra import Expression
+from pyorlib.engines import Engine
+from pyorlib.enums import ValueType
+
+ENGINES: List[Tuple[str, str]] = [
+    ("pyorlib.engines.pulp", "PuLPEngine"),
+    ("pyorlib.engines.ortools", "ORToolsEngine"),
+    ("pyorlib.engines.cplex", "CplexEngine"),
+    ("pyorlib.engines.gurobi", "GurobiEngine"),
+]
+
+
+def load_engines() -> List[Engine]:
+    engines: List[Engine] = []
+    for module_name, class_name in ENGINES:
+        try:
+            engines.append(getattr(importlib.import_module(module_name), class_name)())
+        except Exception:
+            print(f"Skipping {class_name}: optional dependency not available.")
+    return engines
+
+
+def time_ns(func: Callable[[], Any], number: int, repetitions: int) -> float:
+    return min(repeat(func, number=number, repeat=repetitions)) / number * 1e9
+
+
+def run(engine: Engine, number: int, repetitions: int) -> None:
+    x = engine.add_variable(name="x", value_type=ValueType.CONTINUOUS)
+    y = engine.add_variable(name="y", value_type=ValueType.CONTINUOUS)
+    xy = x + y
+    rx, ry, rxy = x.raw, y.raw, xy.raw
+
+    cases: List[Tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        ("x + y", lambda: x + y, lambda: rx + ry),
+        ("2 * x", lambda: 2 * x, lambda: 2 * rx),
+        ("(x + y) - x", lambda: xy - x, lambda: rxy - rx),
+        ("-x", lambda: -x, lambda: -rx),
+        ("x <= 5", lambda: x <= 5, lambda: rx <= 5),
+        ("x == y", lambda: x == y, lambda: rx == ry),
+    ]
+
+    print(f"\n{engine.name}")
+    print(f"{'operation':>14} {'pyorlib (ns)':>14} {'raw (ns)':>10} {'overhead (ns)':>14}")
+    for label, wrapped, raw in cases:
+        wrapped_ns = time_ns(wrapped, number, repetitions)
+        raw_ns = time_ns(raw, number, repetitions)
+        print(f"{label:>14} {wrapped_ns:>14.0f} {raw_ns:>10.0f} {wrapped_ns - raw_ns:>14.0f}")
+
+    terms = [engine.add_variable(name=f"z_{i}", value_type=ValueType.CONTINUOUS) for i in range(500)]
+    products = [3 * term for term in terms]
+    sum_number = max(1, number // 5000)
+    builtin_ns = time_ns(lambda: sum(products), sum_number, repetitions)
+    pyorlib_ns = time_ns(lambda: Expression.sum(products), sum_number, repetitions)
+    print(f"{'sum(500)':>14} {builtin_ns:>14.0f} {'':>10} {'(built-in sum)':>14}")
+    print(f"{'Expression.sum':>14} {pyorlib_ns:>14.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=100_000, help="Calls per timing run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per operation (the minimum is kept).")
+    args = parser.parse_args()
+
+    for engine in load_engines():
+        run(engine, args.number, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
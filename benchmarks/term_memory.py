@@ -0,0 +1,101 @@
+"""
+Memory benchmark of the PyORlib term hierarchy.
+
+Uses `tracemalloc` to measure the bytes allocated per variable when creating a large number of variables:
+
+- `pyorlib wrapper`: the `Variable` objects alone, using a bare subclass without a solver behind it.
+- `<engine>`: variables created through each engine, including the solver-side objects they encapsulate.
+
+Engines whose optional dependency is not installed are skipped.
+
+Usage:
+    python benchmarks/term_memory.py [--count 1000000] [--engine-count 1000000]
+"""
+
+import argparse
+import gc
+import importlib
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from pyorlib.algebra import Variable
+from pyorlib.engines import Engine
+from pyorlib.enums import ValueType
+
+ENGINES: List[Tuple[str, str]] = [
+    ("pyorlib.engines.pulp", "PuLPEngine"),
+    ("pyorlib.engines.ortools", "ORToolsEngine"),
+    ("pyorlib.engines.cplex", "CplexEngine"),
+    ("pyorlib.engines.gurobi", "GurobiEngine"),
+]
+
+
+class BareVariable(Variable):
+    """A variable without a solver behind it, used to measure the cost of the wrapper alone."""
+
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return "x"
+
+    @property
+    def lower_bound(self) -> float:
+        return 0
+
+    @property
+    def upper_bound(self) -> float:
+        return 1
+
+    @property
+    def value(self) -> float:
+        return -0.0
+
+    def __init__(self, id: int):
+        super().__init__(name="x", value_type=ValueType.CONTINUOUS, id=id)
+        self._raw = None
+
+
+def load_engines() -> List[Engine]:
+    engines: List[Engine] = []
+    for module_name, class_name in ENGINES:
+        try:
+            engines.append(getattr(importlib.import_module(module_name), class_name)())
+        except Exception:
+            print(f"Skipping {class_name}: optional dependency not available.")
+    return engines
+
+
+def bytes_per_item(build: Callable[[], List[Any]], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    items = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(items) == count
+    return current / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000, help="Wrapper-only variables to create.")
+    parser.add_argument("--engine-count", type=int, default=1_000_000, help="Variables to create per engine.")
+    args = parser.parse_args()
+
+    print(f"{'layout':>24} {'variables':>10} {'bytes/variable':>15}")
+
+    count: int = args.count
+    wrapper = bytes_per_item(lambda: [BareVariable(id=i) for i in range(count)], count)
+    print(f"{'pyorlib wrapper':>24} {count:>10} {wrapper:>15.1f}")
+
+    for engine in load_engines():
+        engine_count: int = args.engine_count
+        cost = bytes_per_item(
+            lambda: [engine.add_variable(name=f"x_{i}", value_type=ValueType.CONTINUOUS) for i in range(engine_count)],
+            engine_count,
+        )
+        print(f"{engine.name:>24} {engine_count:>10} {cost:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+from .constant_array import ConstantArray
@@ -0,0 +1,223 @@
+from math import isfinite
+from typing import Any, Dict, List, Sequence, Tuple
+
+from ..element import _ELEMENT_TYPES
+from ..expressions import Expression
+from ...enums import ValueType
+from ...exceptions import NumPyException, TermException
+from ...validators import ValueTypeValidator
+
+try:  # pragma: no cover
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
+except ImportError:  # pragma: no cover
+    raise NumPyException(
+        "Optional dependency 'NumPy' not found.\nPlease install it using 'pip install pyorlib[numpy]'."
+    )
+
+
+class ConstantArray:
+    """
+    Represents a dense array of constant values in an optimization model.
+
+    The `ConstantArray` class stores a whole set of constants, such as a cost matrix or a demand vector, in a
+    single read-only NumPy array typed according to its value type, instead of one `Constant` object per index.
+    Indexed access returns plain Python scalars, or lightweight `ConstantArray` views when the index selects
+    more than one value, and the array can be used directly as the coefficient source of linear expressions.
+
+    **Note**: Indices follow NumPy conventions, so they start at 0 regardless of the indices used in term sets.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_name", "_value_type", "_values"]
+
+    __DTYPES: Dict[ValueType, Any] = {
+        ValueType.BINARY: np.int8,
+        ValueType.INTEGER: np.int64,
+        ValueType.CONTINUOUS: np.float64,
+    }
+    """ The NumPy data type used to store the values of each value type. """
+
+    @property
+    def name(self) -> str:
+        """
+        Retrieves the name of the constant array.
+        :return: A string with the name of the constant array.
+        """
+        return self._name
+
+    @property
+    def value_type(self) -> ValueType:
+        """
+        Retrieves the type of the array's values.
+        :return: A ValueType enumeration.
+        """
+        return self._value_type
+
+    @property
+    def values(self) -> NDArray[Any]:
+        """
+        Retrieves the values of the constant array.
+        :return: A read-only NumPy array with the values.
+        """
+        return self._values
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        Retrieves the shape of the constant array.
+        :return: A tuple with the size of each dimension of the array.
+        """
+        return tuple(self._values.shape)
+
+    @property
+    def ndim(self) -> int:
+        """
+        Retrieves the number of dimensions of the constant array.
+        :return: An integer with the number of dimensions.
+        """
+        return int(self._values.ndim)
+
+    @property
+    def size(self) -> int:
+        """
+        Retrieves the number of values in the constant array.
+        :return: An integer with the number of values.
+        """
+        return int(self._values.size)
+
+    def __init__(self, name: str, value_type: ValueType, values: ArrayLike):
+        """
+        Initializes a new instance of the ConstantArray class.
+
+        The values are validated block by block and copied into a read-only array, unless they already are a
+        read-only array of the storage type, such as a memory-mapped file, in which case they are shared.
+        :param name: A string representing the name of the constant array.
+        :param value_type: A ValueType enumeration representing the type of value the constants can assume.
+        :param values: An array-like object (e.g. a NumPy array or nested lists) with the constant values.
+        """
+        # Applies validations
+        if not name:
+            raise TermException("Constant arrays must have a name.")
+        if value_type is None:
+            raise TermException("Invalid constant array value type.")
+        if values is None:
+            raise TermException("Constant arrays must have values.")
+
+        array: NDArray[Any] = np.asarray(values)
+
+        if array.dtype.kind not in "biuf":
+            raise TermException("The values of a constant array must be numeric.")
+        if array.ndim < 1:
+            raise TermException("Constant arrays must have at least one dimension.")
+
+        flat: Any = array.reshape(-1)
+        lowest, highest = ValueTypeValidator.extremes(flat) if flat.size > 0 else (0.0, 0.0)
+
+        if not isfinite(lowest) or not isfinite(highest):
+            raise TermException("Constant array values cannot be NaN or [+/-]infinity.")
+        if value_type == ValueType.BINARY and not ValueTypeValidator.are_binary(flat):
+            raise TermException("The values of a binary constant array must be 0 or 1.")
+        if value_type == ValueType.INTEGER and not ValueTypeValidator.are_integer(flat):
+            raise TermException("The values of an integer constant array must be valid integers.")
+
+        # Read-only arrays that already have the storage type (e.g. memory-mapped files) are shared, not copied.
+        dtype: Any = ConstantArray.__DTYPES[value_type]
+        shared: bool = array.dtype == dtype and not array.flags.writeable
+
+        # Instance attributes
+        self._name: str = name
+        """ The name of the constant array. """
+
+        self._value_type: ValueType = value_type
+        """ An enumeration representing the type of the array's values. """
+
+        self._values: NDArray[Any] = array if shared else array.astype(dtype)
+        """ A read-only NumPy array with the constant values. """
+
+        self._values.setflags(write=False)
+
+    @classmethod
+    def __view(cls, name: str, value_type: ValueType, values: NDArray[Any]) -> "ConstantArray":
+        """
+        Wraps a view of already validated values without copying or validating them again.
+        :param name: The name of the constant array.
+        :param value_type: The type of the array's values.
+        :param values: A read-only NumPy array with the values.
+        :return: A new `ConstantArray` sharing the given values.
+        """
+        view: ConstantArray = cls.__new__(cls)
+        view._name = name
+        view._value_type = value_type
+        view._values = values
+        return view
+
+    def __getitem__(self, index: Any) -> Any:
+        value: Any = self._values[index]
+        if isinstance(value, np.ndarray):
+            return ConstantArray.__view(name=self._name, value_type=self._value_type, values=value)
+        return value.item()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> NDArray[Any]:
+        return self._values if dtype is None else self._values.astype(dtype)
+
+    def dot(self, elements: Sequence[Any]) -> Expression:
+        """
+        Builds the linear expression resulting from the dot product between a one-dimensional constant array
+        and a sequence of elements.
+
+        The expression is accumulated without intermediate wrappers, and zero coefficients are skipped.
+        :param elements: A sequence of `Element` instances and/or numbers, with one entry per value.
+        :return: A new `Expression` instance with the sum of each value multiplied by its element.
+        """
+        if self._values.ndim != 1:
+            raise TermException("The dot product requires a one-dimensional constant array.")
+        if len(elements) != len(self._values):
+            raise TermException("The number of elements must match the size of the constant array.")
+
+        return self.__dot_row(row=self._values, elements=elements)
+
+    def matmul(self, elements: Sequence[Any]) -> List[Expression]:
+        """
+        Builds the linear expressions resulting from the product between a two-dimensional constant array and a
+        sequence of elements, one expression per row. It is typically used to build constraints such as `A x <= b`.
+        :param elements: A sequence of `Element` instances and/or numbers, with one entry per column.
+        :return: A list of `Expression` instances, one per row of the constant array.
+        """
+        if self._values.ndim != 2:
+            raise TermException("The matrix product requires a two-dimensional constant array.")
+        if len(elements) != self._values.shape[1]:
+            raise TermException("The number of elements must match the number of columns of the constant array.")
+
+        # Unwraps the elements once for all the rows.
+        raws: List[Any] = [element._raw if type(element) in _ELEMENT_TYPES else element for element in elements]
+        return [self.__dot_row(row=row, elements=raws) for row in self._values]
+
+    @staticmethod
+    def __dot_row(row: NDArray[Any], elements: Sequence[Any]) -> Expression:
+        """
+        Computes the dot product between a one-dimensional array and a sequence of elements.
+        :param row: A one-dimensional NumPy array with the coefficients.
+        :param elements: A sequence of `Element` instances, raw solver objects and/or numbers.
+        :return: A new `Expression` instance with the dot product.
+        """
+        indices: List[int] = np.flatnonzero(row).tolist()
+        coefficients: List[Any] = row[indices].tolist()
+
+        products: List[Any] = []
+        for coefficient, index in zip(coefficients, indices):
+            element: Any = elements[index]
+            products.append(coefficient * (element._raw if type(element) in _ELEMENT_TYPES else element))
+        return Expression.sum(products)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return "".join(
+            [
+                f"Name: {self.name} | ",
+                f"Value type: {self.value_type.name} | ",
+                f"Shape: {self.shape}",
+            ]
+        )
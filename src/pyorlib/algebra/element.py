@@ -1,5 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Set
+
+_ELEMENT_TYPES: Set[type] = set()
+"""
+A type-keyed table with every concrete `Element` subclass. Operators use it to decide whether an operand must be
+unwrapped to its raw handle, which is considerably cheaper than an `isinstance` check against the `Element` ABC.
+"""
 
 
 class Element(ABC):
@@ -14,18 +20,32 @@ class Element(ABC):
     functions, and any other operations defined by the underlying mathematical element.
     """
 
+    # Strict class attributes.
+    __slots__ = ["_raw"]
+
+    _raw: Any
+    """ The raw handle of the element, stored by subclasses and read directly by the operators. """
+
     @property
-    @abstractmethod
     def raw(self) -> Any:
         """
         Returns the raw representation of the mathematical element.
 
-        The `raw` method, when implemented by subclasses, returns the mathematical element in its raw format.
-        The raw format can take various forms, such as an expression used by solvers or engines, or a
-        mathematical expression that represents the entity itself.
+        The `raw` property returns the mathematical element in its raw format, which subclasses store in the
+        `_raw` slot. The raw format can take various forms, such as an expression used by solvers or engines,
+        or a mathematical expression that represents the entity itself.
         :return: The raw representation of the mathematical element.
         """
-        pass
+        return self._raw
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Registers each subclass in the type-keyed table used by the operators to unwrap operands.
+        :param kwargs: Keyword arguments forwarded to the base implementation.
+        :return: None
+        """
+        super().__init_subclass__(**kwargs)
+        _ELEMENT_TYPES.add(cls)
 
     @abstractmethod
     def _build_expression(self, expression: Any) -> "Element":
@@ -59,10 +79,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be added.
         :return: A new `Element` instance representing the addition.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw + other.raw)
-        else:
-            return self._build_expression(expression=self.raw + other)
+        return self._build_expression(self._raw + (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __radd__(self, other: Any) -> "Element":
         """
@@ -70,10 +87,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be added.
         :return: A new `Element` instance representing the addition.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=other.raw + self.raw)
-        else:
-            return self._build_expression(expression=other + self.raw)
+        return self._build_expression((other._raw if type(other) in _ELEMENT_TYPES else other) + self._raw)
 
     @abstractmethod
     def __iadd__(self, other: Any) -> "Element":
@@ -91,10 +105,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be subtracted.
         :return: A new `Element` instance representing the subtraction.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw - other.raw)
-        else:
-            return self._build_expression(expression=self.raw - other)
+        return self._build_expression(self._raw - (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __rsub__(self, other: Any) -> "Element":
         """
@@ -102,10 +113,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be subtracted.
         :return: A new `Element` instance representing the subtraction.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=other.raw - self.raw)
-        else:
-            return self._build_expression(expression=other - self.raw)
+        return self._build_expression((other._raw if type(other) in _ELEMENT_TYPES else other) - self._raw)
 
     @abstractmethod
     def __isub__(self, other: Any) -> "Element":
@@ -123,10 +131,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be multiplied.
         :return: A new `Element` instance representing the multiplication.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw * other.raw)
-        else:
-            return self._build_expression(expression=self.raw * other)
+        return self._build_expression(self._raw * (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __rmul__(self, other: Any) -> "Element":
         """
@@ -134,10 +139,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be multiplied.
         :return: A new `Element` instance representing the multiplication.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=other.raw * self.raw)
-        else:
-            return self._build_expression(expression=other * self.raw)
+        return self._build_expression((other._raw if type(other) in _ELEMENT_TYPES else other) * self._raw)
 
     @abstractmethod
     def __imul__(self, other: Any) -> "Element":
@@ -155,10 +157,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be divided.
         :return: A new `Element` instance representing the division.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw / other.raw)
-        else:
-            return self._build_expression(expression=self.raw / other)
+        return self._build_expression(self._raw / (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __rtruediv__(self, other: Any) -> "Element":
         """
@@ -166,10 +165,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be divided.
         :return: A new `Element` instance representing the division.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=other.raw / self.raw)
-        else:
-            return self._build_expression(expression=other / self.raw)
+        return self._build_expression((other._raw if type(other) in _ELEMENT_TYPES else other) / self._raw)
 
     @abstractmethod
     def __itruediv__(self, other: Any) -> "Element":
@@ -187,10 +183,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be floor divided.
         :return: A new `Element` instance representing the floor division.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw // other.raw)
-        else:
-            return self._build_expression(expression=self.raw // other)
+        return self._build_expression(self._raw // (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __rfloordiv__(self, other: Any) -> "Element":
         """
@@ -198,10 +191,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be floor divided.
         :return: A new `Element` instance representing the floor division.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=other.raw // self.raw)
-        else:
-            return self._build_expression(expression=other // self.raw)
+        return self._build_expression((other._raw if type(other) in _ELEMENT_TYPES else other) // self._raw)
 
     @abstractmethod
     def __ifloordiv__(self, other: Any) -> "Element":
@@ -219,10 +209,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be used for modulo.
         :return: A new `Element` instance representing the modulo operation.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw % other.raw)
-        else:
-            return self._build_expression(expression=self.raw % other)
+        return self._build_expression(self._raw % (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __rmod__(self, other: Any) -> "Element":
         """
@@ -230,10 +217,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be used for modulo.
         :return: A new `Element` instance representing the modulo operation.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=other.raw % self.raw)
-        else:
-            return self._build_expression(expression=other % self.raw)
+        return self._build_expression((other._raw if type(other) in _ELEMENT_TYPES else other) % self._raw)
 
     @abstractmethod
     def __imod__(self, other: Any) -> "Element":
@@ -251,10 +235,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be used as the exponent.
         :return: A new `Element` instance representing the exponentiation.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw**other.raw)
-        else:
-            return self._build_expression(expression=self.raw**other)
+        return self._build_expression(self._raw ** (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __rpow__(self, other: Any) -> "Element":
         """
@@ -262,10 +243,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be used as the base.
         :return: A new `Element` instance representing the exponentiation.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=other.raw**self.raw)
-        else:
-            return self._build_expression(expression=other**self.raw)
+        return self._build_expression((other._raw if type(other) in _ELEMENT_TYPES else other) ** self._raw)
 
     @abstractmethod
     def __ipow__(self, other: Any) -> "Element":
@@ -282,21 +260,21 @@ class Element(ABC):
         Negation operation.
         :return: A new `Element` instance representing the negation.
         """
-        return self._build_expression(expression=-self.raw)
+        return self._build_expression(-self._raw)
 
     def __pos__(self) -> "Element":
         """
         Positive operation.
         :return: A new `Element` instance representing the positive value.
         """
-        return self._build_expression(expression=+self.raw)
+        return self._build_expression(+self._raw)
 
     def __abs__(self) -> "Element":
         """
         Absolute value operation.
         :return: A new `Element` instance representing the absolute value.
         """
-        return self._build_expression(expression=abs(self.raw))
+        return self._build_expression(abs(self._raw))
 
     # Comparison Methods
     def __eq__(self, other: Any) -> "Element":  # type: ignore[override]
@@ -305,10 +283,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be compared.
         :return: A new `Element` instance representing the comparison result.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw == other.raw)
-        else:
-            return self._build_expression(expression=self.raw == other)
+        return self._build_expression(self._raw == (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __ne__(self, other: Any) -> "Element":  # type: ignore[override]
         """
@@ -316,10 +291,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be compared.
         :return: A new `Element` instance representing the comparison result.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw != other.raw)
-        else:
-            return self._build_expression(expression=self.raw != other)
+        return self._build_expression(self._raw != (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __lt__(self, other: Any) -> "Element":
         """
@@ -327,10 +299,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be compared.
         :return: A new `Element` instance representing the comparison result.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw < other.raw)
-        else:
-            return self._build_expression(expression=self.raw < other)
+        return self._build_expression(self._raw < (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __le__(self, other: Any) -> "Element":
         """
@@ -338,10 +307,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be compared.
         :return: A new `Element` instance representing the comparison result.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw <= other.raw)
-        else:
-            return self._build_expression(expression=self.raw <= other)
+        return self._build_expression(self._raw <= (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __gt__(self, other: Any) -> "Element":
         """
@@ -349,10 +315,7 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be compared.
         :return: A new `Element` instance representing the comparison result.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw > other.raw)
-        else:
-            return self._build_expression(expression=self.raw > other)
+        return self._build_expression(self._raw > (other._raw if type(other) in _ELEMENT_TYPES else other))
 
     def __ge__(self, other: Any) -> "Element":
         """
@@ -360,7 +323,4 @@ class Element(ABC):
         :param other: The `number` or `Element` instance to be compared.
         :return: A new `Element` instance representing the comparison result.
         """
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw >= other.raw)
-        else:
-            return self._build_expression(expression=self.raw >= other)
+        return self._build_expression(self._raw >= (other._raw if type(other) in _ELEMENT_TYPES else other))
@@ -1,6 +1,6 @@
-from typing import Any
+from typing import Any, Iterable
 
-from ..element import Element
+from ..element import Element, _ELEMENT_TYPES
 
 
 class Expression(Element):
@@ -16,9 +16,8 @@ class Expression(Element):
     any other operations defined by the underlying mathematical expression.
     """
 
-    @property
-    def raw(self) -> Any:
-        return self.__expression
+    # Strict class attributes.
+    __slots__ = ()
 
     def __init__(self, expression: Any):
         """
@@ -31,60 +30,62 @@ class Expression(Element):
             raise ValueError("Expression cannot be None")
 
         # Instance attributes
-        self.__expression: Any = expression
+        self._raw = expression
         """ The mathematical expression. """
 
+    @staticmethod
+    def sum(elements: Iterable[Any]) -> "Expression":
+        """
+        Sums a sequence of `Element` instances and/or numbers into a single expression.
+
+        Unlike the built-in `sum`, the raw handles are accumulated in place and wrapped only once, so no
+        intermediate `Expression` is allocated for the chained additions. The accumulator always starts from a
+        fresh raw object, so the operands themselves are never modified.
+        :param elements: An iterable of `Element` instances and/or numbers to be added.
+        :return: A new `Expression` instance representing the sum.
+        """
+        total: Any = 0
+        started: bool = False
+        for element in elements:
+            raw: Any = element._raw if type(element) in _ELEMENT_TYPES else element
+            if started:
+                total += raw
+            else:
+                total = total + raw
+                started = True
+        return Expression(expression=total)
+
     def _build_expression(self, expression: Any) -> Element:
-        return Expression(expression=expression)
+        # Positional construction avoids the slower keyword call path on this hot path.
+        return Expression(expression)
 
     def __str__(self) -> str:
-        return str(self.raw)
+        return str(self._raw)
 
     def __iadd__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            self.__expression += other.raw
-        else:
-            self.__expression += other
+        self._raw += other._raw if type(other) in _ELEMENT_TYPES else other
         return self
 
     def __isub__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            self.__expression -= other.raw
-        else:
-            self.__expression -= other
+        self._raw -= other._raw if type(other) in _ELEMENT_TYPES else other
         return self
 
     def __imul__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            self.__expression *= other.raw
-        else:
-            self.__expression *= other
+        self._raw *= other._raw if type(other) in _ELEMENT_TYPES else other
         return self
 
     def __itruediv__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            self.__expression /= other.raw
-        else:
-            self.__expression /= other
+        self._raw /= other._raw if type(other) in _ELEMENT_TYPES else other
         return self
 
     def __ifloordiv__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            self.__expression //= other.raw
-        else:
-            self.__expression //= other
+        self._raw //= other._raw if type(other) in _ELEMENT_TYPES else other
         return self
 
     def __imod__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            self.__expression %= other.raw
-        else:
-            self.__expression %= other
+        self._raw %= other._raw if type(other) in _ELEMENT_TYPES else other
         return self
 
     def __ipow__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            self.__expression **= other.raw
-        else:
-            self.__expression **= other
+        self._raw **= other._raw if type(other) in _ELEMENT_TYPES else other
         return self
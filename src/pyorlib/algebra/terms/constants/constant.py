@@ -1,5 +1,4 @@
 from math import inf
-from typing import Any
 
 from ..term import Term
 from ....core.constants import StdOutColors
@@ -17,7 +16,11 @@ class Constant(Term):
     parameters in an optimization model.
     """
 
-    __slots__ = ["_name", "_value"]
+    # Strict class attributes.
+    __slots__ = ["_name"]
+
+    _raw: float
+    """ The value of the constant, which is also its raw representation. """
 
     @property
     def name(self) -> str:
@@ -25,19 +28,15 @@ class Constant(Term):
 
     @property
     def lower_bound(self) -> float:
-        return self._value
+        return self._raw
 
     @property
     def upper_bound(self) -> float:
-        return self._value
+        return self._raw
 
     @property
     def value(self) -> float:
-        return self._value
-
-    @property
-    def raw(self) -> Any:
-        return self.value
+        return self._raw
 
     def __init__(self, name: str, value_type: ValueType, value: float):
         """
@@ -65,8 +64,7 @@ class Constant(Term):
         self._name: str = name
         """ The name of the constant. """
 
-        self._value: float = value
-        """ The internal value of the constant. """
+        self._raw = value
 
     def get_pretty_string(self, float_precision: int = 6) -> str:  # pragma: no cover
         default, debug = StdOutColors.DEFAULT, StdOutColors.PURPLE
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any
+from typing import Any, Dict, Tuple
 
 from ..element import Element
 from ..expressions import Expression
@@ -8,7 +7,6 @@ from ...enums import TermType, ValueType
 from ...exceptions import TermException
 
 
-@dataclass
 class Term(Element, ABC):
     """
     A base class representing a term in an optimization model.
@@ -18,7 +16,49 @@ class Term(Element, ABC):
     base class (ABC) that defines the common behavior and interface for all terms.
     """
 
-    __slots__ = ["_term_type", "_value_type"]
+    class _Metadata:
+        """
+        Represents the metadata shared by all terms of the same term type and value type.
+
+        Instances are flyweights: a single `_Metadata` object exists per `(term_type, value_type)` pair, and
+        every term with that combination references it instead of storing its own copies.
+        """
+
+        # Strict class attributes.
+        __slots__ = ["term_type", "value_type"]
+
+        __instances: Dict[Tuple[TermType, ValueType], "Term._Metadata"] = {}
+        """ The shared metadata instances, indexed by term type and value type. """
+
+        def __init__(self, term_type: TermType, value_type: ValueType):
+            """
+            Initializes a new `_Metadata` object. Use `get` to retrieve the shared instance instead.
+            :param term_type: An enumeration representing the type of the term.
+            :param value_type: An enumeration representing the type of the term's value.
+            """
+            # Instance attributes
+            self.term_type: TermType = term_type
+            """ An enumeration representing the type of the term. """
+
+            self.value_type: ValueType = value_type
+            """ An enumeration representing the type of the term's value. """
+
+        @classmethod
+        def get(cls, term_type: TermType, value_type: ValueType) -> "Term._Metadata":
+            """
+            Retrieves the shared metadata instance for the given term type and value type.
+            :param term_type: An enumeration representing the type of the term.
+            :param value_type: An enumeration representing the type of the term's value.
+            :return: The shared `_Metadata` instance.
+            """
+            key: Tuple[TermType, ValueType] = (term_type, value_type)
+            metadata: Term._Metadata | None = cls.__instances.get(key)
+            if metadata is None:
+                metadata = cls.__instances[key] = cls(term_type=term_type, value_type=value_type)
+            return metadata
+
+    # Strict class attributes.
+    __slots__ = ["_metadata"]
 
     @property
     def term_type(self) -> TermType:
@@ -26,7 +66,7 @@ class Term(Element, ABC):
         Retrieves the type of the term.
         :return: A TermType enumeration.
         """
-        return self._term_type
+        return self._metadata.term_type
 
     @property
     def value_type(self) -> ValueType:
@@ -34,7 +74,7 @@ class Term(Element, ABC):
         Retrieves the type of the term's value.
         :return: A ValueType enumeration
         """
-        return self._value_type
+        return self._metadata.value_type
 
     @property
     @abstractmethod
@@ -74,8 +114,10 @@ class Term(Element, ABC):
     def value(self) -> float:
         """
         Retrieves the value of the term.
-            For variable terms, the value corresponds to the current value of the term.
+            For variable terms, the value corresponds to the current value of the term in the engine.
             If the term has not been solved yet, the value is `-0.0`.
+            Warning: when a model finds its solution in its solve cache, the engine is not solved, so the values
+            of its variables are stale and must be read through `Model.get_values` or `Model.solution` instead.
             For constant terms, the value remains the constant value.
         :return: A float representing the value of the term.
         """
@@ -87,7 +129,7 @@ class Term(Element, ABC):
         Determines whether the term is a variable or not.
         :return: `True` if the term is a variable, `False` otherwise.
         """
-        return self._term_type == TermType.VARIABLE
+        return self._metadata.term_type == TermType.VARIABLE
 
     @property
     def is_constant(self) -> bool:
@@ -95,7 +137,7 @@ class Term(Element, ABC):
         Determines whether the term is a constant or not.
         :return: `True` if the term is a constant, `False` otherwise.
         """
-        return self._term_type == TermType.CONSTANT
+        return self._metadata.term_type == TermType.CONSTANT
 
     def __init__(self, term_type: TermType, value_type: ValueType):
         """
@@ -111,14 +153,12 @@ class Term(Element, ABC):
             raise TermException("Invalid term value type.")
 
         # Instance attributes
-        self._term_type: TermType = term_type
-        """ An enumeration representing the type of the term. """
-
-        self._value_type: ValueType = value_type
-        """ An enumeration representing the type of the term's value. """
+        self._metadata: Term._Metadata = Term._Metadata.get(term_type=term_type, value_type=value_type)
+        """ The metadata shared with every other term of the same term type and value type. """
 
     def _build_expression(self, expression: Any) -> Element:
-        return Expression(expression=expression)
+        # Positional construction avoids the slower keyword call path on this hot path.
+        return Expression(expression)
 
     @abstractmethod
     def get_pretty_string(self, float_precision: int = 6) -> str:
@@ -141,44 +181,11 @@ class Term(Element, ABC):
             ]
         )
 
-    def __iadd__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw + other.raw)
-        else:
-            return self._build_expression(expression=self.raw + other)
-
-    def __isub__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw - other.raw)
-        else:
-            return self._build_expression(expression=self.raw - other)
-
-    def __imul__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw * other.raw)
-        else:
-            return self._build_expression(expression=self.raw * other)
-
-    def __itruediv__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw / other.raw)
-        else:
-            return self._build_expression(expression=self.raw / other)
-
-    def __ifloordiv__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw // other.raw)
-        else:
-            return self._build_expression(expression=self.raw // other)
-
-    def __imod__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw % other.raw)
-        else:
-            return self._build_expression(expression=self.raw % other)
-
-    def __ipow__(self, other: Any) -> Element:
-        if isinstance(other, Element):
-            return self._build_expression(expression=self.raw**other.raw)
-        else:
-            return self._build_expression(expression=self.raw**other)
+    # Terms are immutable, so the in-place operations build a new expression, exactly like the normal ones.
+    __iadd__ = Element.__add__
+    __isub__ = Element.__sub__
+    __imul__ = Element.__mul__
+    __itruediv__ = Element.__truediv__
+    __ifloordiv__ = Element.__floordiv__
+    __imod__ = Element.__mod__
+    __ipow__ = Element.__pow__
@@ -17,19 +17,40 @@ class Variable(Term, ABC):
     for all variable terms.
     """
 
-    def __init__(self, name: str, value_type: ValueType, lower_bound: float = 0, upper_bound: float = inf):
+    # Strict class attributes.
+    __slots__ = ["_id"]
+
+    @property
+    def id(self) -> int:
+        """
+        Retrieves the integer identifier of the variable.
+            Engines assign identifiers sequentially, starting from 0, in the order variables are created.
+            A value of -1 means the variable was not created through an engine.
+        :return: An integer with the identifier of the variable.
+        """
+        return self._id
+
+    def __init__(
+        self,
+        name: str | None,
+        value_type: ValueType,
+        lower_bound: float = 0,
+        upper_bound: float = inf,
+        id: int = -1,
+    ):
         """
         Initializes a new `Variable` object with the specified attributes.
-        :param name: The name of the variable.
+        :param name: The name of the variable, or None for an anonymous variable named by its solver.
         :param value_type: An enumeration representing the type of the variable's value.
         :param lower_bound: The lower bound of the variable. Default is 0.
         :param upper_bound: The upper bound of the variable. Default is infinity.
+        :param id: The integer identifier of the variable within its engine. Default is -1 (unassigned).
         """
         # Calls the base init with the term type as Variable.
         super().__init__(term_type=TermType.VARIABLE, value_type=value_type)
 
         # Applies validations
-        if not name:
+        if name is not None and not name:
             raise TermException("Variable terms must have a name.")
         if lower_bound is None or upper_bound is None:
             raise TermException("Variable terms must have lower and upper bounds.")
@@ -46,8 +67,20 @@ class Variable(Term, ABC):
         if value_type == ValueType.INTEGER and not upper_bound == inf and not float(upper_bound).is_integer():
             raise TermException("Invalid upper bound for an integer variable term.")
 
-    def get_pretty_string(self, float_precision: int = 6) -> str:  # pragma: no cover
+        # Instance attributes
+        self._id: int = id
+        """ The integer identifier of the variable within its engine. """
+
+    def get_pretty_string(self, float_precision: int = 6, value: float | None = None) -> str:  # pragma: no cover
+        """
+        Returns a formatted string representation of the variable.
+        :param float_precision: It represents the number of digits used in printing the solution and objective.
+        :param value: The value to be shown, such as the value of the variable in a cached solution.
+            Defaults to the value of the variable in the engine.
+        :return: A formatted string representing the variable.
+        """
         default, debug = StdOutColors.DEFAULT, StdOutColors.PURPLE
+        value = self.value if value is None else value
         return "".join(
             [
                 f"Name: {debug}{self.name}{default} | ",
@@ -58,7 +91,7 @@ class Variable(Term, ABC):
                 f"{default}| Ub:{debug} ",
                 "{0:.{prec}g} ".format(self.upper_bound, prec=float_precision),
                 f"{default}| Val:{debug} ",
-                "{0:.{prec}g} ".format(self.value, prec=float_precision),
-                f"{'(N/A) ' if self.value == -0.0 else ''}{default}",
+                "{0:.{prec}g} ".format(value, prec=float_precision),
+                f"{'(N/A) ' if value == -0.0 else ''}{default}",
             ]
         )
@@ -0,0 +1,8 @@
+"""
+The Algorithms module in PyORlib provides solution algorithms built on top of models, which solve a problem
+through a sequence of related models, such as rolling-horizon planning, rather than a single solve.
+"""
+
+from .rolling_window import RollingWindow
+from .window_result import WindowResult
+from .rolling_horizon import RollingHorizon
@@ -0,0 +1,295 @@
+from typing import Callable, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+from ..algebra.terms import Term
+from ..algebra.terms.variables import Variable
+from ..engines import Engine
+from ..enums import SolutionStatus, ValueType
+from ..exceptions import AlgorithmException
+from ..model import Model
+from ..profiling import ProfileSpan, Profiler
+from .rolling_window import RollingWindow
+from .window_result import WindowResult
+
+
+class RollingHorizon:
+    """
+    Represents a rolling-horizon solver, which solves a long planning horizon as a sequence of overlapping windows.
+
+    Each window is a model over a few consecutive periods of the horizon: it commits the decisions of its first
+    `step` periods and only plans the rest, and the next window starts `step` periods later. Instead of building
+    a model per window, the rolling horizon keeps one model per window shape (number of periods), built once by
+    the `build` callable, and shifts the data of each window into it with the `update` callable, through
+    incremental changes such as `Model.set_variable_bounds` and `Model.set_objective`. Right-hand sides and other
+    data that change between windows are best modeled as variables fixed to their value, so that they are
+    updated through their bounds.
+
+    The decisions of a window are the variables of the `periodic_sets` of its model, whose last index is the
+    relative period of the window. Before solving a window, the decisions of its leading `fixed_periods` periods
+    are fixed to the values committed by previous windows, and the remaining decisions are warm-started from the
+    solution of the previous window, matched by absolute period. The time of the build, update and solve phases
+    of each window is reported as profile spans, and recorded in the profiler, if any.
+    """
+
+    # Strict class attributes.
+    __slots__ = [
+        "_engine_factory",
+        "_build",
+        "_update",
+        "_horizon",
+        "_window",
+        "_step",
+        "_periodic_sets",
+        "_fixed_periods",
+        "_profiler",
+        "_models",
+        "_engine_names",
+        "_solution",
+    ]
+
+    @property
+    def models(self) -> Mapping[int, Model]:
+        """
+        Retrieves the models built so far.
+        :return: A mapping with the model of each window shape, by number of periods.
+        """
+        return self._models
+
+    @property
+    def solution(self) -> Mapping[str, Mapping[Tuple[int, ...], float]]:
+        """
+        Retrieves the decisions committed so far.
+        :return: A mapping with the committed values of each periodic set, by index, where the last index is
+            the absolute period of the horizon.
+        """
+        return self._solution
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], Engine],
+        build: Callable[[Model, int], None],
+        update: Callable[[Model, RollingWindow], None],
+        horizon: int,
+        window: int,
+        step: int,
+        periodic_sets: Sequence[str],
+        fixed_periods: int = 0,
+        profiler: Profiler | None = None,
+    ):
+        """
+        Initializes a new RollingHorizon instance.
+        :param engine_factory: A callable that creates the engine of each new model.
+        :param build: A callable that receives a new model and its number of periods, and adds its variables,
+            constraints and objective.
+        :param update: A callable that receives the model of a window and the window, and loads the data of the
+            periods of the window into the model.
+        :param horizon: The number of periods of the horizon.
+        :param window: The number of periods planned by each window, besides the fixed ones.
+        :param step: The number of periods committed by each window.
+        :param periodic_sets: The names of the term sets of the decisions, whose last index is the period.
+        :param fixed_periods: The number of periods committed by previous windows that are included, fixed,
+            at the beginning of each window, such as to link the inventory of consecutive periods. Defaults to 0.
+        :param profiler: An optional profiler in which the phases of each window are recorded. Defaults to None.
+        """
+        # Applies validations
+        if horizon < 1:
+            raise AlgorithmException("The horizon must have at least one period.")
+        if not 1 <= step <= window:
+            raise AlgorithmException("The step must be a positive integer not greater than the window.")
+        if fixed_periods < 0:
+            raise AlgorithmException("The number of fixed periods must be a non-negative integer.")
+
+        # Instance attributes
+        self._engine_factory: Callable[[], Engine] = engine_factory
+        """ The callable that creates the engine of each new model. """
+
+        self._build: Callable[[Model, int], None] = build
+        """ The callable that builds a model for a number of periods. """
+
+        self._update: Callable[[Model, RollingWindow], None] = update
+        """ The callable that loads the data of a window into its model. """
+
+        self._horizon: int = horizon
+        """ The number of periods of the horizon. """
+
+        self._window: int = window
+        """ The number of periods planned by each window, besides the fixed ones. """
+
+        self._step: int = step
+        """ The number of periods committed by each window. """
+
+        self._periodic_sets: Tuple[str, ...] = tuple(periodic_sets)
+        """ The names of the term sets of the decisions. """
+
+        self._fixed_periods: int = fixed_periods
+        """ The number of committed periods included, fixed, at the beginning of each window. """
+
+        self._profiler: Profiler | None = profiler
+        """ The profiler in which the phases of each window are recorded. """
+
+        self._models: Dict[int, Model] = {}
+        """ The model of each window shape, by number of periods. """
+
+        self._engine_names: Dict[int, str] = {}
+        """ The name of the engine of each model, by number of periods. """
+
+        self._solution: Dict[str, Dict[Tuple[int, ...], float]] = {set_name: {} for set_name in self._periodic_sets}
+        """ The committed values of each periodic set, by index with the absolute period. """
+
+    def windows(self) -> List[RollingWindow]:
+        """
+        Retrieves the windows of the horizon, in solving order.
+        :return: A list with the windows of the run.
+        """
+        windows: List[RollingWindow] = []
+        for index, commit_start in enumerate(range(0, self._horizon, self._step)):
+            windows.append(
+                RollingWindow(
+                    index=index,
+                    start=max(0, commit_start - self._fixed_periods),
+                    end=min(commit_start + self._window, self._horizon),
+                    commit_start=commit_start,
+                    commit_end=min(commit_start + self._step, self._horizon),
+                )
+            )
+        return windows
+
+    def run(self) -> List[WindowResult]:
+        """
+        Solves the windows of the horizon in order, committing the decisions of each one. The run stops at the
+        first window without a feasible solution, since the following windows depend on its decisions.
+        :return: A list with the result of each solved window.
+        """
+        results: List[WindowResult] = []
+        previous: Dict[Tuple[str, Tuple[int, ...]], float] = {}
+        for window in self.windows():
+            spans: List[ProfileSpan] = []
+            profiler: Profiler = Profiler(sink=self.__sink(spans=spans))
+            model: Model | None = self._models.get(window.num_periods)
+
+            if model is None:
+                engine_instance: Engine = self._engine_factory()
+                self._engine_names[window.num_periods] = engine_instance.name
+                with profiler.measure(engine=engine_instance.name, phase="rolling_horizon.build"):
+                    model = Model(engine=engine_instance, name=f"rolling_horizon_{window.num_periods}")
+                    self._build(model, window.num_periods)
+                self._models[window.num_periods] = model
+
+            # The fixed bounds are restored even if the window fails, since the model is reused by later windows.
+            engine: str = self._engine_names[window.num_periods]
+            restore: List[Tuple[Variable, float, float]] = []
+            try:
+                with profiler.measure(engine=engine, phase="rolling_horizon.update"):
+                    self._update(model, window)
+                    self.__fix(model=model, window=window, restore=restore)
+                    self.__warm_start(model=model, window=window, previous=previous)
+
+                with profiler.measure(engine=engine, phase="rolling_horizon.solve"):
+                    model.solve()
+
+                status: SolutionStatus = model.solution_status
+                solved: bool = status in (SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE)
+                results.append(
+                    WindowResult(
+                        window=window,
+                        status=status,
+                        objective_value=model.objective_value if solved else None,
+                        spans=tuple(spans),
+                    )
+                )
+                if solved:
+                    previous = self.__commit(model=model, window=window)
+            finally:
+                for variable, lower_bound, upper_bound in restore:
+                    model.set_variable_bounds(variable=variable, lower_bound=lower_bound, upper_bound=upper_bound)
+
+            if not solved:
+                break
+        return results
+
+    def __sink(self, spans: List[ProfileSpan]) -> Callable[[ProfileSpan], None]:
+        """
+        Creates the sink of the profiler of a window, which collects the spans of the window and records them in
+        the profiler of the rolling horizon, if any.
+        :param spans: The list where the spans of the window are appended.
+        :return: The sink of the profiler of the window.
+        """
+        profiler: Profiler | None = self._profiler
+        if profiler is None:
+            return spans.append
+
+        def record(span: ProfileSpan) -> None:
+            spans.append(span)
+            profiler.record(
+                engine=span.engine, phase=span.phase, start=span.start, end=span.end, cpu_time=span.cpu_time
+            )
+
+        return record
+
+    def __decisions(self, model: Model, window: RollingWindow) -> Iterator[Tuple[str, Tuple[int, ...], Term]]:
+        """
+        Retrieves the decisions of a window.
+        :param model: The model of the window.
+        :param window: The window.
+        :return: An iterator of the set name, the index with the absolute period and the term of each decision.
+        """
+        term_sets: Mapping[str, Mapping[Tuple[int, ...], Term]] = model.term_sets
+        for set_name in self._periodic_sets:
+            for index, term in term_sets[set_name].items():
+                yield set_name, index[:-1] + (window.to_absolute(period=index[-1]),), term
+
+    def __fix(self, model: Model, window: RollingWindow, restore: List[Tuple[Variable, float, float]]) -> None:
+        """
+        Fixes the decisions of the leading periods of a window to their committed values.
+        :param model: The model of the window.
+        :param window: The window.
+        :param restore: The list where each variable is appended with its bounds, before it is fixed.
+        :return: None.
+        """
+        if window.num_fixed_periods == 0:
+            return
+        for set_name, index, term in self.__decisions(model=model, window=window):
+            value: float | None = self._solution[set_name].get(index)
+            if index[-1] >= window.commit_start or value is None or not isinstance(term, Variable):
+                continue
+            if term.value_type != ValueType.CONTINUOUS:
+                value = round(value)
+            restore.append((term, term.lower_bound, term.upper_bound))
+            model.set_variable_bounds(variable=term, lower_bound=value, upper_bound=value)
+
+    def __warm_start(
+        self, model: Model, window: RollingWindow, previous: Mapping[Tuple[str, Tuple[int, ...]], float]
+    ) -> None:
+        """
+        Warm-starts the decisions of a window from the solution of the previous window.
+        :param model: The model of the window.
+        :param window: The window.
+        :param previous: The values of the decisions of the previous window, by set name and absolute index.
+        :return: None.
+        """
+        if not previous:
+            return
+        variables: List[Variable] = []
+        values: List[float] = []
+        for set_name, index, term in self.__decisions(model=model, window=window):
+            value: float | None = previous.get((set_name, index))
+            if value is not None and isinstance(term, Variable):
+                variables.append(term)
+                values.append(value)
+        if variables:
+            model.set_start_values(variables=variables, values=values)
+
+    def __commit(self, model: Model, window: RollingWindow) -> Dict[Tuple[str, Tuple[int, ...]], float]:
+        """
+        Commits the decisions of the committed periods of a solved window.
+        :param model: The model of the window.
+        :param window: The window.
+        :return: A dictionary with the values of all the decisions of the window, by set name and absolute index.
+        """
+        decisions: List[Tuple[str, Tuple[int, ...], Term]] = list(self.__decisions(model=model, window=window))
+        values: List[float] = model.get_values(terms=[term for _, _, term in decisions])
+        solution: Dict[Tuple[str, Tuple[int, ...]], float] = {}
+        for (set_name, index, _), value in zip(decisions, values):
+            solution[set_name, index] = value
+            if window.commit_start <= index[-1] < window.commit_end:
+                self._solution[set_name][index] = value
+        return solution
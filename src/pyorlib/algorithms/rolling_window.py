@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RollingWindow:
+    """
+    Represents a window of a rolling-horizon run, as a range of absolute periods of the horizon.
+
+    The periods of a window are numbered from 0 within its model (relative periods), and the relative period
+    `t` of a window corresponds to the absolute period `start + t`. The window starts with the periods whose
+    decisions were committed by previous windows, which are fixed, followed by the periods whose decisions it
+    commits and the periods that are only planned (look-ahead).
+    """
+
+    index: int
+    """ The position of the window in the run, starting at 0. """
+
+    start: int
+    """ The absolute period of the first period of the window, included. """
+
+    end: int
+    """ The absolute period after the last period of the window, excluded. """
+
+    commit_start: int
+    """ The absolute period of the first period whose decisions are committed by the window. """
+
+    commit_end: int
+    """ The absolute period after the last period whose decisions are committed by the window. """
+
+    @property
+    def num_periods(self) -> int:
+        """
+        Retrieves the number of periods of the window, which is the shape of its model.
+        :return: An integer with the number of periods.
+        """
+        return self.end - self.start
+
+    @property
+    def num_fixed_periods(self) -> int:
+        """
+        Retrieves the number of leading periods of the window that were committed by previous windows.
+        :return: An integer with the number of fixed periods.
+        """
+        return self.commit_start - self.start
+
+    def to_absolute(self, period: int) -> int:
+        """
+        Converts a relative period of the window to an absolute period of the horizon.
+        :param period: The relative period, between 0 and the number of periods of the window.
+        :return: An integer with the absolute period.
+        """
+        return self.start + period
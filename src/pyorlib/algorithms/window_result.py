@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from ..enums import SolutionStatus
+from ..profiling import ProfileSpan
+from .rolling_window import RollingWindow
+
+
+@dataclass(frozen=True)
+class WindowResult:
+    """
+    Represents the outcome of solving a window of a rolling-horizon run.
+    """
+
+    window: RollingWindow
+    """ The solved window. """
+
+    status: SolutionStatus
+    """ The status of the solution of the window. """
+
+    objective_value: float | None
+    """ The objective value of the model of the window, or None if it has no solution. """
+
+    spans: Tuple[ProfileSpan, ...]
+    """ The measured phases of the window: 'rolling_horizon.build' (only when a model is built), then
+    'rolling_horizon.update' and 'rolling_horizon.solve'. """
+
+    @property
+    def wall_time(self) -> float:
+        """
+        Retrieves the total wall time of the window.
+        :return: The elapsed wall time of all the phases of the window, in seconds.
+        """
+        return sum(span.wall_time for span in self.spans)
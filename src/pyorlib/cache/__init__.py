@@ -0,0 +1,9 @@
+"""
+The Cache module in PyORlib provides an opt-in cache of solutions, keyed by a fingerprint of the structure and data
+of the models that is kept up to date as they are built, so that solving a model that was already solved returns
+the stored solution without calling the solver.
+"""
+
+from .model_fingerprint import ModelFingerprint
+from .solution import Solution
+from .solve_cache import SolveCache
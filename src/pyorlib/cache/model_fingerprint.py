@@ -0,0 +1,119 @@
+from hashlib import blake2b
+from typing import Any, Sequence
+
+from ..enums import OptimizationType, ValueType
+
+
+class ModelFingerprint:
+    """
+    Represents a deterministic fingerprint of the structure and data of a model, updated as it is built.
+
+    Every variable and constraint added to the model is fed to a running hash as it is added, so computing the
+    fingerprint does not require walking the model. Variables contribute their type and bounds, and linear
+    constraints their decomposition into engine keys, coefficients and bounds, which are deterministic for a
+    given engine and sequence of additions. The objective is hashed separately, since it replaces the previous
+    one. Names are not part of the fingerprint, since they do not change the solution of a model.
+
+    Constraints and objectives without a linear decomposition cannot be hashed at full precision, since solvers
+    only print them rounded, so they make the fingerprint uncacheable until they are removed from the model.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_structure", "_objective", "_nonlinear_constraints", "_nonlinear_objective"]
+
+    @property
+    def digest(self) -> str:
+        """
+        Retrieves the current fingerprint of the model.
+        :return: A hexadecimal string with the fingerprint.
+        """
+        fingerprint: Any = self._structure.copy()
+        fingerprint.update(self._objective)
+        return str(fingerprint.hexdigest())
+
+    @property
+    def cacheable(self) -> bool:
+        """
+        Determines whether the fingerprint identifies the model, that is, whether all of its constraints and
+        its objective were fed as linear decompositions.
+        :return: True if solutions of the model can be cached under its fingerprint, False otherwise.
+        """
+        return not self._nonlinear_constraints and not self._nonlinear_objective
+
+    def __init__(self) -> None:
+        """
+        Initializes a new ModelFingerprint instance, for an empty model.
+        """
+        # Instance attributes
+        self._structure: Any = blake2b(digest_size=16)
+        """ The running hash of the variables and constraints. """
+
+        self._objective: bytes = b""
+        """ The digest of the objective function. """
+
+        self._nonlinear_constraints: bool = False
+        """ A flag indicating whether a constraint without a linear decomposition was added. """
+
+        self._nonlinear_objective: bool = False
+        """ A flag indicating whether the objective function has no linear decomposition. """
+
+    def add_variable(self, value_type: ValueType, lower_bound: float, upper_bound: float) -> None:
+        """
+        Feeds a new variable to the fingerprint.
+        :param value_type: The type of the variable values.
+        :param lower_bound: The lower bound of the variable.
+        :param upper_bound: The upper bound of the variable.
+        :return: None.
+        """
+        self._structure.update(f"v{int(value_type)}:{lower_bound!r}:{upper_bound!r};".encode())
+
+    def set_variable_bounds(self, identifier: int, lower_bound: float, upper_bound: float) -> None:
+        """
+        Feeds a change of the bounds of a variable to the fingerprint.
+        :param identifier: The identifier of the variable.
+        :param lower_bound: The new lower bound of the variable.
+        :param upper_bound: The new upper bound of the variable.
+        :return: None.
+        """
+        self._structure.update(f"b{identifier}:{lower_bound!r}:{upper_bound!r};".encode())
+
+    def add_constraint(self, keys: Sequence[Any], coefficients: Sequence[float], lower: float, upper: float) -> None:
+        """
+        Feeds a new linear constraint to the fingerprint.
+        :param keys: The engine keys of the variables of the constraint.
+        :param coefficients: The coefficients of the variables.
+        :param lower: The lower bound of the constraint.
+        :param upper: The upper bound of the constraint.
+        :return: None.
+        """
+        self._structure.update(f"c{list(keys)!r}:{list(coefficients)!r}:{lower!r}:{upper!r};".encode())
+
+    def add_column(self, rows: Sequence[int], coefficients: Sequence[float], objective_coefficient: float) -> None:
+        """
+        Feeds the coefficients of the last variable in existing constraints and in the objective to the fingerprint.
+        :param rows: The positions of the constraints where the variable appears.
+        :param coefficients: The coefficient of the variable in each constraint.
+        :param objective_coefficient: The coefficient of the variable in the objective.
+        :return: None.
+        """
+        self._structure.update(f"k{list(rows)!r}:{list(coefficients)!r}:{objective_coefficient!r};".encode())
+
+    def add_nonlinear_constraint(self) -> None:
+        """
+        Feeds a new constraint that cannot be decomposed into a linear row to the fingerprint, which makes it
+        uncacheable.
+        :return: None.
+        """
+        self._structure.update(b"n;")
+        self._nonlinear_constraints = True
+
+    def set_objective(self, opt_type: OptimizationType, text: str | None) -> None:
+        """
+        Replaces the objective function of the fingerprint.
+        :param opt_type: The optimization type of the objective.
+        :param text: A deterministic text of the objective at full precision, such as its linear decomposition,
+            or None if the objective has none, which makes the fingerprint uncacheable until it is replaced.
+        :return: None.
+        """
+        self._objective = blake2b(f"o{opt_type.name}:{text}".encode(), digest_size=16).digest()
+        self._nonlinear_objective = text is None
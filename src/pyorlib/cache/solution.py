@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+from ..algebra.terms.variables import Variable
+from ..enums import SolutionStatus
+
+
+@dataclass(frozen=True)
+class Solution:
+    """
+    Represents the result of solving a model, detached from the engine that produced it.
+
+    Solutions are stored by the solve cache, and the values of the variables are kept by variable identifier,
+    that is, in the order in which the variables were added to the model.
+    """
+
+    status: SolutionStatus
+    """ The status of the solution. """
+
+    objective_value: float | None
+    """ The value of the objective function, or None if the model has no solution. """
+
+    values: Tuple[float, ...] = ()
+    """ The value of each variable, by variable identifier. """
+
+    def get_value(self, variable: Variable) -> float:
+        """
+        Retrieves the value of a variable in the solution.
+        :param variable: A variable of the solved model.
+        :return: The value of the variable.
+        """
+        return self.values[variable.id]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the solution to a dictionary of JSON-compatible values.
+        :return: A dictionary with the status name, the objective value and the values of the variables.
+        """
+        return {"status": self.status.name, "objective_value": self.objective_value, "values": list(self.values)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Solution":
+        """
+        Creates a solution from a dictionary produced by `to_dict`.
+        :param data: The dictionary of the solution.
+        :return: The solution.
+        """
+        objective_value: Any = data["objective_value"]
+        return cls(
+            status=SolutionStatus[data["status"]],
+            objective_value=float(objective_value) if objective_value is not None else None,
+            values=tuple(float(value) for value in data["values"]),
+        )
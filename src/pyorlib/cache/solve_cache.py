@@ -0,0 +1,212 @@
+import json
+import os
+from collections import OrderedDict
+from hashlib import blake2b
+from os import PathLike, fspath
+from typing import Any, List, Mapping, Tuple
+
+from .solution import Solution
+
+
+class SolveCache:
+    """
+    Represents a cache of solutions, keyed by the fingerprint of the solved models.
+
+    Models created with a solve cache keep a fingerprint of their structure and data up to date as they are built
+    (see `ModelFingerprint`), and look it up before solving, together with the engine and the parameters of the
+    cache. When a solution is found, the solver is skipped entirely. Solutions are kept in an in-memory LRU of
+    `max_entries` entries and, if a directory is given, in JSON files on disk, whose total size is bounded by
+    removing the least recently used files. Only optimal, feasible and infeasible results are stored.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_max_entries", "_path", "_max_bytes", "_parameters", "_entries", "_hits", "_misses"]
+
+    @property
+    def path(self) -> str | None:
+        """
+        Retrieves the directory of the on-disk store.
+        :return: A string with the directory, or None if solutions are only kept in memory.
+        """
+        return self._path
+
+    @property
+    def hits(self) -> int:
+        """
+        Retrieves the number of lookups that found a solution.
+        :return: An integer with the number of hits.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Retrieves the number of lookups that did not find a solution.
+        :return: An integer with the number of misses.
+        """
+        return self._misses
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        path: str | PathLike[str] | None = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        parameters: Mapping[str, Any] | None = None,
+    ):
+        """
+        Initializes a new SolveCache instance.
+        :param max_entries: The number of solutions kept in memory. Defaults to 128.
+        :param path: An optional directory where solutions are also stored, so that they survive the process.
+            It is created if it does not exist. Defaults to None.
+        :param max_bytes: The maximum total size of the solution files on disk. Defaults to 256 MiB.
+        :param parameters: Optional solver parameters that are part of the cache keys, so that solutions obtained
+            with different settings are not mixed up. Parameters applied directly to the native solver are not
+            tracked by the models. Defaults to None.
+        """
+        # Applies validations
+        if max_entries < 1:
+            raise ValueError("The number of entries of the cache must be a positive integer.")
+        if max_bytes < 1:
+            raise ValueError("The size of the on-disk store must be a positive integer.")
+
+        # Instance attributes
+        self._max_entries: int = max_entries
+        """ The number of solutions kept in memory. """
+
+        self._path: str | None = fspath(path) if path is not None else None
+        """ The directory of the on-disk store, if any. """
+
+        self._max_bytes: int = max_bytes
+        """ The maximum total size of the solution files on disk. """
+
+        self._parameters: str = json.dumps(dict(parameters or {}), sort_keys=True, default=str)
+        """ The serialized solver parameters that are part of the cache keys. """
+
+        self._entries: OrderedDict[str, Solution] = OrderedDict()
+        """ The solutions kept in memory, from the least to the most recently used. """
+
+        self._hits: int = 0
+        """ The number of lookups that found a solution. """
+
+        self._misses: int = 0
+        """ The number of lookups that did not find a solution. """
+
+        if self._path is not None:
+            os.makedirs(self._path, exist_ok=True)
+
+    def key(self, fingerprint: str, engine: str) -> str:
+        """
+        Builds the cache key of a model.
+        :param fingerprint: The fingerprint of the model.
+        :param engine: The name of the engine of the model.
+        :return: A hexadecimal string with the key.
+        """
+        return blake2b(f"{fingerprint}|{engine}|{self._parameters}".encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Solution | None:
+        """
+        Retrieves a solution from the cache, first in memory and then on disk.
+        :param key: The cache key of the model.
+        :return: The cached solution, or None if there is none.
+        """
+        solution: Solution | None = self._entries.get(key)
+        if solution is not None:
+            self._entries.move_to_end(key)
+        elif self._path is not None:
+            solution = self.__read(key=key)
+            if solution is not None:
+                self.__remember(key=key, solution=solution)
+
+        if solution is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return solution
+
+    def put(self, key: str, solution: Solution) -> None:
+        """
+        Stores a solution in the cache.
+        :param key: The cache key of the model.
+        :param solution: The solution of the model.
+        :return: None.
+        """
+        self.__remember(key=key, solution=solution)
+        if self._path is not None:
+            file_path: str = self.__file_path(key=key)
+            temporary_path: str = f"{file_path}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(solution.to_dict(), file)
+            os.replace(temporary_path, file_path)
+            self.__evict_files()
+
+    def clear(self) -> None:
+        """
+        Removes all the solutions of the cache, in memory and on disk.
+        :return: None.
+        """
+        self._entries.clear()
+        for file_path, _, _ in self.__files():
+            os.remove(file_path)
+
+    def __remember(self, key: str, solution: Solution) -> None:
+        """
+        Keeps a solution in memory, evicting the least recently used one if the cache is full.
+        :param key: The cache key of the model.
+        :param solution: The solution of the model.
+        :return: None.
+        """
+        self._entries[key] = solution
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __read(self, key: str) -> Solution | None:
+        """
+        Reads a solution from disk, marking its file as recently used.
+        :param key: The cache key of the model.
+        :return: The solution, or None if it is not stored or cannot be read.
+        """
+        file_path: str = self.__file_path(key=key)
+        try:
+            with open(file_path, "r", encoding="utf-8") as file:
+                solution: Solution = Solution.from_dict(json.load(file))
+            os.utime(file_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return solution
+
+    def __file_path(self, key: str) -> str:
+        """
+        Retrieves the path of the file of a solution.
+        :param key: The cache key of the model.
+        :return: The path of the file.
+        """
+        return os.path.join(self._path or "", f"{key}.json")
+
+    def __files(self) -> List[Tuple[str, float, int]]:
+        """
+        Lists the solution files on disk.
+        :return: A list with the path, modification time and size of each file.
+        """
+        if self._path is None:
+            return []
+        files: List[Tuple[str, float, int]] = []
+        with os.scandir(self._path) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".json"):
+                    stat: os.stat_result = entry.stat()
+                    files.append((entry.path, stat.st_mtime, stat.st_size))
+        return files
+
+    def __evict_files(self) -> None:
+        """
+        Removes the least recently used solution files until their total size fits the limit.
+        :return: None.
+        """
+        files: List[Tuple[str, float, int]] = self.__files()
+        total: int = sum(size for _, _, size in files)
+        for file_path, _, size in sorted(files, key=lambda file: file[1]):
+            if total <= self._max_bytes:
+                break
+            os.remove(file_path)
+            total -= size
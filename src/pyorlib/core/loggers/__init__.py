@@ -1,2 +1,3 @@
+from .lazy_message import LazyMessage
 from .logger import Logger
 from .stdout_logger import StdOutLogger
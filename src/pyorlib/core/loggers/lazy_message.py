@@ -0,0 +1,34 @@
+from typing import Any, Callable, Dict, Tuple
+
+
+class LazyMessage:
+    """
+    Represents a log message argument whose text is computed only when the message is written.
+
+    Log messages accept %-style arguments, which are only converted to text if the message is written, so
+    messages discarded by the debug mode or by sampling cost almost nothing. The `LazyMessage` class extends
+    this to arguments that are expensive to compute, such as pretty strings of terms, by deferring a call until
+    the argument is converted to text.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_function", "_args", "_kwargs"]
+
+    def __init__(self, function: Callable[..., str], *args: Any, **kwargs: Any):
+        """
+        Initializes a new LazyMessage instance.
+        :param function: The function that computes the text of the argument.
+        :param args: The positional arguments of the function.
+        :param kwargs: The keyword arguments of the function.
+        """
+        self._function: Callable[..., str] = function
+        """ The function that computes the text of the argument. """
+
+        self._args: Tuple[Any, ...] = args
+        """ The positional arguments of the function. """
+
+        self._kwargs: Dict[str, Any] = kwargs
+        """ The keyword arguments of the function. """
+
+    def __str__(self) -> str:
+        return self._function(*self._args, **self._kwargs)
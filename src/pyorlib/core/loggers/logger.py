@@ -1,3 +1,5 @@
+from typing import Any
+
 from .stdout_logger import StdOutLogger
 
 
@@ -33,39 +35,43 @@ class Logger:
         self._debug = debug
         """ A flag indicating whether or not debug mode is enabled. """
 
-    def error(self, msg: str, action: str | None = None) -> None:
+    def error(self, msg: str, *args: Any, action: str | None = None) -> None:
         """
         Logs an ERROR level message.
-        :param msg: The message to be logged.
+        :param msg: The message to be logged, optionally with %-style placeholders.
+        :param args: The arguments of the placeholders of the message, formatted only if it is written.
         :param action: The action or method associated with the log. Defaults to None.
         :return: None
         """
-        StdOutLogger.error(msg=msg, name=self._name, action=action)
+        StdOutLogger.error(msg, *args, name=self._name, action=action)
 
-    def warning(self, msg: str, action: str | None = None) -> None:
+    def warning(self, msg: str, *args: Any, action: str | None = None) -> None:
         """
         Logs a WARNING level message.
-        :param msg: The message to be logged.
+        :param msg: The message to be logged, optionally with %-style placeholders.
+        :param args: The arguments of the placeholders of the message, formatted only if it is written.
         :param action: The action or method associated with the log. Defaults to None.
         :return: None
         """
-        StdOutLogger.warning(msg=msg, name=self._name, action=action)
+        StdOutLogger.warning(msg, *args, name=self._name, action=action)
 
-    def info(self, msg: str, action: str | None = None) -> None:
+    def info(self, msg: str, *args: Any, action: str | None = None) -> None:
         """
         Logs an INFO level message.
-        :param msg: The message to be logged.
+        :param msg: The message to be logged, optionally with %-style placeholders.
+        :param args: The arguments of the placeholders of the message, formatted only if it is written.
         :param action: The action or method associated with the log. Defaults to None.
         :return: None
         """
-        StdOutLogger.info(msg=msg, name=self._name, action=action)
+        StdOutLogger.info(msg, *args, name=self._name, action=action)
 
-    def debug(self, msg: str, action: str | None = None) -> None:
+    def debug(self, msg: str, *args: Any, action: str | None = None) -> None:
         """
         Logs a DEBUG level message.
-        :param msg: The message to be logged.
+        :param msg: The message to be logged, optionally with %-style placeholders.
+        :param args: The arguments of the placeholders of the message, formatted only if it is written.
         :param action: The action or method associated with the log. Defaults to None.
         :return: None
         """
         if self.debug_enabled:
-            StdOutLogger.debug(msg=msg, name=self._name, action=action)
+            StdOutLogger.debug(msg, *args, name=self._name, action=action)
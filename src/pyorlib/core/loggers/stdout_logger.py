@@ -1,15 +1,94 @@
+import atexit
+import re
 from abc import ABC
-from logging import StreamHandler, INFO, DEBUG, WARNING, ERROR, Formatter, getLogger
+from logging import StreamHandler, INFO, DEBUG, WARNING, ERROR, Formatter, Logger, LogRecord, getLogger
 from sys import stdout
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
 
 from ...core.constants import StdOutColors
 
+if TYPE_CHECKING:  # pragma: no cover
+    from logging.handlers import QueueListener
+
+
+class _TextFormatter(Formatter):
+    """
+    Formats records as colored text lines.
+    """
+
+    def __init__(self, level_color: str):
+        """
+        Initializes a new text formatter.
+        :param level_color: The color code of the log level of the records.
+        """
+        super().__init__(datefmt="%Y-%m-%d %I:%M:%S %p")
+        self._level_color: str = level_color
+        """ The color code of the log level of the records. """
+
+    def format(self, record: LogRecord) -> str:
+        level_color: str = self._level_color
+        log: str = StdOutLogger.Handler.build_log(
+            level=record.levelno,
+            msg=record.getMessage(),
+            name=getattr(record, "log_name", None),
+            action=getattr(record, "log_action", None),
+        )
+        return (
+            f"{level_color}[Logger] "
+            f"{StdOutColors.DEFAULT}{self.formatTime(record, self.datefmt)} "
+            f"{level_color}{record.levelname:>8} "
+            f"{level_color}{log}"
+        )
+
+
+class _JsonFormatter(Formatter):
+    """
+    Formats records as JSON lines, without color codes.
+    """
+
+    _COLOR_CODES: str = r"\033\[[0-9;]*m"
+    """ A pattern that matches ANSI color codes, compiled on first use by the `re` module cache. """
+
+    def format(self, record: LogRecord) -> str:
+        # JSON output is opt-in, so the json module is only imported when it is used.
+        import json
+
+        return json.dumps(
+            {
+                "time": record.created,
+                "level": record.levelname,
+                "name": getattr(record, "log_name", None),
+                "action": (getattr(record, "log_action", None) or "").strip(" :") or None,
+                "message": re.sub(self._COLOR_CODES, "", record.getMessage()),
+            }
+        )
+
+
+class _LevelFilter:
+    """
+    Accepts only the records of a single log level.
+    """
+
+    def __init__(self, level: int):
+        """
+        Initializes a new level filter.
+        :param level: The log level of the accepted records.
+        """
+        self._level: int = level
+        """ The log level of the accepted records. """
+
+    def filter(self, record: LogRecord) -> bool:
+        return record.levelno == self._level
+
 
 class StdOutLogger(ABC):
     """
     StdOutLogger is a simple logging interface for logging operations to the standard output.
 
     This class provides a straightforward logging interface for writing log messages to the standard output.
+    Messages accept %-style arguments, which are only formatted if the message is emitted. By default, messages
+    are written synchronously as colored text, and the `configure` method allows moving the formatting and the
+    I/O to a background thread, writing JSON lines instead, and sampling repetitive INFO and DEBUG events.
     """
 
     class Handler:
@@ -33,31 +112,22 @@ class StdOutLogger(ABC):
             return StdOutColors.DEFAULT  # pragma: no cover
 
         @classmethod
-        def get_stream_handler_by_level(cls, level: int) -> StreamHandler:  # type: ignore[type-arg]
+        def get_stream_handler_by_level(
+            cls, level: int, json_output: bool = False
+        ) -> StreamHandler:  # type: ignore[type-arg]
             """
             Returns a stream handler configured with the specified log level.
             :param level: The log level to set for the stream handler.
+            :param json_output: Whether the handler writes JSON lines instead of colored text. Defaults to False.
             :return: The configured stream handler.
             """
-            # Determine the color based on the log level
-            level_color: str = cls.get_color_by_level(level=level)
-
-            # Define the logger format
-            logger_format: str = (
-                f"{level_color}[Logger] "
-                f"{StdOutColors.DEFAULT}%(asctime)s "
-                f"{level_color}%(levelname)8s "
-                f"{level_color}%(message)s"
-            )
-
-            # Create a formatter with the logger format
-            formatter = Formatter(logger_format, datefmt="%Y-%m-%d %I:%M:%S %p")
-
             # Create a stream handler using sys.stdout as the stream
             stream_handler = StreamHandler(stream=stdout)
 
             # Set the formatter for the stream handler
-            stream_handler.setFormatter(fmt=formatter)
+            stream_handler.setFormatter(
+                fmt=_JsonFormatter() if json_output else _TextFormatter(level_color=cls.get_color_by_level(level=level))
+            )
 
             # Return the configured stream handler
             return stream_handler
@@ -96,52 +166,144 @@ class StdOutLogger(ABC):
     __debug_logger = getLogger(name="debug_logger")
     __debug_logger.setLevel(level=DEBUG)
 
-    # Add stream handlers to each logger
-    __error_logger.addHandler(hdlr=Handler.get_stream_handler_by_level(level=__error_logger.level))
-    __warning_logger.addHandler(hdlr=Handler.get_stream_handler_by_level(level=__warning_logger.level))
-    __info_logger.addHandler(hdlr=Handler.get_stream_handler_by_level(level=__info_logger.level))
-    __debug_logger.addHandler(hdlr=Handler.get_stream_handler_by_level(level=__debug_logger.level))
+    # Stream handlers are added on the first message or configuration, so importing the library stays cheap.
+    __configured: bool = False
+
+    # Background listener used in asynchronous mode, and sampling state of INFO and DEBUG events
+    __listener: "QueueListener | None" = None
+    __sample_rate: int = 1
+    __event_counts: Dict[Tuple[int, str | None], int] = {}
+
+    @classmethod
+    def configure(cls, asynchronous: bool = False, json_output: bool = False, sample_rate: int = 1) -> None:
+        """
+        Configures the output of all loggers. Pending messages are flushed before the new configuration applies.
+        :param asynchronous: Whether messages are handed to a queue and written by a background thread, so
+            that logging calls do not wait for the formatting and the I/O. Message arguments are still resolved
+            by the calling thread. Defaults to False.
+        :param json_output: Whether messages are written as JSON lines with the time, level, name, action and
+            message (without color codes) instead of colored text. Defaults to False.
+        :param sample_rate: Only one of every `sample_rate` INFO and DEBUG messages of each action is written,
+            starting with the first one. Errors and warnings are never sampled. Defaults to 1, for all messages.
+        :return: None
+        """
+        if sample_rate < 1:
+            raise ValueError("The sample rate must be a positive integer.")
+
+        cls.flush()
+        if cls.__listener is not None:
+            cls.__listener.stop()
+            cls.__listener = None
+
+        loggers: List[Logger] = [cls.__error_logger, cls.__warning_logger, cls.__info_logger, cls.__debug_logger]
+        stream_handlers: List[StreamHandler] = []  # type: ignore[type-arg]
+        for logger in loggers:
+            for handler in list(logger.handlers):
+                logger.removeHandler(hdlr=handler)
+            stream_handlers.append(cls.Handler.get_stream_handler_by_level(level=logger.level, json_output=json_output))
+
+        if asynchronous:
+            from logging.handlers import QueueHandler, QueueListener
+            from queue import SimpleQueue
+
+            # Queue handlers resolve the message arguments in the calling thread, since they may refer to solver
+            # objects. Each stream handler only writes the records of its own level, as the queue is shared.
+            queue: SimpleQueue[LogRecord] = SimpleQueue()
+            for logger, stream_handler in zip(loggers, stream_handlers):
+                stream_handler.addFilter(_LevelFilter(level=logger.level))
+                logger.addHandler(hdlr=QueueHandler(queue))
+            cls.__listener = QueueListener(queue, *stream_handlers)
+            cls.__listener.start()
+        else:
+            for logger, stream_handler in zip(loggers, stream_handlers):
+                logger.addHandler(hdlr=stream_handler)
+
+        cls.__sample_rate = sample_rate
+        cls.__configured = True
+        cls.__event_counts.clear()
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Waits until all queued messages are written, if the loggers are asynchronous.
+        :return: None
+        """
+        if cls.__listener is not None:
+            cls.__listener.stop()
+            cls.__listener.start()
 
     @classmethod
-    def error(cls, msg: str, name: str | None = None, action: str | None = None) -> None:
+    def __is_sampled_out(cls, level: int, action: str | None) -> bool:
+        """
+        Counts an INFO or DEBUG event and determines whether it is skipped by sampling.
+        :param level: The log level of the event.
+        :param action: The action associated with the event.
+        :return: True if the event must not be written, False otherwise.
+        """
+        if cls.__sample_rate == 1:
+            return False
+        key: Tuple[int, str | None] = (level, action)
+        count: int = cls.__event_counts.get(key, 0)
+        cls.__event_counts[key] = count + 1
+        return count % cls.__sample_rate != 0
+
+    @classmethod
+    def error(cls, msg: str, *args: Any, name: str | None = None, action: str | None = None) -> None:
         """
         Logs an ERROR level message.
-        :param msg: The message to be logged.
+        :param msg: The message to be logged, optionally with %-style placeholders.
+        :param args: The arguments of the placeholders of the message, formatted only if it is written.
         :param name: The name of the logger or class associated with the log. Defaults to None.
         :param action: The action or method associated with the log. Defaults to None.
         :return: None
         """
-        cls.__error_logger.error(cls.Handler.build_log(level=ERROR, msg=msg, name=name, action=action))
+        if not cls.__configured:
+            cls.configure()
+        cls.__error_logger.error(msg, *args, extra={"log_name": name, "log_action": action})
 
     @classmethod
-    def warning(cls, msg: str, name: str | None = None, action: str | None = None) -> None:
+    def warning(cls, msg: str, *args: Any, name: str | None = None, action: str | None = None) -> None:
         """
         Logs a WARNING level message.
-        :param msg: The message to be logged.
+        :param msg: The message to be logged, optionally with %-style placeholders.
+        :param args: The arguments of the placeholders of the message, formatted only if it is written.
         :param name: The name of the logger or class associated with the log. Defaults to None.
         :param action: The action or method associated with the log. Defaults to None.
         :return: None
         """
-        cls.__warning_logger.warning(cls.Handler.build_log(level=WARNING, msg=msg, name=name, action=action))
+        if not cls.__configured:
+            cls.configure()
+        cls.__warning_logger.warning(msg, *args, extra={"log_name": name, "log_action": action})
 
     @classmethod
-    def info(cls, msg: str, name: str | None = None, action: str | None = None) -> None:
+    def info(cls, msg: str, *args: Any, name: str | None = None, action: str | None = None) -> None:
         """
         Logs an INFO level message.
-        :param msg: The message to be logged.
+        :param msg: The message to be logged, optionally with %-style placeholders.
+        :param args: The arguments of the placeholders of the message, formatted only if it is written.
         :param name: The name of the logger or class associated with the log. Defaults to None.
         :param action: The action or method associated with the log. Defaults to None.
         :return: None
         """
-        cls.__info_logger.info(cls.Handler.build_log(level=INFO, msg=msg, name=name, action=action))
+        if not cls.__configured:
+            cls.configure()
+        if not cls.__is_sampled_out(level=INFO, action=action):
+            cls.__info_logger.info(msg, *args, extra={"log_name": name, "log_action": action})
 
     @classmethod
-    def debug(cls, msg: str, name: str | None = None, action: str | None = None) -> None:
+    def debug(cls, msg: str, *args: Any, name: str | None = None, action: str | None = None) -> None:
         """
         Logs a DEBUG level message.
-        :param msg: The message to be logged.
+        :param msg: The message to be logged, optionally with %-style placeholders.
+        :param args: The arguments of the placeholders of the message, formatted only if it is written.
         :param name: The name of the logger or class associated with the log. Defaults to None.
         :param action: The action or method associated with the log. Defaults to None.
         :return: None
         """
-        cls.__debug_logger.debug(cls.Handler.build_log(level=DEBUG, msg=msg, name=name, action=action))
+        if not cls.__configured:
+            cls.configure()
+        if not cls.__is_sampled_out(level=DEBUG, action=action):
+            cls.__debug_logger.debug(msg, *args, extra={"log_name": name, "log_action": action})
+
+
+atexit.register(StdOutLogger.flush)
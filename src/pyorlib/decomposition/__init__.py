@@ -0,0 +1,4 @@
+"""
+The Decomposition module in PyORlib provides decomposition methods, which solve models that are too large to be
+solved at once by splitting them into smaller models that are solved repeatedly and coordinated through cuts.
+"""
@@ -0,0 +1,9 @@
+"""
+The Benders module provides a Benders decomposition for two-stage models, where a master model with the
+first-stage decisions is refined with cuts generated by subproblems solved in parallel worker processes.
+"""
+
+from .benders_iteration import BendersIteration
+from .benders_result import BendersResult
+from .benders_subproblem import BendersSubproblem
+from .benders import Benders
@@ -0,0 +1,319 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from math import inf, isfinite
+from time import perf_counter
+from typing import Callable, List, Sequence, Tuple
+
+from ...algebra import Element, Expression
+from ...algebra.terms.variables import Variable
+from ...engines import Engine
+from ...enums import OptimizationType, SolutionStatus, ValueType
+from ...exceptions import AlgorithmException
+from ...model import Model
+from .benders_iteration import BendersIteration
+from .benders_result import BendersResult
+from .benders_subproblem import BendersSubproblem
+
+_worker_subproblems: List[BendersSubproblem] = []
+""" The subproblems owned by the current worker process. """
+
+
+def _initialize_worker(
+    engine_factory: Callable[[], Engine],
+    build: Callable[[Model, int, Sequence[Variable]], Element],
+    num_links: int,
+    indices: Sequence[int],
+) -> None:
+    """
+    Builds the subproblems owned by a worker process, which are kept for the lifetime of the process.
+    :param engine_factory: A callable that creates the engine of each subproblem.
+    :param build: The callable that builds each subproblem.
+    :param num_links: The number of first-stage variables.
+    :param indices: The indices of the subproblems owned by the worker.
+    :return: None.
+    """
+    _worker_subproblems[:] = [
+        BendersSubproblem(index=index, engine=engine_factory(), build=build, num_links=num_links) for index in indices
+    ]
+
+
+def _solve_in_worker(values: Sequence[float]) -> List[Tuple[int, SolutionStatus, float, List[float]]]:
+    """
+    Solves the subproblems owned by a worker process for a first-stage solution.
+    :param values: The values of the first-stage variables.
+    :return: A list with the index of each subproblem followed by its outcome (see `BendersSubproblem.solve`).
+    """
+    return [(subproblem.index, *subproblem.solve(values=values)) for subproblem in _worker_subproblems]
+
+
+class Benders:
+    """
+    Represents a Benders decomposition of a two-stage model.
+
+    The master model is declared by the user with the first-stage variables and constraints, while the objective
+    is given separately as the first-stage cost, to which the decomposition adds one variable per subproblem that
+    estimates its cost (multi-cut). Each subproblem is built once, by the `subproblem` callable, on a copy of the
+    first-stage variables that is fixed to the values of each master solution. Subproblems are solved in-process,
+    or in parallel by worker processes that build and keep their own subproblems, in which case the callables
+    must be picklable (e.g. module-level functions).
+
+    Each iteration solves the master model, whose objective value is a lower bound, and the subproblems for its
+    first-stage solution. Optimal subproblems yield optimality cuts and, when all of them are optimal, a feasible
+    solution whose cost is an upper bound. Infeasible subproblems yield feasibility cuts from the dual values of
+    their infeasibility. Cuts are built from the dual values of the fixed first-stage copies, so subproblems must
+    be linear models (the master can be a mixed-integer model), and they are added incrementally to the master
+    model. The decomposition stops when the bounds converge, or at the iteration or time limit.
+    """
+
+    # Strict class attributes.
+    __slots__ = [
+        "_master",
+        "_first_stage",
+        "_subproblem",
+        "_num_subproblems",
+        "_engine_factory",
+        "_workers",
+        "_tolerance",
+        "_max_iterations",
+        "_time_limit",
+        "_estimates",
+        "_subproblems",
+    ]
+
+    @property
+    def master(self) -> Model:
+        """
+        Retrieves the master model, with the cuts added so far.
+        :return: The master model.
+        """
+        return self._master
+
+    def __init__(
+        self,
+        master: Model,
+        first_stage: Sequence[Variable],
+        first_stage_cost: Element | float,
+        subproblem: Callable[[Model, int, Sequence[Variable]], Element],
+        num_subproblems: int,
+        engine_factory: Callable[[], Engine],
+        workers: int = 0,
+        recourse_lower_bound: float = 0.0,
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+        time_limit: float | None = None,
+    ):
+        """
+        Initializes a new Benders instance, adding the cost estimates of the subproblems to the master model and
+        setting its objective.
+        :param master: The master model, with the first-stage variables and constraints.
+        :param first_stage: The first-stage variables of the master model that are linked to the subproblems.
+        :param first_stage_cost: The cost of the first-stage decisions, which is minimized with the subproblems.
+        :param subproblem: A callable that receives the model of a subproblem, its index and the copies of the
+            first-stage variables, in the same order, adds the second-stage variables and constraints, and returns
+            the cost of the subproblem, weighted by its probability if it is a scenario.
+        :param num_subproblems: The number of subproblems.
+        :param engine_factory: A callable that creates the engine of each subproblem, with a linear solver.
+        :param workers: The number of worker processes that solve the subproblems. Defaults to 0, for solving
+            them in-process.
+        :param recourse_lower_bound: A lower bound of the cost of each subproblem, such as 0 for nonnegative costs,
+            which bounds the master model before the first cuts. Defaults to 0.
+        :param tolerance: The relative gap between the bounds at which the decomposition stops. Defaults to 1e-6.
+        :param max_iterations: The maximum number of iterations. Defaults to 100.
+        :param time_limit: An optional time budget in seconds, checked after each iteration. Defaults to None.
+        """
+        # Applies validations
+        if num_subproblems < 1:
+            raise AlgorithmException("The number of subproblems must be a positive integer.")
+        if workers < 0:
+            raise AlgorithmException("The number of workers must be a non-negative integer.")
+        if max_iterations < 1:
+            raise AlgorithmException("The maximum number of iterations must be a positive integer.")
+
+        estimates: List[Variable] = [
+            master.add_variable_to_set("benders_recourse", (k,), None, ValueType.CONTINUOUS, recourse_lower_bound, inf)
+            for k in range(num_subproblems)
+        ]
+        master.set_objective(OptimizationType.MINIMIZE, Expression.sum([first_stage_cost, *estimates]))
+
+        # Instance attributes
+        self._master: Model = master
+        """ The master model. """
+
+        self._first_stage: Tuple[Variable, ...] = tuple(first_stage)
+        """ The first-stage variables linked to the subproblems. """
+
+        self._subproblem: Callable[[Model, int, Sequence[Variable]], Element] = subproblem
+        """ The callable that builds each subproblem. """
+
+        self._num_subproblems: int = num_subproblems
+        """ The number of subproblems. """
+
+        self._engine_factory: Callable[[], Engine] = engine_factory
+        """ The callable that creates the engine of each subproblem. """
+
+        self._workers: int = min(workers, num_subproblems)
+        """ The number of worker processes, or 0 for solving the subproblems in-process. """
+
+        self._tolerance: float = tolerance
+        """ The relative gap between the bounds at which the decomposition stops. """
+
+        self._max_iterations: int = max_iterations
+        """ The maximum number of iterations. """
+
+        self._time_limit: float | None = time_limit
+        """ The time budget in seconds, if any. """
+
+        self._estimates: Tuple[Variable, ...] = tuple(estimates)
+        """ The variables of the master model that estimate the cost of each subproblem. """
+
+        self._subproblems: List[BendersSubproblem] = []
+        """ The subproblems solved in-process, built on the first run. """
+
+    def run(self) -> BendersResult:
+        """
+        Runs the decomposition until the bounds converge or a limit is reached. Cuts are kept in the master model,
+        so a later run continues from them.
+        :return: The result of the decomposition.
+        """
+        start: float = perf_counter()
+        executors: List[ProcessPoolExecutor] = self.__start_workers()
+        iterations: List[BendersIteration] = []
+        status: SolutionStatus = SolutionStatus.NOT_SOLVED
+        lower_bound: float = -inf
+        upper_bound: float = inf
+        incumbent: Tuple[float, ...] = ()
+        try:
+            for iteration in range(1, self._max_iterations + 1):
+                master: Model = self._master
+                master.solve()
+                if master.solution_status != SolutionStatus.OPTIMAL:
+                    status = master.solution_status
+                    break
+
+                lower_bound = master.objective_value or 0.0
+                values: List[float] = master.get_values(terms=self._first_stage)
+                estimates: List[float] = master.get_values(terms=self._estimates)
+                outcomes: List[Tuple[int, SolutionStatus, float, List[float]]] = self.__solve_subproblems(
+                    executors=executors, values=values
+                )
+
+                optimality_cuts: int = 0
+                feasibility_cuts: int = 0
+                feasible: bool = True
+                for index, outcome, value, duals in outcomes:
+                    if outcome == SolutionStatus.OPTIMAL:
+                        if value > estimates[index] + self._tolerance * max(1.0, abs(value)):
+                            master.add_constraint(
+                                self._estimates[index] - self.__linearization(duals=duals)
+                                >= value - sum(dual * x for dual, x in zip(duals, values))
+                            )
+                            optimality_cuts += 1
+                    elif outcome == SolutionStatus.INFEASIBLE:
+                        feasible = False
+                        if not any(dual != 0 for dual in duals):
+                            # The subproblem is infeasible for any first-stage solution.
+                            status = SolutionStatus.INFEASIBLE
+                            break
+                        master.add_constraint(
+                            self.__linearization(duals=duals) <= sum(dual * x for dual, x in zip(duals, values)) - value
+                        )
+                        feasibility_cuts += 1
+                    else:
+                        status = SolutionStatus.ERROR
+                        break
+                if status in (SolutionStatus.INFEASIBLE, SolutionStatus.ERROR):
+                    break
+
+                if feasible:
+                    cost: float = lower_bound - sum(estimates) + sum(value for _, _, value, _ in outcomes)
+                    if cost < upper_bound:
+                        upper_bound, incumbent = cost, tuple(values)
+
+                elapsed_time: float = perf_counter() - start
+                iterations.append(
+                    BendersIteration(
+                        iteration=iteration,
+                        lower_bound=lower_bound,
+                        upper_bound=upper_bound,
+                        optimality_cuts=optimality_cuts,
+                        feasibility_cuts=feasibility_cuts,
+                        elapsed_time=elapsed_time,
+                    )
+                )
+
+                converged: bool = isfinite(upper_bound) and (
+                    upper_bound - lower_bound <= self._tolerance * max(1.0, abs(upper_bound))
+                )
+                if converged or optimality_cuts + feasibility_cuts == 0:
+                    status = SolutionStatus.OPTIMAL
+                    break
+                if self._time_limit is not None and elapsed_time >= self._time_limit:
+                    break
+        finally:
+            for executor in executors:
+                executor.shutdown()
+
+        if status == SolutionStatus.NOT_SOLVED and isfinite(upper_bound):
+            status = SolutionStatus.FEASIBLE
+        return BendersResult(
+            status=status,
+            objective_value=upper_bound if isfinite(upper_bound) else None,
+            lower_bound=lower_bound,
+            values=incumbent,
+            iterations=tuple(iterations),
+        )
+
+    def __linearization(self, duals: Sequence[float]) -> Element:
+        """
+        Builds the linear term of a cut, the dual-weighted sum of the first-stage variables.
+        :param duals: The dual value of each first-stage variable.
+        :return: An expression with the linear term of the cut.
+        """
+        return Expression.sum(dual * x for dual, x in zip(duals, self._first_stage) if dual != 0)
+
+    def __start_workers(self) -> List[ProcessPoolExecutor]:
+        """
+        Starts the worker processes, each of which owns a share of the subproblems, or builds the in-process
+        subproblems if there are no workers.
+        :return: A list with an executor per worker process.
+        """
+        if self._workers == 0:
+            if not self._subproblems:
+                self._subproblems = [
+                    BendersSubproblem(
+                        index=index,
+                        engine=self._engine_factory(),
+                        build=self._subproblem,
+                        num_links=len(self._first_stage),
+                    )
+                    for index in range(self._num_subproblems)
+                ]
+            return []
+        return [
+            ProcessPoolExecutor(
+                max_workers=1,
+                initializer=_initialize_worker,
+                initargs=(
+                    self._engine_factory,
+                    self._subproblem,
+                    len(self._first_stage),
+                    range(worker, self._num_subproblems, self._workers),
+                ),
+            )
+            for worker in range(self._workers)
+        ]
+
+    def __solve_subproblems(
+        self, executors: List[ProcessPoolExecutor], values: Sequence[float]
+    ) -> List[Tuple[int, SolutionStatus, float, List[float]]]:
+        """
+        Solves all the subproblems for a first-stage solution.
+        :param executors: The executors of the worker processes, or an empty list to solve them in-process.
+        :param values: The values of the first-stage variables.
+        :return: A list with the index of each subproblem followed by its outcome, sorted by index.
+        """
+        if not executors:
+            return [(subproblem.index, *subproblem.solve(values=values)) for subproblem in self._subproblems]
+        futures: List[Future[List[Tuple[int, SolutionStatus, float, List[float]]]]] = [
+            executor.submit(_solve_in_worker, list(values)) for executor in executors
+        ]
+        return sorted((outcome for future in futures for outcome in future.result()), key=lambda outcome: outcome[0])
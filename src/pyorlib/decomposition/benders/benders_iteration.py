@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BendersIteration:
+    """
+    Represents the progress of a Benders decomposition after an iteration.
+    """
+
+    iteration: int
+    """ The number of the iteration, starting at 1. """
+
+    lower_bound: float
+    """ The objective value of the master model, a lower bound of the optimal value. """
+
+    upper_bound: float
+    """ The objective value of the best first-stage solution found so far, or infinity if there is none. """
+
+    optimality_cuts: int
+    """ The number of optimality cuts added to the master model in the iteration. """
+
+    feasibility_cuts: int
+    """ The number of feasibility cuts added to the master model in the iteration. """
+
+    elapsed_time: float
+    """ The wall time elapsed since the start of the run, in seconds. """
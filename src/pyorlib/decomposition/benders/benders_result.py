@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from math import inf
+from typing import Tuple
+
+from ...enums import SolutionStatus
+from .benders_iteration import BendersIteration
+
+
+@dataclass(frozen=True)
+class BendersResult:
+    """
+    Represents the outcome of a Benders decomposition.
+    """
+
+    status: SolutionStatus
+    """ The status of the decomposition: optimal if the bounds converged, feasible if it stopped early with a
+    first-stage solution, and infeasible if the master model became infeasible. """
+
+    objective_value: float | None
+    """ The objective value of the best first-stage solution, or None if there is none. """
+
+    lower_bound: float
+    """ The best lower bound of the optimal value. """
+
+    values: Tuple[float, ...]
+    """ The values of the first-stage variables of the best solution, in declaration order. """
+
+    iterations: Tuple[BendersIteration, ...]
+    """ The progress of the decomposition after each iteration. """
+
+    @property
+    def gap(self) -> float:
+        """
+        Retrieves the final gap between the bounds.
+        :return: The difference between the best objective value and the lower bound, or infinity if there is
+            no solution.
+        """
+        return self.objective_value - self.lower_bound if self.objective_value is not None else inf
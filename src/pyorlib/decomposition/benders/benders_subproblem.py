@@ -0,0 +1,130 @@
+from math import inf, nan
+from typing import Callable, List, Sequence, Tuple
+
+from ...algebra import Element, Expression
+from ...algebra.terms.variables import Variable
+from ...engines import Engine
+from ...enums import OptimizationType, SolutionStatus, ValueType
+from ...model import Model
+
+
+class BendersSubproblem:
+    """
+    Represents a subproblem of a Benders decomposition, built once and solved for each first-stage solution.
+
+    The model of a subproblem contains a copy of each first-stage variable (link), bound to an anchor variable
+    fixed to the value of the first-stage solution, so that changing the solution only changes the bounds of the
+    anchors, and the reduced costs of the anchors are the dual values of the solution. Each link also has two
+    elastic variables, fixed to zero, which are released to measure the infeasibility of the subproblem when the
+    solution is infeasible. The subproblem must be a linear model, since its cuts are built from dual values.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_index", "_model", "_anchors", "_elastic", "_objective"]
+
+    @property
+    def index(self) -> int:
+        """
+        Retrieves the index of the subproblem.
+        :return: An integer with the index of the subproblem.
+        """
+        return self._index
+
+    @property
+    def model(self) -> Model:
+        """
+        Retrieves the model of the subproblem.
+        :return: The model of the subproblem.
+        """
+        return self._model
+
+    def __init__(
+        self,
+        index: int,
+        engine: Engine,
+        build: Callable[[Model, int, Sequence[Variable]], Element],
+        num_links: int,
+    ):
+        """
+        Initializes a new BendersSubproblem instance.
+        :param index: The index of the subproblem.
+        :param engine: The engine of the model of the subproblem.
+        :param build: A callable that receives the model, the index of the subproblem and the copies of the
+            first-stage variables, adds the second-stage variables and constraints, and returns the cost of
+            the subproblem, which is minimized.
+        :param num_links: The number of first-stage variables.
+        """
+        model: Model = Model(engine=engine, name=f"benders_subproblem_{index}")
+        links: List[Variable] = []
+        anchors: List[Variable] = []
+        elastic: List[Variable] = []
+        for position in range(num_links):
+            link: Variable = model.add_variable_to_set(
+                "benders_link", (position,), None, ValueType.CONTINUOUS, -inf, inf
+            )
+            anchor: Variable = model.add_variable_to_set(
+                "benders_anchor", (position,), None, ValueType.CONTINUOUS, 0, 0
+            )
+            surplus: Variable = model.add_variable_to_set(
+                "benders_surplus", (position,), None, ValueType.CONTINUOUS, 0, 0
+            )
+            slack: Variable = model.add_variable_to_set("benders_slack", (position,), None, ValueType.CONTINUOUS, 0, 0)
+            model.add_constraint(link - anchor - surplus + slack == 0)
+            links.append(link)
+            anchors.append(anchor)
+            elastic.extend((surplus, slack))
+
+        objective: Element = build(model, index, links)
+        model.set_objective(OptimizationType.MINIMIZE, objective)
+
+        # Instance attributes
+        self._index: int = index
+        """ The index of the subproblem. """
+
+        self._model: Model = model
+        """ The model of the subproblem. """
+
+        self._anchors: List[Variable] = anchors
+        """ The variables fixed to the values of the first-stage solution. """
+
+        self._elastic: List[Variable] = elastic
+        """ The elastic variables of the links, fixed to zero unless measuring the infeasibility. """
+
+        self._objective: Element = objective
+        """ The cost of the subproblem. """
+
+    def solve(self, values: Sequence[float]) -> Tuple[SolutionStatus, float, List[float]]:
+        """
+        Solves the subproblem for a first-stage solution.
+        :param values: The values of the first-stage variables.
+        :return: A tuple with the status of the subproblem, its cost and the dual value of each first-stage
+            variable if it is optimal, or its infeasibility and the dual values of the infeasibility if it is
+            infeasible. The cost is NaN and the dual values are empty for other statuses.
+        """
+        model: Model = self._model
+        for anchor, value in zip(self._anchors, values):
+            model.set_variable_bounds(variable=anchor, lower_bound=value, upper_bound=value)
+        model.solve()
+
+        status: SolutionStatus = model.solution_status
+        if status == SolutionStatus.OPTIMAL:
+            return status, model.objective_value or 0.0, model.get_reduced_costs(variables=self._anchors)
+        if status != SolutionStatus.INFEASIBLE:
+            return status, nan, []
+
+        # Measures the infeasibility as the distance between the links and the solution.
+        for variable in self._elastic:
+            model.set_variable_bounds(variable=variable, lower_bound=0, upper_bound=inf)
+        model.set_objective(OptimizationType.MINIMIZE, Expression.sum(self._elastic))
+        model.solve()
+
+        result: Tuple[SolutionStatus, float, List[float]] = (
+            (SolutionStatus.INFEASIBLE, model.objective_value or 0.0, model.get_reduced_costs(variables=self._anchors))
+            if model.solution_status == SolutionStatus.OPTIMAL
+            else (model.solution_status, nan, [])
+        )
+
+        for variable in self._elastic:
+            model.set_variable_bounds(variable=variable, lower_bound=0, upper_bound=0)
+        model.set_objective(OptimizationType.MINIMIZE, self._objective)
+        return result
@@ -0,0 +1,9 @@
+"""
+The Colgen module provides a column generation for set-partitioning and set-covering style models, where the
+columns of a restricted master model are generated by pricing subproblems solved in parallel worker processes.
+"""
+
+from .column import Column
+from .column_generation_iteration import ColumnGenerationIteration
+from .column_generation_result import ColumnGenerationResult
+from .column_generation import ColumnGeneration
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from typing import Any, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    Represents a column proposed by a pricing subproblem, as the coefficients of a new variable of the master
+    model in its objective and in its existing constraints.
+    """
+
+    cost: float
+    """ The coefficient of the column in the objective of the master model. """
+
+    rows: Tuple[int, ...]
+    """ The positions of the constraints of the master model where the column appears. """
+
+    coefficients: Tuple[float, ...]
+    """ The coefficient of the column in each constraint, in the same order. """
+
+    data: Any = None
+    """ Optional data of the column, such as the pattern it represents, which must be picklable when the
+    pricing subproblems run in worker processes. """
+
+    def reduced_cost(self, duals: Sequence[float]) -> float:
+        """
+        Computes the reduced cost of the column.
+        :param duals: The dual value of each constraint of the master model.
+        :return: The cost of the column minus the dual values weighted by its coefficients.
+        """
+        return self.cost - sum(duals[row] * coefficient for row, coefficient in zip(self.rows, self.coefficients))
@@ -0,0 +1,238 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from math import inf
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from ...algebra.terms.variables import Variable
+from ...enums import SolutionStatus, ValueType
+from ...exceptions import AlgorithmException
+from ...model import Model
+from .column import Column
+from .column_generation_iteration import ColumnGenerationIteration
+from .column_generation_result import ColumnGenerationResult
+
+
+class ColumnGeneration:
+    """
+    Represents a column generation over a restricted master model.
+
+    The master model is declared by the user as a linear minimization model with an initial set of columns that
+    makes it feasible, such as one pattern per item of a cutting stock model. Each iteration solves the master
+    model, extracts the dual values of all its constraints in a single call, and passes them to the pricing
+    subproblems, which propose new columns. The pricing subproblems run in-process or concurrently in a pool of
+    worker processes, in which case the pricing callable must be picklable (e.g. a module-level function). The
+    proposed columns with a negative reduced cost are added to the existing constraints of the master model with
+    `Model.add_column`, and the column generation stops when no such column is proposed, or at the iteration or
+    time limit. The added columns are continuous, so the result is the linear relaxation of the master model,
+    from which an integer solution can be derived (e.g. by solving a model over the generated columns).
+    """
+
+    # Strict class attributes.
+    __slots__ = [
+        "_master",
+        "_pricing",
+        "_num_pricing",
+        "_workers",
+        "_upper_bound",
+        "_tolerance",
+        "_max_columns",
+        "_max_iterations",
+        "_time_limit",
+        "_column_name",
+        "_columns",
+    ]
+
+    @property
+    def master(self) -> Model:
+        """
+        Retrieves the restricted master model, with the columns added so far.
+        :return: The master model.
+        """
+        return self._master
+
+    @property
+    def columns(self) -> Sequence[Tuple[Column, Variable]]:
+        """
+        Retrieves the columns added so far.
+        :return: A sequence with each added column and its variable in the master model, in order.
+        """
+        return self._columns
+
+    def __init__(
+        self,
+        master: Model,
+        pricing: Callable[[int, Sequence[float]], Iterable[Column]],
+        num_pricing: int = 1,
+        workers: int = 0,
+        upper_bound: float = inf,
+        tolerance: float = 1e-6,
+        max_columns: int | None = None,
+        max_iterations: int = 1000,
+        time_limit: float | None = None,
+        column_name: str = "column",
+    ):
+        """
+        Initializes a new ColumnGeneration instance.
+        :param master: The restricted master model, a feasible linear minimization model.
+        :param pricing: A callable that receives the index of a pricing subproblem and the dual value of each
+            constraint of the master model, in the order of `Model.constraints`, and returns the columns it
+            proposes, typically those with the most negative reduced costs.
+        :param num_pricing: The number of pricing subproblems. Defaults to 1.
+        :param workers: The number of worker processes that run the pricing subproblems. Defaults to 0, for
+            running them in-process.
+        :param upper_bound: The upper bound of the variables of the added columns. Defaults to infinity.
+        :param tolerance: The margin by which the reduced cost of a column must be negative for it to be added.
+            Defaults to 1e-6.
+        :param max_columns: The maximum number of columns added per iteration, those with the smallest reduced
+            costs. Defaults to None, for all the improving columns.
+        :param max_iterations: The maximum number of iterations. Defaults to 1000.
+        :param time_limit: An optional time budget in seconds, checked after each iteration. Defaults to None.
+        :param column_name: The prefix of the names of the added variables, which are numbered. Defaults to
+            'column'.
+        """
+        # Applies validations
+        if num_pricing < 1:
+            raise AlgorithmException("The number of pricing subproblems must be a positive integer.")
+        if workers < 0:
+            raise AlgorithmException("The number of workers must be a non-negative integer.")
+        if max_columns is not None and max_columns < 1:
+            raise AlgorithmException("The maximum number of columns per iteration must be a positive integer.")
+        if max_iterations < 1:
+            raise AlgorithmException("The maximum number of iterations must be a positive integer.")
+
+        # Instance attributes
+        self._master: Model = master
+        """ The restricted master model. """
+
+        self._pricing: Callable[[int, Sequence[float]], Iterable[Column]] = pricing
+        """ The callable that runs each pricing subproblem. """
+
+        self._num_pricing: int = num_pricing
+        """ The number of pricing subproblems. """
+
+        self._workers: int = min(workers, num_pricing)
+        """ The number of worker processes, or 0 for running the pricing subproblems in-process. """
+
+        self._upper_bound: float = upper_bound
+        """ The upper bound of the variables of the added columns. """
+
+        self._tolerance: float = tolerance
+        """ The margin by which the reduced cost of a column must be negative for it to be added. """
+
+        self._max_columns: int | None = max_columns
+        """ The maximum number of columns added per iteration, if any. """
+
+        self._max_iterations: int = max_iterations
+        """ The maximum number of iterations. """
+
+        self._time_limit: float | None = time_limit
+        """ The time budget in seconds, if any. """
+
+        self._column_name: str = column_name
+        """ The prefix of the names of the added variables. """
+
+        self._columns: List[Tuple[Column, Variable]] = []
+        """ The added columns and their variables in the master model. """
+
+    def run(self) -> ColumnGenerationResult:
+        """
+        Runs the column generation until no improving column is proposed or a limit is reached. Columns are
+        kept in the master model, so a later run continues from them.
+        :return: The result of the column generation.
+        """
+        start: float = perf_counter()
+        master: Model = self._master
+        iterations: List[ColumnGenerationIteration] = []
+        status: SolutionStatus = SolutionStatus.FEASIBLE
+        executor: ProcessPoolExecutor | None = (
+            ProcessPoolExecutor(max_workers=self._workers) if self._workers > 0 else None
+        )
+        try:
+            for iteration in range(1, self._max_iterations + 1):
+                master.solve()
+                if master.solution_status != SolutionStatus.OPTIMAL:
+                    status = master.solution_status
+                    break
+
+                objective_value: float = master.objective_value or 0.0
+                duals: List[float] = master.get_dual_values()
+                candidates: List[Tuple[float, Column]] = self.__price(executor=executor, duals=duals)
+                for _, column in candidates:
+                    self.__add_column(column=column)
+
+                elapsed_time: float = perf_counter() - start
+                iterations.append(
+                    ColumnGenerationIteration(
+                        iteration=iteration,
+                        objective_value=objective_value,
+                        columns_added=len(candidates),
+                        min_reduced_cost=candidates[0][0] if candidates else 0.0,
+                        elapsed_time=elapsed_time,
+                    )
+                )
+                if not candidates:
+                    status = SolutionStatus.OPTIMAL
+                    break
+                if self._time_limit is not None and elapsed_time >= self._time_limit:
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        # The columns of the last iteration are only part of the solution once the master model is solved again.
+        if status == SolutionStatus.FEASIBLE:
+            master.solve()
+            status = (
+                SolutionStatus.FEASIBLE if master.solution_status == SolutionStatus.OPTIMAL else master.solution_status
+            )
+
+        solved: bool = status in (SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE)
+        return ColumnGenerationResult(
+            status=status,
+            objective_value=master.objective_value if solved else None,
+            columns=tuple(column for column, _ in self._columns),
+            values=tuple(master.get_values(terms=[variable for _, variable in self._columns])) if solved else (),
+            iterations=tuple(iterations),
+        )
+
+    def __price(self, executor: ProcessPoolExecutor | None, duals: List[float]) -> List[Tuple[float, Column]]:
+        """
+        Runs the pricing subproblems and selects the distinct columns with a negative reduced cost.
+        :param executor: The pool of worker processes, or None to run the pricing subproblems in-process.
+        :param duals: The dual value of each constraint of the master model.
+        :return: A list with the reduced cost of each selected column and the column, by increasing reduced cost.
+        """
+        indices: range = range(self._num_pricing)
+        proposals: Iterable[Iterable[Column]] = (
+            map(self._pricing, indices, repeat(duals))
+            if executor is None
+            else executor.map(self._pricing, indices, repeat(duals))
+        )
+
+        candidates: Dict[Tuple[float, Tuple[int, ...], Tuple[float, ...]], Tuple[float, Column]] = {}
+        for columns in proposals:
+            for column in columns:
+                reduced_cost: float = column.reduced_cost(duals=duals)
+                if reduced_cost < -self._tolerance:
+                    candidates.setdefault((column.cost, column.rows, column.coefficients), (reduced_cost, column))
+
+        selected: List[Tuple[float, Column]] = sorted(candidates.values(), key=lambda candidate: candidate[0])
+        return selected[: self._max_columns] if self._max_columns is not None else selected
+
+    def __add_column(self, column: Column) -> None:
+        """
+        Adds a column to the master model.
+        :param column: The column to be added.
+        :return: None.
+        """
+        variable: Variable = self._master.add_column(
+            name=f"{self._column_name}_{len(self._columns)}",
+            value_type=ValueType.CONTINUOUS,
+            lower_bound=0,
+            upper_bound=self._upper_bound,
+            objective_coefficient=column.cost,
+            rows=column.rows,
+            coefficients=column.coefficients,
+        )
+        self._columns.append((column, variable))
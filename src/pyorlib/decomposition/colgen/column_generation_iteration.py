@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ColumnGenerationIteration:
+    """
+    Represents the progress of a column generation after an iteration.
+    """
+
+    iteration: int
+    """ The number of the iteration, starting at 1. """
+
+    objective_value: float
+    """ The objective value of the restricted master model, before the columns of the iteration were added. """
+
+    columns_added: int
+    """ The number of columns added to the master model in the iteration. """
+
+    min_reduced_cost: float
+    """ The smallest reduced cost of the proposed columns, or 0 if no column was proposed. """
+
+    elapsed_time: float
+    """ The wall time elapsed since the start of the run, in seconds. """
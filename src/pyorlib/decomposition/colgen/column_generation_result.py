@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from ...enums import SolutionStatus
+from .column import Column
+from .column_generation_iteration import ColumnGenerationIteration
+
+
+@dataclass(frozen=True)
+class ColumnGenerationResult:
+    """
+    Represents the outcome of a column generation.
+    """
+
+    status: SolutionStatus
+    """ The status of the column generation: optimal if no column with a negative reduced cost is left, feasible
+    if it stopped early, and the status of the master model if it could not be solved. """
+
+    objective_value: float | None
+    """ The objective value of the last restricted master model, or None if it could not be solved. """
+
+    columns: Tuple[Column, ...]
+    """ The columns added to the master model, in order. """
+
+    values: Tuple[float, ...]
+    """ The value of each added column in the last solution of the master model. """
+
+    iterations: Tuple[ColumnGenerationIteration, ...]
+    """ The progress of the column generation after each iteration. """
@@ -1,5 +1,5 @@
 from math import inf
-from typing import List, Any
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
 
 from ..engine import Engine
 from ...algebra import Element
@@ -10,8 +10,12 @@ from ...enums import SolutionStatus, ValueType, OptimizationType
 from ...exceptions import CplexException
 
 try:  # pragma: no cover
+    import cplex
     import docplex.mp.model as cpx
+    from docplex.mp.constants import ComparisonType
+    from docplex.mp.constr import LinearConstraint, RangeConstraint
     from docplex.mp.dvar import Var
+    from docplex.mp.solution import SolveSolution
     from docplex.mp.utils import DOcplexException
 except ImportError:  # pragma: no cover
     raise CplexException(
@@ -36,52 +40,52 @@ class CplexEngine(Engine):
         """
 
         # Strict class attributes.
-        __slots__ = ["_cplex_var"]
+        __slots__ = ()
 
         @property
         def name(self) -> str:
-            return str(self._cplex_var.name)
+            # Anonymous variables are named by CPLEX on demand.
+            name: str | None = self._raw.name
+            return str(name) if name is not None else str(self._raw.lp_name)
 
         @property
         def lower_bound(self) -> float:
-            lb = self._cplex_var.lb
+            lb = self._raw.lb
             return -inf if lb <= -1e20 else float(lb)
 
         @property
         def upper_bound(self) -> float:
-            ub = self._cplex_var.ub
+            ub = self._raw.ub
             return inf if ub >= 1e20 else float(ub)
 
         @property
         def value(self) -> float:
             try:
-                return float(self._cplex_var.solution_value)
+                return float(self._raw.solution_value)
             except DOcplexException:
                 return -0.0
 
-        @property
-        def raw(self) -> Any:
-            return self._cplex_var
-
         def __init__(
             self,
-            name: str,
+            name: str | None,
             solver: cpx.Model,
             value_type: ValueType,
             lower_bound: float = 0,
             upper_bound: float = inf,
+            id: int = -1,
         ):
             """
             Initializes a new `CplexVariable` object with the specified attributes and creates a corresponding CPLEX
             variable in the specified CPLEX solver.
-            :param name: The name of the variable.
+            :param name: The name of the variable, or None for an anonymous variable.
             :param solver: A reference to the CPLEX solver.
             :param value_type: An enumeration representing the type of the variable's value.
             :param lower_bound: The lower bound of the variable. Default is 0.
             :param upper_bound: The upper bound of the variable. Default is infinity.
+            :param id: The integer identifier of the variable within the engine. Default is -1 (unassigned).
             """
             # Calls the super init method and its validations
-            super().__init__(name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound)
+            super().__init__(name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound, id=id)
 
             # Applies new validations
             if solver is None:
@@ -104,7 +108,7 @@ class CplexEngine(Engine):
                 raise CplexException("Failed to create the CPLEX variable.")
 
             # Instance attributes
-            self._cplex_var: Var = cplex_var
+            self._raw = cplex_var
             """ A Cplex.Var object representing the variable in the CPLEX solver. """
 
     @property
@@ -158,23 +162,37 @@ class CplexEngine(Engine):
         self._solver: cpx.Model = solver if solver else cpx.Model(log_output=False)
         """ A reference to the CPLEX solver. """
 
+        self._num_variables: int = 0
+        """ The number of variables created through the engine, used to assign variable identifiers. """
+
+        self._incumbent_callback: Callable[[float], None] | None = None
+        """ The callable invoked with the objective value of each improving solution. """
+
+        self._lazy_constraint_callback: (
+            Callable[[Callable[[Sequence[Variable]], List[float]]], Sequence[Element]] | None
+        ) = None
+        """ The callable that returns the lazy constraints violated by each candidate incumbent. """
+
         if self._solver is None or not isinstance(self._solver, cpx.Model):
             raise CplexException("The CPLEX solver must be an instance of cpx.Model")
 
     def add_variable(
         self,
-        name: str,
+        name: str | None,
         value_type: ValueType,
         lower_bound: float = 0,
         upper_bound: float = inf,
     ) -> Variable:
-        return CplexEngine._Variable(
+        variable: Variable = CplexEngine._Variable(
             name=name,
             solver=self._solver,
             value_type=value_type,
             lower_bound=lower_bound,
             upper_bound=upper_bound,
+            id=self._num_variables,
         )
+        self._num_variables += 1
+        return variable
 
     def add_constraint(self, expression: Element) -> Element:
         self._solver.add_constraint(ct=expression.raw)
@@ -189,5 +207,169 @@ class CplexEngine(Engine):
             raise CplexException("Optimization type not supported.")
         return expression
 
+    def get_variable_key(self, variable: Variable) -> Any:
+        return variable.raw.index
+
+    def get_linear_constraint(self, expression: Element) -> Tuple[List[Any], List[float], float, float]:
+        return self.__decompose(constraint=expression.raw)
+
+    def get_range_constraint(self, expression: Element, lower_bound: float, upper_bound: float) -> Element:
+        return Expression(expression=self._solver.range_constraint(lb=lower_bound, expr=expression.raw, ub=upper_bound))
+
+    def iter_linear_constraints(self) -> Iterator[Tuple[List[Any], List[float], float, float]]:
+        for constraint in self._solver.iter_constraints():
+            yield self.__decompose(constraint=constraint)
+
+    @staticmethod
+    def __decompose(constraint: Any) -> Tuple[List[Any], List[float], float, float]:
+        """
+        Decomposes a CPLEX constraint into a linear row.
+        :param constraint: A linear or range constraint.
+        :return: A tuple with the variable keys, the coefficients, and the lower and upper bounds of the row.
+        """
+        keys: List[Any] = []
+        coefficients: List[float] = []
+        if isinstance(constraint, LinearConstraint):
+            for cplex_var, coefficient in constraint.iter_net_linear_coefs():
+                keys.append(cplex_var.index)
+                coefficients.append(float(coefficient))
+            rhs: float = float(constraint.cplex_num_rhs())
+            sense: ComparisonType = constraint.sense
+            lower_bound: float = rhs if sense in (ComparisonType.GE, ComparisonType.EQ) else -inf
+            upper_bound: float = rhs if sense in (ComparisonType.LE, ComparisonType.EQ) else inf
+            return keys, coefficients, lower_bound, upper_bound
+        elif isinstance(constraint, RangeConstraint):
+            for cplex_var, coefficient in constraint.expr.iter_terms():
+                keys.append(cplex_var.index)
+                coefficients.append(float(coefficient))
+            constant: float = float(constraint.expr.get_constant())
+            return keys, coefficients, float(constraint.lb) - constant, float(constraint.ub) - constant
+        else:
+            raise CplexException("Only linear constraints can be decomposed.")
+
+    def get_linear_objective(self) -> Tuple[List[Any], List[float], float, OptimizationType]:
+        opt_type: OptimizationType = (
+            OptimizationType.MAXIMIZE if self._solver.objective_sense.is_maximize() else OptimizationType.MINIMIZE
+        )
+        objective: Any = self._solver.get_objective_expr()
+        if objective is None:
+            return [], [], 0.0, opt_type
+        if objective.is_quad_expr():
+            raise CplexException("Only linear objectives can be decomposed.")
+        keys: List[Any] = []
+        coefficients: List[float] = []
+        for cplex_var, coefficient in objective.iter_terms():
+            keys.append(cplex_var.index)
+            coefficients.append(float(coefficient))
+        return keys, coefficients, float(objective.get_constant()), opt_type
+
     def solve(self) -> None:
-        self._solver.solve()
+        if self._incumbent_callback is None and self._lazy_constraint_callback is None:
+            self._solver.solve()
+            return
+
+        # Generic callbacks are invoked on every candidate incumbent, whereas progress listeners are only polled.
+        callback: Callable[[float], None] | None = self._incumbent_callback
+        separator: Callable[[Callable[[Sequence[Variable]], List[float]]], Sequence[Element]] | None = (
+            self._lazy_constraint_callback
+        )
+        decompose: Callable[[Element], Tuple[List[Any], List[float], float, float]] = self.get_linear_constraint
+        maximize: bool = self._solver.objective_sense.is_maximize()
+        best: List[float] = []
+
+        class CandidateCallback:
+            def invoke(self, context: Any) -> None:
+                if not (context.in_candidate() and context.is_candidate_point()):
+                    return
+                if separator is not None:
+                    point: List[float] = context.get_candidate_point()
+                    cuts: Sequence[Element] = separator(
+                        lambda variables: [float(point[variable.raw.index]) for variable in variables]
+                    )
+                    if cuts:
+                        # Rejected candidates are not incumbents, and ranges are rejected as a pair of rows.
+                        rows: List[Any] = []
+                        senses: List[str] = []
+                        rhs: List[float] = []
+                        for cut in cuts:
+                            keys, coefficients, lower_bound, upper_bound = decompose(cut)
+                            row: Any = cplex.SparsePair(ind=keys, val=coefficients)
+                            if lower_bound == upper_bound:
+                                rows.append(row)
+                                senses.append("E")
+                                rhs.append(lower_bound)
+                                continue
+                            if lower_bound > -inf:
+                                rows.append(row)
+                                senses.append("G")
+                                rhs.append(lower_bound)
+                            if upper_bound < inf:
+                                rows.append(row)
+                                senses.append("L")
+                                rhs.append(upper_bound)
+                        context.reject_candidate(constraints=rows, senses=senses, rhs=rhs)
+                        return
+                if callback is not None:
+                    objective_value: float = context.get_candidate_objective()
+                    if not best or (objective_value > best[0] if maximize else objective_value < best[0]):
+                        best[:] = [objective_value]
+                        callback(objective_value)
+
+        cplex_solver: Any = self._solver.get_cplex()
+        cplex_solver.set_callback(CandidateCallback(), cplex.callbacks.Context.id.candidate)
+        try:
+            self._solver.solve()
+        finally:
+            cplex_solver.set_callback(None, 0)
+
+    def set_variable_bounds(self, variable: Variable, lower_bound: float, upper_bound: float) -> None:
+        variable.raw.lb = lower_bound
+        variable.raw.ub = upper_bound
+
+    def set_start_values(self, variables: Sequence[Variable], values: Sequence[float]) -> None:
+        # MIP starts are only accepted by models with integer variables, which are the only ones that use them.
+        self._solver.clear_mip_starts()
+        if self._solver.number_of_integer_variables + self._solver.number_of_binary_variables > 0:
+            self._solver.add_mip_start(
+                SolveSolution(self._solver, {variable.raw: value for variable, value in zip(variables, values)})
+            )
+
+    def get_reduced_costs(self, variables: Sequence[Variable]) -> List[float]:
+        return list(self._solver.reduced_costs([variable.raw for variable in variables]))
+
+    def add_column(
+        self,
+        name: str | None,
+        value_type: ValueType,
+        lower_bound: float,
+        upper_bound: float,
+        objective_coefficient: float,
+        rows: Sequence[int],
+        coefficients: Sequence[float],
+    ) -> Variable:
+        variable: Variable = self.add_variable(
+            name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound
+        )
+        # The expressions of the constraints are replaced rather than modified in place, since they may be shared.
+        for row, coefficient in zip(rows, coefficients):
+            constraint: Any = self._solver.get_constraint_by_index(row)
+            constraint.lhs = constraint.lhs + coefficient * variable.raw
+        if objective_coefficient:
+            self._solver.set_objective_expr(self._solver.get_objective_expr() + objective_coefficient * variable.raw)
+        return variable
+
+    def get_dual_values(self) -> List[float]:
+        return list(self._solver.dual_values(list(self._solver.iter_linear_constraints())))
+
+    def set_incumbent_callback(self, callback: Callable[[float], None] | None) -> None:
+        self._incumbent_callback = callback
+
+    def set_lazy_constraint_callback(
+        self, callback: Callable[[Callable[[Sequence[Variable]], List[float]]], Sequence[Element]] | None
+    ) -> bool:
+        # Candidate incumbents are only rejected in the branch and bound of models with integer variables.
+        if self._solver.number_of_integer_variables + self._solver.number_of_binary_variables == 0:
+            self._lazy_constraint_callback = None
+            return False
+        self._lazy_constraint_callback = callback
+        return callback is not None
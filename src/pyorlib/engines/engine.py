@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
 from math import inf
-from typing import List
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
 
 from ..algebra import Element
 from ..algebra.terms.variables import Variable
 from ..enums import SolutionStatus, ValueType, OptimizationType
+from ..exceptions import EngineException
 
 
 class Engine(ABC):
@@ -25,8 +27,19 @@ class Engine(ABC):
     The `Engine` class defines a set of abstract methods that must be implemented by concrete engine classes. These
     methods include solving the optimization model, adding variables and constraints, setting the objective function,
     and configuring solver-specific parameters.
+
+    Engines can also be created by name through the `create` method, which imports the module of the solver only
+    when an engine of that solver is first requested.
     """
 
+    # The module and class of the engine of each backend, imported on first use.
+    __backends: Dict[str, Tuple[str, str]] = {
+        "cplex": ("pyorlib.engines.cplex", "CplexEngine"),
+        "gurobi": ("pyorlib.engines.gurobi", "GurobiEngine"),
+        "ortools": ("pyorlib.engines.ortools", "ORToolsEngine"),
+        "pulp": ("pyorlib.engines.pulp", "PuLPEngine"),
+    }
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -75,14 +88,15 @@ class Engine(ABC):
     @abstractmethod
     def add_variable(
         self,
-        name: str,
+        name: str | None,
         value_type: ValueType,
         lower_bound: float = 0,
         upper_bound: float = inf,
     ) -> Variable:
         """
         Add a new variable to the engine.
-        :param name: The name of the variable.
+        :param name: The name of the variable, or None to leave it unnamed in the solver, which then names it
+            on demand (e.g. when the model is exported by the solver).
         :param value_type: The value type of the variable.
         :param lower_bound: The lower bound of the variable. Default is 0.
         :param upper_bound: The upper bound of the variable. Default is infinity.
@@ -109,6 +123,52 @@ class Engine(ABC):
         """
         pass
 
+    def get_variable_key(self, variable: Variable) -> Any:
+        """
+        Get the key that identifies a variable in the linear decompositions of the engine.
+        :param variable: A variable created by the engine.
+        :return: A hashable key identifying the variable within the solver.
+        """
+        raise EngineException(f"The {self.name} does not support linear decompositions.")
+
+    def get_linear_constraint(self, expression: Element) -> Tuple[List[Any], List[float], float, float]:
+        """
+        Get the linear decomposition of a constraint expression, which does not need to be added to the engine.
+        :param expression: A linear constraint expression built from variables of the engine.
+        :return: A tuple with the variable keys, the coefficients, and the lower and upper bounds of the row
+            (constant terms are moved to the bounds, and missing bounds are infinite).
+        """
+        raise EngineException(f"The {self.name} does not support linear decompositions.")
+
+    def get_range_constraint(self, expression: Element, lower_bound: float, upper_bound: float) -> Element:
+        """
+        Get a range constraint that keeps a linear expression between two finite bounds as a single row, which
+        is not added to the engine. Engines whose solver has no ranged rows without auxiliary variables do not
+        support them, and ranges are then added as a pair of constraints.
+        :param expression: A linear expression built from variables of the engine.
+        :param lower_bound: The finite lower bound of the expression.
+        :param upper_bound: The finite upper bound of the expression, greater than the lower bound.
+        :return: The range constraint, to be added with `add_constraint`.
+        """
+        raise EngineException(f"The {self.name} does not support range constraints.")
+
+    def iter_linear_constraints(self) -> Iterator[Tuple[List[Any], List[float], float, float]]:
+        """
+        Iterate over the constraints of the engine as linear rows, read directly from the solver objects
+        without building intermediate expressions.
+        :return: An iterator of tuples with the variable keys, the coefficients, and the lower and upper
+            bounds of each row (constant terms are moved to the bounds, and missing bounds are infinite).
+        """
+        raise EngineException(f"The {self.name} does not support linear decompositions.")
+
+    def get_linear_objective(self) -> Tuple[List[Any], List[float], float, OptimizationType]:
+        """
+        Get the linear decomposition of the objective function.
+        :return: A tuple with the variable keys, the coefficients, the constant term and the
+            optimization type of the objective. An unset objective is returned as an empty minimization.
+        """
+        raise EngineException(f"The {self.name} does not support linear decompositions.")
+
     @abstractmethod
     def solve(self) -> None:
         """
@@ -116,3 +176,148 @@ class Engine(ABC):
         :return: None
         """
         pass
+
+    def begin_batch(self) -> None:
+        """
+        Start a batch of additions, during which the engine may defer per-call work, such as updating the
+        solver model, until `end_batch` is called. Variables and constraints added within a batch can be used
+        in expressions, but their solver attributes may not be available until the batch ends.
+        :return: None
+        """
+        pass
+
+    def end_batch(self) -> None:
+        """
+        End a batch of additions, applying the work deferred since `begin_batch` was called.
+        :return: None
+        """
+        pass
+
+    def set_variable_bounds(self, variable: Variable, lower_bound: float, upper_bound: float) -> None:
+        """
+        Change the bounds of a variable of the engine, such as to load new data into a model that is solved
+        repeatedly. Fixing a variable (equal bounds) is also the way to change right-hand sides that are
+        modeled as fixed variables.
+        :param variable: The variable whose bounds are changed.
+        :param lower_bound: The new lower bound of the variable.
+        :param upper_bound: The new upper bound of the variable.
+        :return: None
+        """
+        raise EngineException(f"The {self.name} does not support changing the bounds of variables.")
+
+    def set_start_values(self, variables: Sequence[Variable], values: Sequence[float]) -> None:
+        """
+        Provide a starting point for the next solve, such as the solution of a similar model. Starting points
+        are hints: engines whose solver does not accept them, or for which they do not apply, ignore them.
+        :param variables: The variables of the starting point.
+        :param values: The value of each variable, in the same order.
+        :return: None
+        """
+        pass
+
+    def get_reduced_costs(self, variables: Sequence[Variable]) -> List[float]:
+        """
+        Retrieve the reduced costs of variables after solving a linear model, which are the dual values of their
+        bounds: the rate at which the objective value changes with the bound of a variable that is at it.
+        :param variables: The variables whose reduced costs are retrieved.
+        :return: A list with the reduced cost of each variable, in the same order.
+        """
+        raise EngineException(f"The {self.name} does not support retrieving reduced costs.")
+
+    def add_column(
+        self,
+        name: str | None,
+        value_type: ValueType,
+        lower_bound: float,
+        upper_bound: float,
+        objective_coefficient: float,
+        rows: Sequence[int],
+        coefficients: Sequence[float],
+    ) -> Variable:
+        """
+        Add a new variable with coefficients in existing linear constraints and in the objective, such as a
+        column generated by a pricing problem.
+        :param name: The name of the variable, or None for an anonymous variable.
+        :param value_type: The type of the variable values.
+        :param lower_bound: The lower bound of the variable.
+        :param upper_bound: The upper bound of the variable.
+        :param objective_coefficient: The coefficient of the variable in the objective.
+        :param rows: The positions of the constraints where the variable appears, as in `constraints`.
+        :param coefficients: The coefficient of the variable in each constraint, in the same order.
+        :return: The variable that was added.
+        """
+        raise EngineException(f"The {self.name} does not support adding columns.")
+
+    def get_dual_values(self) -> List[float]:
+        """
+        Retrieve the dual values of all the linear constraints after solving a linear model, in a single call.
+        :return: A list with the dual value of each constraint, in the order of `constraints`.
+        """
+        raise EngineException(f"The {self.name} does not support retrieving dual values.")
+
+    def set_incumbent_callback(self, callback: Callable[[float], None] | None) -> None:
+        """
+        Set a callable invoked with the objective value of each improving solution found while solving.
+        Engines whose solver does not report intermediate solutions ignore the callback.
+        :param callback: The callable to be invoked, or None to remove the current one.
+        :return: None
+        """
+        pass
+
+    def set_lazy_constraint_callback(
+        self, callback: Callable[[Callable[[Sequence[Variable]], List[float]]], Sequence[Element]] | None
+    ) -> bool:
+        """
+        Set a callable invoked on each candidate incumbent found while solving, which receives a function that
+        retrieves the values of variables in the candidate and returns the linear constraints it violates. The
+        engine adds these constraints to the solver as lazy constraints, rejecting the candidate, without adding
+        them to the model. Engines whose solver does not support lazy constraints for the current model ignore
+        the callback.
+        :param callback: The callable to be invoked, or None to remove the current one.
+        :return: True if the callback is used by the next solves, or False if it is ignored.
+        """
+        return False
+
+    @classmethod
+    def from_option(cls, option: str | None = None, **kwargs: Any) -> "Engine":
+        """
+        Creates an engine of this class from the option of an engine specification (see `create`). Engines
+        that accept options override this method.
+        :param option: The option given after the backend name, or None if there is none.
+        :param kwargs: The keyword arguments of the engine constructor.
+        :return: The new engine.
+        """
+        if option:
+            raise EngineException(f"The {cls.__name__} does not support options: {option}")
+        return cls(**kwargs)
+
+    @staticmethod
+    def register(backend: str, module: str, class_name: str) -> None:
+        """
+        Registers a backend that can be created by name, replacing any backend registered with the same name.
+        :param backend: The name of the backend, case-insensitive.
+        :param module: The fully qualified name of the module that defines the engine class.
+        :param class_name: The name of the engine class.
+        :return: None
+        """
+        if not backend or ":" in backend:
+            raise EngineException(f"Invalid backend name: {backend}")
+        Engine.__backends[backend.lower()] = (module, class_name)
+
+    @staticmethod
+    def create(spec: str, **kwargs: Any) -> "Engine":
+        """
+        Creates an engine by name, importing the module of its solver on first use.
+        :param spec: The name of the backend (`cplex`, `gurobi`, `ortools`, `pulp`, or a registered one),
+            optionally followed by a colon and an option, such as the solver of OR-Tools (e.g. `"ortools:SCIP"`).
+        :param kwargs: The keyword arguments of the engine constructor.
+        :return: The new engine.
+        """
+        backend, _, option = spec.partition(":")
+        entry: Tuple[str, str] | None = Engine.__backends.get(backend.strip().lower())
+        if entry is None:
+            raise EngineException(f"Unknown engine backend: {backend}")
+
+        module_name, class_name = entry
+        engine_class: type[Engine] = getattr(import_module(module_name), class_name)
+        return engine_class.from_option(option=option.strip() or None, **kwargs)
@@ -1,5 +1,5 @@
 from math import inf
-from typing import List, Any
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
 
 from ..engine import Engine
 from ...algebra import Element
@@ -33,53 +33,51 @@ class GurobiEngine(Engine):
         It represents a variable that is compatible with the Gurobi solver.
         """
 
-        __slots__ = ["_gurobi_var"]
+        __slots__ = ()
 
         @property
         def name(self) -> str:
-            return str(self._gurobi_var.VarName)
+            return str(self._raw.VarName)
 
         @property
         def lower_bound(self) -> float:
-            lb = self._gurobi_var.getAttr("lb")
+            lb = self._raw.getAttr("lb")
             return -inf if lb == gp.GRB.INFINITY else float(lb) if lb != -0.0 else 0.0
 
         @property
         def upper_bound(self) -> float:
-            ub = self._gurobi_var.getAttr("ub")
+            ub = self._raw.getAttr("ub")
             return inf if ub == gp.GRB.INFINITY else float(ub) if ub != -0.0 else 0.0
 
         @property
         def value(self) -> float:
             try:
-                value = self._gurobi_var.getAttr("x")
+                value = self._raw.getAttr("x")
                 return float(value) if value != -0.0 else 0.0  # pragma: no cover
             except AttributeError:
                 return -0.0
 
-        @property
-        def raw(self) -> Any:
-            return self._gurobi_var
-
         def __init__(
             self,
-            name: str,
+            name: str | None,
             solver: gp.Model,
             value_type: ValueType,
             lower_bound: float = 0,
             upper_bound: float = inf,
+            id: int = -1,
         ):
             """
             Initializes a new `GurobiVariable` object with the specified attributes and creates a
             corresponding Gurobi variable.
-            :param name: The name of the variable.
+            :param name: The name of the variable, or None for an anonymous variable.
             :param solver: A reference to the Gurobi solver.
             :param value_type: An enumeration representing the type of the variable's value.
             :param lower_bound: The lower bound of the variable. Default is 0.
             :param upper_bound: The upper bound of the variable. Default is infinity.
+            :param id: The integer identifier of the variable within the engine. Default is -1 (unassigned).
             """
             # Calls the super init method and its validations
-            super().__init__(name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound)
+            super().__init__(name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound, id=id)
 
             # Applies new validations
             if solver is None:
@@ -89,13 +87,13 @@ class GurobiEngine(Engine):
             gurobi_var: gp.Var | None
 
             if self.value_type == ValueType.BINARY:
-                gurobi_var = solver.addVar(lb=0, ub=1, vtype=gp.GRB.BINARY, name=name, column=None, obj=0)
+                gurobi_var = solver.addVar(lb=0, ub=1, vtype=gp.GRB.BINARY, name=name or "", column=None, obj=0)
             elif self.value_type == ValueType.INTEGER:
                 gurobi_var = solver.addVar(
                     lb=lower_bound,
                     ub=upper_bound,
                     vtype=gp.GRB.INTEGER,
-                    name=name,
+                    name=name or "",
                     column=None,
                     obj=0,
                 )
@@ -104,7 +102,7 @@ class GurobiEngine(Engine):
                     lb=lower_bound,
                     ub=upper_bound,
                     vtype=gp.GRB.CONTINUOUS,
-                    name=name,
+                    name=name or "",
                     column=None,
                     obj=0,
                 )
@@ -116,14 +114,9 @@ class GurobiEngine(Engine):
                 raise GurobiException("Failed to create the Gurobi variable.")
 
             # Instance attributes
-            self._gurobi_var: gp.Var = gurobi_var
+            self._raw = gurobi_var
             """ A gp.Var object representing the variable in the Gurobi solver. """
 
-            # After creating the variable, we need to update the model in order
-            # to gain access to the newly created variable. This is necessary
-            # because Gurobi employs a lazy update approach.
-            solver.update()
-
     @property
     def name(self) -> str:  # pragma: no cover
         return "Gurobi Engine"
@@ -180,6 +173,20 @@ class GurobiEngine(Engine):
         self._solver: gp.Model = solver if solver else gp.Model()
         """ A reference to the Gurobi solver. """
 
+        self._num_variables: int = 0
+        """ The number of variables created through the engine, used to assign variable identifiers. """
+
+        self._incumbent_callback: Callable[[float], None] | None = None
+        """ The callable invoked with the objective value of each improving solution. """
+
+        self._lazy_constraint_callback: (
+            Callable[[Callable[[Sequence[Variable]], List[float]]], Sequence[Element]] | None
+        ) = None
+        """ The callable that returns the lazy constraints violated by each candidate incumbent. """
+
+        self._batch: bool = False
+        """ Whether a batch of additions is in progress, deferring the updates of the solver model. """
+
         if self._solver is None or not isinstance(self._solver, gp.Model):
             raise GurobiException("The Gurobi solver must be an instance of gp.Model")
 
@@ -187,20 +194,42 @@ class GurobiEngine(Engine):
 
     def add_variable(
         self,
-        name: str,
+        name: str | None,
         value_type: ValueType,
         lower_bound: float = 0,
         upper_bound: float = inf,
     ) -> Variable:
-        return GurobiEngine._Variable(
-            name=name, solver=self._solver, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound
+        variable: Variable = GurobiEngine._Variable(
+            name=name,
+            solver=self._solver,
+            value_type=value_type,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            id=self._num_variables,
         )
+        self._num_variables += 1
+
+        # After creating the variable, we need to update the model in order
+        # to gain access to the newly created variable. This is necessary
+        # because Gurobi employs a lazy update approach. Within a batch, a
+        # single update is applied when the batch ends.
+        if not self._batch:
+            self._solver.update()
+        return variable
 
     def add_constraint(self, expression: Element) -> Element:
         self._solver.addConstr(expression.raw, name="")
-        self._solver.update()
+        if not self._batch:
+            self._solver.update()
         return expression
 
+    def begin_batch(self) -> None:
+        self._batch = True
+
+    def end_batch(self) -> None:
+        self._batch = False
+        self._solver.update()
+
     def set_objective(self, opt_type: OptimizationType, expression: Element) -> Element:
         if opt_type == OptimizationType.MINIMIZE:
             self._solver.setObjective(expression.raw, gp.GRB.MINIMIZE)
@@ -211,5 +240,157 @@ class GurobiEngine(Engine):
         self._solver.update()
         return expression
 
+    def get_variable_key(self, variable: Variable) -> Any:
+        return variable.raw.index
+
+    def get_linear_constraint(self, expression: Element) -> Tuple[List[Any], List[float], float, float]:
+        if not isinstance(expression.raw, gp.TempConstr):
+            raise GurobiException("Only linear constraints can be decomposed.")
+        constraint: Any = expression.raw
+
+        # Temporary constraints keep both sides apart until they are added, and ranges store a pair of bounds.
+        # These attributes are private, so versions of gurobipy that store them differently are reported as
+        # not decomposable.
+        try:
+            lhs: Any = constraint._lhs
+            rhs: Any = constraint._rhs
+            sense: str = constraint._sense
+        except (AttributeError, TypeError) as error:
+            raise GurobiException("The constraint cannot be decomposed by this version of gurobipy.") from error
+        if isinstance(lhs, gp.QuadExpr) or isinstance(rhs, gp.QuadExpr) or sense not in ("<", ">", "="):
+            raise GurobiException("Only linear constraints can be decomposed.")
+
+        row: Any = gp.LinExpr(lhs)
+        lower_bound: float
+        upper_bound: float
+        if isinstance(rhs, (list, tuple)):
+            lower_bound, upper_bound = float(rhs[0]), float(rhs[1])
+        else:
+            row -= rhs
+            lower_bound = upper_bound = 0.0
+            if sense == gp.GRB.LESS_EQUAL:
+                lower_bound = -inf
+            elif sense == gp.GRB.GREATER_EQUAL:
+                upper_bound = inf
+        constant: float = row.getConstant()
+        size: int = row.size()
+        return (
+            [row.getVar(i).index for i in range(size)],
+            [row.getCoeff(i) for i in range(size)],
+            lower_bound - constant,
+            upper_bound - constant,
+        )
+
+    def iter_linear_constraints(self) -> Iterator[Tuple[List[Any], List[float], float, float]]:
+        if self._solver.NumQConstrs > 0 or self._solver.NumGenConstrs > 0:
+            raise GurobiException("Only linear constraints can be decomposed.")
+        for constraint in self._solver.getConstrs():
+            row: Any = self._solver.getRow(constraint)
+            size: int = row.size()
+            keys: List[Any] = [row.getVar(i).index for i in range(size)]
+            coefficients: List[float] = [row.getCoeff(i) for i in range(size)]
+            rhs: float = constraint.RHS
+            sense: str = constraint.Sense
+            yield keys, coefficients, rhs if sense != gp.GRB.LESS_EQUAL else -inf, (
+                rhs if sense != gp.GRB.GREATER_EQUAL else inf
+            )
+
+    def get_linear_objective(self) -> Tuple[List[Any], List[float], float, OptimizationType]:
+        objective: Any = self._solver.getObjective()
+        if not isinstance(objective, gp.LinExpr):
+            raise GurobiException("Only linear objectives can be decomposed.")
+        size: int = objective.size()
+        keys: List[Any] = [objective.getVar(i).index for i in range(size)]
+        coefficients: List[float] = [objective.getCoeff(i) for i in range(size)]
+        opt_type: OptimizationType = (
+            OptimizationType.MAXIMIZE if self._solver.ModelSense == gp.GRB.MAXIMIZE else OptimizationType.MINIMIZE
+        )
+        return keys, coefficients, objective.getConstant(), opt_type
+
     def solve(self) -> None:
-        self._solver.optimize()
+        if self._incumbent_callback is None and self._lazy_constraint_callback is None:
+            self._solver.optimize()
+            return
+
+        callback: Callable[[float], None] | None = self._incumbent_callback
+        separator: Callable[[Callable[[Sequence[Variable]], List[float]]], Sequence[Element]] | None = (
+            self._lazy_constraint_callback
+        )
+
+        def on_event(model: Any, where: int) -> None:
+            if where != gp.GRB.Callback.MIPSOL:
+                return
+            if separator is not None:
+                cuts: Sequence[Element] = separator(
+                    lambda variables: list(model.cbGetSolution([variable.raw for variable in variables]))
+                )
+                for cut in cuts:
+                    model.cbLazy(cut.raw)
+                if cuts:
+                    # Solutions that violate lazy constraints are rejected, so they are not incumbents.
+                    return
+            if callback is not None:
+                callback(model.cbGet(gp.GRB.Callback.MIPSOL_OBJ))
+
+        lazy_constraints: int = self._solver.Params.LazyConstraints
+        if separator is not None:
+            self._solver.Params.LazyConstraints = 1
+        try:
+            self._solver.optimize(on_event)
+        finally:
+            self._solver.Params.LazyConstraints = lazy_constraints
+
+    def set_variable_bounds(self, variable: Variable, lower_bound: float, upper_bound: float) -> None:
+        variable.raw.LB = lower_bound
+        variable.raw.UB = upper_bound
+        if not self._batch:
+            self._solver.update()
+
+    def set_start_values(self, variables: Sequence[Variable], values: Sequence[float]) -> None:
+        for variable, value in zip(variables, values):
+            variable.raw.Start = value
+        if not self._batch:
+            self._solver.update()
+
+    def get_reduced_costs(self, variables: Sequence[Variable]) -> List[float]:
+        return [variable.raw.RC for variable in variables]
+
+    def add_column(
+        self,
+        name: str | None,
+        value_type: ValueType,
+        lower_bound: float,
+        upper_bound: float,
+        objective_coefficient: float,
+        rows: Sequence[int],
+        coefficients: Sequence[float],
+    ) -> Variable:
+        variable: Variable = self.add_variable(
+            name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound
+        )
+        if self._batch:
+            self._solver.update()
+        constraints: List[Any] = self._solver.getConstrs()
+        for row, coefficient in zip(rows, coefficients):
+            self._solver.chgCoeff(constraints[row], variable.raw, coefficient)
+        variable.raw.Obj = objective_coefficient
+        if not self._batch:
+            self._solver.update()
+        return variable
+
+    def get_dual_values(self) -> List[float]:
+        return list(self._solver.getAttr("Pi", self._solver.getConstrs()))
+
+    def set_incumbent_callback(self, callback: Callable[[float], None] | None) -> None:
+        self._incumbent_callback = callback
+
+    def set_lazy_constraint_callback(
+        self, callback: Callable[[Callable[[Sequence[Variable]], List[float]]], Sequence[Element]] | None
+    ) -> bool:
+        # Solution callbacks, where lazy constraints are added, are only invoked for models with integer variables.
+        self._solver.update()
+        if self._solver.NumIntVars == 0:
+            self._lazy_constraint_callback = None
+            return False
+        self._lazy_constraint_callback = callback
+        return callback is not None
@@ -1,5 +1,5 @@
 from math import inf
-from typing import List, Any, Callable
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
 
 from ..engine import Engine
 from ...algebra import Element
@@ -7,9 +7,11 @@ from ...algebra.expressions import Expression
 from ...algebra.terms.variables import Variable
 from ...core.loggers import StdOutLogger
 from ...enums import SolutionStatus, ValueType, OptimizationType
-from ...exceptions import ORToolsException
+from ...exceptions import EngineException, ORToolsException
 
 try:  # pragma: no cover
+    from ortools.linear_solver.linear_solver_pb2 import MPModelProto
+    from ortools.linear_solver.python.linear_solver_natural_api import LinearConstraint, OFFSET_KEY
     from ortools.linear_solver.pywraplp import Solver, MPSolverParameters, Variable as ORToolsVar
 except ImportError:  # pragma: no cover
     raise ORToolsException(
@@ -33,52 +35,50 @@ class ORToolsEngine(Engine):
         It represents a variable that is compatible with the OR-Tools solver.
         """
 
-        __slots__ = ["_ortools_var", "_solution_status"]
+        __slots__ = ["_solution_status"]
 
         @property
         def name(self) -> str:
-            return str(self._ortools_var.name())
+            return str(self._raw.name())
 
         @property
         def lower_bound(self) -> float:
-            return float(self._ortools_var.lb())
+            return float(self._raw.lb())
 
         @property
         def upper_bound(self) -> float:
-            return float(self._ortools_var.ub())
+            return float(self._raw.ub())
 
         @property
         def value(self) -> float:
             if self._solution_status() in [SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE]:
-                return float(round(self._ortools_var.solution_value(), 6))
+                return float(round(self._raw.solution_value(), 6))
             else:
                 return -0.0
 
-        @property
-        def raw(self) -> Any:
-            return self._ortools_var
-
         def __init__(
             self,
-            name: str,
+            name: str | None,
             solver: Solver,
             value_type: ValueType,
             solution_status: Callable[[], SolutionStatus],
             lower_bound: float = 0,
             upper_bound: float = inf,
+            id: int = -1,
         ):
             """
             Initializes a new `ORToolsVariable` object with the specified attributes and creates a
             corresponding OR-Tools variable.
-            :param name: The name of the variable.
+            :param name: The name of the variable, or None for an anonymous variable.
             :param solver: A reference to the OR-Tools solver.
             :param value_type: An enumeration representing the type of the variable's value.
             :param solution_status: A callable function that returns the current solution status.
             :param lower_bound: The lower bound of the variable. Default is 0.
             :param upper_bound: The upper bound of the variable. Default is infinity.
+            :param id: The integer identifier of the variable within the engine. Default is -1 (unassigned).
             """
             # Calls the super init method and its validations
-            super().__init__(name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound)
+            super().__init__(name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound, id=id)
 
             # Applies new validations
             if solver is None:
@@ -88,11 +88,11 @@ class ORToolsEngine(Engine):
             ortools_var: ORToolsVar | None
 
             if self.value_type == ValueType.BINARY:
-                ortools_var = solver.BoolVar(name=name)
+                ortools_var = solver.BoolVar(name=name or "")
             elif self.value_type == ValueType.INTEGER:
-                ortools_var = solver.IntVar(name=name, lb=lower_bound, ub=upper_bound)
+                ortools_var = solver.IntVar(name=name or "", lb=lower_bound, ub=upper_bound)
             elif self.value_type == ValueType.CONTINUOUS:
-                ortools_var = solver.NumVar(name=name, lb=lower_bound, ub=upper_bound)
+                ortools_var = solver.NumVar(name=name or "", lb=lower_bound, ub=upper_bound)
             else:
                 raise ORToolsException("Unknown ValueType.")
 
@@ -107,7 +107,7 @@ class ORToolsEngine(Engine):
             self._solution_status: Callable[[], SolutionStatus] = solution_status
             """ A callable to check the current status of the solution. """
 
-            self._ortools_var: ORToolsVar = ortools_var
+            self._raw = ortools_var
             """ A pywraplp.Variable object representing the variable in the OR-Tools solver. """
 
     @property
@@ -163,6 +163,12 @@ class ORToolsEngine(Engine):
         self._solver: Solver = solver if solver else Solver.CreateSolver(solver_id="SCIP")
         """ A reference to the OR-Tools solver. """
 
+        self._num_variables: int = 0
+        """ The number of variables created through the engine, used to assign variable identifiers. """
+
+        self._get_solution_status: Callable[[], SolutionStatus] = lambda: self.solution_status
+        """ A callable, shared by all the engine's variables, that returns the current solution status. """
+
         # Set or tools configuration
         self._solver_params: MPSolverParameters = solver_params if solver_params else MPSolverParameters()
 
@@ -175,21 +181,42 @@ class ORToolsEngine(Engine):
         if self._solver_params is None:  # pragma: no cover
             raise ORToolsException("The OR-Tools params cannot be None.")
 
+    @classmethod
+    def from_option(cls, option: str | None = None, **kwargs: Any) -> Engine:
+        """
+        Creates an OR-Tools engine, using the option as the identifier of the backend solver (e.g. `SCIP`,
+        `GLOP` or `CBC`).
+        :param option: The identifier of the backend solver, or None to use SCIP.
+        :param kwargs: The keyword arguments of the engine constructor.
+        :return: The new engine.
+        """
+        if not option:
+            return cls(**kwargs)
+        if "solver" in kwargs:
+            raise EngineException("The OR-Tools solver cannot be given along with a solver option.")
+        solver: Solver | None = Solver.CreateSolver(solver_id=option)
+        if solver is None:
+            raise EngineException(f"Unsupported OR-Tools solver: {option}")
+        return cls(solver=solver, **kwargs)
+
     def add_variable(
         self,
-        name: str,
+        name: str | None,
         value_type: ValueType,
         lower_bound: float = 0,
         upper_bound: float = inf,
     ) -> Variable:
-        return ORToolsEngine._Variable(
+        variable: Variable = ORToolsEngine._Variable(
             name=name,
             solver=self._solver,
             value_type=value_type,
             lower_bound=lower_bound,
             upper_bound=upper_bound,
-            solution_status=lambda: self.solution_status,
+            solution_status=self._get_solution_status,
+            id=self._num_variables,
         )
+        self._num_variables += 1
+        return variable
 
     def add_constraint(self, expression: Element) -> Element:
         self._solver.Add(constraint=expression.raw)
@@ -204,5 +231,92 @@ class ORToolsEngine(Engine):
             raise ORToolsException("Optimization type not supported.")
         return expression
 
+    def get_variable_key(self, variable: Variable) -> Any:
+        return variable.raw.index()
+
+    def get_linear_constraint(self, expression: Element) -> Tuple[List[Any], List[float], float, float]:
+        constraint: Any = expression.raw
+        if not isinstance(constraint, LinearConstraint):
+            raise ORToolsException("Only linear constraints can be decomposed.")
+
+        # The natural API keeps the expression and bounds of a constraint private until it is extracted, so
+        # versions of OR-Tools that store them differently are reported as not decomposable.
+        try:
+            coefficients: Any = constraint._LinearConstraint__expr.GetCoeffs()  # type: ignore[attr-defined]
+            lower_bound: float = constraint._LinearConstraint__lb  # type: ignore[attr-defined]
+            upper_bound: float = constraint._LinearConstraint__ub  # type: ignore[attr-defined]
+        except (AttributeError, TypeError) as error:
+            raise ORToolsException("The constraint cannot be decomposed by this version of OR-Tools.") from error
+        constant: float = float(coefficients.pop(OFFSET_KEY, 0.0))
+        return (
+            [ortools_var.index() for ortools_var in coefficients],
+            [float(coefficient) for coefficient in coefficients.values()],
+            lower_bound - constant if lower_bound > -inf else -inf,
+            upper_bound - constant if upper_bound < inf else inf,
+        )
+
+    def get_range_constraint(self, expression: Element, lower_bound: float, upper_bound: float) -> Element:
+        return Expression(
+            expression=LinearConstraint(expression.raw, lower_bound, upper_bound)  # type: ignore[no-untyped-call]
+        )
+
+    def iter_linear_constraints(self) -> Iterator[Tuple[List[Any], List[float], float, float]]:
+        # OR-Tools only exposes the coefficients of a constraint through the model proto.
+        model: MPModelProto = MPModelProto()
+        self._solver.ExportModelToProto(model)
+        for constraint in model.constraint:
+            yield list(constraint.var_index), list(
+                constraint.coefficient
+            ), constraint.lower_bound, constraint.upper_bound
+
+    def get_linear_objective(self) -> Tuple[List[Any], List[float], float, OptimizationType]:
+        objective: Any = self._solver.Objective()
+        keys: List[Any] = []
+        coefficients: List[float] = []
+        for ortools_var in self._solver.variables():
+            coefficient: float = objective.GetCoefficient(ortools_var)
+            if coefficient != 0:
+                keys.append(ortools_var.index())
+                coefficients.append(coefficient)
+        opt_type: OptimizationType = (
+            OptimizationType.MAXIMIZE if objective.maximization() else OptimizationType.MINIMIZE
+        )
+        return keys, coefficients, float(objective.offset()), opt_type
+
+    def set_variable_bounds(self, variable: Variable, lower_bound: float, upper_bound: float) -> None:
+        variable.raw.SetBounds(lower_bound, upper_bound)
+
+    def set_start_values(self, variables: Sequence[Variable], values: Sequence[float]) -> None:
+        self._solver.SetHint([variable.raw for variable in variables], list(values))
+
+    def get_reduced_costs(self, variables: Sequence[Variable]) -> List[float]:
+        if self._solver.IsMip():
+            raise ORToolsException("Reduced costs are only available with linear solvers, such as GLOP.")
+        return [variable.raw.reduced_cost() for variable in variables]
+
+    def add_column(
+        self,
+        name: str | None,
+        value_type: ValueType,
+        lower_bound: float,
+        upper_bound: float,
+        objective_coefficient: float,
+        rows: Sequence[int],
+        coefficients: Sequence[float],
+    ) -> Variable:
+        variable: Variable = self.add_variable(
+            name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound
+        )
+        constraints: List[Any] = self._solver.constraints()
+        for row, coefficient in zip(rows, coefficients):
+            constraints[row].SetCoefficient(variable.raw, coefficient)
+        self._solver.Objective().SetCoefficient(variable.raw, objective_coefficient)
+        return variable
+
+    def get_dual_values(self) -> List[float]:
+        if self._solver.IsMip():
+            raise ORToolsException("Dual values are only available with linear solvers, such as GLOP.")
+        return [constraint.dual_value() for constraint in self._solver.constraints()]
+
     def solve(self) -> None:
         self._status = self._solver.Solve(self._solver_params)
@@ -1,5 +1,5 @@
 from math import inf
-from typing import List, Any
+from typing import Any, Iterator, List, Sequence, Tuple
 
 from ..engine import Engine
 from ...algebra import Element
@@ -20,6 +20,8 @@ try:  # pragma: no cover
         LpBinary,
         LpInteger,
         LpContinuous,
+        LpConstraint,
+        PULP_CBC_CMD,
     )
 except ImportError:  # pragma: no cover
     raise PuLPException("Optional dependency 'PuLP' not found.\nPlease install it using 'pip install pyorlib[pulp]'.")
@@ -42,55 +44,56 @@ class PuLPEngine(Engine):
         """
 
         # Strict class attributes.
-        __slots__ = ["_pulp_var"]
+        __slots__ = ()
 
         @property
         def name(self) -> str:
-            return str(self._pulp_var.name)
+            return str(self._raw.name)
 
         @property
         def lower_bound(self) -> float:
-            lb = self._pulp_var.lowBound
+            lb = self._raw.lowBound
             return float(lb) if lb is not None else -inf
 
         @property
         def upper_bound(self) -> float:
-            ub = self._pulp_var.upBound
+            ub = self._raw.upBound
             return float(ub) if ub is not None else inf
 
         @property
         def value(self) -> float:
-            val = self._pulp_var.value()
+            val = self._raw.value()
             return float(val) if val else -0.0
 
-        @property
-        def raw(self) -> Any:
-            return self._pulp_var
-
         def __init__(
             self,
-            name: str,
+            name: str | None,
             solver: LpProblem,
             value_type: ValueType,
             lower_bound: float = 0,
             upper_bound: float = inf,
+            id: int = -1,
         ):
             """
             Initializes a new `PuLPVariable` object with the specified attributes and creates a corresponding PuLP
             variable in the PuLP solver.
-            :param name: The name of the variable.
+            :param name: The name of the variable, or None for an anonymous variable.
             :param solver: A reference to the PuLP solver.
             :param value_type: An enumeration representing the type of the variable's value.
             :param lower_bound: The lower bound of the variable. Default is 0.
             :param upper_bound: The upper bound of the variable. Default is infinity.
+            :param id: The integer identifier of the variable within the engine. Default is -1 (unassigned).
             """
             # Calls the super init method and its validations
-            super().__init__(name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound)
+            super().__init__(name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound, id=id)
 
             # Applies new validations
             if solver is None:
                 raise PuLPException("The 'solver' argument cannot be None.")
 
+            # PuLP identifies variables by name, so anonymous variables are named after their identifier.
+            name = name if name is not None else f"_v{id}"
+
             # Creates the PuLP variable according to the value type
             pulp_var: LpVariable | None
 
@@ -118,7 +121,7 @@ class PuLPEngine(Engine):
                 raise PuLPException("Failed to create the PuLP variable.")
 
             # Instance attributes
-            self._pulp_var: LpVariable = pulp_var
+            self._raw = pulp_var
             """ A LpVariable object representing the variable in the PuLP solver. """
 
     @property
@@ -170,6 +173,9 @@ class PuLPEngine(Engine):
         self._solver: LpProblem = solver if solver else LpProblem()
         """ A reference to the PuLP solver. """
 
+        self._num_variables: int = 0
+        """ The number of variables created through the engine, used to assign variable identifiers. """
+
         if self._solver is None or not isinstance(self._solver, LpProblem):
             raise PuLPException("The PuLP solver cannot be None.")
 
@@ -179,20 +185,26 @@ class PuLPEngine(Engine):
         self._status: int = 0
         """ Represents the state of the solution. """
 
+        self._warm_start: bool = False
+        """ A flag indicating whether the next solves are warm-started from the initial values of the variables. """
+
     def add_variable(
         self,
-        name: str,
+        name: str | None,
         value_type: ValueType,
         lower_bound: float = 0,
         upper_bound: float = inf,
     ) -> Variable:
-        return PuLPEngine._Variable(
+        variable: Variable = PuLPEngine._Variable(
             name=name,
             solver=self._solver,
             value_type=value_type,
             lower_bound=lower_bound,
             upper_bound=upper_bound,
+            id=self._num_variables,
         )
+        self._num_variables += 1
+        return variable
 
     def add_constraint(self, expression: Element) -> Element:
         self._solver += expression.raw
@@ -209,6 +221,93 @@ class PuLPEngine(Engine):
         self._objective = expression.raw
         return expression
 
+    def get_variable_key(self, variable: Variable) -> Any:
+        return variable.raw.name
+
+    def get_linear_constraint(self, expression: Element) -> Tuple[List[Any], List[float], float, float]:
+        return self.__decompose(constraint=expression.raw)
+
+    def iter_linear_constraints(self) -> Iterator[Tuple[List[Any], List[float], float, float]]:
+        for constraint in self._solver.constraints.values():
+            yield self.__decompose(constraint=constraint)
+
+    @staticmethod
+    def __decompose(constraint: Any) -> Tuple[List[Any], List[float], float, float]:
+        """
+        Decomposes a PuLP constraint into a linear row.
+        :param constraint: A PuLP constraint.
+        :return: A tuple with the variable keys, the coefficients, and the lower and upper bounds of the row.
+        """
+        if not isinstance(constraint, LpConstraint):
+            raise PuLPException("Only linear constraints can be decomposed.")
+        keys: List[Any] = []
+        coefficients: List[float] = []
+        for pulp_var, coefficient in constraint.items():
+            keys.append(pulp_var.name)
+            coefficients.append(float(coefficient))
+
+        # PuLP keeps the right-hand side as a negated constant, and encodes <=, == and >= as -1, 0 and 1.
+        rhs: float = -float(constraint.constant)
+        sense: int = constraint.sense
+        return keys, coefficients, rhs if sense >= 0 else -inf, rhs if sense <= 0 else inf
+
+    def get_linear_objective(self) -> Tuple[List[Any], List[float], float, OptimizationType]:
+        opt_type: OptimizationType = (
+            OptimizationType.MAXIMIZE if self._solver.sense == LpMaximize else OptimizationType.MINIMIZE
+        )
+        if self._objective is None:
+            return [], [], 0.0, opt_type
+        objective: Any = self._solver.objective
+        keys: List[Any] = []
+        coefficients: List[float] = []
+        for pulp_var, coefficient in objective.items():
+            keys.append(pulp_var.name)
+            coefficients.append(float(coefficient))
+        return keys, coefficients, float(objective.constant), opt_type
+
+    def set_variable_bounds(self, variable: Variable, lower_bound: float, upper_bound: float) -> None:
+        variable.raw.lowBound = lower_bound if lower_bound > -inf else None
+        variable.raw.upBound = upper_bound if upper_bound < inf else None
+
+    def set_start_values(self, variables: Sequence[Variable], values: Sequence[float]) -> None:
+        for variable, start_value in zip(variables, values):
+            variable.raw.setInitialValue(start_value)
+        self._warm_start = True
+
+    def get_reduced_costs(self, variables: Sequence[Variable]) -> List[float]:
+        return [variable.raw.dj or 0.0 for variable in variables]
+
+    def add_column(
+        self,
+        name: str | None,
+        value_type: ValueType,
+        lower_bound: float,
+        upper_bound: float,
+        objective_coefficient: float,
+        rows: Sequence[int],
+        coefficients: Sequence[float],
+    ) -> Variable:
+        variable: Variable = self.add_variable(
+            name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound
+        )
+        constraints: List[Any] = list(self._solver.constraints.values())
+        for row, coefficient in zip(rows, coefficients):
+            constraints[row].addInPlace(coefficient * variable.raw)
+        if objective_coefficient:
+            if self._solver.objective is None:
+                self._solver.setObjective(objective_coefficient * variable.raw)
+            else:
+                self._solver.objective.addterm(variable.raw, objective_coefficient)
+            self._objective = self._solver.objective
+        return variable
+
+    def get_dual_values(self) -> List[float]:
+        return [constraint.pi or 0.0 for constraint in self._solver.constraints.values()]
+
     def solve(self) -> None:
-        solve_param = LpSolverDefault.msg = False
-        self._status = self._solver.solve(solve_param)
+        # CBC is given the values of the variables as a starting point, which are the start values or the last solution.
+        if self._warm_start:
+            self._status = self._solver.solve(PULP_CBC_CMD(msg=False, warmStart=True))
+        else:
+            solve_param = LpSolverDefault.msg = False
+            self._status = self._solver.solve(solve_param)
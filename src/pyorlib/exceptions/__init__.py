@@ -3,9 +3,15 @@ The Exceptions module in PyORlib provides a set of exception classes for handlin
 may occur during the usage of the library.
 """
 
+from .algorithm_exception import AlgorithmException
 from .cplex_exception import CplexException
+from .engine_exception import EngineException
 from .gurobi_exception import GurobiException
+from .loader_exception import LoaderException
 from .model_exception import ModelException
+from .numpy_exception import NumPyException
 from .ortools_exception import ORToolsException
+from .presolve_exception import PresolveException
 from .pulp_exception import PuLPException
 from .term_exception import TermException
+from .writer_exception import WriterException
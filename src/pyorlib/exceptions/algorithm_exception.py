@@ -0,0 +1,13 @@
+from ..core.exceptions import PyORlibException
+
+
+class AlgorithmException(PyORlibException):
+    """
+    An exception class for handling errors related to the solution algorithms of PyORlib.
+
+    The AlgorithmException class is a subclass of the CoreException class and is used to handle
+    exceptions raised by algorithms that solve models iteratively, such as decompositions and rolling horizons.
+    """
+
+    def __init__(self, message: str = "Algorithm exception"):
+        super().__init__(message)
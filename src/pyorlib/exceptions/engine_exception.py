@@ -0,0 +1,13 @@
+from ..core.exceptions import PyORlibException
+
+
+class EngineException(PyORlibException):
+    """
+    An exception class for handling errors related to the creation of engines in PyORlib.
+
+    The EngineException class is a subclass of the CoreException class and is used to handle
+    exceptions raised while creating engines by name, such as unknown backends or unsupported options.
+    """
+
+    def __init__(self, message: str = "Engine exception"):
+        super().__init__(message)
@@ -0,0 +1,13 @@
+from ..core.exceptions import PyORlibException
+
+
+class LoaderException(PyORlibException):
+    """
+    An exception class for handling errors related to the data loaders of PyORlib.
+
+    The LoaderException class is a subclass of the CoreException class and is used to handle
+    exceptions raised while reading and validating parameter values from files.
+    """
+
+    def __init__(self, message: str = "Loader exception"):
+        super().__init__(message)
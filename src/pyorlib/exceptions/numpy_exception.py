@@ -0,0 +1,13 @@
+from ..core.exceptions import PyORlibException
+
+
+class NumPyException(PyORlibException):
+    """
+    An exception class for handling errors related to the NumPy library.
+
+    The NumPyException class is a subclass of the CoreException class and is used to handle
+    exceptions specific to the NumPy library.
+    """
+
+    def __init__(self, message: str = "NumPy exception"):
+        super().__init__(message)
@@ -0,0 +1,13 @@
+from ..core.exceptions import PyORlibException
+
+
+class PresolveException(PyORlibException):
+    """
+    An exception class for handling errors related to the presolve stage of PyORlib.
+
+    The PresolveException class is a subclass of the CoreException class and is used to handle
+    exceptions raised while reducing models, such as infeasibilities detected before solving.
+    """
+
+    def __init__(self, message: str = "Presolve exception"):
+        super().__init__(message)
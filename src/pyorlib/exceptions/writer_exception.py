@@ -0,0 +1,13 @@
+from ..core.exceptions import PyORlibException
+
+
+class WriterException(PyORlibException):
+    """
+    An exception class for handling errors related to the model writers of PyORlib.
+
+    The WriterException class is a subclass of the CoreException class and is used to handle
+    exceptions raised while exporting models to files.
+    """
+
+    def __init__(self, message: str = "Writer exception"):
+        super().__init__(message)
@@ -0,0 +1,17 @@
+"""
+The IO module in PyORlib provides loaders that stream parameter values from files, validating them against
+their definitions as they are read, as well as writers and readers for models in the standard MPS and LP formats
+and in a binary snapshot format that is memory-mapped when loaded.
+
+The CSV loader only relies on the standard library, while the Parquet and NumPy loaders are available in the
+`pyorlib.io.parquet` and `pyorlib.io.npy` modules once their optional dependencies are installed.
+"""
+
+from .parameter_loader import ParameterLoader
+from .csv import CSVLoader
+from .model_writer import LinearObjective, LinearRow, ModelWriter
+from .model_record import ModelRecord
+from .model_reader import ModelReader
+from .mps import MPSReader, MPSWriter
+from .lp import LPReader, LPWriter
+from .snapshot import SnapshotReader, SnapshotWriter
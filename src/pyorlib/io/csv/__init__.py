@@ -0,0 +1 @@
+from .csv_loader import CSVLoader
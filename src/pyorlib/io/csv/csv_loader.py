@@ -0,0 +1,104 @@
+import csv
+from array import array
+from os import PathLike
+from typing import Any, Callable, List, Sequence
+
+from ..parameter_loader import Column, ParameterLoader
+from ...exceptions import LoaderException
+
+
+class CSVLoader(ParameterLoader):
+    """
+    A parameter loader for CSV files.
+
+    The `CSVLoader` class reads the file row by row with the standard `csv` module and stores the values of each
+    column in an `array.array` of doubles, so only the current chunk is held as Python floats at any time.
+    Columns are selected by their header name or by their position.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_delimiter", "_header", "_encoding"]
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        chunk_size: int = 1_000_000,
+        delimiter: str = ",",
+        header: bool = True,
+        encoding: str = "utf-8",
+    ):
+        """
+        Initializes a new CSVLoader instance.
+        :param path: The path of the CSV file.
+        :param chunk_size: The number of rows read and validated at once. Defaults to 1,000,000.
+        :param delimiter: The character that separates the fields of a row. Defaults to ",".
+        :param header: Whether the first row of the file contains the column names. Defaults to True.
+        :param encoding: The encoding of the file. Defaults to "utf-8".
+        """
+        super().__init__(path=path, chunk_size=chunk_size)
+
+        # Instance attributes
+        self._delimiter: str = delimiter
+        """ The character that separates the fields of a row. """
+
+        self._header: bool = header
+        """ Whether the first row of the file contains the column names. """
+
+        self._encoding: str = encoding
+        """ The encoding of the file. """
+
+    def _read(
+        self,
+        columns: Sequence[Column],
+        on_chunk: Callable[[int, Sequence[Sequence[float]]], None],
+    ) -> List[Sequence[float]]:
+        with open(self._path, newline="", encoding=self._encoding) as file:
+            reader: Any = csv.reader(file, delimiter=self._delimiter)
+            names: List[str] = next(reader, []) if self._header else []
+            positions: List[int] = [self.__position(column=column, names=names) for column in columns]
+
+            results: List[array[float]] = [array("d") for _ in columns]
+            chunks: List[array[float]] = [array("d") for _ in columns]
+            offset: int = 0
+
+            for row in reader:
+                if not row:
+                    continue
+                try:
+                    for chunk, position in zip(chunks, positions):
+                        chunk.append(float(row[position]))
+                except (ValueError, IndexError):
+                    raise LoaderException(f"Invalid or missing value at line {reader.line_num} of '{self._path}'.")
+
+                if len(chunks[0]) == self._chunk_size:
+                    on_chunk(offset, chunks)
+                    for result, chunk in zip(results, chunks):
+                        result.extend(chunk)
+                    offset += len(chunks[0])
+                    chunks = [array("d") for _ in columns]
+
+            if len(chunks[0]) > 0:
+                on_chunk(offset, chunks)
+                for result, chunk in zip(results, chunks):
+                    result.extend(chunk)
+
+        return list(results)
+
+    def __position(self, column: Column, names: List[str]) -> int:
+        """
+        Resolves the position of a column within the rows of the file.
+        :param column: A column name, a column position, or None for the first column.
+        :param names: The column names of the header.
+        :return: The position of the column.
+        """
+        if column is None:
+            return 0
+        if isinstance(column, int):
+            if column < 0:
+                raise LoaderException("Column positions cannot be negative.")
+            return column
+        if not self._header:
+            raise LoaderException("Columns can only be selected by name in files with a header.")
+        if column not in names:
+            raise LoaderException(f"Column '{column}' not found in '{self._path}'.")
+        return names.index(column)
@@ -0,0 +1,2 @@
+from .lp_writer import LPWriter
+from .lp_reader import LPReader
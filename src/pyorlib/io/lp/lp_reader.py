@@ -0,0 +1,352 @@
+import re
+from math import copysign, inf
+from typing import Dict, List, Pattern, Tuple
+
+from ..model_reader import ModelReader
+from ..model_record import ModelRecord
+from ...enums import OptimizationType, ValueType
+from ...exceptions import LoaderException
+
+
+class _Statement:
+    """
+    Accumulates the terms of an objective or constraint that may span several lines of an LP file.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["terms", "constant", "operator", "rhs", "_sign", "_number"]
+
+    def __init__(self) -> None:
+        self.terms: Dict[int, float] = {}
+        self.constant: float = 0.0
+        self.operator: str | None = None
+        self.rhs: float | None = None
+        self._sign: float = 1.0
+        self._number: float | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.terms and self.operator is None and self._number is None and self._sign == 1
+
+    def add_sign(self, text: str) -> None:
+        self.__flush_constant()
+        if text == "-":
+            self._sign = -self._sign
+
+    def add_number(self, value: float) -> None:
+        if self._number is not None:
+            raise LoaderException("Two consecutive numbers without an operator.")
+        if self.operator is not None:
+            self.rhs = self._sign * value
+        else:
+            self._number = self._sign * value
+        self._sign = 1.0
+
+    def add_term(self, column: int) -> None:
+        if self.operator is not None:
+            raise LoaderException("Variables are only allowed on the left-hand side of constraints.")
+        coefficient: float = self._number if self._number is not None else self._sign
+        self.terms[column] = self.terms.get(column, 0.0) + coefficient
+        self._sign, self._number = 1.0, None
+
+    def add_operator(self, text: str) -> None:
+        if self.operator is not None:
+            raise LoaderException("Ranged constraints are not supported by the LP format.")
+        self.__flush_constant()
+        self.operator = text
+        self._sign = 1.0
+
+    def close(self) -> None:
+        self.__flush_constant()
+
+    def __flush_constant(self) -> None:
+        if self._number is not None:
+            self.constant += self._number
+            self._number = None
+
+
+class LPReader(ModelReader):
+    """
+    A model reader for the CPLEX LP format.
+
+    The `LPReader` class is row oriented: each constraint is appended to the compressed sparse row layout of the
+    record as soon as its right-hand side is read, so only the terms of the current constraint are kept as
+    Python objects. Columns are numbered in order of appearance and, as in CPLEX, default to the bounds
+    [0, +infinity]. Values whose magnitude is at least 1e20 are read as infinite.
+
+    Quadratic terms, SOS and semi-continuous sections are not supported and raise an exception.
+    """
+
+    # Strict class attributes.
+    __slots__: List[str] = []
+
+    _TOKEN: Pattern[str] = re.compile(
+        r"\s*(?:(?P<operator>[<>]=?|=[<>]?)|(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|(?P<sign>[+-])"
+        r"|(?P<colon>:)|(?P<name>[^\s+\-*/^<>=:\[\]]+)|(?P<other>\S))"
+    )
+    """ The pattern of the tokens of an LP file. """
+
+    _SECTIONS: Dict[str, Pattern[str]] = {
+        "maximize": re.compile(r"max(?:imi[sz]e|imum)?", re.IGNORECASE),
+        "minimize": re.compile(r"min(?:imi[sz]e|imum)?", re.IGNORECASE),
+        "constraints": re.compile(r"subject\s+to|such\s+that|st\.?|s\.t\.", re.IGNORECASE),
+        "bounds": re.compile(r"bounds?", re.IGNORECASE),
+        "binaries": re.compile(r"bin(?:ar(?:y|ies))?", re.IGNORECASE),
+        "generals": re.compile(r"gen(?:erals?)?|integers?", re.IGNORECASE),
+        "unsupported": re.compile(
+            r"semi(?:s|-continuous)?|sos[12]?|lazy\s+constraints|user\s+cuts|general\s+constraints",
+            re.IGNORECASE,
+        ),
+        "end": re.compile(r"end", re.IGNORECASE),
+    }
+    """ The keywords of each section, which must appear alone on their line. """
+
+    _PROBLEM_NAME: Pattern[str] = re.compile(r"problem\s+name\s*:\s*(.*)", re.IGNORECASE)
+    """ The pattern of the comment that carries the name of the model. """
+
+    _INFINITY: float = 1e20
+    """ The magnitude from which values are read as infinite. """
+
+    def read(self) -> ModelRecord:
+        record: ModelRecord = ModelRecord()
+        columns: Dict[str, int] = {}
+        section: str | None = None
+        statement: _Statement = _Statement()
+
+        with self._open() as file:
+            for line_number, line in enumerate(file, start=1):
+                content, _, comment = line.partition("\\")
+                match = self._PROBLEM_NAME.match(comment.strip())
+                if match and not record.name:
+                    record.name = match.group(1).strip()
+
+                content = content.strip()
+                if not content:
+                    continue
+
+                keyword: str | None = self.__section(content)
+                if keyword is not None:
+                    if keyword == "unsupported":
+                        raise self._error(line_number, f"Unsupported section '{content}'.")
+                    if section in ("maximize", "minimize"):
+                        self.__finish_objective(record=record, statement=statement)
+                    elif section == "constraints" and not statement.is_empty:
+                        raise self._error(line_number, "Incomplete constraint.")
+                    if keyword in ("maximize", "minimize"):
+                        record.opt_type = (
+                            OptimizationType.MAXIMIZE if keyword == "maximize" else OptimizationType.MINIMIZE
+                        )
+                    section = keyword
+                    statement = _Statement()
+                    if section == "end":
+                        break
+                    continue
+
+                if section is None:
+                    raise self._error(line_number, "Expected an objective section.")
+
+                try:
+                    tokens: List[Tuple[str, str]] = self.__tokens(content)
+                    if section in ("maximize", "minimize", "constraints"):
+                        statement = self.__parse_statement(
+                            record=record,
+                            columns=columns,
+                            statement=statement,
+                            tokens=tokens,
+                            is_constraint=section == "constraints",
+                        )
+                    elif section == "bounds":
+                        self.__parse_bound(record=record, columns=columns, tokens=tokens)
+                    else:
+                        for kind, text in tokens:
+                            if kind != "name":
+                                raise LoaderException(f"Unexpected '{text}'.")
+                            column: int = self.__column(record=record, columns=columns, name=text)
+                            if section == "binaries":
+                                record.column_types[column] = ValueType.BINARY
+                                record.column_lower_bounds[column] = 0
+                                record.column_upper_bounds[column] = 1
+                            else:
+                                record.column_types[column] = ValueType.INTEGER
+                except LoaderException as e:
+                    raise self._error(line_number, str(e))
+
+        if section in ("maximize", "minimize"):
+            self.__finish_objective(record=record, statement=statement)
+        elif section == "constraints" and not statement.is_empty:
+            raise LoaderException(f"Incomplete constraint at the end of '{self._path}'.")
+
+        return record
+
+    def __section(self, content: str) -> str | None:
+        """
+        Retrieves the section started by a line, if any.
+        :param content: The content of the line, without comments and surrounding spaces.
+        :return: The name of the section, or None if the line is not a section keyword.
+        """
+        for keyword, pattern in self._SECTIONS.items():
+            if pattern.fullmatch(content):
+                return keyword
+        return None
+
+    def __tokens(self, content: str) -> List[Tuple[str, str]]:
+        """
+        Splits the content of a line into tokens.
+        :param content: The content of the line.
+        :return: A list of (kind, text) tuples.
+        """
+        tokens: List[Tuple[str, str]] = []
+        for match in self._TOKEN.finditer(content):
+            kind: str | None = match.lastgroup
+            if kind is None:
+                continue
+            if kind == "other":
+                raise LoaderException(f"Unsupported symbol '{match.group(kind)}'.")
+            tokens.append((kind, match.group(kind)))
+        return tokens
+
+    def __value(self, text: str) -> float:
+        """
+        Parses a number, reading large magnitudes as infinite.
+        :param text: The text to be parsed.
+        :return: The parsed number.
+        """
+        value: float = inf if text.lower() in ("inf", "infinity") else float(text)
+        return copysign(inf, value) if abs(value) >= self._INFINITY else value
+
+    @staticmethod
+    def __column(record: ModelRecord, columns: Dict[str, int], name: str) -> int:
+        """
+        Retrieves the position of a column, adding it to the record on its first appearance.
+        :return: The position of the column.
+        """
+        column: int | None = columns.get(name)
+        if column is None:
+            column = columns[name] = len(columns)
+            record.column_names.append(name)
+            record.column_types.append(ValueType.CONTINUOUS)
+            record.column_lower_bounds.append(0.0)
+            record.column_upper_bounds.append(inf)
+            record.objective.append(0.0)
+        return column
+
+    def __parse_statement(
+        self,
+        record: ModelRecord,
+        columns: Dict[str, int],
+        statement: _Statement,
+        tokens: List[Tuple[str, str]],
+        is_constraint: bool,
+    ) -> _Statement:
+        """
+        Adds the tokens of a line to the current objective or constraint, appending constraints to the record as
+        they are completed.
+        :return: The statement that remains open after the line.
+        """
+        position: int = 0
+        while position < len(tokens):
+            kind, text = tokens[position]
+            if kind == "name" and position + 1 < len(tokens) and tokens[position + 1][0] == "colon":
+                if not statement.is_empty:
+                    raise LoaderException(f"Unexpected label '{text}'.")
+                position += 2
+                continue
+            if kind == "sign":
+                statement.add_sign(text)
+            elif kind == "number":
+                statement.add_number(self.__value(text))
+            elif kind == "name" and statement.operator is not None and text.lower() in ("inf", "infinity"):
+                statement.add_number(inf)
+            elif kind == "name":
+                statement.add_term(self.__column(record=record, columns=columns, name=text))
+            elif kind == "operator" and is_constraint:
+                statement.add_operator(text)
+            else:
+                raise LoaderException(f"Unexpected '{text}'.")
+
+            if statement.rhs is not None:
+                self.__finish_row(record=record, statement=statement)
+                statement = _Statement()
+            position += 1
+        return statement
+
+    @staticmethod
+    def __finish_row(record: ModelRecord, statement: _Statement) -> None:
+        """
+        Appends a completed constraint to the record.
+        :return: None.
+        """
+        statement.close()
+        rhs: float = (statement.rhs or 0.0) - statement.constant
+        operator: str = statement.operator or "="
+        for column, coefficient in statement.terms.items():
+            if coefficient != 0:
+                record.row_columns.append(column)
+                record.row_values.append(coefficient)
+        record.row_starts.append(len(record.row_columns))
+        record.row_lower_bounds.append(-inf if "<" in operator else rhs)
+        record.row_upper_bounds.append(inf if ">" in operator else rhs)
+
+    @staticmethod
+    def __finish_objective(record: ModelRecord, statement: _Statement) -> None:
+        """
+        Copies the terms of the objective into the record.
+        :return: None.
+        """
+        statement.close()
+        for column, coefficient in statement.terms.items():
+            record.objective[column] += coefficient
+        record.objective_constant += statement.constant
+
+    def __parse_bound(self, record: ModelRecord, columns: Dict[str, int], tokens: List[Tuple[str, str]]) -> None:
+        """
+        Applies a line of the Bounds section to the record.
+        :return: None.
+        """
+        # Merges signs with the numbers that follow them.
+        items: List[Tuple[str, str | float]] = []
+        sign: float = 1.0
+        for kind, text in tokens:
+            if kind == "sign":
+                sign = -sign if text == "-" else sign
+            elif kind == "number" or (kind == "name" and text.lower() in ("inf", "infinity")):
+                items.append(("value", sign * self.__value(text)))
+                sign = 1.0
+            elif kind in ("name", "operator"):
+                items.append((kind, text))
+            else:
+                raise LoaderException(f"Unexpected '{text}'.")
+
+        kinds: Tuple[str, ...] = tuple(kind for kind, _ in items)
+        if kinds == ("name", "name") and str(items[1][1]).lower() == "free":
+            column: int = self.__column(record=record, columns=columns, name=str(items[0][1]))
+            record.column_lower_bounds[column] = -inf
+            record.column_upper_bounds[column] = inf
+        elif kinds == ("name", "operator", "value"):
+            column = self.__column(record=record, columns=columns, name=str(items[0][1]))
+            self.__apply_bound(record, column, str(items[1][1]), float(items[2][1]))
+        elif kinds == ("value", "operator", "name"):
+            column = self.__column(record=record, columns=columns, name=str(items[2][1]))
+            reversed_operator: str = str(items[1][1]).translate(str.maketrans("<>", "><"))
+            self.__apply_bound(record, column, reversed_operator, float(items[0][1]))
+        elif kinds == ("value", "operator", "name", "operator", "value"):
+            column = self.__column(record=record, columns=columns, name=str(items[2][1]))
+            reversed_operator = str(items[1][1]).translate(str.maketrans("<>", "><"))
+            self.__apply_bound(record, column, reversed_operator, float(items[0][1]))
+            self.__apply_bound(record, column, str(items[3][1]), float(items[4][1]))
+        else:
+            raise LoaderException("Invalid bound.")
+
+    @staticmethod
+    def __apply_bound(record: ModelRecord, column: int, operator: str, value: float) -> None:
+        """
+        Applies a bound with the column on the left-hand side of the operator.
+        :return: None.
+        """
+        if "<" in operator:
+            record.column_upper_bounds[column] = value
+        elif ">" in operator:
+            record.column_lower_bounds[column] = value
+        else:
+            record.column_lower_bounds[column] = value
+            record.column_upper_bounds[column] = value
@@ -0,0 +1,181 @@
+from math import inf
+from typing import Iterable, List, Sequence, Set, TextIO
+
+from ..model_writer import LinearObjective, LinearRow, ModelWriter, format_number
+from ...algebra.terms.variables import Variable
+from ...enums import OptimizationType, ValueType
+from ...exceptions import WriterException
+
+
+class LPWriter(ModelWriter):
+    """
+    A model writer for the CPLEX LP format.
+
+    The `LPWriter` class is row oriented, so each row is formatted and written as soon as it is consumed, and
+    no record of the constraints is kept. Rows are named `c0, c1, ...` in the order they are received, with the
+    prefix preceded by underscores if a variable already has a name of that form.
+
+    Since LP readers do not agree on a syntax for ranged rows and objective constants, both are written with
+    auxiliary columns, as the CPLEX and Gurobi writers do: ranged rows as equalities with a range column
+    named `Rg<row>`, and the objective constant as the coefficient of a column named `Constant` fixed to 1.
+    The MPS format has native support for both and should be preferred when the exact column set matters.
+    """
+
+    # Strict class attributes.
+    __slots__: List[str] = []
+
+    _TERMS_PER_LINE: int = 8
+    """ The number of terms written per line, since LP readers limit the line length. """
+
+    def write(
+        self,
+        name: str,
+        variables: Sequence[Variable],
+        objective: LinearObjective,
+        rows: Iterable[LinearRow],
+        column_names: Sequence[str] | None = None,
+    ) -> None:
+        names: List[str] = [
+            self.__validate_lp_name(name) for name in column_names or [variable.name for variable in variables]
+        ]
+        objective_columns, objective_coefficients, objective_constant, opt_type = objective
+
+        with self._open() as file:
+            file.write(f"\\ Problem name: {name}\n")
+            file.write("Maximize\n" if opt_type == OptimizationType.MAXIMIZE else "Minimize\n")
+            objective_terms: str = self.__terms(objective_columns, objective_coefficients, names)
+            constant_name: str | None = None
+            if objective_constant != 0:
+                constant_name = self.__constant_name(names)
+                sign: str = "-" if objective_constant < 0 else "+"
+                objective_terms += f" {sign} {format_number(abs(objective_constant))} {constant_name}"
+            file.write(f" obj: {objective_terms}\n")
+
+            file.write("Subject To\n")
+            row_prefix: str = self.__generated_prefix(names, "c")
+            range_prefix: str = self.__generated_prefix(names, f"Rg{row_prefix}")
+            lines: List[str] = []
+            ranges: List[str] = []
+            for index, (columns, coefficients, lower_bound, upper_bound) in enumerate(rows):
+                terms: str = self.__terms(columns, coefficients, names)
+                row: str = f"{row_prefix}{index}"
+                if lower_bound == upper_bound:
+                    lines.append(f" {row}: {terms} = {format_number(lower_bound)}\n")
+                elif lower_bound > -inf and upper_bound < inf:
+                    lines.append(f" {row}: {terms} - {range_prefix}{index} = {format_number(lower_bound)}\n")
+                    ranges.append(f" 0 <= {range_prefix}{index} <= {format_number(upper_bound - lower_bound)}\n")
+                elif lower_bound > -inf:
+                    lines.append(f" {row}: {terms} >= {format_number(lower_bound)}\n")
+                elif upper_bound < inf:
+                    lines.append(f" {row}: {terms} <= {format_number(upper_bound)}\n")
+                else:
+                    lines.append(f" {row}: {terms} >= -1e+30\n")
+
+                if len(lines) >= self._BUFFER_SIZE:
+                    file.write("".join(lines))
+                    lines.clear()
+            file.write("".join(lines))
+
+            file.write("Bounds\n")
+            file.write("".join(ranges))
+            if constant_name is not None:
+                file.write(f" {constant_name} = 1\n")
+            self.__write_bounds(file=file, variables=variables, names=names)
+
+            binaries: List[str] = [n for v, n in zip(variables, names) if v.value_type == ValueType.BINARY]
+            generals: List[str] = [n for v, n in zip(variables, names) if v.value_type == ValueType.INTEGER]
+            if binaries:
+                file.write("Binaries\n")
+                file.write("".join(f" {name}\n" for name in binaries))
+            if generals:
+                file.write("Generals\n")
+                file.write("".join(f" {name}\n" for name in generals))
+            file.write("End\n")
+
+    def __terms(self, columns: Sequence[int], coefficients: Sequence[float], names: List[str]) -> str:
+        """
+        Formats a linear expression, wrapping it every `_TERMS_PER_LINE` terms.
+        :param columns: The column positions of the terms.
+        :param coefficients: The coefficients of the terms.
+        :param names: The names of the columns.
+        :return: The formatted expression.
+        """
+        if not columns:
+            if not names:
+                raise WriterException("Rows without terms cannot be written for models without variables.")
+            return f"0 {names[0]}"
+
+        parts: List[str] = []
+        for position, (column, coefficient) in enumerate(zip(columns, coefficients)):
+            if position > 0 and position % self._TERMS_PER_LINE == 0:
+                parts.append("\n  ")
+            sign: str = "-" if coefficient < 0 else "+"
+            magnitude: float = abs(coefficient)
+            term: str = names[column] if magnitude == 1 else f"{format_number(magnitude)} {names[column]}"
+            parts.append(f"{sign} {term} " if position > 0 or sign == "-" else f"{term} ")
+        return "".join(parts).rstrip()
+
+    @staticmethod
+    def __constant_name(names: List[str]) -> str:
+        """
+        Retrieves a name for the objective constant column that does not clash with the variable names.
+        :param names: The names of the columns.
+        :return: The name of the constant column.
+        """
+        taken: Set[str] = set(names)
+        name: str = "Constant"
+        while name in taken:
+            name = f"_{name}"
+        return name
+
+    @staticmethod
+    def __generated_prefix(names: List[str], prefix: str) -> str:
+        """
+        Retrieves a prefix for numbered generated names, such as those of the rows and range columns, that does
+        not clash with the variable names.
+        :param names: The names of the columns.
+        :param prefix: The preferred prefix, which is preceded by underscores until no name is the prefix
+            followed by digits.
+        :return: The prefix of the generated names.
+        """
+        while any(name.startswith(prefix) and name[len(prefix) :].isdigit() for name in names):
+            prefix = f"_{prefix}"
+        return prefix
+
+    def __write_bounds(self, file: TextIO, variables: Sequence[Variable], names: List[str]) -> None:
+        """
+        Writes the bounds of the variables. Bounds equal to the defaults (0 and +infinity) are omitted.
+        :return: None.
+        """
+        lines: List[str] = []
+        for variable, name in zip(variables, names):
+            lower_bound, upper_bound = variable.lower_bound, variable.upper_bound
+            if variable.value_type == ValueType.BINARY and lower_bound == 0 and upper_bound == 1:
+                continue
+            if lower_bound == upper_bound:
+                lines.append(f" {name} = {format_number(lower_bound)}\n")
+            elif lower_bound == -inf and upper_bound == inf:
+                lines.append(f" {name} free\n")
+            elif upper_bound == inf:
+                if lower_bound != 0:
+                    lines.append(f" {name} >= {format_number(lower_bound)}\n")
+            else:
+                lower: str = "-inf" if lower_bound == -inf else format_number(lower_bound)
+                lines.append(f" {lower} <= {name} <= {format_number(upper_bound)}\n")
+
+            if len(lines) >= self._BUFFER_SIZE:
+                file.write("".join(lines))
+                lines.clear()
+        file.write("".join(lines))
+
+    def __validate_lp_name(self, name: str) -> str:
+        """
+        Validates that a name can be written to an LP file, which additionally forbids the operator characters
+        and names starting with a digit or a period.
+        :param name: The name to be validated.
+        :return: The validated name.
+        """
+        self._validate_name(name)
+        if name[0] in "0123456789." or any(character in name for character in "+-*^<>=:[]\\"):
+            raise WriterException(f"The name '{name}' cannot be written to an LP file.")
+        return name
@@ -0,0 +1,67 @@
+import gzip
+from abc import ABC, abstractmethod
+from os import PathLike, fspath
+from typing import TextIO
+
+from .model_record import ModelRecord
+from ..exceptions import LoaderException
+
+
+class ModelReader(ABC):
+    """
+    A base class for readers that parse linear models from standard file formats.
+
+    The `ModelReader` class reads the file line by line, so only the current line is held as text, and parses it
+    into a `ModelRecord`, whose columns and rows are stored in typed arrays. Files whose path ends in `.gz` are
+    decompressed on the fly.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_path"]
+
+    @property
+    def path(self) -> str:
+        """
+        Retrieves the path of the file to be read.
+        :return: A string with the file path.
+        """
+        return self._path
+
+    def __init__(self, path: str | PathLike[str]):
+        """
+        Initializes a new ModelReader instance.
+        :param path: The path of the file to be read.
+        """
+        # Applies validations
+        if not path:
+            raise LoaderException("The file path cannot be empty.")
+
+        # Instance attributes
+        self._path: str = fspath(path)
+        """ The path of the file to be read. """
+
+    @abstractmethod
+    def read(self) -> ModelRecord:
+        """
+        Parses the file into a model record.
+        :return: A `ModelRecord` with the columns, rows and objective of the model.
+        """
+        pass
+
+    def _open(self) -> TextIO:
+        """
+        Opens the file for reading, decompressing it if required.
+        :return: A text stream.
+        """
+        if self._path.endswith(".gz"):
+            return gzip.open(self._path, "rt", encoding="utf-8", errors="replace")
+        return open(self._path, "r", encoding="utf-8", errors="replace")
+
+    def _error(self, line_number: int, message: str) -> LoaderException:
+        """
+        Builds an exception for a parsing error.
+        :param line_number: The number of the line where the error was found.
+        :param message: The description of the error.
+        :return: A `LoaderException` with the location and description of the error.
+        """
+        return LoaderException(f"Line {line_number} of '{self._path}': {message}")
@@ -0,0 +1,110 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple
+
+from ..enums import OptimizationType
+
+
+@dataclass
+class ModelRecord:
+    """
+    Represents a solver-independent record of a linear model.
+
+    The record stores columns and rows in typed arrays rather than Python objects: the attributes of each
+    column in parallel arrays, and the coefficients of the rows in compressed sparse row (CSR) format, where the
+    coefficients of row `i` are those between `row_starts[i]` and `row_starts[i + 1]`. It is produced by the
+    model readers and takes roughly 16 bytes per nonzero coefficient. Records loaded from snapshots hold
+    read-only memory views of the mapped file instead of arrays, which support the same indexing.
+    """
+
+    name: str = ""
+    """ The name of the model. """
+
+    opt_type: OptimizationType = OptimizationType.MINIMIZE
+    """ The optimization type of the objective. """
+
+    objective_constant: float = 0.0
+    """ The constant term of the objective. """
+
+    column_names: List[str] = field(default_factory=list)
+    """ The name of each column. """
+
+    column_types: "array[int]" = field(default_factory=lambda: array("b"))
+    """ The `ValueType` value of each column. """
+
+    column_lower_bounds: "array[float]" = field(default_factory=lambda: array("d"))
+    """ The lower bound of each column. """
+
+    column_upper_bounds: "array[float]" = field(default_factory=lambda: array("d"))
+    """ The upper bound of each column. """
+
+    objective: "array[float]" = field(default_factory=lambda: array("d"))
+    """ The objective coefficient of each column. """
+
+    row_starts: "array[int]" = field(default_factory=lambda: array("q", [0]))
+    """ The position of the first coefficient of each row, followed by the total number of coefficients. """
+
+    row_columns: "array[int]" = field(default_factory=lambda: array("q"))
+    """ The column of each coefficient, row by row. """
+
+    row_values: "array[float]" = field(default_factory=lambda: array("d"))
+    """ The value of each coefficient, row by row. """
+
+    row_lower_bounds: "array[float]" = field(default_factory=lambda: array("d"))
+    """ The lower bound of each row. """
+
+    row_upper_bounds: "array[float]" = field(default_factory=lambda: array("d"))
+    """ The upper bound of each row. """
+
+    term_sets: Dict[str, Dict[Tuple[int, ...], int]] = field(default_factory=dict)
+    """ The column of each variable that belongs to a term set, by set name and index. """
+
+    dimensions: Dict[str, int] = field(default_factory=dict)
+    """ The dimensions of the model and their sizes. """
+
+    @property
+    def num_columns(self) -> int:
+        """
+        Retrieves the number of columns of the record.
+        :return: An integer with the number of columns.
+        """
+        return len(self.column_names)
+
+    @property
+    def num_rows(self) -> int:
+        """
+        Retrieves the number of rows of the record.
+        :return: An integer with the number of rows.
+        """
+        return len(self.row_starts) - 1
+
+    @property
+    def num_nonzeros(self) -> int:
+        """
+        Retrieves the number of coefficients of the rows.
+        :return: An integer with the number of nonzero coefficients.
+        """
+        return len(self.row_values)
+
+    def row(self, index: int) -> Tuple["array[int]", "array[float]", float, float]:
+        """
+        Retrieves a row of the record.
+        :param index: The position of the row.
+        :return: A tuple with the columns, the coefficients, and the lower and upper bounds of the row.
+        """
+        start, end = self.row_starts[index], self.row_starts[index + 1]
+        return (
+            self.row_columns[start:end],
+            self.row_values[start:end],
+            self.row_lower_bounds[index],
+            self.row_upper_bounds[index],
+        )
+
+    def iter_rows(self) -> Iterator[Tuple["array[int]", "array[float]", float, float]]:
+        """
+        Iterates over the rows of the record.
+        :return: An iterator of tuples with the columns, the coefficients, and the lower and upper bounds of
+            each row.
+        """
+        for index in range(self.num_rows):
+            yield self.row(index)
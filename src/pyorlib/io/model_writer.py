@@ -0,0 +1,115 @@
+import gzip
+from abc import ABC, abstractmethod
+from os import PathLike, fspath
+from typing import Iterable, Sequence, TextIO, Tuple
+
+from ..algebra.terms.variables import Variable
+from ..enums import OptimizationType
+from ..exceptions import WriterException
+
+LinearRow = Tuple[Sequence[int], Sequence[float], float, float]
+""" A linear row: the column positions, the coefficients, and the lower and upper bounds of the row. """
+
+LinearObjective = Tuple[Sequence[int], Sequence[float], float, OptimizationType]
+""" A linear objective: the column positions, the coefficients, the constant term and the optimization type. """
+
+
+def format_number(value: float) -> str:
+    """
+    Formats a number with the shortest representation that reads back to the same value.
+    :param value: The number to be formatted.
+    :return: A string with the number, without a trailing ".0" for integral values.
+    """
+    text: str = repr(float(value))
+    return text[:-2] if text.endswith(".0") else text
+
+
+class ModelWriter(ABC):
+    """
+    A base class for writers that export linear models to standard file formats.
+
+    The `ModelWriter` class receives the columns of a model as pyorlib variables and its rows as an iterable of
+    linear rows, so the file is produced from pyorlib's own view of the model regardless of the engine in use.
+    Rows are consumed one at a time and written in buffered blocks, and files whose path ends in `.gz` are
+    compressed with gzip.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_path", "_compress"]
+
+    _BUFFER_SIZE: int = 4096
+    """ The number of lines joined before each write to the file. """
+
+    @property
+    def path(self) -> str:
+        """
+        Retrieves the path of the file to be written.
+        :return: A string with the file path.
+        """
+        return self._path
+
+    @property
+    def compress(self) -> bool:
+        """
+        Retrieves whether the file is compressed with gzip.
+        :return: True if the file is compressed, False otherwise.
+        """
+        return self._compress
+
+    def __init__(self, path: str | PathLike[str], compress: bool | None = None):
+        """
+        Initializes a new ModelWriter instance.
+        :param path: The path of the file to be written.
+        :param compress: Whether to compress the file with gzip. Defaults to True for paths ending in `.gz`.
+        """
+        # Applies validations
+        if not path:
+            raise WriterException("The file path cannot be empty.")
+
+        # Instance attributes
+        self._path: str = fspath(path)
+        """ The path of the file to be written. """
+
+        self._compress: bool = self._path.endswith(".gz") if compress is None else compress
+        """ Whether the file is compressed with gzip. """
+
+    @abstractmethod
+    def write(
+        self,
+        name: str,
+        variables: Sequence[Variable],
+        objective: LinearObjective,
+        rows: Iterable[LinearRow],
+        column_names: Sequence[str] | None = None,
+    ) -> None:
+        """
+        Writes a linear model to the file.
+        :param name: The name of the model.
+        :param variables: The variables of the model, one per column.
+        :param objective: The linear objective, referencing variables by their position in `variables`.
+        :param rows: An iterable of linear rows, referencing variables by their position in `variables`.
+        :param column_names: The name of each column, for variables that have no name in the engine. Defaults to
+            None, for the names of the variables.
+        :return: None.
+        """
+        pass
+
+    def _open(self) -> TextIO:
+        """
+        Opens the file for writing, compressed if required.
+        :return: A text stream.
+        """
+        if self._compress:
+            return gzip.open(self._path, "wt", encoding="utf-8", newline="\n")
+        return open(self._path, "w", encoding="utf-8", newline="\n")
+
+    @staticmethod
+    def _validate_name(name: str) -> str:
+        """
+        Validates that a name can be written to a file.
+        :param name: The name to be validated.
+        :return: The validated name.
+        """
+        if name.split() != [name]:
+            raise WriterException(f"The name '{name}' cannot be written: names cannot be empty or contain spaces.")
+        return name
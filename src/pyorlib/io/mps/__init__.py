@@ -0,0 +1,2 @@
+from .mps_writer import MPSWriter
+from .mps_reader import MPSReader
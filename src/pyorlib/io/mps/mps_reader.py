@@ -0,0 +1,314 @@
+from array import array
+from math import inf
+from os import PathLike
+from typing import Dict, List, Sequence, Set, Tuple
+
+from ..model_reader import ModelReader
+from ..model_record import ModelRecord
+from ...enums import OptimizationType, ValueType
+
+
+class MPSReader(ModelReader):
+    """
+    A model reader for the free and fixed MPS formats.
+
+    The `MPSReader` class parses the sections of the file as they are read. Since MPS files are column oriented,
+    the coefficients are collected as (row, column, value) triplets in typed arrays and sorted by row into the
+    compressed sparse row layout of the record once the COLUMNS section ends.
+
+    Integer columns declared between markers default to the bounds [0, +infinity], and only the first
+    objective row is kept: additional free rows are ignored, as most solvers do.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_fixed"]
+
+    _SECTIONS: Set[str] = {"NAME", "OBJSENSE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA"}
+    """ The supported sections of the MPS format. """
+
+    _FIXED_FIELDS: List[slice] = [slice(1, 3), slice(4, 12), slice(14, 22), slice(24, 36), slice(39, 47), slice(49, 61)]
+    """ The positions of the six fields of a line in the fixed MPS format. """
+
+    @property
+    def fixed(self) -> bool:
+        """
+        Retrieves whether the file is read in the fixed MPS format.
+        :return: True for the fixed format, False for the free format.
+        """
+        return self._fixed
+
+    def __init__(self, path: str | PathLike[str], fixed: bool = False):
+        """
+        Initializes a new MPSReader instance.
+        :param path: The path of the MPS file.
+        :param fixed: Whether the file uses the fixed MPS format, in which fields are located by position and
+            names may contain spaces. Defaults to False (free format, with whitespace-separated fields).
+        """
+        super().__init__(path=path)
+
+        # Instance attributes
+        self._fixed: bool = fixed
+        """ Whether the file is read in the fixed MPS format. """
+
+    def read(self) -> ModelRecord:
+        record: ModelRecord = ModelRecord()
+
+        objective_name: str | None = None
+        free_rows: Set[str] = set()
+        rows: Dict[str, int] = {}
+        row_types: bytearray = bytearray()
+        columns: Dict[str, int] = {}
+
+        # The coefficients, as (row, column, value) triplets in file order.
+        triplet_rows: array[int] = array("q")
+        triplet_columns: array[int] = array("q")
+        triplet_values: array[float] = array("d")
+
+        rhs: array[float] = array("d")
+        ranges: Dict[int, float] = {}
+        integral: bool = False
+        section: str | None = None
+
+        with self._open() as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip() or line[0] == "*":
+                    continue
+
+                # Section headers start at the first position of the line.
+                if not line[0].isspace():
+                    tokens: List[str] = line.split()
+                    section = tokens[0].upper()
+                    if section not in self._SECTIONS:
+                        raise self._error(line_number, f"Unsupported section '{tokens[0]}'.")
+                    if section == "NAME":
+                        record.name = line[4:].strip() if self._fixed else " ".join(tokens[1:])
+                    elif section == "OBJSENSE" and len(tokens) > 1:
+                        record.opt_type = self.__opt_type(tokens[1], line_number)
+                    elif section == "ENDATA":
+                        break
+                    continue
+
+                fields: List[str] = self.__fields(line)
+
+                if section == "OBJSENSE":
+                    record.opt_type = self.__opt_type(fields[0], line_number)
+
+                elif section == "ROWS":
+                    if len(fields) != 2:
+                        raise self._error(line_number, "Rows require a type and a name.")
+                    row_type, row_name = fields[0].upper(), fields[1]
+                    if row_type == "N":
+                        if objective_name is None:
+                            objective_name = row_name
+                        else:
+                            free_rows.add(row_name)
+                    elif row_type in ("L", "G", "E"):
+                        if row_name in rows:
+                            raise self._error(line_number, f"Duplicate row '{row_name}'.")
+                        rows[row_name] = len(rows)
+                        row_types.append(ord(row_type))
+                        rhs.append(0.0)
+                    else:
+                        raise self._error(line_number, f"Unknown row type '{fields[0]}'.")
+
+                elif section == "COLUMNS":
+                    if len(fields) >= 3 and fields[1].upper() == "'MARKER'":
+                        marker: str = fields[2].upper()
+                        if marker not in ("'INTORG'", "'INTEND'"):
+                            raise self._error(line_number, f"Unknown marker '{fields[2]}'.")
+                        integral = marker == "'INTORG'"
+                        continue
+                    if len(fields) not in (3, 5):
+                        raise self._error(line_number, "Column entries require a column and row/value pairs.")
+
+                    column: int | None = columns.get(fields[0])
+                    if column is None:
+                        column = columns[fields[0]] = len(columns)
+                        record.column_names.append(fields[0])
+                        record.column_types.append(ValueType.INTEGER if integral else ValueType.CONTINUOUS)
+                        record.column_lower_bounds.append(0.0)
+                        record.column_upper_bounds.append(inf)
+                        record.objective.append(0.0)
+
+                    for position in range(1, len(fields), 2):
+                        row_name = fields[position]
+                        value: float = self.__number(fields[position + 1], line_number)
+                        if row_name == objective_name:
+                            record.objective[column] += value
+                        elif row_name in rows:
+                            triplet_rows.append(rows[row_name])
+                            triplet_columns.append(column)
+                            triplet_values.append(value)
+                        elif row_name not in free_rows:
+                            raise self._error(line_number, f"Unknown row '{row_name}'.")
+
+                elif section in ("RHS", "RANGES"):
+                    # The name of the RHS or RANGES vector is optional in free MPS files.
+                    pairs: List[str] = fields[1:] if len(fields) % 2 == 1 else fields
+                    for position in range(0, len(pairs), 2):
+                        row_name = pairs[position]
+                        value = self.__number(pairs[position + 1], line_number)
+                        if row_name == objective_name:
+                            if section == "RHS":
+                                record.objective_constant = -value
+                        elif row_name in rows:
+                            if section == "RHS":
+                                rhs[rows[row_name]] = value
+                            else:
+                                ranges[rows[row_name]] = value
+                        elif row_name not in free_rows:
+                            raise self._error(line_number, f"Unknown row '{row_name}'.")
+
+                elif section == "BOUNDS":
+                    self.__apply_bound(record=record, columns=columns, fields=fields, line_number=line_number)
+
+        self.__build_rows(
+            record=record,
+            num_rows=len(rows),
+            triplet_rows=triplet_rows,
+            triplet_columns=triplet_columns,
+            triplet_values=triplet_values,
+        )
+
+        for row, type_code in enumerate(row_types):
+            lower_bound, upper_bound = self.__row_bounds(chr(type_code), rhs[row], ranges.get(row))
+            record.row_lower_bounds.append(lower_bound)
+            record.row_upper_bounds.append(upper_bound)
+
+        return record
+
+    def __fields(self, line: str) -> List[str]:
+        """
+        Splits a data line into its fields.
+        :param line: The line to be split.
+        :return: A list with the non-empty fields of the line.
+        """
+        if not self._fixed:
+            return line.split()
+        fields: List[str] = [line[position].strip() for position in self._FIXED_FIELDS]
+        return [field for field in fields if field]
+
+    def __number(self, text: str, line_number: int) -> float:
+        """
+        Parses a number.
+        :param text: The text to be parsed.
+        :param line_number: The number of the line being parsed.
+        :return: The parsed number.
+        """
+        try:
+            return float(text)
+        except ValueError:
+            raise self._error(line_number, f"Invalid number '{text}'.")
+
+    def __opt_type(self, text: str, line_number: int) -> OptimizationType:
+        """
+        Parses the optimization type of an OBJSENSE section.
+        :param text: The text to be parsed.
+        :param line_number: The number of the line being parsed.
+        :return: The optimization type.
+        """
+        sense: str = text.upper()
+        if sense in ("MAX", "MAXIMIZE"):
+            return OptimizationType.MAXIMIZE
+        if sense in ("MIN", "MINIMIZE"):
+            return OptimizationType.MINIMIZE
+        raise self._error(line_number, f"Unknown objective sense '{text}'.")
+
+    def __apply_bound(self, record: ModelRecord, columns: Dict[str, int], fields: List[str], line_number: int) -> None:
+        """
+        Applies a line of the BOUNDS section to the record. The name of the bound vector is optional.
+        :param record: The record being built.
+        :param columns: The position of each column by name.
+        :param fields: The fields of the line.
+        :param line_number: The number of the line being parsed.
+        :return: None.
+        """
+        bound_type: str = fields[0].upper()
+        valued: bool = bound_type in ("UP", "LO", "FX", "LI", "UI")
+        if bound_type not in ("UP", "LO", "FX", "LI", "UI", "FR", "MI", "PL", "BV"):
+            raise self._error(line_number, f"Unsupported bound type '{fields[0]}'.")
+
+        # Skips the optional name of the bound vector.
+        expected_fields: int = 3 if valued else 2
+        if len(fields) == expected_fields + 1 or (bound_type == "BV" and len(fields) == 3):
+            fields = fields[:1] + fields[2:]
+        if len(fields) < expected_fields:
+            raise self._error(line_number, "Incomplete bound.")
+
+        column: int | None = columns.get(fields[1])
+        if column is None:
+            raise self._error(line_number, f"Unknown column '{fields[1]}'.")
+        value: float = self.__number(fields[2], line_number) if valued else 0.0
+
+        if bound_type in ("UP", "UI"):
+            # A negative upper bound on a column with the default lower bound frees the lower bound.
+            if value < 0 and record.column_lower_bounds[column] == 0:
+                record.column_lower_bounds[column] = -inf
+            record.column_upper_bounds[column] = value
+        elif bound_type in ("LO", "LI"):
+            record.column_lower_bounds[column] = value
+        elif bound_type == "FX":
+            record.column_lower_bounds[column] = value
+            record.column_upper_bounds[column] = value
+        elif bound_type == "FR":
+            record.column_lower_bounds[column] = -inf
+            record.column_upper_bounds[column] = inf
+        elif bound_type == "MI":
+            record.column_lower_bounds[column] = -inf
+        elif bound_type == "PL":
+            record.column_upper_bounds[column] = inf
+        else:
+            record.column_types[column] = ValueType.BINARY
+            record.column_lower_bounds[column] = 0
+            record.column_upper_bounds[column] = 1
+
+        if bound_type in ("LI", "UI"):
+            record.column_types[column] = ValueType.INTEGER
+
+    @staticmethod
+    def __build_rows(
+        record: ModelRecord,
+        num_rows: int,
+        triplet_rows: Sequence[int],
+        triplet_columns: Sequence[int],
+        triplet_values: Sequence[float],
+    ) -> None:
+        """
+        Sorts the coefficient triplets by row into the compressed sparse row layout of the record.
+        :return: None.
+        """
+        row_starts: array[int] = array("q", bytes(8 * (num_rows + 1)))
+        for row in triplet_rows:
+            row_starts[row + 1] += 1
+        for row in range(num_rows):
+            row_starts[row + 1] += row_starts[row]
+
+        positions: array[int] = array("q", row_starts)
+        row_columns: array[int] = array("q", bytes(8 * len(triplet_rows)))
+        row_values: array[float] = array("d", bytes(8 * len(triplet_rows)))
+        for row, column, value in zip(triplet_rows, triplet_columns, triplet_values):
+            position: int = positions[row]
+            row_columns[position] = column
+            row_values[position] = value
+            positions[row] = position + 1
+
+        record.row_starts = row_starts
+        record.row_columns = row_columns
+        record.row_values = row_values
+
+    @staticmethod
+    def __row_bounds(row_type: str, rhs: float, range_value: float | None) -> Tuple[float, float]:
+        """
+        Computes the bounds of a row from its type, right-hand side and range.
+        :param row_type: The MPS type of the row: L, G or E.
+        :param rhs: The right-hand side of the row.
+        :param range_value: The range of the row, if any.
+        :return: A tuple with the lower and upper bounds of the row.
+        """
+        if range_value is None:
+            return (rhs if row_type != "L" else -inf), (rhs if row_type != "G" else inf)
+        if row_type == "L":
+            return rhs - abs(range_value), rhs
+        if row_type == "G":
+            return rhs, rhs + abs(range_value)
+        return (rhs, rhs + range_value) if range_value >= 0 else (rhs + range_value, rhs)
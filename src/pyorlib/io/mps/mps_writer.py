@@ -0,0 +1,217 @@
+from array import array
+from math import inf
+from typing import Iterable, List, Sequence, TextIO
+
+from ..model_writer import LinearObjective, LinearRow, ModelWriter, format_number
+from ...algebra.terms.variables import Variable
+from ...enums import OptimizationType, ValueType
+
+
+class MPSWriter(ModelWriter):
+    """
+    A model writer for the free MPS format.
+
+    The `MPSWriter` class writes the ROWS section while the rows are consumed, and keeps their coefficients in a
+    compact compressed sparse row record (typed arrays of positions and values, 16 bytes per nonzero) that is
+    transposed in place to produce the column-oriented COLUMNS section. Rows are named `c0, c1, ...` in the
+    order they are received, and maximization problems are written with an `OBJSENSE` section.
+    """
+
+    # Strict class attributes.
+    __slots__: List[str] = []
+
+    def write(
+        self,
+        name: str,
+        variables: Sequence[Variable],
+        objective: LinearObjective,
+        rows: Iterable[LinearRow],
+        column_names: Sequence[str] | None = None,
+    ) -> None:
+        names: List[str] = [
+            self._validate_name(name) for name in column_names or [variable.name for variable in variables]
+        ]
+        objective_columns, objective_coefficients, objective_constant, opt_type = objective
+
+        # The compressed sparse row record of the constraints.
+        row_starts: array[int] = array("q", [0])
+        row_columns: array[int] = array("q")
+        row_values: array[float] = array("d")
+        row_lower_bounds: array[float] = array("d")
+        row_upper_bounds: array[float] = array("d")
+
+        with self._open() as file:
+            file.write(f"NAME {name}\n")
+            if opt_type == OptimizationType.MAXIMIZE:
+                file.write("OBJSENSE\n    MAX\n")
+            file.write("ROWS\n N  obj\n")
+
+            lines: List[str] = []
+            for index, (columns, coefficients, lower_bound, upper_bound) in enumerate(rows):
+                lines.append(f" {self.__row_type(lower_bound, upper_bound)}  c{index}\n")
+                row_columns.extend(columns)
+                row_values.extend(coefficients)
+                row_starts.append(len(row_columns))
+                row_lower_bounds.append(lower_bound)
+                row_upper_bounds.append(upper_bound)
+                if len(lines) >= self._BUFFER_SIZE:
+                    file.write("".join(lines))
+                    lines.clear()
+            file.write("".join(lines))
+
+            # Transposes the record into columns, so that rows and coefficients can be read per column.
+            num_columns: int = len(variables)
+            column_starts: array[int] = array("q", bytes(8 * (num_columns + 1)))
+            for column in row_columns:
+                column_starts[column + 1] += 1
+            for column in range(num_columns):
+                column_starts[column + 1] += column_starts[column]
+
+            positions: array[int] = array("q", column_starts)
+            column_rows: array[int] = array("q", bytes(8 * len(row_columns)))
+            column_values: array[float] = array("d", bytes(8 * len(row_columns)))
+            for row in range(len(row_starts) - 1):
+                for k in range(row_starts[row], row_starts[row + 1]):
+                    position: int = positions[row_columns[k]]
+                    column_rows[position] = row
+                    column_values[position] = row_values[k]
+                    positions[row_columns[k]] = position + 1
+            del row_columns, row_values, positions
+
+            costs: array[float] = array("d", bytes(8 * num_columns))
+            for column, coefficient in zip(objective_columns, objective_coefficients):
+                costs[column] += coefficient
+
+            self.__write_columns(
+                file=file,
+                variables=variables,
+                names=names,
+                costs=costs,
+                column_starts=column_starts,
+                column_rows=column_rows,
+                column_values=column_values,
+            )
+            self.__write_rhs_and_ranges(
+                file=file,
+                objective_constant=objective_constant,
+                row_lower_bounds=row_lower_bounds,
+                row_upper_bounds=row_upper_bounds,
+            )
+            self.__write_bounds(file=file, variables=variables, names=names)
+            file.write("ENDATA\n")
+
+    @staticmethod
+    def __row_type(lower_bound: float, upper_bound: float) -> str:
+        """
+        Retrieves the MPS type of a row from its bounds. Ranged rows are written as G rows with a range.
+        :param lower_bound: The lower bound of the row.
+        :param upper_bound: The upper bound of the row.
+        :return: The MPS row type: E, G, L or N.
+        """
+        if lower_bound == upper_bound:
+            return "E"
+        if lower_bound > -inf:
+            return "G"
+        if upper_bound < inf:
+            return "L"
+        return "N"
+
+    def __write_columns(
+        self,
+        file: TextIO,
+        variables: Sequence[Variable],
+        names: List[str],
+        costs: Sequence[float],
+        column_starts: Sequence[int],
+        column_rows: Sequence[int],
+        column_values: Sequence[float],
+    ) -> None:
+        """
+        Writes the COLUMNS section, enclosing integer columns in markers.
+        :return: None.
+        """
+        file.write("COLUMNS\n")
+        lines: List[str] = []
+        integral: bool = False
+        for column, (variable, name) in enumerate(zip(variables, names)):
+            if (variable.value_type != ValueType.CONTINUOUS) != integral:
+                integral = not integral
+                lines.append(f"    MARKER  'MARKER'  '{'INTORG' if integral else 'INTEND'}'\n")
+
+            start, end = column_starts[column], column_starts[column + 1]
+            # Columns without coefficients are still listed, so that readers know about them.
+            if costs[column] != 0 or start == end:
+                lines.append(f"    {name}  obj  {format_number(costs[column])}\n")
+            for position in range(start, end):
+                lines.append(f"    {name}  c{column_rows[position]}  {format_number(column_values[position])}\n")
+
+            if len(lines) >= self._BUFFER_SIZE:
+                file.write("".join(lines))
+                lines.clear()
+
+        if integral:
+            lines.append("    MARKER  'MARKER'  'INTEND'\n")
+        file.write("".join(lines))
+
+    def __write_rhs_and_ranges(
+        self,
+        file: TextIO,
+        objective_constant: float,
+        row_lower_bounds: Sequence[float],
+        row_upper_bounds: Sequence[float],
+    ) -> None:
+        """
+        Writes the RHS and RANGES sections. The objective constant is written negated, as MPS readers expect.
+        :return: None.
+        """
+        file.write("RHS\n")
+        lines: List[str] = []
+        if objective_constant != 0:
+            lines.append(f"    RHS  obj  {format_number(-objective_constant)}\n")
+
+        ranges: List[str] = []
+        for row, (lower_bound, upper_bound) in enumerate(zip(row_lower_bounds, row_upper_bounds)):
+            rhs: float = lower_bound if lower_bound > -inf else upper_bound if upper_bound < inf else 0
+            if rhs != 0:
+                lines.append(f"    RHS  c{row}  {format_number(rhs)}\n")
+            if -inf < lower_bound < upper_bound < inf:
+                ranges.append(f"    RNG  c{row}  {format_number(upper_bound - lower_bound)}\n")
+            if len(lines) >= self._BUFFER_SIZE:
+                file.write("".join(lines))
+                lines.clear()
+        file.write("".join(lines))
+
+        if ranges:
+            file.write("RANGES\n")
+            file.write("".join(ranges))
+
+    def __write_bounds(self, file: TextIO, variables: Sequence[Variable], names: List[str]) -> None:
+        """
+        Writes the BOUNDS section. Bounds equal to the MPS defaults (0 and +infinity) are omitted, except for
+        the upper bound of integer columns, which some readers default to 1.
+        :return: None.
+        """
+        file.write("BOUNDS\n")
+        lines: List[str] = []
+        for variable, name in zip(variables, names):
+            lower_bound, upper_bound = variable.lower_bound, variable.upper_bound
+            if variable.value_type == ValueType.BINARY and lower_bound == 0 and upper_bound == 1:
+                lines.append(f" BV BND  {name}\n")
+            elif lower_bound == upper_bound:
+                lines.append(f" FX BND  {name}  {format_number(lower_bound)}\n")
+            elif lower_bound == -inf and upper_bound == inf:
+                lines.append(f" FR BND  {name}\n")
+            else:
+                if lower_bound == -inf:
+                    lines.append(f" MI BND  {name}\n")
+                elif lower_bound != 0:
+                    lines.append(f" LO BND  {name}  {format_number(lower_bound)}\n")
+                if upper_bound < inf:
+                    lines.append(f" UP BND  {name}  {format_number(upper_bound)}\n")
+                elif variable.value_type != ValueType.CONTINUOUS:
+                    lines.append(f" PL BND  {name}\n")
+
+            if len(lines) >= self._BUFFER_SIZE:
+                file.write("".join(lines))
+                lines.clear()
+        file.write("".join(lines))
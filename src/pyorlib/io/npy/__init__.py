@@ -0,0 +1 @@
+from .npy_loader import NpyLoader
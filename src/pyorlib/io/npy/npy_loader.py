@@ -0,0 +1,63 @@
+from typing import Any, Callable, List, Sequence
+
+from ..parameter_loader import Column, ParameterLoader
+from ...exceptions import LoaderException, NumPyException
+
+try:  # pragma: no cover
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise NumPyException(
+        "Optional dependency 'NumPy' not found.\nPlease install it using 'pip install pyorlib[numpy]'."
+    )
+
+
+class NpyLoader(ParameterLoader):
+    """
+    A parameter loader for NumPy binary files (`.npy`).
+
+    The `NpyLoader` class memory-maps the file in read-only mode, so values are paged in from disk as each chunk
+    is validated and the loaded values are views of the file rather than copies. Loaded arrays can therefore be
+    shared by `ConstantArray` without copying when their data type matches the storage type of the value type.
+
+    Columns are selected as follows: None selects all the values of the file, in row-major order; an integer
+    selects a column of a two-dimensional array; and a string selects a field of a structured array.
+    """
+
+    # Strict class attributes.
+    __slots__: List[str] = []
+
+    def _read(
+        self,
+        columns: Sequence[Column],
+        on_chunk: Callable[[int, Sequence[Sequence[float]]], None],
+    ) -> List[Sequence[float]]:
+        data: Any = np.load(self._path, mmap_mode="r")
+        results: List[Any] = [self.__select(data=data, column=column) for column in columns]
+
+        size: int = len(results[0])
+        for offset in range(0, size, self._chunk_size):
+            on_chunk(offset, [result[offset : offset + self._chunk_size] for result in results])
+
+        return results
+
+    def __select(self, data: Any, column: Column) -> Any:
+        """
+        Selects the values of a column as a one-dimensional view of the memory-mapped data.
+        :param data: The memory-mapped array of the file.
+        :param column: None for all the values, a column position, or a field name.
+        :return: A one-dimensional view with the values of the column.
+        """
+        if isinstance(column, str):
+            if data.dtype.names is None or column not in data.dtype.names:
+                raise LoaderException(f"Field '{column}' not found in '{self._path}'.")
+            values: Any = data[column].reshape(-1)
+        elif isinstance(column, int):
+            if data.ndim != 2 or not 0 <= column < data.shape[1]:
+                raise LoaderException(f"Column position {column} is out of range in '{self._path}'.")
+            values = data[:, column]
+        else:
+            values = data.reshape(-1)
+
+        if values.dtype.kind not in "biuf":
+            raise LoaderException(f"The values of '{self._path}' must be numeric.")
+        return values
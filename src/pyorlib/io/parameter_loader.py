@@ -0,0 +1,286 @@
+from abc import ABC, abstractmethod
+from importlib import import_module
+from math import prod
+from os import PathLike, fspath
+from typing import Any, Callable, List, Mapping, Sequence
+
+from ..enums import ParameterType, ValueType
+from ..exceptions import LoaderException, NumPyException
+from ..structures import DimensionDefinition, MultiValueParameter, ParameterDefinition
+from ..validators import ValueTypeValidator
+
+Column = str | int | None
+""" A column selector: a column name, a column position, or None for the default column. """
+
+
+class ParameterLoader(ABC):
+    """
+    A base class for loaders that stream parameter values from files.
+
+    The `ParameterLoader` class reads the values of one or more columns of a file in chunks of `chunk_size` rows
+    and validates each chunk as it is read: against the value type, against the parameter definition (its value
+    types, parameter types and range) and against the dimensions the values must fill. Invalid data is reported
+    with its row range as soon as it is read, and the values are stored in typed buffers (`array.array` objects
+    or NumPy arrays) instead of Python lists.
+
+    Subclasses implement the reading of each file format.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_path", "_chunk_size"]
+
+    @property
+    def path(self) -> str:
+        """
+        Retrieves the path of the file to be loaded.
+        :return: A string with the file path.
+        """
+        return self._path
+
+    @property
+    def chunk_size(self) -> int:
+        """
+        Retrieves the number of rows read and validated at once.
+        :return: An integer with the chunk size.
+        """
+        return self._chunk_size
+
+    def __init__(self, path: str | PathLike[str], chunk_size: int = 1_000_000):
+        """
+        Initializes a new ParameterLoader instance.
+        :param path: The path of the file to be loaded.
+        :param chunk_size: The number of rows read and validated at once. Defaults to 1,000,000.
+        """
+        # Applies validations
+        if not path:
+            raise LoaderException("The file path cannot be empty.")
+        if chunk_size is None or chunk_size < 1:
+            raise LoaderException("The chunk size must be a positive integer.")
+
+        # Instance attributes
+        self._path: str = fspath(path)
+        """ The path of the file to be loaded. """
+
+        self._chunk_size: int = chunk_size
+        """ The number of rows read and validated at once. """
+
+    @abstractmethod
+    def _read(
+        self,
+        columns: Sequence[Column],
+        on_chunk: Callable[[int, Sequence[Sequence[float]]], None],
+    ) -> List[Sequence[float]]:
+        """
+        Streams the given columns of the file in chunks of `chunk_size` rows.
+        :param columns: The columns to be read.
+        :param on_chunk: A callable invoked with the row offset and the chunk of each column, as they are read.
+        :return: A list with all the values of each column.
+        """
+        pass
+
+    def load_values(
+        self,
+        value_type: ValueType,
+        column: Column = None,
+        definition: ParameterDefinition | None = None,
+        dimensions: Mapping[DimensionDefinition, int] | None = None,
+    ) -> Sequence[float]:
+        """
+        Loads and validates the values of a column.
+        :param value_type: The type of the values.
+        :param column: The column to be loaded. Defaults to the first column of the file.
+        :param definition: An optional parameter definition the values must comply with.
+        :param dimensions: An optional mapping of dimension definitions to their sizes. When given, the column
+            must contain exactly one value per combination of indices.
+        :return: A typed sequence with the values of the column.
+        """
+        return self.__load(
+            columns=[column],
+            value_type=value_type,
+            parameter_type=ParameterType.FIXED,
+            definition=definition,
+            dimensions=dimensions,
+        )[0]
+
+    def load_parameter(
+        self,
+        value_type: ValueType,
+        definition: ParameterDefinition | None = None,
+        column: Column = None,
+        lower_bound_column: Column = None,
+        upper_bound_column: Column = None,
+        dimensions: Mapping[DimensionDefinition, int] | None = None,
+    ) -> MultiValueParameter:
+        """
+        Loads a multi-value parameter. If bound columns are given, the parameter is bounded; otherwise, its
+        values are read from `column`.
+        :param value_type: The type of the parameter values.
+        :param definition: An optional parameter definition the parameter must comply with.
+        :param column: The column with the parameter values. Defaults to the first column of the file.
+        :param lower_bound_column: The column with the lower bounds of a bounded parameter.
+        :param upper_bound_column: The column with the upper bounds of a bounded parameter.
+        :param dimensions: An optional mapping of dimension definitions to their sizes. When given, the columns
+            must contain exactly one value per combination of indices.
+        :return: A `MultiValueParameter` backed by the loaded buffers.
+        """
+        if lower_bound_column is None and upper_bound_column is None:
+            values: Sequence[float] = self.load_values(
+                value_type=value_type, column=column, definition=definition, dimensions=dimensions
+            )
+            return MultiValueParameter(parameter_type=ParameterType.FIXED, value_type=value_type, values=values)
+
+        if lower_bound_column is None or upper_bound_column is None:
+            raise LoaderException("Bounded parameters require both a lower and an upper bound column.")
+
+        lower_bounds, upper_bounds = self.__load(
+            columns=[lower_bound_column, upper_bound_column],
+            value_type=value_type,
+            parameter_type=ParameterType.BOUNDED,
+            definition=definition,
+            dimensions=dimensions,
+        )
+        return MultiValueParameter(
+            parameter_type=ParameterType.BOUNDED,
+            value_type=value_type,
+            lower_bounds=lower_bounds,
+            upper_bounds=upper_bounds,
+        )
+
+    def load_array(
+        self,
+        value_type: ValueType,
+        column: Column = None,
+        definition: ParameterDefinition | None = None,
+        dimensions: Mapping[DimensionDefinition, int] | None = None,
+    ) -> Any:
+        """
+        Loads the values of a column into a read-only NumPy array shaped by the given dimensions, ready to be
+        added to a model with `Model.add_constant_array`. This method requires the optional NumPy dependency.
+        :param value_type: The type of the values.
+        :param column: The column to be loaded. Defaults to the first column of the file.
+        :param definition: An optional parameter definition the values must comply with.
+        :param dimensions: An optional mapping of dimension definitions to their sizes, in axis order.
+            If not given, a one-dimensional array is returned.
+        :return: A read-only NumPy array with the values.
+        """
+        try:
+            np: Any = import_module("numpy")
+        except ImportError:  # pragma: no cover
+            raise NumPyException(
+                "Optional dependency 'NumPy' not found.\nPlease install it using 'pip install pyorlib[numpy]'."
+            )
+
+        values: Sequence[float] = self.load_values(
+            value_type=value_type, column=column, definition=definition, dimensions=dimensions
+        )
+        array: Any = np.asarray(values)
+        if dimensions:
+            array = array.reshape(tuple(dimensions.values()))
+        if array.flags.writeable:
+            array.setflags(write=False)
+        return array
+
+    def __load(
+        self,
+        columns: Sequence[Column],
+        value_type: ValueType,
+        parameter_type: ParameterType,
+        definition: ParameterDefinition | None,
+        dimensions: Mapping[DimensionDefinition, int] | None,
+    ) -> List[Sequence[float]]:
+        """
+        Validates the loading options, then streams and validates the values of the given columns.
+        :param columns: The columns to be loaded.
+        :param value_type: The type of the values.
+        :param parameter_type: The type of the parameter: FIXED for a single column of values,
+            BOUNDED for a lower and an upper bound column.
+        :param definition: An optional parameter definition the values must comply with.
+        :param dimensions: An optional mapping of dimension definitions to their sizes.
+        :return: A list with the values of each column.
+        """
+        if value_type is None:
+            raise LoaderException("The value type cannot be None.")
+        if definition is not None and value_type not in definition.value_types:
+            raise LoaderException(f"The parameter definition does not support {value_type.name} values.")
+        if definition is not None and parameter_type not in definition.parameter_types:
+            raise LoaderException(f"The parameter definition does not support {parameter_type.name} parameters.")
+
+        expected_size: int | None = None
+        if dimensions is not None:
+            for dimension, size in dimensions.items():
+                if size is None or not ValueTypeValidator.is_integer(size):
+                    raise LoaderException(f"The size of dimension '{dimension.name}' must be an integer number.")
+                if dimension.min is not None and size < dimension.min:
+                    raise LoaderException(f"The size of dimension '{dimension.name}' must be >= {dimension.min}.")
+                if dimension.max is not None and size > dimension.max:
+                    raise LoaderException(f"The size of dimension '{dimension.name}' must be <= {dimension.max}.")
+            expected_size = prod(dimensions.values())
+
+        def on_chunk(offset: int, chunks: Sequence[Sequence[float]]) -> None:
+            self.__validate_chunk(
+                offset=offset,
+                chunks=chunks,
+                columns=columns,
+                value_type=value_type,
+                definition=definition,
+                expected_size=expected_size,
+            )
+
+        results: List[Sequence[float]] = self._read(columns=columns, on_chunk=on_chunk)
+
+        num_values: int = len(results[0])
+        if num_values == 0:
+            raise LoaderException(f"No values were found in '{self._path}'.")
+        if expected_size is not None and num_values != expected_size:
+            raise LoaderException(
+                f"Expected {expected_size} values according to the dimensions, but found {num_values}."
+            )
+
+        return results
+
+    def __validate_chunk(
+        self,
+        offset: int,
+        chunks: Sequence[Sequence[float]],
+        columns: Sequence[Column],
+        value_type: ValueType,
+        definition: ParameterDefinition | None,
+        expected_size: int | None,
+    ) -> None:
+        """
+        Validates a chunk of values. With two columns, they are treated as lower and upper bounds.
+        :param offset: The position of the first row of the chunk.
+        :param chunks: The chunk of each column.
+        :param columns: The columns the chunks belong to.
+        :param value_type: The type of the values.
+        :param definition: An optional parameter definition the values must comply with.
+        :param expected_size: The total number of values expected, if known.
+        :return: None.
+        """
+        size: int = len(chunks[0])
+        rows: str = f"rows {offset} to {offset + size - 1}"
+
+        if expected_size is not None and offset + size > expected_size:
+            raise LoaderException(f"Expected {expected_size} values according to the dimensions, but found more.")
+
+        for position, (column, chunk) in enumerate(zip(columns, chunks)):
+            location: str = f"Column '{column if column is not None else 0}', {rows}"
+            lowest, highest = ValueTypeValidator.extremes(chunk)
+
+            if not (-1e20 < lowest and highest < 1e20):
+                raise LoaderException(f"{location}: values cannot be NaN or [+/-]infinity.")
+            if value_type == ValueType.BINARY and not ValueTypeValidator.are_binary(chunk):
+                raise LoaderException(f"{location}: values must be valid binary numbers.")
+            if value_type == ValueType.INTEGER and not ValueTypeValidator.are_integer(chunk):
+                raise LoaderException(f"{location}: values must be valid integer numbers.")
+
+            # Lower bound columns are checked against the minimum, upper bound columns against the maximum.
+            checks_min: bool = len(columns) == 1 or position == 0
+            checks_max: bool = len(columns) == 1 or position == 1
+            if definition is not None and definition.min is not None and checks_min and lowest < definition.min:
+                raise LoaderException(f"{location}: values must be greater than or equal to {definition.min}.")
+            if definition is not None and definition.max is not None and checks_max and highest > definition.max:
+                raise LoaderException(f"{location}: values must be less than or equal to {definition.max}.")
+
+        if len(chunks) == 2 and not ValueTypeValidator.are_ordered(chunks[0], chunks[1]):
+            raise LoaderException(f"{rows}: lower bounds cannot be greater than upper bounds.")
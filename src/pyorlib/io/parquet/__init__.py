@@ -0,0 +1 @@
+from .parquet_loader import ParquetLoader
@@ -0,0 +1,77 @@
+from typing import Any, Callable, List, Sequence
+
+from ..parameter_loader import Column, ParameterLoader
+from ...exceptions import LoaderException
+
+try:  # pragma: no cover
+    import numpy as np
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    raise LoaderException(
+        "Optional dependency 'PyArrow' not found.\nPlease install it using 'pip install pyorlib[parquet]'."
+    )
+
+
+class ParquetLoader(ParameterLoader):
+    """
+    A parameter loader for Parquet files.
+
+    The `ParquetLoader` class memory-maps the file and decodes it in record batches of `chunk_size` rows. Each
+    batch is validated through zero-copy NumPy views of its Arrow buffers and then written into a preallocated
+    NumPy array per column, whose data type follows the column type of the file. Columns are selected by their
+    name or by their position in the schema, and null values are rejected.
+    """
+
+    # Strict class attributes.
+    __slots__: List[str] = []
+
+    def _read(
+        self,
+        columns: Sequence[Column],
+        on_chunk: Callable[[int, Sequence[Sequence[float]]], None],
+    ) -> List[Sequence[float]]:
+        parquet_file: Any = pq.ParquetFile(self._path, memory_map=True)
+        names: List[str] = [
+            self.__name(column=column, schema_names=parquet_file.schema_arrow.names) for column in columns
+        ]
+        num_rows: int = parquet_file.metadata.num_rows
+
+        results: List[Any] = [
+            np.empty(num_rows, dtype=parquet_file.schema_arrow.field(name).type.to_pandas_dtype()) for name in names
+        ]
+        for name, result in zip(names, results):
+            if result.dtype.kind not in "biuf":
+                raise LoaderException(f"Column '{name}' of '{self._path}' must be numeric.")
+        offset: int = 0
+
+        for batch in parquet_file.iter_batches(batch_size=self._chunk_size, columns=list(dict.fromkeys(names))):
+            chunks: List[Any] = []
+            for name in names:
+                arrow_column: Any = batch.column(name)
+                if arrow_column.null_count > 0:
+                    raise LoaderException(f"Column '{name}' of '{self._path}' contains null values.")
+                chunks.append(arrow_column.to_numpy(zero_copy_only=False))
+
+            on_chunk(offset, chunks)
+            for result, chunk in zip(results, chunks):
+                result[offset : offset + len(chunk)] = chunk
+            offset += batch.num_rows
+
+        return results
+
+    def __name(self, column: Column, schema_names: List[str]) -> str:
+        """
+        Resolves the name of a column within the schema of the file.
+        :param column: A column name, a column position, or None for the first column.
+        :param schema_names: The column names of the file schema.
+        :return: The name of the column.
+        """
+        if column is None:
+            column = 0
+        if isinstance(column, int):
+            if not 0 <= column < len(schema_names):
+                raise LoaderException(f"Column position {column} is out of range in '{self._path}'.")
+            return schema_names[column]
+        if column not in schema_names:
+            raise LoaderException(f"Column '{column}' not found in '{self._path}'.")
+        return column
@@ -0,0 +1,2 @@
+from .snapshot_writer import SnapshotWriter
+from .snapshot_reader import SnapshotReader
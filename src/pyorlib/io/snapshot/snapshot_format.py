@@ -0,0 +1,28 @@
+from struct import Struct
+
+SNAPSHOT_MAGIC: bytes = b"PYORSNAP"
+""" The bytes that identify a PyORlib snapshot file. """
+
+SNAPSHOT_VERSION: int = 1
+""" The version of the snapshot layout written by this release. """
+
+SNAPSHOT_HEADER: Struct = Struct("<8sIIqqqdqq")
+"""
+The header of a snapshot file: the magic bytes, the layout version, the optimization type, the number of columns,
+rows and nonzero coefficients, the objective constant, and the sizes of the metadata and names tables.
+
+The header is followed by the arrays of the model, each starting at a multiple of 8 bytes and stored in
+little-endian order: the column types (int8), lower bounds, upper bounds and objective coefficients (float64),
+the term set of each column (int64, -1 for none), the starts and values of the term set indices (int64), the row
+starts and columns (int64), the coefficients and the row lower and upper bounds (float64). The file ends with a
+UTF-8 JSON metadata table and the UTF-8 column names separated by null characters.
+"""
+
+
+def align(offset: int) -> int:
+    """
+    Rounds an offset up to the next multiple of 8 bytes.
+    :param offset: The offset to be aligned.
+    :return: The aligned offset.
+    """
+    return (offset + 7) & ~7
@@ -0,0 +1,114 @@
+import json
+import mmap
+import sys
+from array import array
+from typing import Any, Dict, List, Tuple
+
+from .snapshot_format import SNAPSHOT_HEADER, SNAPSHOT_MAGIC, SNAPSHOT_VERSION, align
+from ..model_reader import ModelReader
+from ..model_record import ModelRecord
+from ...enums import OptimizationType
+from ...exceptions import LoaderException
+
+
+class SnapshotReader(ModelReader):
+    """
+    A model reader for the PyORlib binary snapshot format.
+
+    The `SnapshotReader` class memory-maps the file in read-only mode and returns a record whose arrays are
+    memory views of the mapping, so nothing is parsed or copied except the names and the term set indices. Pages
+    are loaded by the operating system on first access and shared between all processes that map the same file.
+    The mapping stays open for as long as the record, or any view taken from it, is referenced.
+    """
+
+    # Strict class attributes.
+    __slots__: List[str] = []
+
+    def read(self) -> ModelRecord:
+        with open(self._path, "rb") as file:
+            try:
+                mapping: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise LoaderException(f"The snapshot '{self._path}' is empty.")
+
+        buffer: memoryview = memoryview(mapping)
+        if len(buffer) < SNAPSHOT_HEADER.size:
+            raise LoaderException(f"The file '{self._path}' is not a PyORlib snapshot.")
+
+        (
+            magic,
+            version,
+            opt_type,
+            num_columns,
+            num_rows,
+            num_nonzeros,
+            objective_constant,
+            metadata_size,
+            names_size,
+        ) = SNAPSHOT_HEADER.unpack_from(buffer)
+        if magic != SNAPSHOT_MAGIC:
+            raise LoaderException(f"The file '{self._path}' is not a PyORlib snapshot.")
+        if version != SNAPSHOT_VERSION:
+            raise LoaderException(
+                f"The snapshot '{self._path}' has version {version}, but only version {SNAPSHOT_VERSION} is supported."
+            )
+
+        offset: int = SNAPSHOT_HEADER.size
+
+        def view(typecode: str, length: int) -> Any:
+            nonlocal offset
+            size: int = array(typecode).itemsize * length
+            if offset + size > len(buffer):
+                raise LoaderException(f"The snapshot '{self._path}' is truncated.")
+            values: Any = buffer[offset : offset + size].cast(typecode)  # type: ignore[call-overload]
+            offset = align(offset + size)
+            if sys.byteorder != "little":  # pragma: no cover
+                values = array(typecode, values)
+                values.byteswap()
+            return values
+
+        column_types = view("b", num_columns)
+        column_lower_bounds = view("d", num_columns)
+        column_upper_bounds = view("d", num_columns)
+        objective = view("d", num_columns)
+        column_sets = view("q", num_columns)
+        index_starts = view("q", num_columns + 1)
+        indices = view("q", index_starts[num_columns])
+        row_starts = view("q", num_rows + 1)
+        row_columns = view("q", num_nonzeros)
+        row_values = view("d", num_nonzeros)
+        row_lower_bounds = view("d", num_rows)
+        row_upper_bounds = view("d", num_rows)
+
+        if offset + metadata_size + names_size > len(buffer):
+            raise LoaderException(f"The snapshot '{self._path}' is truncated.")
+        metadata: Dict[str, Any] = json.loads(bytes(buffer[offset : offset + metadata_size]))
+        offset += metadata_size
+        names: str = bytes(buffer[offset : offset + names_size]).decode()
+
+        # Rebuilds the term sets from the set position and the contiguous indices of each column.
+        set_names: List[str] = metadata["sets"]
+        term_sets: Dict[str, Dict[Tuple[int, ...], int]] = {set_name: {} for set_name in set_names}
+        for column in range(num_columns):
+            set_position: int = column_sets[column]
+            if set_position >= 0:
+                set_index: Tuple[int, ...] = tuple(indices[index_starts[column] : index_starts[column + 1]])
+                term_sets[set_names[set_position]][set_index] = column
+
+        return ModelRecord(
+            name=metadata["name"],
+            opt_type=OptimizationType(opt_type),
+            objective_constant=objective_constant,
+            column_names=names.split("\0") if num_columns else [],
+            column_types=column_types,
+            column_lower_bounds=column_lower_bounds,
+            column_upper_bounds=column_upper_bounds,
+            objective=objective,
+            row_starts=row_starts,
+            row_columns=row_columns,
+            row_values=row_values,
+            row_lower_bounds=row_lower_bounds,
+            row_upper_bounds=row_upper_bounds,
+            term_sets=term_sets,
+            dimensions=metadata["dimensions"],
+        )
@@ -0,0 +1,160 @@
+import json
+import sys
+from array import array
+from os import PathLike
+from typing import Any, BinaryIO, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from .snapshot_format import SNAPSHOT_HEADER, SNAPSHOT_MAGIC, SNAPSHOT_VERSION, align
+from ..model_writer import LinearObjective, LinearRow, ModelWriter
+from ...algebra.terms import Term
+from ...algebra.terms.variables import Variable
+from ...exceptions import WriterException
+
+
+class SnapshotWriter(ModelWriter):
+    """
+    A model writer for the PyORlib binary snapshot format.
+
+    The `SnapshotWriter` class stores the columns and the compressed sparse row record of the constraints as raw
+    little-endian arrays behind a versioned header, so that they can be memory-mapped by the `SnapshotReader`
+    without parsing. Unlike the text formats, snapshots also keep the term sets of the variables and the
+    dimensions of the model, and names are stored as they are, without restrictions.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_term_sets", "_dimensions"]
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        term_sets: Mapping[str, Mapping[Tuple[int, ...], Term]] | None = None,
+        dimensions: Mapping[str, int] | None = None,
+    ):
+        """
+        Initializes a new SnapshotWriter instance.
+        :param path: The path of the file to be written. Snapshots are never compressed, since they are
+            memory-mapped when loaded.
+        :param term_sets: The term sets of the model, used to record the set and index of each variable.
+            Defaults to None.
+        :param dimensions: The dimensions of the model. Defaults to None.
+        """
+        super().__init__(path=path, compress=False)
+
+        if self._path.endswith(".gz"):
+            raise WriterException("Snapshots cannot be compressed, since they are memory-mapped when loaded.")
+
+        # Instance attributes
+        self._term_sets: Mapping[str, Mapping[Tuple[int, ...], Term]] = term_sets or {}
+        """ The term sets of the model. """
+
+        self._dimensions: Dict[str, int] = dict(dimensions or {})
+        """ The dimensions of the model. """
+
+    def write(
+        self,
+        name: str,
+        variables: Sequence[Variable],
+        objective: LinearObjective,
+        rows: Iterable[LinearRow],
+        column_names: Sequence[str] | None = None,
+    ) -> None:
+        objective_columns, objective_coefficients, objective_constant, opt_type = objective
+        num_columns: int = len(variables)
+
+        column_types: array[int] = array("b", (variable.value_type for variable in variables))
+        column_lower_bounds: array[float] = array("d", (variable.lower_bound for variable in variables))
+        column_upper_bounds: array[float] = array("d", (variable.upper_bound for variable in variables))
+        costs: array[float] = array("d", bytes(8 * num_columns))
+        for position, coefficient in zip(objective_columns, objective_coefficients):
+            costs[position] += coefficient
+
+        # The term set and index of each column, with the indices of all columns stored contiguously.
+        positions: Dict[int, int] = {id(variable): column for column, variable in enumerate(variables)}
+        set_names: List[str] = []
+        column_sets: array[int] = array("q", [-1]) * num_columns
+        set_indices: List[Tuple[int, ...]] = [()] * num_columns
+        for set_name, terms in self._term_sets.items():
+            set_position: int | None = None
+            for set_index, term in terms.items():
+                column: int | None = positions.get(id(term))
+                if column is None:
+                    continue
+                if set_position is None:
+                    set_position = len(set_names)
+                    set_names.append(set_name)
+                column_sets[column] = set_position
+                set_indices[column] = set_index
+
+        index_starts: array[int] = array("q", [0])
+        indices: array[int] = array("q")
+        for set_index in set_indices:
+            indices.extend(set_index)
+            index_starts.append(len(indices))
+        del set_indices, positions
+
+        # The compressed sparse row record of the constraints.
+        row_starts: array[int] = array("q", [0])
+        row_columns: array[int] = array("q")
+        row_values: array[float] = array("d")
+        row_lower_bounds: array[float] = array("d")
+        row_upper_bounds: array[float] = array("d")
+        for columns, coefficients, lower_bound, upper_bound in rows:
+            row_columns.extend(columns)
+            row_values.extend(coefficients)
+            row_starts.append(len(row_columns))
+            row_lower_bounds.append(lower_bound)
+            row_upper_bounds.append(upper_bound)
+
+        metadata: bytes = json.dumps({"name": name, "sets": set_names, "dimensions": self._dimensions}).encode()
+        names: bytes = "\0".join(column_names or [variable.name for variable in variables]).encode()
+
+        with open(self._path, "wb") as file:
+            file.write(
+                SNAPSHOT_HEADER.pack(
+                    SNAPSHOT_MAGIC,
+                    SNAPSHOT_VERSION,
+                    opt_type.value,
+                    num_columns,
+                    len(row_lower_bounds),
+                    len(row_values),
+                    objective_constant,
+                    len(metadata),
+                    len(names),
+                )
+            )
+            offset: int = SNAPSHOT_HEADER.size
+            arrays: List["array[Any]"] = [
+                column_types,
+                column_lower_bounds,
+                column_upper_bounds,
+                costs,
+                column_sets,
+                index_starts,
+                indices,
+                row_starts,
+                row_columns,
+                row_values,
+                row_lower_bounds,
+                row_upper_bounds,
+            ]
+            for values in arrays:
+                offset = self.__write_array(file=file, values=values, offset=offset)
+            file.write(metadata)
+            file.write(names)
+
+    @staticmethod
+    def __write_array(file: BinaryIO, values: "array[Any]", offset: int) -> int:
+        """
+        Writes an array in little-endian order, padded to a multiple of 8 bytes.
+        :param file: The file being written.
+        :param values: The array to be written.
+        :param offset: The current offset in the file.
+        :return: The offset after the array and its padding.
+        """
+        if sys.byteorder != "little":  # pragma: no cover
+            values = array(values.typecode, values)
+            values.byteswap()
+        file.write(values)
+        size: int = values.itemsize * len(values)
+        file.write(bytes(align(offset + size) - offset - size))
+        return align(offset + size)
@@ -1 +1,8 @@
+from .constraint_index import ConstraintIndex
+from .lazy_constraint_report import LazyConstraintReport
+from .lazy_constraint_round import LazyConstraintRound
+from .lazy_term_set import LazyTermSet
 from .model import Model
+from .model_observer import ModelObserver
+from .model_stats import ModelStats
+from .scenario import Scenario
@@ -0,0 +1,145 @@
+from math import isfinite
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from ..algebra import Element
+from ..exceptions import ModelException
+
+
+class ConstraintIndex:
+    """
+    Represents a hashing index over the linear constraints of a model.
+
+    The `ConstraintIndex` class canonicalizes each linear constraint before it reaches the engine: its variables
+    are sorted, duplicates are summed, and the coefficients are divided by the first one, so that constraints
+    that are multiples of each other share the same key. A constraint whose key is already indexed is dropped
+    when its bounds are equal to or looser than the indexed ones, and otherwise it is added and its bounds are
+    merged into the index, so later constraints are compared against the tightest bounds seen so far.
+
+    Constraints that were already sent to the engine are never modified, so the index only removes rows at
+    insertion, and models with an index do not accept columns, which would change indexed rows. It is enabled by
+    passing it to the `Model` constructor.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_drop_dominated", "_tolerance", "_rows", "_stats"]
+
+    @property
+    def tolerance(self) -> float:
+        """
+        Retrieves the tolerance used to compare coefficients and bounds.
+        :return: A float with the tolerance.
+        """
+        return self._tolerance
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Retrieves the number of constraints processed by the index, by outcome.
+        :return: A dictionary with the number of indexed, duplicate, dominated and merged rows.
+        """
+        return dict(self._stats)
+
+    @property
+    def num_removed_rows(self) -> int:
+        """
+        Retrieves the number of constraints that were not added to the engine.
+        :return: An integer with the number of duplicate and dominated rows.
+        """
+        return self._stats["duplicate_rows"] + self._stats["dominated_rows"]
+
+    def __init__(self, drop_dominated: bool = True, tolerance: float = 1e-9):
+        """
+        Initializes a new ConstraintIndex instance.
+        :param drop_dominated: Whether to drop constraints whose bounds are looser than those of an equivalent
+            indexed constraint. If False, only exact duplicates are dropped. Defaults to True.
+        :param tolerance: The tolerance used to compare coefficients and bounds. Defaults to 1e-9.
+        """
+        # Applies validations
+        if tolerance <= 0:
+            raise ModelException("The tolerance of the constraint index must be positive.")
+
+        # Instance attributes
+        self._drop_dominated: bool = drop_dominated
+        """ Whether to drop constraints that are dominated by an equivalent indexed constraint. """
+
+        self._tolerance: float = tolerance
+        """ The tolerance used to compare coefficients and bounds. """
+
+        self._rows: Dict[Tuple[Any, ...], Tuple[float, float, Element]] = {}
+        """ The bounds and the constraint kept for each canonical row. """
+
+        self._stats: Dict[str, int] = {"indexed_rows": 0, "duplicate_rows": 0, "dominated_rows": 0, "merged_rows": 0}
+        """ The number of constraints processed by the index, by outcome. """
+
+    def add(
+        self,
+        row: Tuple[Sequence[Any], Sequence[float], float, float],
+        add_constraint: Callable[[], Element],
+    ) -> Element:
+        """
+        Indexes a linear constraint and adds it to the engine unless an equivalent constraint makes it redundant.
+        :param row: The linear decomposition of the constraint, with the variable keys, the coefficients, and the
+            lower and upper bounds.
+        :param add_constraint: A callable that adds the constraint to the engine and returns it.
+        :return: The constraint added to the engine, or the indexed constraint that makes it redundant.
+        """
+        keys, coefficients, lower_bound, upper_bound = row
+
+        # Coefficients of repeated variables are summed, and zeros are dropped.
+        entries: Dict[Any, float] = {}
+        for key, coefficient in zip(keys, coefficients):
+            entries[key] = entries.get(key, 0.0) + coefficient
+        sorted_entries: List[Tuple[Any, float]] = sorted(
+            (key, coefficient) for key, coefficient in entries.items() if abs(coefficient) > self._tolerance
+        )
+        if not sorted_entries:
+            return add_constraint()
+
+        # Rows are normalized by their first coefficient, and the coefficients are hashed on the tolerance grid.
+        scale: float = sorted_entries[0][1]
+        canonical_key: Tuple[Any, ...] = tuple(
+            (key, round(coefficient / scale / self._tolerance)) for key, coefficient in sorted_entries
+        )
+        if scale > 0:
+            lower_bound, upper_bound = lower_bound / scale, upper_bound / scale
+        else:
+            lower_bound, upper_bound = upper_bound / scale, lower_bound / scale
+
+        indexed: Tuple[float, float, Element] | None = self._rows.get(canonical_key)
+        if indexed is None:
+            constraint: Element = add_constraint()
+            self._rows[canonical_key] = (lower_bound, upper_bound, constraint)
+            self._stats["indexed_rows"] += 1
+            return constraint
+
+        indexed_lower_bound, indexed_upper_bound, indexed_constraint = indexed
+        lower_equal: bool = self.__equal(lower_bound, indexed_lower_bound)
+        upper_equal: bool = self.__equal(upper_bound, indexed_upper_bound)
+        if lower_equal and upper_equal:
+            self._stats["duplicate_rows"] += 1
+            return indexed_constraint
+
+        if not self._drop_dominated:
+            return add_constraint()
+
+        if (lower_equal or lower_bound < indexed_lower_bound) and (upper_equal or upper_bound > indexed_upper_bound):
+            self._stats["dominated_rows"] += 1
+            return indexed_constraint
+
+        constraint = add_constraint()
+        self._rows[canonical_key] = (
+            max(lower_bound, indexed_lower_bound),
+            min(upper_bound, indexed_upper_bound),
+            constraint,
+        )
+        self._stats["merged_rows"] += 1
+        return constraint
+
+    def __equal(self, bound: float, other: float) -> bool:
+        """
+        Determines whether two bounds are equal within the tolerance.
+        :param bound: The first bound.
+        :param other: The second bound.
+        :return: True if the bounds are equal, False otherwise.
+        """
+        return bound == other or (isfinite(other) and abs(bound - other) <= self._tolerance * (1 + abs(other)))
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from ..enums import SolutionStatus
+from .lazy_constraint_round import LazyConstraintRound
+
+
+@dataclass(frozen=True)
+class LazyConstraintReport:
+    """
+    Represents the outcome of a solve with lazy constraints.
+    """
+
+    status: SolutionStatus
+    """ The status of the last solution of the model. """
+
+    native: bool
+    """ Whether the lazy constraints were added natively by the solver while solving, rather than by
+    re-solving the model. """
+
+    converged: bool
+    """ Whether the last solution satisfies all the lazy constraints, that is, the separator returned no
+    violated constraint for it. """
+
+    wall_time: float
+    """ The elapsed wall time of the whole solve in seconds. """
+
+    rounds: Tuple[LazyConstraintRound, ...]
+    """ The rounds of the solve, in order. """
+
+    @property
+    def num_rounds(self) -> int:
+        """
+        Retrieves the number of rounds of the solve.
+        :return: The number of times the separator was called.
+        """
+        return len(self.rounds)
+
+    @property
+    def num_cuts(self) -> int:
+        """
+        Retrieves the number of lazy constraints added during the solve.
+        :return: The total number of violated constraints returned by the separator.
+        """
+        return sum(lazy_round.cuts_added for lazy_round in self.rounds)
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LazyConstraintRound:
+    """
+    Represents a round of a solve with lazy constraints, in which the separator checks a solution.
+    """
+
+    round: int
+    """ The number of the round, starting at 1. """
+
+    cuts_added: int
+    """ The number of violated constraints returned by the separator, which are added in the round. """
+
+    wall_time: float
+    """ The elapsed wall time of the round in seconds: the separation of a candidate incumbent when lazy
+    constraints are added natively, or the solve and the separation when the model is re-solved. """
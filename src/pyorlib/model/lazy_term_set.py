@@ -0,0 +1,140 @@
+from typing import Callable, Dict, Iterator, Mapping, Tuple, TypeVar, overload
+
+from ..algebra import Term
+from ..exceptions import ModelException
+from ..structures import IndexSet
+
+_T = TypeVar("_T")
+
+
+class LazyTermSet(Mapping[Tuple[int, ...], Term]):
+    """
+    Represents a set of terms whose terms are only created when they are first accessed.
+
+    Lazy term sets are created with `Model.add_lazy_variables_to_set` over a declared domain, which can be much
+    larger than the terms the model actually needs, such as the columns of a column generation formulation.
+    Accessing an index of the domain that was not used before creates its variable in the engine, so the memory
+    of the model grows with the variables in use rather than with the size of the domain. Iterating the set,
+    its length, membership tests and `get` only consider the materialized terms, which are also the terms of
+    the set in `Model.term_sets`, so read-only lookups never create variables. Once frozen, typically before
+    solving, the set no longer creates terms.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_set_name", "_domain", "_terms", "_create", "_frozen"]
+
+    @property
+    def set_name(self) -> str:
+        """
+        Retrieves the name of the set.
+        :return: A string with the name of the set.
+        """
+        return self._set_name
+
+    @property
+    def domain(self) -> IndexSet:
+        """
+        Retrieves the declared domain of the set.
+        :return: The index set with all the indices whose terms can be created.
+        """
+        return self._domain
+
+    @property
+    def materialized_count(self) -> int:
+        """
+        Retrieves the number of terms created so far.
+        :return: An integer with the number of materialized terms.
+        """
+        return len(self._terms)
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Determines whether the set no longer creates terms.
+        :return: `True` if the set is frozen, `False` otherwise.
+        """
+        return self._frozen
+
+    def __init__(
+        self,
+        set_name: str,
+        domain: IndexSet,
+        terms: Dict[Tuple[int, ...], Term],
+        create: Callable[[Tuple[int, ...]], Term],
+    ):
+        """
+        Initializes a new LazyTermSet instance.
+        :param set_name: The name of the set.
+        :param domain: The declared domain of the set.
+        :param terms: The dictionary where the created terms are stored by index.
+        :param create: A callable that creates and stores the term of an index of the domain.
+        """
+        # Instance attributes
+        self._set_name: str = set_name
+        """ The name of the set. """
+
+        self._domain: IndexSet = domain
+        """ The declared domain of the set. """
+
+        self._terms: Dict[Tuple[int, ...], Term] = terms
+        """ The terms created so far, by index. """
+
+        self._create: Callable[[Tuple[int, ...]], Term] = create
+        """ The callable that creates and stores the term of an index of the domain. """
+
+        self._frozen: bool = False
+        """ Whether the set no longer creates terms. """
+
+    def __getitem__(self, index: Tuple[int, ...]) -> Term:
+        term: Term | None = self._terms.get(index)
+        if term is not None:
+            return term
+        if index not in self._domain:
+            raise KeyError(index)
+        if self._frozen:
+            raise ModelException(f"The term set '{self._set_name}' is frozen and cannot create the term {index}.")
+        return self._create(index)
+
+    @overload
+    def get(self, index: Tuple[int, ...], /) -> Term | None: ...
+
+    @overload
+    def get(self, index: Tuple[int, ...], /, default: Term | _T) -> Term | _T: ...
+
+    def get(self, index: Tuple[int, ...], /, default: Term | _T | None = None) -> Term | _T | None:
+        """
+        Retrieves the term of an index if it was already created, without creating it.
+        :param index: The index of the term.
+        :param default: The value returned if the term of the index was not created. Defaults to None.
+        :return: The term of the index, or the default value.
+        """
+        return self._terms.get(index, default)
+
+    def __contains__(self, index: object) -> bool:
+        return index in self._terms
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        return iter(self._terms)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyTermSet(set_name={self._set_name!r}, materialized={len(self._terms)}, "
+            f"declared={len(self._domain)}, frozen={self._frozen})"
+        )
+
+    def freeze(self) -> None:
+        """
+        Freezes the set, so that accessing an index whose term was not created raises an exception instead.
+        :return: None.
+        """
+        self._frozen = True
+
+    def unfreeze(self) -> None:
+        """
+        Allows the set to create terms again, such as before adding new columns to a solved model.
+        :return: None.
+        """
+        self._frozen = False
@@ -1,16 +1,88 @@
-from math import inf
-from typing import Dict, Tuple, List, Mapping
+import gc
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+from itertools import chain, islice
+from math import ceil, floor, inf, isfinite
+from os import PathLike, fspath
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple, List, Mapping, Sequence, TypeVar, TYPE_CHECKING, cast
+from dataclasses import replace
 from uuid import uuid4
 
-from ..algebra import Element
+from ..algebra import Element, Expression
 from ..algebra.terms import Term
 from ..algebra.terms.constants import Constant
 from ..algebra.terms.variables import Variable
+from .constraint_index import ConstraintIndex
+from .lazy_constraint_report import LazyConstraintReport
+from .lazy_constraint_round import LazyConstraintRound
+from .lazy_term_set import LazyTermSet
+from .model_observer import ModelObserver
+from .model_stats import ModelStats
+from .scenario import Scenario
 from ..core.constants import StdOutColors
-from ..core.loggers import Logger
+from ..core.exceptions import PyORlibException
+from ..core.loggers import LazyMessage, Logger
 from ..engines import Engine
 from ..enums import SolutionStatus, ValueType, OptimizationType
-from ..exceptions import ModelException
+from ..exceptions import EngineException, ModelException
+from ..structures import IndexSet, NameTemplate
+
+# The solve cache, file formats, presolve and profiling are imported when used, to keep the import of the
+# package cheap.
+if TYPE_CHECKING:  # pragma: no cover
+    from ..algebra.arrays import ConstantArray
+    from ..cache import ModelFingerprint, Solution, SolveCache
+    from ..io import LinearObjective, LinearRow, ModelReader, ModelRecord, ModelWriter
+    from ..presolve import PostsolveMap, Presolver
+    from ..profiling import ProfiledEngine, Profiler
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _profiled(phase: str) -> Callable[[_Method], _Method]:
+    """
+    Records the calls of a model method as a phase of the profiler of the model, if it has one.
+    :param phase: The name of the phase.
+    :return: A decorator for model methods.
+    """
+
+    def decorator(method: _Method) -> _Method:
+        @wraps(method)
+        def wrapper(self: "Model", *args: Any, **kwargs: Any) -> Any:
+            profiler: Profiler | None = self._profiler
+            if profiler is None:
+                return method(self, *args, **kwargs)
+            with profiler.measure(engine=self._engine.name, phase=phase):
+                return method(self, *args, **kwargs)
+
+        return cast(_Method, wrapper)
+
+    return decorator
+
+
+def _default_name(set_name: str, set_index: Tuple[int, ...]) -> str:
+    """
+    Builds the default name of a term within a set, from the set name and the indices (e.g. `x_1_2`).
+    :param set_name: The name of the set.
+    :param set_index: The indices of the term.
+    :return: The name of the term.
+    """
+    return "_".join([set_name, *map(str, set_index)])
+
+
+def _printable(element: Element) -> str:
+    """
+    Converts an element to text for the logs.
+    :param element: The element to convert.
+    :return: The text of the element, or a placeholder if it is too deeply nested to be printed.
+    """
+    try:
+        return str(element)
+    except RecursionError:
+        return "Unprintable expression"
 
 
 class Model:
@@ -69,6 +141,23 @@ class Model:
         """
         return self._term_sets
 
+    @property
+    def lazy_term_sets(self) -> Mapping[str, LazyTermSet]:
+        """
+        Retrieves the lazy term sets of the model, whose terms are created on first access.
+        :return: A mapping with the lazy term sets, by set name.
+        """
+        return self._lazy_term_sets
+
+    @property
+    def constant_arrays(self) -> Mapping[str, "ConstantArray"]:
+        """
+        Retrieves a dictionary of constant arrays used in the model.
+        :return: A dictionary where the keys represent the names of the sets and the values
+            represent the constant arrays that store them.
+        """
+        return self._constant_arrays
+
     @property
     def objective_value(self) -> float | None:
         """
@@ -76,7 +165,8 @@ class Model:
         :return: The value of the objective function, or `None` if the model has
             not been solved or an objective function is not defined.
         """
-        return self._engine.objective_value
+        solution: Solution | None = self.solution if self._solution is not None else None
+        return solution.objective_value if solution is not None else self._engine.objective_value
 
     @property
     def objective_expr(self) -> Element | None:
@@ -86,13 +176,97 @@ class Model:
         """
         return self._engine.objective_expr
 
+    @property
+    def postsolve_map(self) -> "PostsolveMap | None":
+        """
+        Retrieves the postsolve map of the model, if it was built from a presolved record.
+        :return: The map between the original columns and those sent to the engine, or `None` if the model
+            was not presolved.
+        """
+        return self._postsolve_map
+
+    @property
+    def constraint_index(self) -> ConstraintIndex | None:
+        """
+        Retrieves the index used to drop duplicate and dominated constraints, if enabled.
+        :return: The constraint index of the model, or `None` if constraints are added as they are.
+        """
+        return self._constraint_index
+
+    @property
+    def profiler(self) -> "Profiler | None":
+        """
+        This property is used to get or set the profiler of the model.
+        While a profiler is set, the modeling and solving calls of the model and its engine are recorded in it,
+        as are the values read through `get_values` and the objective value and status of the solution. Values
+        read from the variables themselves (`Variable.value`) go directly to the solver and are not recorded.
+        Setting it to None disables profiling.
+        :return: The profiler of the model, or `None` if profiling is disabled.
+        """
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: "Profiler | None") -> None:
+        from ..profiling import ProfiledEngine
+
+        engine: Engine = self.__unwrapped_engine()
+        self._engine: Engine = engine if profiler is None else ProfiledEngine(engine=engine, profiler=profiler)
+        self._profiler: Profiler | None = profiler
+        """ The profiler in which the calls of the model are recorded, if profiling is enabled. """
+
+    @property
+    def observers(self) -> Tuple[ModelObserver, ...]:
+        """
+        Retrieves the observers registered in the model.
+        :return: A tuple with the observers, in registration order.
+        """
+        return self._observers
+
+    @property
+    def anonymous(self) -> bool:
+        """
+        Determines whether the variables added to sets are created without names in the engine.
+        :return: `True` if the model is anonymous, `False` otherwise.
+        """
+        return self._anonymous
+
+    @property
+    def solve_cache(self) -> "SolveCache | None":
+        """
+        Retrieves the cache of solutions of the model, if enabled.
+        :return: The solve cache of the model, or `None` if solutions are not cached.
+        """
+        return self._solve_cache
+
+    @property
+    def fingerprint(self) -> str | None:
+        """
+        Retrieves the fingerprint of the structure and data of the model, if it has a solve cache.
+        :return: A hexadecimal string with the fingerprint, or `None` if the model has no solve cache.
+        """
+        return self._fingerprint.digest if self._fingerprint is not None else None
+
+    @property
+    def solution(self) -> "Solution | None":
+        """
+        Retrieves the solution of the last solve, if the model has a solve cache and was not modified since.
+        When the solution comes from the cache, the solver was not called, so the values of the variables
+        must be read through this solution or `get_values` rather than from the variables themselves.
+        :return: The solution of the model, or `None` if it is not available.
+        """
+        if self._solution is None or self._fingerprint is None:
+            return None
+        fingerprint, solution = self._solution
+        return solution if fingerprint == self._fingerprint.digest else None
+
     @property
     def solution_status(self) -> SolutionStatus:
         """
         Retrieves an enumeration that represents the state of the solution.
         :return: An enumeration that represents the state of the solution.
         """
-        return self._engine.solution_status
+        solution: Solution | None = self.solution if self._solution is not None else None
+        return solution.status if solution is not None else self._engine.solution_status
 
     @property
     def float_precision(self) -> int:
@@ -114,13 +288,36 @@ class Model:
         self._float_precision: int = num_digits
         """ The float precision is an integer number of digits, used in printing the solution and objective. """
 
-    def __init__(self, engine: Engine, name: str | None = None, debug: bool = False, float_precision: int = 6):
+    def __init__(
+        self,
+        engine: Engine,
+        name: str | None = None,
+        debug: bool = False,
+        float_precision: int = 6,
+        constraint_index: ConstraintIndex | None = None,
+        collect_stats: bool = False,
+        profiler: "Profiler | None" = None,
+        anonymous: bool = False,
+        solve_cache: "SolveCache | None" = None,
+    ):
         """
         Initializes a new instance of the `Model` class.
         :param engine: The engine interface to be used for solving the model.
         :param name: An optional name for the model. Defaults to None.
         :param debug: A flag indicating whether debug mode is enabled. Defaults to False.
         :param float_precision: The number of digits used in printing the solution and objective. Defaults to 6.
+        :param constraint_index: An optional index used to drop duplicate and dominated linear constraints
+            before they reach the engine. Defaults to None.
+        :param collect_stats: Whether to keep the statistics of the model up to date. Collecting them requires the
+            linear decomposition of each constraint, which slows down builds, so it is opt-in. Defaults to False.
+        :param profiler: An optional profiler in which the calls of the model and its engine are recorded.
+            Defaults to None.
+        :param anonymous: Whether the variables added to sets are created without names in the engine. Their
+            names are rendered from the template or the default naming of their set only when requested, such
+            as when the model is exported, and they are not stored among the individual terms. Defaults to False.
+        :param solve_cache: An optional cache of solutions. The model then keeps a fingerprint of its structure
+            and data, and solving it returns the cached solution, if any, without calling the solver. Models with
+            constraints or an objective that have no linear decomposition are always solved. Defaults to None.
         """
         # Instance attributes
         self._name: str = name if name else f"model_{str(uuid4())}"
@@ -129,8 +326,8 @@ class Model:
         self._logger: Logger = Logger(self._name, debug)
         """ An object used for logging messages from the model. """
 
-        self._engine: Engine = engine
-        """ The engine interface used to solve the model. """
+        self._engine = engine
+        """ The engine interface used to solve the model, wrapped by a `ProfiledEngine` while profiling. """
 
         self._dimensions: Dict[str, int] = {}
         """  
@@ -160,9 +357,72 @@ class Model:
             }
         """
 
+        self._constant_arrays: Dict[str, "ConstantArray"] = {}
+        """
+        Stores sets of constants held in dense arrays. Each array is represented by a key-value pair,
+        where the key is the name of the set and the value is the constant array itself.
+        """
+
+        self._postsolve_map: PostsolveMap | None = None
+        """ The map between the original columns and those sent to the engine, if the model was presolved. """
+
+        self._constraint_index: ConstraintIndex | None = constraint_index
+        """ The index used to drop duplicate and dominated constraints, if enabled. """
+
+        self._stats: ModelStats | None = ModelStats() if collect_stats else None
+        """ The statistics of the model, updated as terms and constraints are added, if enabled. """
+
+        self._bulk_terms: List[Tuple[str | None, str | None, Tuple[int, ...] | None, Term]] | None = None
+        """ The name, set name, set index and term of each term added within a bulk build, if one is active. """
+
+        self._anonymous: bool = anonymous
+        """ Whether the variables added to sets are created without names in the engine. """
+
+        self._name_templates: Dict[str, NameTemplate | None] = {}
+        """ The name template of each set of anonymous variables, or None if the set uses the default naming. """
+
+        self._lazy_term_sets: Dict[str, LazyTermSet] = {}
+        """ The lazy term sets of the model, by set name. """
+
+        self._solve_cache: SolveCache | None = solve_cache
+        """ The cache of solutions of the model, if enabled. """
+
+        self._fingerprint: ModelFingerprint | None = None
+        if solve_cache is not None:
+            from ..cache import ModelFingerprint
+
+            self._fingerprint = ModelFingerprint()
+        """ The fingerprint of the structure and data of the model, kept only if it has a solve cache. """
+
+        self._solution: Tuple[str, Solution] | None = None
+        """ The fingerprint of the model and the solution of its last solve, if the model has a solve cache. """
+
         if self._engine is None:
             raise ModelException("The engine interface cannot be None.")
 
+        self.profiler = profiler
+
+        self._observers: Tuple[ModelObserver, ...] = ()
+        """ The observers registered in the model. """
+
+        self._on_variable_added: Tuple[Callable[[Model, Variable], None], ...] = ()
+        """ The observer methods called after a variable is added. """
+
+        self._on_constraint_added: Tuple[Callable[[Model, Element], None], ...] = ()
+        """ The observer methods called after a constraint is added to the engine. """
+
+        self._on_objective_set: Tuple[Callable[[Model, Element], None], ...] = ()
+        """ The observer methods called after the objective function is defined. """
+
+        self._on_solve_started: Tuple[Callable[[Model], None], ...] = ()
+        """ The observer methods called before solving the model. """
+
+        self._on_incumbent_found: Tuple[Callable[[Model, float], None], ...] = ()
+        """ The observer methods called when the solver finds an improving solution. """
+
+        self._on_solve_finished: Tuple[Callable[[Model], None], ...] = ()
+        """ The observer methods called after solving the model. """
+
         if self._logger.debug_enabled:  # pragma: no cover
             self._logger.debug(
                 f"The '{StdOutColors.PURPLE}{self.name.capitalize()}{StdOutColors.DEFAULT}' has been created."
@@ -170,6 +430,123 @@ class Model:
 
         self.float_precision = float_precision
 
+    @contextmanager
+    def bulk(self) -> Iterator["Model"]:
+        """
+        Creates a context for building large models, in which the per-call work of adding terms and constraints
+        is suspended or deferred until the context ends.
+
+        Within the context, the cyclic garbage collector is disabled, debug logs and observer events of added
+        terms, constraints and objectives are not emitted, and the engine defers per-call work such as updating
+        the solver model. Duplicate names and set indices are checked once when the context ends, which raises
+        a `ModelException` if any are found, leaving the model in an inconsistent state. The statistics of the
+        terms added within the context are also recorded when it ends. Nested contexts have no further effect.
+        :return: A context manager that yields the model.
+        """
+        if self._bulk_terms is not None:
+            yield self
+            return
+
+        bulk_terms: List[Tuple[str | None, str | None, Tuple[int, ...] | None, Term]] = []
+        num_terms: int = len(self._terms)
+        set_sizes: Dict[str, int] = {set_name: len(term_set) for set_name, term_set in self._term_sets.items()}
+        logger: Logger = self._logger
+        gc_enabled: bool = gc.isenabled()
+
+        gc.disable()
+        self._logger = Logger(self._name, debug=False)
+        self._bulk_terms = bulk_terms
+        self.__dispatch_events()
+        self._engine.begin_batch()
+        try:
+            yield self
+        finally:
+            self._engine.end_batch()
+            self._bulk_terms = None
+            self.__dispatch_events()
+            self._logger = logger
+            if gc_enabled:
+                gc.enable()
+
+        self.__validate_bulk_terms(bulk_terms=bulk_terms, num_terms=num_terms, set_sizes=set_sizes)
+
+        stats: ModelStats | None = self._stats
+        fingerprint: ModelFingerprint | None = self._fingerprint
+        if stats is not None or fingerprint is not None:
+            for name, _, _, term in bulk_terms:
+                if isinstance(term, Variable):
+                    if stats is not None:
+                        stats.record_variable(
+                            name=name or "",
+                            value_type=term.value_type,
+                            lower_bound=term.lower_bound,
+                            upper_bound=term.upper_bound,
+                        )
+                    if fingerprint is not None:
+                        fingerprint.add_variable(
+                            value_type=term.value_type, lower_bound=term.lower_bound, upper_bound=term.upper_bound
+                        )
+                elif stats is not None:
+                    stats.record_constant(name=cast(str, name))
+
+        if self._logger.debug_enabled:  # pragma: no cover
+            self._logger.debug("%d terms added in bulk.", len(bulk_terms), action="Bulk build finished: ")
+
+    def add_observer(self, observer: ModelObserver) -> None:
+        """
+        Registers an observer of the events of the model.
+        :param observer: The observer to be registered. Only the event methods it overrides are called.
+        :return: None.
+        """
+        if not isinstance(observer, ModelObserver):
+            raise ModelException("Observers must be instances of ModelObserver.")
+        if observer in self._observers:
+            raise ModelException("The observer is already registered in the model.")
+        self._observers += (observer,)
+        self.__dispatch_events()
+
+    def remove_observer(self, observer: ModelObserver) -> None:
+        """
+        Unregisters an observer of the events of the model.
+        :param observer: The observer to be unregistered.
+        :return: None.
+        """
+        if observer not in self._observers:
+            raise ModelException("The observer is not registered in the model.")
+        self._observers = tuple(registered for registered in self._observers if registered is not observer)
+        self.__dispatch_events()
+
+    def __dispatch_events(self) -> None:
+        """
+        Precomputes the observer methods called on each event, skipping those that are not overridden.
+        :return: None.
+        """
+
+        def methods(event: str) -> Tuple[Any, ...]:
+            return tuple(
+                getattr(observer, event)
+                for observer in self._observers
+                if getattr(type(observer), event) is not getattr(ModelObserver, event)
+            )
+
+        # Within a bulk build, the events of added terms, constraints and objectives are not emitted.
+        bulk: bool = self._bulk_terms is not None
+        self._on_variable_added = () if bulk else methods("on_variable_added")
+        self._on_constraint_added = () if bulk else methods("on_constraint_added")
+        self._on_objective_set = () if bulk else methods("on_objective_set")
+        self._on_solve_started = methods("on_solve_started")
+        self._on_incumbent_found = methods("on_incumbent_found")
+        self._on_solve_finished = methods("on_solve_finished")
+
+    def __unwrapped_engine(self) -> Engine:
+        """
+        Retrieves the engine of the model without the profiling wrapper.
+        :return: The engine given to the model.
+        """
+        from ..profiling import ProfiledEngine
+
+        return self._engine.engine if isinstance(self._engine, ProfiledEngine) else self._engine
+
     def __save_term(self, term: Term) -> None:
         """
         Saves a single term in the model.
@@ -178,24 +555,96 @@ class Model:
         """
         self._terms[term.name] = term
 
-    def __save_term_to_set(self, set_name: str, set_index: Tuple[int, ...], term: Term) -> None:
+    def __save_term_to_set(self, set_name: str, set_index: Tuple[int, ...], term: Term, named: bool = True) -> None:
         """
         Saves a term into a set within the model.
         :param set_name: The name of the set where the term will be saved.
         :param set_index: The index position of the term within the set in the model.
         :param term: The term to be saved.
+        :param named: Whether the term is also saved among the individual terms, by name. Defaults to True.
         :return: None
         """
         if not set_name:
             raise ModelException("Set name cannot be empty.")
 
-        self.__save_term(term)
+        if named:
+            self.__save_term(term)
 
         if set_name not in self._term_sets:
             self._term_sets[set_name] = {}
 
         self._term_sets[set_name][set_index] = term
 
+    def __save_bulk_term(
+        self,
+        bulk_terms: List[Tuple[str | None, str | None, Tuple[int, ...] | None, Term]],
+        name: str | None,
+        term: Term,
+        set_name: str | None = None,
+        set_index: Tuple[int, ...] | None = None,
+    ) -> None:
+        """
+        Saves a term added within a bulk build, whose duplicate checks and statistics are deferred until the
+        bulk build ends. The term is saved under the given name, since some engines cannot read the attributes
+        of their variables until the batch of additions ends.
+        :param bulk_terms: The terms added within the bulk build.
+        :param name: The name of the term, or None if it is an anonymous term of a set.
+        :param term: The term to be saved.
+        :param set_name: The name of the set where the term will be saved, or None if it is an individual term.
+        :param set_index: The index position of the term within the set, or None if it is an individual term.
+        :return: None
+        """
+        if set_name is not None:
+            if not set_name:
+                raise ModelException("Set name cannot be empty.")
+            term_set: Dict[Tuple[int, ...], Term] | None = self._term_sets.get(set_name)
+            if term_set is None:
+                term_set = self._term_sets[set_name] = {}
+            term_set[cast(Tuple[int, ...], set_index)] = term
+
+        if name is not None:
+            self._terms[name] = term
+        bulk_terms.append((name, set_name, set_index, term))
+
+    def __validate_bulk_terms(
+        self,
+        bulk_terms: List[Tuple[str | None, str | None, Tuple[int, ...] | None, Term]],
+        num_terms: int,
+        set_sizes: Dict[str, int],
+    ) -> None:
+        """
+        Checks that the terms added within a bulk build did not repeat any name or set index. Term dictionaries
+        keep the position of overwritten keys, so duplicates are only searched for when the sizes do not match.
+        :param bulk_terms: The terms added within the bulk build.
+        :param num_terms: The number of individual terms before the bulk build.
+        :param set_sizes: The number of terms of each set before the bulk build.
+        :return: None
+        """
+        duplicates: List[str] = []
+        names: List[str] = [name for name, _, _, _ in bulk_terms if name is not None]
+        if len(self._terms) != num_terms + len(names):
+            existing_names: set[str] = set(islice(self._terms, num_terms))
+            name_counts: Counter[str] = Counter(names)
+            duplicates.extend(name for name, count in name_counts.items() if count > 1 or name in existing_names)
+
+        set_counts: Counter[str] = Counter(set_name for _, set_name, _, _ in bulk_terms if set_name is not None)
+        for set_name, count in set_counts.items():
+            term_set: Dict[Tuple[int, ...], Term] = self._term_sets[set_name]
+            set_size: int = set_sizes.get(set_name, 0)
+            if len(term_set) != set_size + count:
+                existing_indices: set[Tuple[int, ...]] = set(islice(term_set, set_size))
+                index_counts: Counter[Tuple[int, ...] | None] = Counter(
+                    set_index for _, term_set_name, set_index, _ in bulk_terms if term_set_name == set_name
+                )
+                duplicates.extend(
+                    f"{set_name} | {set_index}"
+                    for set_index, index_count in index_counts.items()
+                    if index_count > 1 or set_index in existing_indices
+                )
+
+        if duplicates:
+            raise ModelException(f"Duplicate terms added in bulk: {', '.join(duplicates)}")
+
     def get_dimension_by_name(self, name: str) -> int:
         """
         Retrieves the size of a dimension in the model based on its name.
@@ -220,6 +669,36 @@ class Model:
         """
         return self._term_sets.get(name, None)
 
+    def get_set_term_name(self, set_name: str, set_index: Tuple[int, ...]) -> str:
+        """
+        Retrieves the name of a term within a set. The names of the variables of anonymous models are rendered
+        from the template of their set, or from the default naming, since they have no name in the engine.
+        :param set_name: The name of the set.
+        :param set_index: The indices of the term within the set.
+        :return: The name of the term.
+        """
+        terms: Dict[Tuple[int, ...], Term] | None = self._term_sets.get(set_name, None)
+        term: Term | None = terms.get(set_index, None) if terms is not None else None
+        if term is None:
+            raise ModelException(f"Term not found: {set_name} | {set_index}")
+
+        if set_name in self._name_templates and isinstance(term, Variable):
+            template: NameTemplate | None = self._name_templates[set_name]
+            return (
+                template.render(set_index)
+                if template is not None
+                else _default_name(set_name=set_name, set_index=set_index)
+            )
+        return term.name
+
+    def get_constant_array_by_name(self, name: str) -> "ConstantArray | None":
+        """
+        Retrieves a constant array from the model based on its set name.
+        :param name: The name of the set.
+        :return: The constant array with the specified name. Returns `None` if the array does not exist.
+        """
+        return self._constant_arrays.get(name, None)
+
     def add_dimension(self, name: str, value: int) -> int:
         """
         Adds a new dimension to the model.
@@ -252,21 +731,30 @@ class Model:
         :param value: The constant value.
         :return: The constant that was added to the model.
         """
-        if name in self.terms:
+        bulk_terms: List[Tuple[str | None, str | None, Tuple[int, ...] | None, Term]] | None = self._bulk_terms
+        if bulk_terms is None and name in self.terms:
             raise ModelException(f"Duplicate term with name: {name}")
 
         constant: Constant = Constant(name=name, value_type=value_type, value=value)
 
+        if bulk_terms is not None:
+            self.__save_bulk_term(bulk_terms=bulk_terms, name=name, term=constant)
+            return constant
+
         self.__save_term(term=constant)
+        if self._stats is not None:
+            self._stats.record_constant(name=name)
 
         if self._logger.debug_enabled:  # pragma: no cover
             self._logger.debug(
+                "%s",
+                LazyMessage(constant.get_pretty_string, float_precision=self.float_precision),
                 action="Constant added: ",
-                msg=constant.get_pretty_string(float_precision=self.float_precision),
             )
 
         return constant
 
+    @_profiled(phase="model.add_variable")
     def add_variable(
         self,
         name: str,
@@ -282,19 +770,106 @@ class Model:
         :param upper_bound: The upper bound of the variable. Default is infinity.
         :return: The variable that was added to the model.
         """
-        if name in self.terms:
+        bulk_terms: List[Tuple[str | None, str | None, Tuple[int, ...] | None, Term]] | None = self._bulk_terms
+        if bulk_terms is None and name in self.terms:
             raise ModelException(f"Duplicate term with name: {name}")
 
         variable: Variable = self._engine.add_variable(
             name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound
         )
 
+        if bulk_terms is not None:
+            self.__save_bulk_term(bulk_terms=bulk_terms, name=name, term=variable)
+            return variable
+
         self.__save_term(term=variable)
+        for on_variable_added in self._on_variable_added:
+            on_variable_added(self, variable)
+        if self._stats is not None:
+            self._stats.record_variable(
+                name=name,
+                value_type=value_type,
+                lower_bound=variable.lower_bound,
+                upper_bound=variable.upper_bound,
+            )
+        if self._fingerprint is not None:
+            self._fingerprint.add_variable(
+                value_type=value_type, lower_bound=variable.lower_bound, upper_bound=variable.upper_bound
+            )
 
         if self._logger.debug_enabled:  # pragma: no cover
             self._logger.debug(
+                "%s",
+                LazyMessage(variable.get_pretty_string, float_precision=self.float_precision),
                 action="Variable added: ",
-                msg=variable.get_pretty_string(float_precision=self.float_precision),
+            )
+
+        return variable
+
+    def add_column(
+        self,
+        name: str,
+        value_type: ValueType,
+        lower_bound: float,
+        upper_bound: float,
+        objective_coefficient: float,
+        rows: Sequence[int],
+        coefficients: Sequence[float],
+    ) -> Variable:
+        """
+        Adds a new variable to the model with coefficients in existing linear constraints and in the objective,
+        such as a column generated by the pricing problem of a column generation. Models with a constraint index
+        do not accept columns, since the index compares new constraints against the rows as they were added.
+        :param name: The name of the variable to be added.
+        :param value_type: The type of the variable values.
+        :param lower_bound: The lower bound of the variable.
+        :param upper_bound: The upper bound of the variable.
+        :param objective_coefficient: The coefficient of the variable in the objective.
+        :param rows: The positions of the constraints where the variable appears (see `constraints`).
+        :param coefficients: The coefficient of the variable in each constraint, in the same order.
+        :return: The variable that was added to the model.
+        """
+        if name in self.terms:
+            raise ModelException(f"Duplicate term with name: {name}")
+        if self._constraint_index is not None:
+            raise ModelException("Columns cannot be added to models with a constraint index, since they change rows.")
+        if len(rows) != len(coefficients):
+            raise ModelException("The number of coefficients of a column must match the number of rows.")
+
+        variable: Variable = self._engine.add_column(
+            name=name,
+            value_type=value_type,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            objective_coefficient=objective_coefficient,
+            rows=rows,
+            coefficients=coefficients,
+        )
+
+        self.__save_term(term=variable)
+        for on_variable_added in self._on_variable_added:
+            on_variable_added(self, variable)
+        if self._stats is not None:
+            self._stats.record_variable(
+                name=name,
+                value_type=value_type,
+                lower_bound=variable.lower_bound,
+                upper_bound=variable.upper_bound,
+            )
+            self._stats.record_column(coefficients=coefficients, objective_coefficient=objective_coefficient)
+        if self._fingerprint is not None:
+            self._fingerprint.add_variable(
+                value_type=value_type, lower_bound=variable.lower_bound, upper_bound=variable.upper_bound
+            )
+            self._fingerprint.add_column(
+                rows=rows, coefficients=coefficients, objective_coefficient=objective_coefficient
+            )
+
+        if self._logger.debug_enabled:  # pragma: no cover
+            self._logger.debug(
+                "%s",
+                LazyMessage(variable.get_pretty_string, float_precision=self.float_precision),
+                action="Column added: ",
             )
 
         return variable
@@ -316,91 +891,350 @@ class Model:
         :param value: The constant value.
         :return: The constant that was added to the model.
         """
-        if const_name in self.terms:
-            raise ModelException(f"Duplicate term with name: {const_name}")
+        bulk_terms: List[Tuple[str | None, str | None, Tuple[int, ...] | None, Term]] | None = self._bulk_terms
+        if bulk_terms is None:
+            if const_name in self.terms:
+                raise ModelException(f"Duplicate term with name: {const_name}")
+
+            if set_name in self.term_sets and set_index in self.term_sets[set_name]:
+                raise ModelException(f"Duplicate set name and index: {set_name} | {set_index}")
 
-        if set_name in self.term_sets and set_index in self.term_sets[set_name]:
-            raise ModelException(f"Duplicate set name and index: {set_name} | {set_index}")
+        if set_name in self._constant_arrays:
+            raise ModelException(f"Duplicate set name: {set_name}")
 
         constant: Constant = Constant(name=const_name, value_type=value_type, value=value)
 
+        if bulk_terms is not None:
+            self.__save_bulk_term(
+                bulk_terms=bulk_terms, name=const_name, term=constant, set_name=set_name, set_index=set_index
+            )
+            return constant
+
         self.__save_term_to_set(set_name=set_name, set_index=set_index, term=constant)
+        if self._stats is not None:
+            self._stats.record_constant(name=const_name)
 
         if self._logger.debug_enabled:  # pragma: no cover
             self._logger.debug(
+                f"Set name: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT} | "
+                f"Set index: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT} | %s",
+                set_name,
+                set_index,
+                LazyMessage(constant.get_pretty_string, float_precision=self.float_precision),
                 action="Constant added to set: ",
+            )
+
+        return constant
+
+    def add_constant_array(self, set_name: str, values: Any, value_type: ValueType) -> "ConstantArray":
+        """
+        Adds a new set of constants to the model, stored in a dense array.
+
+        Unlike `add_constant_to_set`, which creates a `Constant` object per index, the values are kept in a
+        single typed NumPy array. This method requires the optional NumPy dependency.
+        :param set_name: The name of the set of constants.
+        :param values: An array-like object (e.g. a NumPy array or nested lists) with the constant values.
+        :param value_type: The type of the constant values.
+        :return: The constant array that was added to the model.
+        """
+        if set_name in self.term_sets or set_name in self._constant_arrays:
+            raise ModelException(f"Duplicate set name: {set_name}")
+
+        from ..algebra.arrays import ConstantArray
+
+        constant_array: ConstantArray = ConstantArray(name=set_name, value_type=value_type, values=values)
+
+        self._constant_arrays[set_name] = constant_array
+
+        if self._logger.debug_enabled:  # pragma: no cover
+            self._logger.debug(
+                action="Constant array added: ",
                 msg="".join(
                     [
                         f"Set name: {StdOutColors.PURPLE}{set_name}{StdOutColors.DEFAULT} | ",
-                        f"Set index: {StdOutColors.PURPLE}{set_index}{StdOutColors.DEFAULT} | ",
-                        constant.get_pretty_string(float_precision=self.float_precision),
+                        f"Value type: {StdOutColors.PURPLE}{value_type.name.capitalize()}{StdOutColors.DEFAULT} | ",
+                        f"Shape: {StdOutColors.PURPLE}{constant_array.shape}{StdOutColors.DEFAULT}",
                     ]
                 ),
             )
 
-        return constant
+        return constant_array
 
+    @_profiled(phase="model.add_variable_to_set")
     def add_variable_to_set(
         self,
         set_name: str,
         set_index: Tuple[int, ...],
-        var_name: str,
+        var_name: str | NameTemplate | None,
         value_type: ValueType,
         lower_bound: float = 0,
         upper_bound: float = inf,
     ) -> Variable:
         """
         Adds a new variable to the model within a set.
+
+        In anonymous models, the variable is created without a name in the engine, and its name is only
+        rendered from the template when requested (see `get_set_term_name`).
         :param set_name: The name of the set where the variable will be added.
         :param set_index: The position of a term within a set that represents its indices.
-        :param var_name: The name of the variable to be added.
+        :param var_name: The name of the variable to be added, a template rendered with the set index, or None
+            for the default name made of the set name and the indices (e.g. `x_1_2`). Anonymous models only
+            accept templates or None, which must be the same for all the variables of a set.
         :param value_type: The type of the variable values.
         :param lower_bound: The lower bound of the variable. Default is 0.
         :param upper_bound: The upper bound of the variable. Default is infinity.
         :return: The variable that was added to the model.
         """
-        if var_name in self.terms:
-            raise ModelException(f"Duplicate term with name: {var_name}")
-
-        if set_name in self.term_sets and set_index in self.term_sets[set_name]:
-            raise ModelException(f"Duplicate set name and index: {set_name} | {set_index}")
+        name: str | None
+        if self._anonymous:
+            if isinstance(var_name, str):
+                raise ModelException("Variables of anonymous models must be named by a template or left unnamed.")
+            template: NameTemplate | None = self._name_templates.get(set_name, var_name)
+            if (template is None) != (var_name is None) or (
+                template is not None and var_name is not None and template.template != var_name.template
+            ):
+                raise ModelException(f"The variables of the anonymous set '{set_name}' must share the same template.")
+            name = None
+        elif var_name is None:
+            name = _default_name(set_name=set_name, set_index=set_index)
+        elif isinstance(var_name, NameTemplate):
+            name = var_name.render(set_index)
+        else:
+            name = var_name
+
+        bulk_terms: List[Tuple[str | None, str | None, Tuple[int, ...] | None, Term]] | None = self._bulk_terms
+        if bulk_terms is None:
+            if name is not None and name in self.terms:
+                raise ModelException(f"Duplicate term with name: {name}")
+
+            if set_name in self.term_sets and set_index in self.term_sets[set_name]:
+                raise ModelException(f"Duplicate set name and index: {set_name} | {set_index}")
+
+        if set_name in self._constant_arrays:
+            raise ModelException(f"Duplicate set name: {set_name}")
 
         variable: Variable = self._engine.add_variable(
-            name=var_name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound
+            name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound
         )
 
-        self.__save_term_to_set(set_name=set_name, set_index=set_index, term=variable)
+        if name is None and set_name not in self._name_templates:
+            self._name_templates[set_name] = cast(NameTemplate | None, var_name)
+
+        if bulk_terms is not None:
+            self.__save_bulk_term(
+                bulk_terms=bulk_terms, name=name, term=variable, set_name=set_name, set_index=set_index
+            )
+            return variable
+
+        self.__save_term_to_set(set_name=set_name, set_index=set_index, term=variable, named=name is not None)
+        for on_variable_added in self._on_variable_added:
+            on_variable_added(self, variable)
+        if self._stats is not None:
+            self._stats.record_variable(
+                name=name or "",
+                value_type=value_type,
+                lower_bound=variable.lower_bound,
+                upper_bound=variable.upper_bound,
+            )
+        if self._fingerprint is not None:
+            self._fingerprint.add_variable(
+                value_type=value_type, lower_bound=variable.lower_bound, upper_bound=variable.upper_bound
+            )
 
         if self._logger.debug_enabled:  # pragma: no cover
             self._logger.debug(
+                f"Set name: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT} | "
+                f"Set index: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT} | %s",
+                set_name,
+                set_index,
+                LazyMessage(variable.get_pretty_string, float_precision=self.float_precision),
                 action="Variable added to set: ",
-                msg="".join(
-                    [
-                        f"Set name: {StdOutColors.PURPLE}{set_name}{StdOutColors.DEFAULT} | ",
-                        f"Set index: {StdOutColors.PURPLE}{set_index}{StdOutColors.DEFAULT} | ",
-                        variable.get_pretty_string(float_precision=self.float_precision),
-                    ]
-                ),
             )
 
         return variable
 
+    def add_variables_to_set(
+        self,
+        set_name: str,
+        index_set: Iterable[Tuple[int, ...]],
+        var_name: NameTemplate | None,
+        value_type: ValueType,
+        lower_bound: float = 0,
+        upper_bound: float = inf,
+    ) -> Mapping[Tuple[int, ...], Term]:
+        """
+        Adds a new variable to the model within a set for each index of a domain, such as an `IndexSet`.
+
+        Only the indices of the domain are created, so sparse sets avoid building and pruning the full Cartesian
+        product of the dimensions. For large domains, the call can be made within `bulk()`.
+        :param set_name: The name of the set where the variables will be added.
+        :param index_set: The indices of the variables, such as an `IndexSet` or any iterable of tuples.
+        :param var_name: A template rendered with the indices of each variable, or None for the default names
+            made of the set name and the indices (e.g. `x_1_2`).
+        :param value_type: The value type of the variables.
+        :param lower_bound: The lower bound of the variables. Defaults to 0.
+        :param upper_bound: The upper bound of the variables. Defaults to infinity.
+        :return: The set of terms where the variables were added.
+        """
+        for set_index in index_set:
+            self.add_variable_to_set(
+                set_name=set_name,
+                set_index=set_index,
+                var_name=var_name,
+                value_type=value_type,
+                lower_bound=lower_bound,
+                upper_bound=upper_bound,
+            )
+        return self._term_sets.get(set_name, {})
+
+    def add_lazy_variables_to_set(
+        self,
+        set_name: str,
+        index_set: IndexSet,
+        var_name: NameTemplate | None,
+        value_type: ValueType,
+        lower_bound: float = 0,
+        upper_bound: float = inf,
+    ) -> LazyTermSet:
+        """
+        Declares a set of variables over a domain whose variables are only created when they are first accessed
+        through the returned set.
+
+        No variable is created by this call, so the domain can be much larger than the variables the model
+        actually uses, such as in column generation. Each access to a new index of the domain adds its variable
+        to the model as `add_variable_to_set` would, and the materialized variables are also available in
+        `term_sets`. The set can be frozen before solving, so that unexpected accesses raise an exception.
+        :param set_name: The name of the set.
+        :param index_set: The declared domain of the set. Dense index sets take no memory regardless of their size.
+        :param var_name: A template rendered with the indices of each variable, or None for the default names
+            made of the set name and the indices (e.g. `x_1_2`).
+        :param value_type: The value type of the variables.
+        :param lower_bound: The lower bound of the variables. Defaults to 0.
+        :param upper_bound: The upper bound of the variables. Defaults to infinity.
+        :return: The lazy term set.
+        """
+        if not set_name:
+            raise ModelException("Set name cannot be empty.")
+        if set_name in self._term_sets or set_name in self._constant_arrays:
+            raise ModelException(f"Duplicate set name: {set_name}")
+
+        def create(set_index: Tuple[int, ...]) -> Term:
+            return self.add_variable_to_set(
+                set_name=set_name,
+                set_index=set_index,
+                var_name=var_name,
+                value_type=value_type,
+                lower_bound=lower_bound,
+                upper_bound=upper_bound,
+            )
+
+        lazy_term_set: LazyTermSet = LazyTermSet(
+            set_name=set_name, domain=index_set, terms=self._term_sets.setdefault(set_name, {}), create=create
+        )
+        self._lazy_term_sets[set_name] = lazy_term_set
+
+        if self._logger.debug_enabled:  # pragma: no cover
+            self._logger.debug(
+                f"Set name: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT} | "
+                f"Declared size: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT}",
+                set_name,
+                len(index_set),
+                action="Lazy variable set added: ",
+            )
+
+        return lazy_term_set
+
+    def set_variable_bounds(self, variable: Variable, lower_bound: float, upper_bound: float) -> None:
+        """
+        Changes the bounds of a variable of the model, such as to load new data into a model that is solved
+        repeatedly. Right-hand sides and other data that change between solves can be modeled as variables
+        fixed to their value (equal bounds), so that they are updated with this method instead of rebuilding
+        the constraints.
+        :param variable: The variable whose bounds are changed.
+        :param lower_bound: The new lower bound of the variable.
+        :param upper_bound: The new upper bound of the variable.
+        :return: None.
+        """
+        if lower_bound > upper_bound:
+            raise ModelException(f"Invalid bounds for variable {variable.name}: [{lower_bound}, {upper_bound}]")
+
+        self._engine.set_variable_bounds(variable=variable, lower_bound=lower_bound, upper_bound=upper_bound)
+        if self._fingerprint is not None:
+            self._fingerprint.set_variable_bounds(
+                identifier=variable.id, lower_bound=lower_bound, upper_bound=upper_bound
+            )
+
+        if self._logger.debug_enabled:  # pragma: no cover
+            self._logger.debug(
+                f"Name: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT} | "
+                f"Bounds: {StdOutColors.PURPLE}[%s, %s]{StdOutColors.DEFAULT}",
+                variable.name,
+                lower_bound,
+                upper_bound,
+                action="Variable bounds changed: ",
+            )
+
+    def set_start_values(self, variables: Sequence[Variable], values: Sequence[float]) -> None:
+        """
+        Provides a starting point for the next solve, such as the solution of a similar model, to warm-start
+        the solver. Starting points are hints, which are ignored by engines whose solver does not accept them.
+        :param variables: The variables of the starting point.
+        :param values: The value of each variable, in the same order.
+        :return: None.
+        """
+        if len(variables) != len(values):
+            raise ModelException("The number of start values must match the number of variables.")
+        self._engine.set_start_values(variables=variables, values=values)
+
+    @_profiled(phase="model.add_constraint")
     def add_constraint(self, expression: Element) -> Element:
         """
         Adds a new constraint to the model.
+
+        If the model has a constraint index, the constraint is dropped when an equivalent constraint with equal
+        or tighter bounds was already added, and that constraint is returned instead.
         :param expression: The constraint expression
         :return: An object representing the constraint.
         """
-        constraint: Element = self._engine.add_constraint(expression=expression)
+        stats: ModelStats | None = self._stats
+        fingerprint: ModelFingerprint | None = self._fingerprint
+        row: Tuple[List[Any], List[float], float, float] | None = None
+        if stats is not None or fingerprint is not None or self._constraint_index is not None:
+            # Engines that cannot decompose a constraint, including those of third parties that fail on it,
+            # leave it to be recorded as nonlinear.
+            try:
+                row = self._engine.get_linear_constraint(expression=expression)
+            except (PyORlibException, AttributeError, TypeError):
+                row = None
+
+        def add_to_engine() -> Element:
+            if stats is not None:
+                if row is None:
+                    stats.record_nonlinear_constraint()
+                else:
+                    stats.record_constraint(coefficients=row[1], lower_bound=row[2], upper_bound=row[3])
+            if fingerprint is not None:
+                if row is None:
+                    fingerprint.add_nonlinear_constraint()
+                else:
+                    fingerprint.add_constraint(keys=row[0], coefficients=row[1], lower=row[2], upper=row[3])
+            added: Element = self._engine.add_constraint(expression=expression)
+            for on_constraint_added in self._on_constraint_added:
+                on_constraint_added(self, added)
+            return added
+
+        constraint: Element = (
+            add_to_engine()
+            if self._constraint_index is None or row is None
+            else self._constraint_index.add(row=row, add_constraint=add_to_engine)
+        )
 
         if self._logger.debug_enabled:  # pragma: no cover
-            try:
-                self._logger.debug(action="Constraint added: ", msg=f"Expr: {expression}")
-            except RecursionError:
-                self._logger.debug(action="Constraint added: ", msg="Expr: Unprintable expression")
+            self._logger.debug("Expr: %s", LazyMessage(_printable, expression), action="Constraint added: ")
 
         return constraint
 
+    @_profiled(phase="model.set_objective")
     def set_objective(self, opt_type: OptimizationType, expression: Element) -> Element:
         """
         Defines the objective function.
@@ -409,36 +1243,842 @@ class Model:
         :return: The objective function.
         """
         objective: Element = self._engine.set_objective(opt_type=opt_type, expression=expression)
+        for on_objective_set in self._on_objective_set:
+            on_objective_set(self, objective)
 
-        if self._logger.debug_enabled:  # pragma: no cover
+        if self._stats is not None or self._fingerprint is not None:
+            linear_objective: Tuple[List[Any], List[float], float, OptimizationType] | None
             try:
-                self._logger.debug(
-                    action="Objective function added: ",
-                    msg="".join(
-                        [
-                            f"Opt Type: {StdOutColors.PURPLE}{opt_type.name.capitalize()}{StdOutColors.DEFAULT} | ",
-                            f"Expr: {objective}",
-                        ]
-                    ),
+                linear_objective = self._engine.get_linear_objective()
+            except PyORlibException:
+                linear_objective = None
+            if self._stats is not None:
+                self._stats.record_objective(coefficients=linear_objective[1] if linear_objective is not None else [])
+            if self._fingerprint is not None:
+                self._fingerprint.set_objective(
+                    opt_type=opt_type,
+                    text=repr(linear_objective) if linear_objective is not None else None,
                 )
-            except RecursionError:
-                self._logger.debug(action="Objective function added: ", msg="Expr: Unprintable expression")
+
+        if self._logger.debug_enabled:  # pragma: no cover
+            self._logger.debug(
+                f"Opt Type: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT} | Expr: %s",
+                opt_type.name.capitalize(),
+                LazyMessage(_printable, objective),
+                action="Objective function added: ",
+            )
 
         return objective
 
+    def stats(self) -> ModelStats:
+        """
+        Retrieves the statistics of the model.
+
+        The statistics are updated as terms, constraints and the objective are added, so this method takes
+        constant time and can be called on every build, e.g. to reject badly scaled or oversized models before
+        solving them. They are only collected by models created with `collect_stats=True`. Constraints dropped
+        by the constraint index are not counted.
+        :return: A copy of the current statistics of the model.
+        """
+        if self._stats is None:
+            raise ModelException("The statistics of the model are not collected.")
+        return replace(
+            self._stats,
+            variables_by_type=dict(self._stats.variables_by_type),
+            constraints_by_sense=dict(self._stats.constraints_by_sense),
+        )
+
+    @_profiled(phase="model.solve")
     def solve(self) -> None:
         """
         Solves the optimization problem represented by the model.
         :return: None.
         """
+        self.__solve(use_cache=True)
+
+    def __solve(self, use_cache: bool) -> None:
+        """
+        Solves the optimization problem represented by the model.
+        :param use_cache: Whether the solve cache, if any, is used. Solves whose solution depends on more than
+            the model, such as those with native lazy constraints, must not use it.
+        :return: None.
+        """
         if self._logger.debug_enabled:  # pragma: no cover
             self._logger.debug(f"Solving the model...")
 
-        self._engine.solve()
+        for on_solve_started in self._on_solve_started:
+            on_solve_started(self)
+
+        # Models whose fingerprint does not identify them, such as those with nonlinear constraints, are not cached.
+        cache_key: str | None = None
+        if not use_cache or (self._fingerprint is not None and not self._fingerprint.cacheable):
+            self._solution = None
+        elif self._solve_cache is not None and self._fingerprint is not None:
+            fingerprint: str = self._fingerprint.digest
+            cache_key = self._solve_cache.key(fingerprint=fingerprint, engine=self._engine.name)
+            cached_solution: Solution | None = self._solve_cache.get(key=cache_key)
+            if cached_solution is not None:
+                self._solution = (fingerprint, cached_solution)
+                for on_solve_finished in self._on_solve_finished:
+                    on_solve_finished(self)
+                if self._logger.debug_enabled:  # pragma: no cover
+                    self._logger.debug(
+                        f"The solution of the model was found in the solve cache, so the engine was not solved. "
+                        f"Read the values of the variables through get_values or solution."
+                    )
+                return
+
+        incumbent_hooks: Tuple[Callable[[Model, float], None], ...] = self._on_incumbent_found
+        if incumbent_hooks:
+
+            def on_incumbent(objective_value: float) -> None:
+                for on_incumbent_found in incumbent_hooks:
+                    on_incumbent_found(self, objective_value)
+
+            self._engine.set_incumbent_callback(callback=on_incumbent)
+
+        try:
+            self._engine.solve()
+        finally:
+            if incumbent_hooks:
+                self._engine.set_incumbent_callback(callback=None)
+            for on_solve_finished in self._on_solve_finished:
+                on_solve_finished(self)
+
+        if self._solve_cache is not None and cache_key is not None:
+            self.__cache_solution(cache_key=cache_key)
 
         if self._logger.debug_enabled:  # pragma: no cover
             self._logger.debug(f"The model has been solved.")
 
+    def solve_with_lazy_constraints(
+        self,
+        separator: Callable[[Callable[[Sequence[Variable]], List[float]]], Sequence[Element]],
+        max_rounds: int = 100,
+    ) -> LazyConstraintReport:
+        """
+        Solves the model with lazy constraints, which are only enforced once a solution violates them, such as
+        the subtour elimination constraints of a routing model.
+
+        The separator receives a function that retrieves the values of variables in a solution, and returns the
+        linear constraints that the solution violates, or an empty sequence if it satisfies all of them. When the
+        engine supports lazy constraints for the model (CPLEX and Gurobi, for models with integer variables), the
+        separator is called on each candidate incumbent while solving, and the violated constraints are added
+        natively to the solver, but not to the model. Otherwise, the model is solved in rounds: the violated
+        constraints of each solution are added to the model, which is re-solved from the previous solution,
+        until the separator returns none or the round limit is reached.
+        :param separator: A callable that receives a function that retrieves the values of variables in a
+            solution, and returns the constraints violated by the solution.
+        :param max_rounds: The maximum number of rounds, when the constraints are not added natively. Once it
+            is reached, the model is solved a last time with the constraints of the last round, but its solution
+            is not separated, and the report is not converged. Defaults to 100.
+        :return: A report with the rounds of the solve.
+        """
+        if max_rounds < 1:
+            raise ModelException("The maximum number of rounds must be a positive integer.")
+
+        start: float = perf_counter()
+        rounds: List[LazyConstraintRound] = []
+
+        def separate(get_values: Callable[[Sequence[Variable]], List[float]]) -> Sequence[Element]:
+            round_start: float = perf_counter()
+            cuts: Sequence[Element] = separator(get_values)
+            rounds.append(
+                LazyConstraintRound(round=len(rounds) + 1, cuts_added=len(cuts), wall_time=perf_counter() - round_start)
+            )
+            return cuts
+
+        native: bool = self._engine.set_lazy_constraint_callback(callback=separate)
+        if native:
+            try:
+                self.__solve(use_cache=False)
+            finally:
+                self._engine.set_lazy_constraint_callback(callback=None)
+        else:
+            for _ in range(max_rounds):
+                round_start: float = perf_counter()
+                self.__solve(use_cache=True)
+                if self.solution_status not in (SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE):
+                    break
+                variables: List[Variable] = self.__variables()
+                values: List[float] = self.get_values(terms=variables)
+                cuts: Sequence[Element] = separator(lambda terms: self.get_values(terms=terms))
+                for cut in cuts:
+                    self.add_constraint(expression=cut)
+                rounds.append(
+                    LazyConstraintRound(
+                        round=len(rounds) + 1, cuts_added=len(cuts), wall_time=perf_counter() - round_start
+                    )
+                )
+                if not cuts:
+                    break
+                self.set_start_values(variables=variables, values=values)
+            else:
+                # The cuts of the last round are already in the model, so it is solved once more to report a
+                # solution that satisfies them, although that solution is not separated.
+                self.__solve(use_cache=True)
+
+        status: SolutionStatus = self.solution_status
+        report: LazyConstraintReport = LazyConstraintReport(
+            status=status,
+            native=native,
+            converged=(
+                status in (SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE)
+                and (native or (bool(rounds) and rounds[-1].cuts_added == 0))
+            ),
+            wall_time=perf_counter() - start,
+            rounds=tuple(rounds),
+        )
+
+        if self._logger.debug_enabled:  # pragma: no cover
+            self._logger.debug(
+                f"Rounds: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT} | "
+                f"Cuts: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT} | "
+                f"Native: {StdOutColors.PURPLE}%s{StdOutColors.DEFAULT}",
+                report.num_rounds,
+                report.num_cuts,
+                native,
+                action="Lazy constraints solved: ",
+            )
+        return report
+
+    def __cache_solution(self, cache_key: str) -> None:
+        """
+        Stores the solution found by the engine in the solve cache, if it is optimal, feasible or infeasible.
+        :param cache_key: The cache key of the model.
+        :return: None.
+        """
+        status: SolutionStatus = self._engine.solution_status
+        if status not in (SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE, SolutionStatus.INFEASIBLE):
+            self._solution = None
+            return
+
+        from ..cache import Solution
+
+        variables: List[Variable] = self.__variables()
+        values: List[float] = [0.0] * (variables[-1].id + 1 if variables else 0)
+        if status != SolutionStatus.INFEASIBLE:
+            for variable in variables:
+                values[variable.id] = variable.value
+        solution: Solution = Solution(status=status, objective_value=self._engine.objective_value, values=tuple(values))
+        self._solution = (cast("ModelFingerprint", self._fingerprint).digest, solution)
+        cast("SolveCache", self._solve_cache).put(key=cache_key, solution=solution)
+
+    @_profiled(phase="model.get_values")
+    def get_values(self, terms: Iterable[Term]) -> List[float]:
+        """
+        Retrieves the values of several terms, such as the variables of a term set after solving the model.
+        :param terms: The terms whose values are retrieved.
+        :return: A list with the value of each term, in the same order.
+        """
+        solution: Solution | None = self.solution if self._solution is not None else None
+        if solution is not None:
+            return [solution.get_value(term) if isinstance(term, Variable) else term.value for term in terms]
+        return [term.value for term in terms]
+
+    def get_reduced_costs(self, variables: Sequence[Variable]) -> List[float]:
+        """
+        Retrieves the reduced costs of variables after solving a linear model. The reduced cost of a fixed
+        variable is the rate at which the objective value changes with its value, which makes fixed variables
+        a convenient way to obtain the dual values of parameters of the model.
+        :param variables: The variables whose reduced costs are retrieved.
+        :return: A list with the reduced cost of each variable, in the same order.
+        """
+        return self._engine.get_reduced_costs(variables=variables)
+
+    def get_dual_values(self) -> List[float]:
+        """
+        Retrieves the dual values of all the linear constraints after solving a linear model, in a single call
+        to the engine.
+        :return: A list with the dual value of each constraint, in the order of `constraints`.
+        """
+        return self._engine.get_dual_values()
+
+    def write(self, path: str | PathLike[str], format: str | None = None) -> None:
+        """
+        Writes the model to a file in MPS or LP format.
+
+        The file is produced by PyORlib itself rather than by the engine, so its layout is the same regardless of
+        the solver in use. Constraints are read one at a time from the solver objects as linear rows and streamed
+        to the file, and paths ending in `.gz` are compressed with gzip.
+        :param path: The path of the file to be written.
+        :param format: The file format, either "mps" or "lp". If None, it is inferred from the file extension.
+        :return: None.
+        """
+        from ..io import LPWriter, MPSWriter
+
+        file_path: str = fspath(path)
+        file_format: str = (format or file_path.removesuffix(".gz").rpartition(".")[2]).lower()
+
+        writer: ModelWriter
+        if file_format == "mps":
+            writer = MPSWriter(path=file_path)
+        elif file_format == "lp":
+            writer = LPWriter(path=file_path)
+        else:
+            raise ModelException(f"Unsupported file format '{file_format}'. Supported formats are 'mps' and 'lp'.")
+
+        self.__write_with(writer=writer)
+
+        if self._logger.debug_enabled:  # pragma: no cover
+            self._logger.debug(action="Model written: ", msg=f"Path: {file_path} | Format: {file_format.upper()}")
+
+    @classmethod
+    def read(
+        cls,
+        path: str | PathLike[str],
+        engine: Engine,
+        format: str | None = None,
+        name: str | None = None,
+        set_name: str = "x",
+        chunk_size: int = 10_000,
+        on_progress: Callable[[int, int], None] | None = None,
+        presolver: "Presolver | None" = None,
+        debug: bool = False,
+        float_precision: int = 6,
+    ) -> "Model":
+        """
+        Reads a model from a file in MPS or LP format and builds it on the given engine.
+
+        The file is parsed into a compact record of typed arrays, since MPS files list coefficients by column and
+        bounds only at the end. The variables are then added to a term set indexed by column position, and the
+        constraints are added to the engine in batches of `chunk_size` rows, during which the engine defers its
+        per-call work, such as updating the solver model. Ranged rows are added as single range constraints, so
+        constraint positions match row positions, except on engines without range constraints (PuLP and
+        Gurobi), which receive each ranged row as a pair of constraints.
+        :param path: The path of the file to be read. Paths ending in `.gz` are decompressed on the fly.
+        :param engine: The engine interface on which the model is built.
+        :param format: The file format: "mps", "fixed-mps" or "lp". If None, it is inferred from the file
+            extension, and MPS files are read in free format.
+        :param name: An optional name for the model. Defaults to the name stored in the file.
+        :param set_name: The name of the term set that holds the variables. Defaults to "x".
+        :param chunk_size: The number of rows added per batch of the engine. Defaults to 10,000.
+        :param on_progress: An optional callback invoked after each batch with the number of rows processed
+            and the total number of rows.
+        :param presolver: An optional presolver applied to the model before it is built on the engine. Removed
+            variables are added as constants with their fixed value. Defaults to None.
+        :param debug: A flag indicating whether debug mode is enabled. Defaults to False.
+        :param float_precision: The number of digits used in printing the solution and objective. Defaults to 6.
+        :return: The model read from the file.
+        """
+        file_path: str = fspath(path)
+        file_format: str = (format or file_path.removesuffix(".gz").rpartition(".")[2]).lower()
+
+        if chunk_size <= 0:
+            raise ModelException("The chunk size must be a positive integer.")
+
+        from ..io import LPReader, MPSReader
+
+        reader: ModelReader
+        if file_format == "mps":
+            reader = MPSReader(path=file_path)
+        elif file_format == "fixed-mps":
+            reader = MPSReader(path=file_path, fixed=True)
+        elif file_format == "lp":
+            reader = LPReader(path=file_path)
+        else:
+            raise ModelException(
+                f"Unsupported file format '{file_format}'. Supported formats are 'mps', 'fixed-mps' and 'lp'."
+            )
+
+        record: ModelRecord = reader.read()
+        model: Model = cls.__from_record(
+            record=record,
+            engine=engine,
+            name=name,
+            set_name=set_name,
+            chunk_size=chunk_size,
+            on_progress=on_progress,
+            presolver=presolver,
+            debug=debug,
+            float_precision=float_precision,
+        )
+
+        if model._logger.debug_enabled:  # pragma: no cover
+            model._logger.debug(
+                action="Model read: ",
+                msg=f"Path: {file_path} | Format: {file_format.upper()} | "
+                f"Columns: {record.num_columns} | Rows: {record.num_rows} | Nonzeros: {record.num_nonzeros}",
+            )
+
+        return model
+
+    def save_snapshot(self, path: str | PathLike[str]) -> None:
+        """
+        Saves the model to a binary snapshot file.
+
+        Snapshots store the variables, constraints and objective of the model as raw arrays that are memory-mapped
+        when loaded, together with the term sets of the variables and the dimensions of the model, so they are
+        much faster to load than text formats. Constants are not part of the snapshot.
+        :param path: The path of the file to be written.
+        :return: None.
+        """
+        from ..io import SnapshotWriter
+
+        file_path: str = fspath(path)
+        self.__write_with(writer=SnapshotWriter(path=file_path, term_sets=self._term_sets, dimensions=self._dimensions))
+
+        if self._logger.debug_enabled:  # pragma: no cover
+            self._logger.debug(action="Model snapshot saved: ", msg=f"Path: {file_path}")
+
+    @classmethod
+    def load_snapshot(
+        cls,
+        path: str | PathLike[str],
+        engine: Engine,
+        name: str | None = None,
+        chunk_size: int = 10_000,
+        on_progress: Callable[[int, int], None] | None = None,
+        presolver: "Presolver | None" = None,
+        debug: bool = False,
+        float_precision: int = 6,
+    ) -> "Model":
+        """
+        Loads a model from a binary snapshot file and builds it on the given engine.
+
+        The arrays of the snapshot are memory-mapped rather than read, so the operating system shares their pages
+        between all processes that load the same file. Variables are restored in their original term sets, and
+        constraints are added to the engine in batches of `chunk_size` rows, during which the engine defers its
+        per-call work.
+        :param path: The path of the snapshot file.
+        :param engine: The engine interface on which the model is built.
+        :param name: An optional name for the model. Defaults to the name stored in the snapshot.
+        :param chunk_size: The number of rows added per batch of the engine. Defaults to 10,000.
+        :param on_progress: An optional callback invoked after each batch with the number of rows processed
+            and the total number of rows.
+        :param presolver: An optional presolver applied to the model before it is built on the engine. Removed
+            variables are added as constants with their fixed value. Defaults to None.
+        :param debug: A flag indicating whether debug mode is enabled. Defaults to False.
+        :param float_precision: The number of digits used in printing the solution and objective. Defaults to 6.
+        :return: The model loaded from the snapshot.
+        """
+        if chunk_size <= 0:
+            raise ModelException("The chunk size must be a positive integer.")
+
+        from ..io import SnapshotReader
+
+        file_path: str = fspath(path)
+        record: ModelRecord = SnapshotReader(path=file_path).read()
+        model: Model = cls.__from_record(
+            record=record,
+            engine=engine,
+            name=name,
+            set_name=None,
+            chunk_size=chunk_size,
+            on_progress=on_progress,
+            presolver=presolver,
+            debug=debug,
+            float_precision=float_precision,
+        )
+
+        if model._logger.debug_enabled:  # pragma: no cover
+            model._logger.debug(
+                action="Model snapshot loaded: ",
+                msg=f"Path: {file_path} | Columns: {record.num_columns} | Rows: {record.num_rows} | "
+                f"Nonzeros: {record.num_nonzeros}",
+            )
+
+        return model
+
+    def clone(self, engine: Engine | None = None, name: str | None = None) -> "Model":
+        """
+        Creates a copy of the model on a new engine.
+
+        The model is collected into a compact record of typed arrays, as for snapshots, and replayed into the
+        engine, so the copy does not depend on the solver of the original model. Variables keep their names and
+        term sets, constants are copied, and constant arrays are shared since they are read-only. The copy is
+        built without the profiler, constraint index and observers of the original model.
+        :param engine: The engine on which the copy is built. Defaults to None, for a new engine of the same
+            class as the engine of this model, with its default settings.
+        :param name: An optional name for the copy. Defaults to the name of this model.
+        :return: The copy of the model.
+        """
+        if engine is None:
+            engine = type(self.__unwrapped_engine())()
+
+        model: Model = Model.__from_record(
+            record=self.__to_record(),
+            engine=engine,
+            name=name or self.name,
+            set_name=None,
+            chunk_size=10_000,
+            on_progress=None,
+            presolver=None,
+            debug=self._logger.debug_enabled,
+            float_precision=self.float_precision,
+        )
+
+        for set_name, terms in self._term_sets.items():
+            for set_index, term in terms.items():
+                if not isinstance(term, Variable):
+                    model.add_constant_to_set(
+                        set_name=set_name,
+                        set_index=set_index,
+                        const_name=term.name,
+                        value_type=term.value_type,
+                        value=term.value,
+                    )
+        for term_name, term in self._terms.items():
+            if not isinstance(term, Variable) and term_name not in model.terms:
+                model.add_constant(name=term_name, value_type=term.value_type, value=term.value)
+        model._constant_arrays.update(self._constant_arrays)
+
+        return model
+
+    def scenario(self, name: str | None = None) -> Scenario:
+        """
+        Creates a what-if scenario of the model, which records changes of bounds and coefficients on top of a
+        record of the current model. Models are built from scenarios with `from_scenario`.
+        :param name: An optional name for the scenario. Defaults to the name of the model.
+        :return: A new scenario without changes.
+        """
+        return Scenario(base=self.__to_record(), name=name or self.name)
+
+    @classmethod
+    def from_scenario(
+        cls,
+        scenario: Scenario,
+        engine: Engine,
+        name: str | None = None,
+        debug: bool = False,
+        float_precision: int = 6,
+    ) -> "Model":
+        """
+        Builds a model from a scenario, applying its changes to its base.
+        :param scenario: The scenario of the model.
+        :param engine: The engine interface on which the model is built.
+        :param name: An optional name for the model. Defaults to the name of the scenario.
+        :param debug: A flag indicating whether debug mode is enabled. Defaults to False.
+        :param float_precision: The number of digits used in printing the solution and objective. Defaults to 6.
+        :return: The model of the scenario.
+        """
+        return cls.__from_record(
+            record=scenario.to_record(),
+            engine=engine,
+            name=name,
+            set_name=None,
+            chunk_size=10_000,
+            on_progress=None,
+            presolver=None,
+            debug=debug,
+            float_precision=float_precision,
+        )
+
+    def presolve(
+        self,
+        engine: Engine,
+        presolver: "Presolver | None" = None,
+        chunk_size: int = 10_000,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> "Model":
+        """
+        Builds a presolved copy of the model on the given engine.
+
+        The variables, constraints and objective of the model are collected into a record, reduced by the
+        presolver and lowered to the new engine, so the engine only receives the reduced model. Variables removed
+        by presolve are added to the copy as constants with their fixed value, in the same term sets, so the
+        values of all terms are reported in the original space once the copy is solved. Constants are not copied.
+        :param engine: The engine interface on which the presolved model is built. It must be a new engine.
+        :param presolver: The presolver to be applied. Defaults to a presolver with all reductions enabled.
+        :param chunk_size: The number of rows added per batch of the engine. Defaults to 10,000.
+        :param on_progress: An optional callback invoked after each batch with the number of rows processed
+            and the total number of rows.
+        :return: The presolved model.
+        """
+        if chunk_size <= 0:
+            raise ModelException("The chunk size must be a positive integer.")
+        if engine is self._engine or engine is self.__unwrapped_engine():
+            raise ModelException("The presolved model must be built on a different engine.")
+
+        from ..presolve import Presolver
+
+        model: Model = Model.__from_record(
+            record=self.__to_record(),
+            engine=engine,
+            name=self.name,
+            set_name=None,
+            chunk_size=chunk_size,
+            on_progress=on_progress,
+            presolver=presolver or Presolver(),
+            debug=self._logger.debug_enabled,
+            float_precision=self.float_precision,
+        )
+
+        if self._logger.debug_enabled and model.postsolve_map is not None:  # pragma: no cover
+            self._logger.debug(
+                action="Model presolved: ",
+                msg=" | ".join(f"{kind}: {count}" for kind, count in model.postsolve_map.stats.items()),
+            )
+
+        return model
+
+    def __linear_view(self) -> Tuple[List[Variable], "LinearObjective", Iterator["LinearRow"]]:
+        """
+        Retrieves pyorlib's view of the model as linear rows, with variables referenced by their position in
+        creation order.
+        :return: A tuple with the variables, the linear objective and an iterator of linear rows.
+        """
+        variables: List[Variable] = self.__variables()
+        columns: Dict[Any, int] = {
+            self._engine.get_variable_key(variable=variable): column for column, variable in enumerate(variables)
+        }
+
+        def to_columns(keys: List[Any]) -> List[int]:
+            try:
+                return [columns[key] for key in keys]
+            except KeyError:
+                raise ModelException("The model contains constraints with variables that do not belong to it.")
+
+        def rows() -> Iterator["LinearRow"]:
+            for keys, coefficients, lower_bound, upper_bound in self._engine.iter_linear_constraints():
+                yield to_columns(keys), coefficients, lower_bound, upper_bound
+
+        keys, coefficients, constant, opt_type = self._engine.get_linear_objective()
+        return variables, (to_columns(keys), coefficients, constant, opt_type), rows()
+
+    def __variables(self) -> List[Variable]:
+        """
+        Retrieves the variables of the model, named or anonymous, in creation order.
+        :return: A list with the variables, sorted by identifier.
+        """
+        return sorted(
+            chain(
+                (term for term in self._terms.values() if isinstance(term, Variable)),
+                (variable for _, _, variable in self.__anonymous_variables()),
+            ),
+            key=lambda variable: variable.id,
+        )
+
+    def __anonymous_variables(self) -> Iterator[Tuple[str, Tuple[int, ...], Variable]]:
+        """
+        Iterates over the variables of the sets whose variables have no name in the engine.
+        :return: An iterator of tuples with the set name, the set index and the variable.
+        """
+        for set_name in self._name_templates:
+            for set_index, term in self._term_sets[set_name].items():
+                if isinstance(term, Variable):
+                    yield set_name, set_index, term
+
+    def __column_names(self, variables: List[Variable]) -> List[str] | None:
+        """
+        Renders the names of the columns of the model, if it has variables without a name in the engine.
+        :param variables: The variables of the model, one per column.
+        :return: A list with the name of each column, or None if all variables have a name in the engine.
+        """
+        if not self._name_templates:
+            return None
+        rendered: Dict[int, str] = {
+            id(variable): self.get_set_term_name(set_name=set_name, set_index=set_index)
+            for set_name, set_index, variable in self.__anonymous_variables()
+        }
+        return [rendered.get(id(variable)) or variable.name for variable in variables]
+
+    def __write_with(self, writer: "ModelWriter") -> None:
+        """
+        Writes the model with the given writer.
+        :param writer: The writer used to produce the file.
+        :return: None.
+        """
+        variables, objective, rows = self.__linear_view()
+        writer.write(
+            name=self.name,
+            variables=variables,
+            objective=objective,
+            rows=rows,
+            column_names=self.__column_names(variables=variables),
+        )
+
+    def __to_record(self) -> "ModelRecord":
+        """
+        Collects the variables, constraints and objective of the model into a record.
+        :return: A record with the term sets of the variables and the dimensions of the model.
+        """
+        from ..io import ModelRecord
+
+        variables, objective, rows = self.__linear_view()
+        objective_columns, objective_coefficients, objective_constant, opt_type = objective
+
+        record: ModelRecord = ModelRecord(
+            name=self.name,
+            opt_type=opt_type,
+            objective_constant=objective_constant,
+            column_names=self.__column_names(variables=variables) or [variable.name for variable in variables],
+            column_types=array("b", (variable.value_type for variable in variables)),
+            column_lower_bounds=array("d", (variable.lower_bound for variable in variables)),
+            column_upper_bounds=array("d", (variable.upper_bound for variable in variables)),
+            objective=array("d", bytes(8 * len(variables))),
+            dimensions=dict(self._dimensions),
+        )
+        for column, coefficient in zip(objective_columns, objective_coefficients):
+            record.objective[column] += coefficient
+
+        positions: Dict[int, int] = {id(variable): column for column, variable in enumerate(variables)}
+        for set_name, terms in self._term_sets.items():
+            for set_index, term in terms.items():
+                position: int | None = positions.get(id(term))
+                if position is not None:
+                    record.term_sets.setdefault(set_name, {})[set_index] = position
+
+        for columns, coefficients, lower_bound, upper_bound in rows:
+            record.row_columns.extend(columns)
+            record.row_values.extend(coefficients)
+            record.row_starts.append(len(record.row_columns))
+            record.row_lower_bounds.append(lower_bound)
+            record.row_upper_bounds.append(upper_bound)
+
+        return record
+
+    def __add_range(self, expression: Element, lower_bound: float, upper_bound: float) -> None:
+        """
+        Adds a ranged row to the model as a single range constraint, so that the positions of the constraints
+        match those of the rows. Engines that do not support range constraints, such as PuLP and Gurobi (whose
+        ranges add an auxiliary variable), receive the row as a pair of constraints instead.
+        :param expression: The linear expression of the row.
+        :param lower_bound: The finite lower bound of the row.
+        :param upper_bound: The finite upper bound of the row, greater than the lower bound.
+        :return: None.
+        """
+        try:
+            range_constraint: Element = self._engine.get_range_constraint(
+                expression=expression, lower_bound=lower_bound, upper_bound=upper_bound
+            )
+        except EngineException:
+            self.add_constraint(expression=expression >= lower_bound)
+            self.add_constraint(expression=expression <= upper_bound)
+        else:
+            self.add_constraint(expression=range_constraint)
+
+    @classmethod
+    def __from_record(
+        cls,
+        record: "ModelRecord",
+        engine: Engine,
+        name: str | None,
+        set_name: str | None,
+        chunk_size: int,
+        on_progress: Callable[[int, int], None] | None,
+        presolver: "Presolver | None",
+        debug: bool,
+        float_precision: int,
+    ) -> "Model":
+        """
+        Builds a model from a record.
+        :param record: The record of the model.
+        :param engine: The engine interface on which the model is built.
+        :param name: An optional name for the model. Defaults to the name stored in the record.
+        :param set_name: The name of the term set that holds all the variables, indexed by column position. If
+            None, the term sets of the record are restored and other columns are added as individual variables.
+        :param chunk_size: The number of rows added per batch of the engine.
+        :param on_progress: An optional callback invoked after each batch.
+        :param presolver: An optional presolver applied to the record before the model is built.
+        :param debug: A flag indicating whether debug mode is enabled.
+        :param float_precision: The number of digits used in printing the solution and objective.
+        :return: The model built from the record.
+        """
+        model: Model = cls(
+            engine=engine, name=name or record.name or None, debug=debug, float_precision=float_precision
+        )
+
+        postsolve_map: PostsolveMap | None = None
+        if presolver is not None:
+            record, postsolve_map = presolver.presolve(record=record)
+            model._postsolve_map = postsolve_map
+
+        for dimension, size in record.dimensions.items():
+            model.add_dimension(name=dimension, value=size)
+
+        memberships: Dict[int, Tuple[str, Tuple[int, ...]]] = {}
+        if set_name is None:
+            for record_set_name, columns_by_index in record.term_sets.items():
+                for set_index, column in columns_by_index.items():
+                    memberships[column] = (record_set_name, set_index)
+
+        # Integer bounds are rounded inwards, since fractional bounds are accepted by file formats but not here.
+        raws: List[Any] = []
+        for column, var_name in enumerate(record.column_names):
+            value_type: ValueType = ValueType(record.column_types[column])
+            lower_bound: float = record.column_lower_bounds[column]
+            upper_bound: float = record.column_upper_bounds[column]
+            if value_type == ValueType.INTEGER:
+                lower_bound = ceil(lower_bound) if isfinite(lower_bound) else lower_bound
+                upper_bound = floor(upper_bound) if isfinite(upper_bound) else upper_bound
+
+            membership: Tuple[str, Tuple[int, ...]] | None = (
+                (set_name, (column,)) if set_name is not None else memberships.get(column)
+            )
+
+            # Variables removed by presolve are kept as constants, so their values remain available.
+            if postsolve_map is not None and postsolve_map.is_removed(column):
+                value: float = postsolve_map.fixed_values[column]
+                if membership is None:
+                    model.add_constant(name=var_name, value_type=value_type, value=value)
+                else:
+                    model.add_constant_to_set(
+                        set_name=membership[0],
+                        set_index=membership[1],
+                        const_name=var_name,
+                        value_type=value_type,
+                        value=value,
+                    )
+                raws.append(None)
+                continue
+
+            variable: Variable
+            if membership is None:
+                variable = model.add_variable(
+                    name=var_name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound
+                )
+            else:
+                variable = model.add_variable_to_set(
+                    set_name=membership[0],
+                    set_index=membership[1],
+                    var_name=var_name,
+                    value_type=value_type,
+                    lower_bound=lower_bound,
+                    upper_bound=upper_bound,
+                )
+            raws.append(variable.raw)
+
+        num_rows: int = record.num_rows
+        for start in range(0, num_rows, chunk_size):
+            end: int = min(start + chunk_size, num_rows)
+            model._engine.begin_batch()
+            try:
+                for row in range(start, end):
+                    columns, coefficients, lower_bound, upper_bound = record.row(row)
+                    if not columns:
+                        if lower_bound > 0 or upper_bound < 0:
+                            raise ModelException(f"Row {row} has no coefficients and cannot be satisfied.")
+                        continue
+
+                    expression: Expression = Expression.sum(
+                        coefficient * raws[column] for column, coefficient in zip(columns, coefficients)
+                    )
+                    if lower_bound == upper_bound:
+                        model.add_constraint(expression=expression == lower_bound)
+                    elif -inf < lower_bound < upper_bound < inf:
+                        model.__add_range(expression=expression, lower_bound=lower_bound, upper_bound=upper_bound)
+                    else:
+                        if lower_bound > -inf:
+                            model.add_constraint(expression=expression >= lower_bound)
+                        if upper_bound < inf:
+                            model.add_constraint(expression=expression <= upper_bound)
+            finally:
+                model._engine.end_batch()
+
+            if on_progress is not None:
+                on_progress(end, num_rows)
+
+        model.set_objective(
+            opt_type=record.opt_type,
+            expression=Expression.sum(
+                [coefficient * raws[column] for column, coefficient in enumerate(record.objective) if coefficient != 0]
+                + [record.objective_constant]
+            ),
+        )
+
+        return model
+
     def print_info(self, display_term_sets: bool = False) -> None:  # pragma: no cover
         """
         Prints information about the model.
@@ -482,6 +2122,15 @@ class Model:
                         f"{term.get_pretty_string(float_precision=self.float_precision)}",
                     )
 
+        if self.constant_arrays:
+            print(f"Constant arrays: {debug}{len(self.constant_arrays)}{default}")
+            for name, constant_array in self.constant_arrays.items():
+                print(
+                    f"\tName: {debug}{name}{default} | ",
+                    f"Value type: {debug}{constant_array.value_type.name.capitalize()}{default} | ",
+                    f"Shape: {debug}{constant_array.shape}{default}",
+                )
+
         constraints = self.constraints
         print(f"Constraints: {debug}{len(constraints)}{default}")
         for exp in constraints:
@@ -510,13 +2159,15 @@ class Model:
             f"{default}",
         )
 
-        solution_variables: Dict[str, Term] = {
-            name: term for name, term in self.terms.items() if (term.is_variable and term.value != 0)
-        }
+        # The values are read through the solution of the model, which is the cached one after a cache hit.
+        variables: List[Variable] = [term for term in self.terms.values() if isinstance(term, Variable)]
+        solution_variables: List[Tuple[Variable, float]] = [
+            (variable, value) for variable, value in zip(variables, self.get_values(terms=variables)) if value != 0
+        ]
 
         if solution_variables:
             print("Terms:")
-            for name, term in solution_variables.items():
-                print(f"\t{term.get_pretty_string(float_precision=self.float_precision)}")
+            for variable, value in solution_variables:
+                print(f"\t{variable.get_pretty_string(float_precision=self.float_precision, value=value)}")
 
         print()
@@ -0,0 +1,72 @@
+from typing import TYPE_CHECKING
+
+from ..algebra import Element
+from ..algebra.terms.variables import Variable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .model import Model
+
+
+class ModelObserver:
+    """
+    Base class for the observers of the events of a model.
+
+    Observers are registered with `Model.add_observer` and only need to override the methods of the events they
+    are interested in. When observers change, the model precomputes a tuple with the overridden methods of each
+    event, so events without observers cost a single iteration over an empty tuple, and the methods left as
+    defined here are never called.
+    """
+
+    def on_variable_added(self, model: "Model", variable: Variable) -> None:
+        """
+        Called after a variable is added to the model, individually or within a set.
+        :param model: The model that emitted the event.
+        :param variable: The variable that was added.
+        :return: None.
+        """
+        pass
+
+    def on_constraint_added(self, model: "Model", constraint: Element) -> None:
+        """
+        Called after a constraint is added to the engine of the model. Constraints dropped by the constraint
+        index of the model are not reported.
+        :param model: The model that emitted the event.
+        :param constraint: The constraint that was added.
+        :return: None.
+        """
+        pass
+
+    def on_objective_set(self, model: "Model", objective: Element) -> None:
+        """
+        Called after the objective function of the model is defined.
+        :param model: The model that emitted the event.
+        :param objective: The objective function.
+        :return: None.
+        """
+        pass
+
+    def on_solve_started(self, model: "Model") -> None:
+        """
+        Called before the model is solved.
+        :param model: The model that emitted the event.
+        :return: None.
+        """
+        pass
+
+    def on_incumbent_found(self, model: "Model", objective_value: float) -> None:
+        """
+        Called while the model is being solved, each time the solver finds an improving solution. Only engines
+        whose solver reports intermediate solutions, such as CPLEX and Gurobi, emit this event.
+        :param model: The model that emitted the event.
+        :param objective_value: The objective value of the new solution.
+        :return: None.
+        """
+        pass
+
+    def on_solve_finished(self, model: "Model") -> None:
+        """
+        Called after the model is solved, even if the solver raised an error.
+        :param model: The model that emitted the event.
+        :return: None.
+        """
+        pass
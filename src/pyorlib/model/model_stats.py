@@ -0,0 +1,191 @@
+from dataclasses import dataclass, field
+from math import inf, isfinite
+from typing import Dict, Sequence, Tuple
+
+from ..enums import ValueType
+
+
+@dataclass
+class ModelStats:
+    """
+    Represents the statistics of a model, kept up to date as terms and constraints are added.
+
+    The `ModelStats` class counts the variables by type, the constraints by sense and the nonzero coefficients
+    of a model, and tracks the smallest and largest magnitudes of its coefficients, bounds and right-hand sides,
+    so that badly scaled or oversized models can be detected before they are solved. Every update only looks
+    at the term or row being added, so retrieving the statistics does not depend on the size of the model.
+    Ranges without any value are reported as `(inf, 0)`.
+    """
+
+    big_m_threshold: float = 1e6
+    """ The magnitude from which a coefficient or bound is reported as a big-M suspect. """
+
+    num_constants: int = 0
+    """ The number of constants. """
+
+    num_variables: int = 0
+    """ The number of variables. """
+
+    variables_by_type: Dict[str, int] = field(default_factory=lambda: {value_type.name: 0 for value_type in ValueType})
+    """ The number of variables of each value type, by type name. """
+
+    num_constraints: int = 0
+    """ The number of constraints. """
+
+    constraints_by_sense: Dict[str, int] = field(
+        default_factory=lambda: {"<=": 0, ">=": 0, "==": 0, "range": 0, "nonlinear": 0}
+    )
+    """ The number of constraints of each sense, with constraints that cannot be decomposed as nonlinear. """
+
+    num_nonzeros: int = 0
+    """ The number of nonzero coefficients in the constraints. """
+
+    num_objective_nonzeros: int = 0
+    """ The number of nonzero coefficients in the objective. """
+
+    coefficient_range: Tuple[float, float] = (inf, 0.0)
+    """ The smallest and largest magnitudes of the nonzero constraint coefficients. """
+
+    objective_range: Tuple[float, float] = (inf, 0.0)
+    """ The smallest and largest magnitudes of the nonzero objective coefficients. """
+
+    bound_range: Tuple[float, float] = (inf, 0.0)
+    """ The smallest and largest magnitudes of the finite nonzero variable bounds. """
+
+    rhs_range: Tuple[float, float] = (inf, 0.0)
+    """ The smallest and largest magnitudes of the finite nonzero constraint bounds. """
+
+    big_m_rows: int = 0
+    """ The number of constraints with a coefficient whose magnitude reaches the big-M threshold. """
+
+    big_m_bounds: int = 0
+    """ The number of variables with a finite bound whose magnitude reaches the big-M threshold. """
+
+    name_bytes: int = 0
+    """ The total length of the term names, in bytes. """
+
+    @property
+    def coefficient_ratio(self) -> float:
+        """
+        Retrieves the ratio between the largest and smallest constraint coefficient magnitudes. Ratios above
+        1e6 to 1e9 usually lead to numerical trouble in the solvers.
+        :return: A float with the ratio, or 1 if there are no coefficients.
+        """
+        smallest, largest = self.coefficient_range
+        return largest / smallest if largest > 0 else 1.0
+
+    @property
+    def estimated_memory(self) -> Dict[str, int]:
+        """
+        Retrieves an estimate of the memory taken by the model data, by component. The estimate is the size of
+        the compact record of the model (see `ModelRecord`), which is a lower bound of the memory used by the
+        engines.
+        :return: A dictionary with the estimated number of bytes of the variables, constraints, objective
+            and names.
+        """
+        return {
+            "variables": 25 * self.num_variables,
+            "constraints": 24 * self.num_constraints + 16 * self.num_nonzeros,
+            "objective": 16 * self.num_objective_nonzeros,
+            "names": self.name_bytes,
+        }
+
+    def record_constant(self, name: str) -> None:
+        """
+        Records a new constant.
+        :param name: The name of the constant.
+        :return: None.
+        """
+        self.num_constants += 1
+        self.name_bytes += len(name)
+
+    def record_variable(self, name: str, value_type: ValueType, lower_bound: float, upper_bound: float) -> None:
+        """
+        Records a new variable.
+        :param name: The name of the variable.
+        :param value_type: The type of the variable values.
+        :param lower_bound: The lower bound of the variable.
+        :param upper_bound: The upper bound of the variable.
+        :return: None.
+        """
+        self.num_variables += 1
+        self.variables_by_type[value_type.name] += 1
+        self.name_bytes += len(name)
+
+        bounds: Sequence[float] = [abs(bound) for bound in (lower_bound, upper_bound) if bound and isfinite(bound)]
+        if bounds:
+            self.bound_range = self.__extend(self.bound_range, bounds)
+            if max(bounds) >= self.big_m_threshold:
+                self.big_m_bounds += 1
+
+    def record_constraint(self, coefficients: Sequence[float], lower_bound: float, upper_bound: float) -> None:
+        """
+        Records a new linear constraint.
+        :param coefficients: The coefficients of the constraint.
+        :param lower_bound: The lower bound of the constraint, or -inf if it has none.
+        :param upper_bound: The upper bound of the constraint, or inf if it has none.
+        :return: None.
+        """
+        self.num_constraints += 1
+        if lower_bound == upper_bound:
+            self.constraints_by_sense["=="] += 1
+        elif lower_bound == -inf:
+            self.constraints_by_sense["<="] += 1
+        elif upper_bound == inf:
+            self.constraints_by_sense[">="] += 1
+        else:
+            self.constraints_by_sense["range"] += 1
+
+        magnitudes: Sequence[float] = [abs(coefficient) for coefficient in coefficients if coefficient]
+        if magnitudes:
+            self.num_nonzeros += len(magnitudes)
+            self.coefficient_range = self.__extend(self.coefficient_range, magnitudes)
+            if max(magnitudes) >= self.big_m_threshold:
+                self.big_m_rows += 1
+
+        bounds: Sequence[float] = [abs(bound) for bound in (lower_bound, upper_bound) if bound and isfinite(bound)]
+        if bounds:
+            self.rhs_range = self.__extend(self.rhs_range, bounds)
+
+    def record_column(self, coefficients: Sequence[float], objective_coefficient: float) -> None:
+        """
+        Records the coefficients of a new variable in existing constraints and in the objective.
+        :param coefficients: The coefficients of the variable in the constraints.
+        :param objective_coefficient: The coefficient of the variable in the objective.
+        :return: None.
+        """
+        magnitudes: Sequence[float] = [abs(coefficient) for coefficient in coefficients if coefficient]
+        if magnitudes:
+            self.num_nonzeros += len(magnitudes)
+            self.coefficient_range = self.__extend(self.coefficient_range, magnitudes)
+        if objective_coefficient:
+            self.num_objective_nonzeros += 1
+            self.objective_range = self.__extend(self.objective_range, [abs(objective_coefficient)])
+
+    def record_nonlinear_constraint(self) -> None:
+        """
+        Records a new constraint that cannot be decomposed into a linear row.
+        :return: None.
+        """
+        self.num_constraints += 1
+        self.constraints_by_sense["nonlinear"] += 1
+
+    def record_objective(self, coefficients: Sequence[float]) -> None:
+        """
+        Records the objective function, replacing the previous one.
+        :param coefficients: The coefficients of the objective.
+        :return: None.
+        """
+        magnitudes: Sequence[float] = [abs(coefficient) for coefficient in coefficients if coefficient]
+        self.num_objective_nonzeros = len(magnitudes)
+        self.objective_range = self.__extend((inf, 0.0), magnitudes) if magnitudes else (inf, 0.0)
+
+    @staticmethod
+    def __extend(current: Tuple[float, float], magnitudes: Sequence[float]) -> Tuple[float, float]:
+        """
+        Extends a magnitude range with new magnitudes.
+        :param current: The current smallest and largest magnitudes.
+        :param magnitudes: A non-empty sequence of new magnitudes.
+        :return: The extended range.
+        """
+        return min(current[0], min(magnitudes)), max(current[1], max(magnitudes))
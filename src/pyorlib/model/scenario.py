@@ -0,0 +1,231 @@
+from array import array
+from dataclasses import replace
+from typing import Dict, Mapping, Tuple, TYPE_CHECKING
+
+from ..exceptions import ModelException
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..io import ModelRecord
+
+
+class Scenario:
+    """
+    Represents a what-if variant of a model, as a set of changes on top of a shared base record.
+
+    Scenarios are created with `Model.scenario` from the record of a base model, and only record the changes
+    made to it: variable bounds, constraint bounds, constraint coefficients and objective coefficients. The base
+    record is shared, never modified, by all the scenarios derived from it, so forking a scenario only copies
+    its changes and the memory of each variant is proportional to the number of changes. A scenario is turned
+    into a model on any engine with `Model.from_scenario`, which applies the changes to a copy of the base.
+
+    Variables are referenced by name, and constraints by their position among the linear constraints of the
+    base model (see `Model.constraints`).
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_base", "_name", "_columns", "_column_bounds", "_row_bounds", "_coefficients", "_objective"]
+
+    @property
+    def base(self) -> "ModelRecord":
+        """
+        Retrieves the base record of the scenario, shared with the scenarios forked from it.
+        :return: The record of the base model.
+        """
+        return self._base
+
+    @property
+    def name(self) -> str:
+        """
+        Retrieves the name of the scenario.
+        :return: A string with the name of the scenario.
+        """
+        return self._name
+
+    @property
+    def num_changes(self) -> int:
+        """
+        Retrieves the number of changes of the scenario with respect to its base.
+        :return: An integer with the number of changed bounds and coefficients.
+        """
+        return len(self._column_bounds) + len(self._row_bounds) + len(self._coefficients) + len(self._objective)
+
+    def __init__(self, base: "ModelRecord", name: str | None = None, columns: Mapping[str, int] | None = None):
+        """
+        Initializes a new Scenario instance without changes.
+        :param base: The record of the base model, which is shared and must not be modified.
+        :param name: An optional name for the scenario. Defaults to the name of the base model.
+        :param columns: The position of each variable in the base record, by name. Defaults to None, for the
+            positions of the column names of the base record.
+        """
+        # Instance attributes
+        self._base: ModelRecord = base
+        """ The record of the base model. """
+
+        self._name: str = name or base.name
+        """ The name of the scenario. """
+
+        self._columns: Mapping[str, int] = (
+            columns if columns is not None else {name: column for column, name in enumerate(base.column_names)}
+        )
+        """ The position of each variable in the base record, by name, shared with the forked scenarios. """
+
+        self._column_bounds: Dict[int, Tuple[float, float]] = {}
+        """ The changed bounds of the variables, by column. """
+
+        self._row_bounds: Dict[int, Tuple[float, float]] = {}
+        """ The changed bounds of the constraints, by row. """
+
+        self._coefficients: Dict[Tuple[int, int], float] = {}
+        """ The changed coefficients of the constraints, by row and column. """
+
+        self._objective: Dict[int, float] = {}
+        """ The changed objective coefficients, by column. """
+
+    def fork(self, name: str | None = None) -> "Scenario":
+        """
+        Creates a new scenario with the same base and a copy of the changes of this scenario, so that both can
+        be changed independently.
+        :param name: An optional name for the new scenario. Defaults to the name of this scenario.
+        :return: The new scenario.
+        """
+        scenario: Scenario = Scenario(base=self._base, name=name or self._name, columns=self._columns)
+        scenario._column_bounds = dict(self._column_bounds)
+        scenario._row_bounds = dict(self._row_bounds)
+        scenario._coefficients = dict(self._coefficients)
+        scenario._objective = dict(self._objective)
+        return scenario
+
+    def set_variable_bounds(
+        self, name: str, lower_bound: float | None = None, upper_bound: float | None = None
+    ) -> "Scenario":
+        """
+        Changes the bounds of a variable.
+        :param name: The name of the variable.
+        :param lower_bound: The new lower bound, or None to keep the current one.
+        :param upper_bound: The new upper bound, or None to keep the current one.
+        :return: The scenario itself, so that changes can be chained.
+        """
+        column: int = self.__column(name=name)
+        current_lower, current_upper = self._column_bounds.get(
+            column, (self._base.column_lower_bounds[column], self._base.column_upper_bounds[column])
+        )
+        self._column_bounds[column] = (
+            current_lower if lower_bound is None else lower_bound,
+            current_upper if upper_bound is None else upper_bound,
+        )
+        return self
+
+    def set_constraint_bounds(
+        self, row: int, lower_bound: float | None = None, upper_bound: float | None = None
+    ) -> "Scenario":
+        """
+        Changes the bounds, or right-hand sides, of a constraint.
+        :param row: The position of the constraint in the base model.
+        :param lower_bound: The new lower bound, or None to keep the current one.
+        :param upper_bound: The new upper bound, or None to keep the current one.
+        :return: The scenario itself, so that changes can be chained.
+        """
+        self.__validate_row(row=row)
+        current_lower, current_upper = self._row_bounds.get(
+            row, (self._base.row_lower_bounds[row], self._base.row_upper_bounds[row])
+        )
+        self._row_bounds[row] = (
+            current_lower if lower_bound is None else lower_bound,
+            current_upper if upper_bound is None else upper_bound,
+        )
+        return self
+
+    def set_coefficient(self, row: int, name: str, value: float) -> "Scenario":
+        """
+        Changes the coefficient of a variable in a constraint. A zero removes the variable from the constraint.
+        :param row: The position of the constraint in the base model.
+        :param name: The name of the variable.
+        :param value: The new coefficient.
+        :return: The scenario itself, so that changes can be chained.
+        """
+        self.__validate_row(row=row)
+        self._coefficients[row, self.__column(name=name)] = value
+        return self
+
+    def set_objective_coefficient(self, name: str, value: float) -> "Scenario":
+        """
+        Changes the objective coefficient of a variable.
+        :param name: The name of the variable.
+        :param value: The new coefficient.
+        :return: The scenario itself, so that changes can be chained.
+        """
+        self._objective[self.__column(name=name)] = value
+        return self
+
+    def to_record(self) -> "ModelRecord":
+        """
+        Builds the record of the scenario, applying its changes to a copy of the base record. Only the arrays
+        affected by the changes are copied, while the others are shared with the base.
+        :return: The record of the scenario.
+        """
+        base: ModelRecord = self._base
+        record: ModelRecord = replace(base, name=self._name)
+
+        if self._column_bounds:
+            record.column_lower_bounds = array("d", base.column_lower_bounds)
+            record.column_upper_bounds = array("d", base.column_upper_bounds)
+            for column, (lower_bound, upper_bound) in self._column_bounds.items():
+                record.column_lower_bounds[column] = lower_bound
+                record.column_upper_bounds[column] = upper_bound
+
+        if self._row_bounds:
+            record.row_lower_bounds = array("d", base.row_lower_bounds)
+            record.row_upper_bounds = array("d", base.row_upper_bounds)
+            for row, (lower_bound, upper_bound) in self._row_bounds.items():
+                record.row_lower_bounds[row] = lower_bound
+                record.row_upper_bounds[row] = upper_bound
+
+        if self._objective:
+            record.objective = array("d", base.objective)
+            for column, coefficient in self._objective.items():
+                record.objective[column] = coefficient
+
+        if self._coefficients:
+            changes: Dict[int, Dict[int, float]] = {}
+            for (row, column), coefficient in self._coefficients.items():
+                changes.setdefault(row, {})[column] = coefficient
+
+            record.row_starts = array("q", [0])
+            record.row_columns = array("q")
+            record.row_values = array("d")
+            for row in range(base.num_rows):
+                start, end = base.row_starts[row], base.row_starts[row + 1]
+                row_changes: Dict[int, float] | None = changes.get(row)
+                if row_changes is None:
+                    record.row_columns.extend(base.row_columns[start:end])
+                    record.row_values.extend(base.row_values[start:end])
+                else:
+                    coefficients: Dict[int, float] = dict(zip(base.row_columns[start:end], base.row_values[start:end]))
+                    coefficients.update(row_changes)
+                    for column, coefficient in coefficients.items():
+                        if coefficient != 0:
+                            record.row_columns.append(column)
+                            record.row_values.append(coefficient)
+                record.row_starts.append(len(record.row_columns))
+
+        return record
+
+    def __column(self, name: str) -> int:
+        """
+        Retrieves the position of a variable in the base record.
+        :param name: The name of the variable.
+        :return: The column of the variable.
+        """
+        column: int | None = self._columns.get(name)
+        if column is None:
+            raise ModelException(f"Variable not found in the scenario: {name}")
+        return column
+
+    def __validate_row(self, row: int) -> None:
+        """
+        Validates that a row exists in the base record.
+        :param row: The position of the constraint.
+        :return: None.
+        """
+        if not 0 <= row < self._base.num_rows:
+            raise ModelException(f"Constraint not found in the scenario: {row}")
@@ -0,0 +1,8 @@
+"""
+The Presolve module in PyORlib provides a presolve stage that reduces linear models over their solver-independent
+record before they are lowered to an engine, together with the postsolve map that expresses the values of the
+reduced model in the original space.
+"""
+
+from .postsolve_map import PostsolveMap
+from .presolver import Presolver
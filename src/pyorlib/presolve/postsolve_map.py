@@ -0,0 +1,64 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+from ..exceptions import PresolveException
+
+
+@dataclass
+class PostsolveMap:
+    """
+    Represents the mapping between the columns of a model and those of its presolved version.
+
+    Presolve keeps the original column space: removed columns are fixed at their value and no longer referenced
+    by the rows or the objective, while the remaining columns are sent to the engine in their original order.
+    The map records where each original column ended up, so that values of the reduced model can be expressed
+    in the original space.
+    """
+
+    column_map: "array[int]" = field(default_factory=lambda: array("q"))
+    """ The position of each original column among the remaining columns, or -1 if it was removed. """
+
+    fixed_values: "array[float]" = field(default_factory=lambda: array("d"))
+    """ The value of each removed column, and 0 for the remaining columns. """
+
+    stats: Dict[str, int] = field(default_factory=dict)
+    """ The number of reductions applied, by kind. """
+
+    @property
+    def num_columns(self) -> int:
+        """
+        Retrieves the number of columns of the original model.
+        :return: An integer with the number of original columns.
+        """
+        return len(self.column_map)
+
+    @property
+    def num_removed_columns(self) -> int:
+        """
+        Retrieves the number of columns removed by presolve.
+        :return: An integer with the number of removed columns.
+        """
+        return sum(1 for position in self.column_map if position < 0)
+
+    def is_removed(self, column: int) -> bool:
+        """
+        Determines whether an original column was removed by presolve.
+        :param column: The position of the column in the original model.
+        :return: True if the column was removed, False otherwise.
+        """
+        return self.column_map[column] < 0
+
+    def postsolve(self, values: Sequence[float]) -> List[float]:
+        """
+        Expresses the values of the remaining columns in the original column space.
+        :param values: The values of the remaining columns, in their original order.
+        :return: A list with the value of every original column.
+        """
+        num_remaining: int = self.num_columns - self.num_removed_columns
+        if len(values) != num_remaining:
+            raise PresolveException(f"Expected {num_remaining} values, but {len(values)} were given.")
+        return [
+            self.fixed_values[column] if position < 0 else values[position]
+            for column, position in enumerate(self.column_map)
+        ]
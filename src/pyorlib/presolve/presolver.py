@@ -0,0 +1,458 @@
+from array import array
+from math import ceil, floor, inf, isfinite
+from typing import Dict, List, Tuple
+
+from .postsolve_map import PostsolveMap
+from ..enums import ValueType
+from ..exceptions import PresolveException
+from ..io import ModelRecord
+
+
+class Presolver:
+    """
+    Reduces linear models before they are lowered to an engine.
+
+    The `Presolver` class works on the `ModelRecord` of a model, so reductions cost no engine calls and the
+    engine only receives the reduced model. Each pass applies the enabled reductions:
+
+    - Fixed columns (equal bounds) are substituted into the rows and the objective constant.
+    - Empty rows are checked for feasibility and removed.
+    - Singleton rows are converted into bounds of their column.
+    - Duplicate rows, including rows that are multiples of each other, are detected by hashing their
+      normalized coefficients and merged into one row with the intersection of their bounds.
+    - Bounds are tightened from the activity ranges of the rows, and rows that can never be violated are removed.
+
+    Passes are repeated until no reduction applies or `max_passes` is reached, and infeasibilities found along
+    the way raise a `PresolveException`.
+    """
+
+    # Strict class attributes.
+    __slots__ = [
+        "_remove_fixed_columns",
+        "_convert_singleton_rows",
+        "_remove_duplicate_rows",
+        "_tighten_bounds",
+        "_max_passes",
+        "_tolerance",
+    ]
+
+    @property
+    def max_passes(self) -> int:
+        """
+        Retrieves the maximum number of presolve passes.
+        :return: An integer with the maximum number of passes.
+        """
+        return self._max_passes
+
+    @property
+    def tolerance(self) -> float:
+        """
+        Retrieves the feasibility tolerance used by the reductions.
+        :return: A float with the tolerance.
+        """
+        return self._tolerance
+
+    def __init__(
+        self,
+        remove_fixed_columns: bool = True,
+        convert_singleton_rows: bool = True,
+        remove_duplicate_rows: bool = True,
+        tighten_bounds: bool = True,
+        max_passes: int = 10,
+        tolerance: float = 1e-9,
+    ):
+        """
+        Initializes a new Presolver instance.
+        :param remove_fixed_columns: Whether to substitute and remove fixed columns. Defaults to True.
+        :param convert_singleton_rows: Whether to convert singleton rows into column bounds. Defaults to True.
+        :param remove_duplicate_rows: Whether to merge duplicate rows. Defaults to True.
+        :param tighten_bounds: Whether to tighten bounds and remove redundant rows from row activities.
+            Defaults to True.
+        :param max_passes: The maximum number of presolve passes. Defaults to 10.
+        :param tolerance: The feasibility tolerance used by the reductions. Defaults to 1e-9.
+        """
+        # Applies validations
+        if max_passes < 1:
+            raise PresolveException("The maximum number of passes must be a positive integer.")
+        if tolerance < 0:
+            raise PresolveException("The tolerance cannot be negative.")
+
+        # Instance attributes
+        self._remove_fixed_columns: bool = remove_fixed_columns
+        """ Whether to substitute and remove fixed columns. """
+
+        self._convert_singleton_rows: bool = convert_singleton_rows
+        """ Whether to convert singleton rows into column bounds. """
+
+        self._remove_duplicate_rows: bool = remove_duplicate_rows
+        """ Whether to merge duplicate rows. """
+
+        self._tighten_bounds: bool = tighten_bounds
+        """ Whether to tighten bounds and remove redundant rows from row activities. """
+
+        self._max_passes: int = max_passes
+        """ The maximum number of presolve passes. """
+
+        self._tolerance: float = tolerance
+        """ The feasibility tolerance used by the reductions. """
+
+    def presolve(self, record: ModelRecord) -> Tuple[ModelRecord, PostsolveMap]:
+        """
+        Reduces a model record.
+        :param record: The record of the model to be reduced. It is not modified.
+        :return: A tuple with the reduced record, which keeps the original columns but only references the
+            remaining ones, and the postsolve map that relates both.
+        """
+        state: _PresolveState = _PresolveState(record=record, tolerance=self._tolerance)
+
+        for _ in range(self._max_passes):
+            changed: bool = False
+            if self._remove_fixed_columns:
+                changed |= state.remove_fixed_columns()
+            changed |= state.remove_small_rows(convert_singletons=self._convert_singleton_rows)
+            if self._remove_duplicate_rows:
+                changed |= state.remove_duplicate_rows()
+            if self._tighten_bounds:
+                changed |= state.tighten_bounds()
+            if not changed:
+                break
+        else:
+            if self._remove_fixed_columns:
+                state.remove_fixed_columns()
+
+        return state.build()
+
+
+class _PresolveState:
+    """
+    Holds the working copy of a record while it is being reduced.
+
+    Rows are never rewritten: removed columns are flagged as inactive and their contribution is moved into the
+    row bounds, and removed rows are flagged as inactive, so the compressed sparse row arrays of the original
+    record are shared until the reduced record is built.
+    """
+
+    # Strict class attributes.
+    __slots__ = [
+        "record",
+        "tolerance",
+        "lower_bounds",
+        "upper_bounds",
+        "types",
+        "row_lower_bounds",
+        "row_upper_bounds",
+        "row_sizes",
+        "column_active",
+        "row_active",
+        "column_starts",
+        "column_entries",
+        "entry_rows",
+        "objective",
+        "objective_constant",
+        "fixed_values",
+        "stats",
+    ]
+
+    def __init__(self, record: ModelRecord, tolerance: float):
+        num_columns, num_rows = record.num_columns, record.num_rows
+        self.record: ModelRecord = record
+        self.tolerance: float = tolerance
+        self.types: List[int] = list(record.column_types)
+        self.lower_bounds: List[float] = list(record.column_lower_bounds)
+        self.upper_bounds: List[float] = list(record.column_upper_bounds)
+        for column, value_type in enumerate(self.types):
+            if value_type == ValueType.BINARY:
+                self.lower_bounds[column] = max(self.lower_bounds[column], 0.0)
+                self.upper_bounds[column] = min(self.upper_bounds[column], 1.0)
+        self.row_lower_bounds: List[float] = list(record.row_lower_bounds)
+        self.row_upper_bounds: List[float] = list(record.row_upper_bounds)
+        self.row_sizes: List[int] = [record.row_starts[i + 1] - record.row_starts[i] for i in range(num_rows)]
+        self.column_active: bytearray = bytearray(b"\x01") * num_columns
+        self.row_active: bytearray = bytearray(b"\x01") * num_rows
+        self.objective: List[float] = list(record.objective)
+        self.objective_constant: float = record.objective_constant
+        self.fixed_values: array[float] = array("d", bytes(8 * num_columns))
+        self.stats: Dict[str, int] = {
+            "fixed_columns": 0,
+            "empty_rows": 0,
+            "singleton_rows": 0,
+            "duplicate_rows": 0,
+            "redundant_rows": 0,
+            "tightened_bounds": 0,
+        }
+
+        # Transposes the rows, so that the entries of each column can be visited when it is removed.
+        row_starts, row_columns = record.row_starts, record.row_columns
+        column_starts: array[int] = array("q", bytes(8 * (num_columns + 1)))
+        for column in row_columns:
+            column_starts[column + 1] += 1
+        for column in range(num_columns):
+            column_starts[column + 1] += column_starts[column]
+        positions: array[int] = array("q", column_starts)
+        column_entries: array[int] = array("q", bytes(8 * len(row_columns)))
+        entry_rows: array[int] = array("q", bytes(8 * len(row_columns)))
+        for row in range(num_rows):
+            for entry in range(row_starts[row], row_starts[row + 1]):
+                column = row_columns[entry]
+                column_entries[positions[column]] = entry
+                positions[column] += 1
+                entry_rows[entry] = row
+        self.column_starts: array[int] = column_starts
+        self.column_entries: array[int] = column_entries
+        self.entry_rows: array[int] = entry_rows
+
+    def remove_fixed_columns(self) -> bool:
+        changed: bool = False
+        for column in range(len(self.types)):
+            if self.column_active[column] and self.upper_bounds[column] - self.lower_bounds[column] <= self.tolerance:
+                self.__fix_column(column=column, value=self.lower_bounds[column])
+                changed = True
+        return changed
+
+    def remove_small_rows(self, convert_singletons: bool) -> bool:
+        changed: bool = False
+        for row in range(len(self.row_active)):
+            if not self.row_active[row] or self.row_sizes[row] > 1:
+                continue
+
+            entries: List[Tuple[int, float]] = self.__entries(row)
+            if entries and abs(entries[0][1]) > self.tolerance:
+                if not convert_singletons:
+                    continue
+                column, coefficient = entries[0]
+                lower_bound: float = self.row_lower_bounds[row] / coefficient
+                upper_bound: float = self.row_upper_bounds[row] / coefficient
+                if coefficient < 0:
+                    lower_bound, upper_bound = upper_bound, lower_bound
+                self.__tighten_column(column=column, lower_bound=lower_bound, upper_bound=upper_bound, threshold=0)
+                self.stats["singleton_rows"] += 1
+            else:
+                if self.row_lower_bounds[row] > self.tolerance or self.row_upper_bounds[row] < -self.tolerance:
+                    raise PresolveException(f"Row {row} has no coefficients and cannot be satisfied.")
+                self.stats["empty_rows"] += 1
+            self.row_active[row] = 0
+            changed = True
+        return changed
+
+    def remove_duplicate_rows(self) -> bool:
+        changed: bool = False
+        rows_by_key: Dict[Tuple[Tuple[int, float], ...], Tuple[int, float]] = {}
+        for row in range(len(self.row_active)):
+            if not self.row_active[row]:
+                continue
+            entries: List[Tuple[int, float]] = sorted(self.__entries(row))
+            if not entries or entries[0][1] == 0:
+                continue
+
+            # Rows are normalized by their first coefficient, so that multiples of a row share its key.
+            scale: float = entries[0][1]
+            key: Tuple[Tuple[int, float], ...] = tuple((column, coefficient / scale) for column, coefficient in entries)
+            kept: Tuple[int, float] | None = rows_by_key.get(key)
+            if kept is None:
+                rows_by_key[key] = (row, scale)
+                continue
+
+            kept_row, kept_scale = kept
+            lower_bound, upper_bound = self.__scaled_bounds(row, 1 / scale)
+            kept_lower_bound, kept_upper_bound = self.__scaled_bounds(kept_row, 1 / kept_scale)
+            lower_bound, upper_bound = max(lower_bound, kept_lower_bound), min(upper_bound, kept_upper_bound)
+            if lower_bound > upper_bound + self.tolerance * (1 + abs(upper_bound)):
+                raise PresolveException(f"Rows {kept_row} and {row} are duplicates with incompatible bounds.")
+
+            self.row_lower_bounds[kept_row], self.row_upper_bounds[kept_row] = (
+                (lower_bound * kept_scale, upper_bound * kept_scale)
+                if kept_scale > 0
+                else (upper_bound * kept_scale, lower_bound * kept_scale)
+            )
+            self.row_active[row] = 0
+            self.stats["duplicate_rows"] += 1
+            changed = True
+        return changed
+
+    def tighten_bounds(self) -> bool:
+        tolerance: float = self.tolerance
+        changed: bool = False
+        for row in range(len(self.row_active)):
+            if not self.row_active[row]:
+                continue
+            entries: List[Tuple[int, float]] = [entry for entry in self.__entries(row) if abs(entry[1]) > tolerance]
+            row_lower_bound, row_upper_bound = self.row_lower_bounds[row], self.row_upper_bounds[row]
+
+            # The smallest and largest activities of the row, with the number of infinite contributions apart.
+            minimum: float = 0.0
+            maximum: float = 0.0
+            minimum_infinite: int = 0
+            maximum_infinite: int = 0
+            contributions: List[Tuple[float, float]] = []
+            for column, coefficient in entries:
+                low: float = coefficient * (self.lower_bounds[column] if coefficient > 0 else self.upper_bounds[column])
+                high: float = coefficient * (
+                    self.upper_bounds[column] if coefficient > 0 else self.lower_bounds[column]
+                )
+                contributions.append((low, high))
+                if isfinite(low):
+                    minimum += low
+                else:
+                    minimum_infinite += 1
+                if isfinite(high):
+                    maximum += high
+                else:
+                    maximum_infinite += 1
+
+            if (minimum_infinite == 0 and minimum > row_upper_bound + tolerance * (1 + abs(row_upper_bound))) or (
+                maximum_infinite == 0 and maximum < row_lower_bound - tolerance * (1 + abs(row_lower_bound))
+            ):
+                raise PresolveException(f"Row {row} cannot be satisfied within the bounds of its columns.")
+            if (row_lower_bound == -inf or (minimum_infinite == 0 and minimum >= row_lower_bound - tolerance)) and (
+                row_upper_bound == inf or (maximum_infinite == 0 and maximum <= row_upper_bound + tolerance)
+            ):
+                self.row_active[row] = 0
+                self.stats["redundant_rows"] += 1
+                changed = True
+                continue
+
+            for (column, coefficient), (low, high) in zip(entries, contributions):
+                # The activity of the other columns, available when at most this column contributes infinity.
+                others_minimum: float = -inf
+                if minimum_infinite == 0:
+                    others_minimum = minimum - low
+                elif minimum_infinite == 1 and not isfinite(low):
+                    others_minimum = minimum
+                others_maximum: float = inf
+                if maximum_infinite == 0:
+                    others_maximum = maximum - high
+                elif maximum_infinite == 1 and not isfinite(high):
+                    others_maximum = maximum
+
+                lower_bound, upper_bound = -inf, inf
+                if row_upper_bound < inf and others_minimum > -inf:
+                    implied: float = (row_upper_bound - others_minimum) / coefficient
+                    if coefficient > 0:
+                        upper_bound = implied
+                    else:
+                        lower_bound = implied
+                if row_lower_bound > -inf and others_maximum < inf:
+                    implied = (row_lower_bound - others_maximum) / coefficient
+                    if coefficient > 0:
+                        lower_bound = max(lower_bound, implied)
+                    else:
+                        upper_bound = min(upper_bound, implied)
+                changed |= self.__tighten_column(
+                    column=column, lower_bound=lower_bound, upper_bound=upper_bound, threshold=1e-6
+                )
+        return changed
+
+    def build(self) -> Tuple[ModelRecord, PostsolveMap]:
+        record: ModelRecord = self.record
+        num_columns: int = len(self.types)
+
+        column_map: array[int] = array("q", [-1]) * num_columns
+        position: int = 0
+        for column in range(num_columns):
+            if self.column_active[column]:
+                column_map[column] = position
+                position += 1
+
+        # Removed columns keep their fixed value as bounds, and no longer appear in rows or the objective.
+        objective: array[float] = array("d", self.objective)
+        for column in range(num_columns):
+            if not self.column_active[column]:
+                objective[column] = 0.0
+
+        reduced: ModelRecord = ModelRecord(
+            name=record.name,
+            opt_type=record.opt_type,
+            objective_constant=self.objective_constant,
+            column_names=list(record.column_names),
+            column_types=array("b", self.types),
+            column_lower_bounds=array("d", self.lower_bounds),
+            column_upper_bounds=array("d", self.upper_bounds),
+            objective=objective,
+            term_sets=record.term_sets,
+            dimensions=record.dimensions,
+        )
+        for row in range(len(self.row_active)):
+            if not self.row_active[row]:
+                continue
+            for column, coefficient in self.__entries(row):
+                reduced.row_columns.append(column)
+                reduced.row_values.append(coefficient)
+            reduced.row_starts.append(len(reduced.row_columns))
+            reduced.row_lower_bounds.append(self.row_lower_bounds[row])
+            reduced.row_upper_bounds.append(self.row_upper_bounds[row])
+
+        return reduced, PostsolveMap(column_map=column_map, fixed_values=self.fixed_values, stats=self.stats)
+
+    def __entries(self, row: int) -> List[Tuple[int, float]]:
+        """
+        Retrieves the entries of a row whose columns have not been removed.
+        :return: A list of (column, coefficient) tuples.
+        """
+        record: ModelRecord = self.record
+        row_columns, row_values, column_active = record.row_columns, record.row_values, self.column_active
+        return [
+            (row_columns[entry], row_values[entry])
+            for entry in range(record.row_starts[row], record.row_starts[row + 1])
+            if column_active[row_columns[entry]]
+        ]
+
+    def __scaled_bounds(self, row: int, scale: float) -> Tuple[float, float]:
+        """
+        Retrieves the bounds of a row multiplied by a factor, swapping them for negative factors.
+        :return: A tuple with the lower and upper bounds.
+        """
+        lower_bound: float = self.row_lower_bounds[row] * scale
+        upper_bound: float = self.row_upper_bounds[row] * scale
+        return (lower_bound, upper_bound) if scale > 0 else (upper_bound, lower_bound)
+
+    def __fix_column(self, column: int, value: float) -> None:
+        """
+        Removes a column, moving its contribution into the bounds of its rows and the objective constant.
+        :return: None.
+        """
+        self.column_active[column] = 0
+        self.fixed_values[column] = value
+        self.lower_bounds[column] = self.upper_bounds[column] = value
+        self.objective_constant += self.objective[column] * value
+        self.stats["fixed_columns"] += 1
+
+        row_values = self.record.row_values
+        for position in range(self.column_starts[column], self.column_starts[column + 1]):
+            entry: int = self.column_entries[position]
+            row: int = self.entry_rows[entry]
+            if self.row_active[row]:
+                shift: float = row_values[entry] * value
+                self.row_lower_bounds[row] -= shift
+                self.row_upper_bounds[row] -= shift
+                self.row_sizes[row] -= 1
+
+    def __tighten_column(self, column: int, lower_bound: float, upper_bound: float, threshold: float) -> bool:
+        """
+        Tightens the bounds of a column, rounding them inwards for integer columns.
+        :param threshold: The relative improvement required to apply a bound, which prevents endless sequences
+            of negligible tightenings.
+        :return: True if a bound was tightened, False otherwise.
+        """
+        tolerance: float = self.tolerance
+        if self.types[column] != ValueType.CONTINUOUS:
+            lower_bound = ceil(lower_bound - 1e-6) if isfinite(lower_bound) else lower_bound
+            upper_bound = floor(upper_bound + 1e-6) if isfinite(upper_bound) else upper_bound
+
+        changed: bool = False
+        current_lower_bound, current_upper_bound = self.lower_bounds[column], self.upper_bounds[column]
+        if lower_bound > current_lower_bound + threshold * (1 + abs(lower_bound)):
+            self.lower_bounds[column] = lower_bound
+            changed = True
+        if upper_bound < current_upper_bound - threshold * (1 + abs(upper_bound)):
+            self.upper_bounds[column] = upper_bound
+            changed = True
+
+        if self.lower_bounds[column] > self.upper_bounds[column]:
+            gap: float = self.lower_bounds[column] - self.upper_bounds[column]
+            if gap > max(tolerance, 1e-6) * (1 + abs(self.upper_bounds[column])):
+                raise PresolveException(f"Column {column} has incompatible bounds.")
+            self.upper_bounds[column] = self.lower_bounds[column]
+
+        if changed:
+            self.stats["tightened_bounds"] += 1
+        return changed
@@ -0,0 +1,9 @@
+"""
+The Profiling module in PyORlib provides a lightweight profiler that records the wall time, CPU time and number
+of calls of the modeling and solving phases of a model, separating the time spent in PyORlib from the time
+spent in the engine, and optionally forwards each measured span to a pluggable sink.
+"""
+
+from .profile_span import ProfileSpan
+from .profiler import Profiler
+from .profiled_engine import ProfiledEngine
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ProfileSpan:
+    """
+    Represents a single measured call of a profiled phase.
+    """
+
+    engine: str
+    """ The name of the engine of the profiled model. """
+
+    phase: str
+    """ The name of the profiled phase, such as 'model.add_constraint' or 'engine.solve'. """
+
+    start: float
+    """ The value of `time.perf_counter` when the call started. """
+
+    end: float
+    """ The value of `time.perf_counter` when the call ended. """
+
+    cpu_time: float
+    """ The CPU time of the process spent during the call, in seconds. """
+
+    @property
+    def wall_time(self) -> float:
+        """
+        Retrieves the wall time of the call.
+        :return: The elapsed wall time, in seconds.
+        """
+        return self.end - self.start
@@ -0,0 +1,164 @@
+from math import inf
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
+
+from .profiler import Profiler
+from ..algebra import Element
+from ..algebra.terms.variables import Variable
+from ..engines import Engine
+from ..enums import SolutionStatus, ValueType, OptimizationType
+
+
+class ProfiledEngine(Engine):
+    """
+    An engine that measures the calls made to another engine.
+
+    The `ProfiledEngine` class delegates every operation to the wrapped engine and records the modeling and
+    solving calls, and the reads of the objective value and status, in a profiler under phases prefixed with
+    'engine.'. Models wrap their engine with it while a profiler is enabled, so engines themselves do not pay
+    for profiling. The values of variables are read from the solver objects, so they are not recorded.
+    """
+
+    @property
+    def engine(self) -> Engine:
+        """
+        Retrieves the wrapped engine.
+        :return: The engine whose calls are measured.
+        """
+        return self._engine
+
+    @property
+    def profiler(self) -> Profiler:
+        """
+        Retrieves the profiler in which the calls are recorded.
+        :return: The profiler of the engine.
+        """
+        return self._profiler
+
+    @property
+    def name(self) -> str:
+        return self._engine.name
+
+    @property
+    def constraints(self) -> List[Element]:
+        return self._engine.constraints
+
+    @property
+    def objective_value(self) -> float | None:
+        with self._profiler.measure(engine=self._engine_name, phase="engine.objective_value"):
+            return self._engine.objective_value
+
+    @property
+    def objective_expr(self) -> Element | None:
+        return self._engine.objective_expr
+
+    @property
+    def solution_status(self) -> SolutionStatus:
+        with self._profiler.measure(engine=self._engine_name, phase="engine.solution_status"):
+            return self._engine.solution_status
+
+    def __init__(self, engine: Engine, profiler: Profiler):
+        """
+        Initializes a new ProfiledEngine instance.
+        :param engine: The engine whose calls are measured.
+        :param profiler: The profiler in which the calls are recorded.
+        """
+        # Instance attributes
+        self._engine: Engine = engine
+        """ The engine whose calls are measured. """
+
+        self._profiler: Profiler = profiler
+        """ The profiler in which the calls are recorded. """
+
+        self._engine_name: str = engine.name
+        """ The name of the wrapped engine, used to group its phases. """
+
+    def add_variable(
+        self,
+        name: str | None,
+        value_type: ValueType,
+        lower_bound: float = 0,
+        upper_bound: float = inf,
+    ) -> Variable:
+        with self._profiler.measure(engine=self._engine_name, phase="engine.add_variable"):
+            return self._engine.add_variable(
+                name=name, value_type=value_type, lower_bound=lower_bound, upper_bound=upper_bound
+            )
+
+    def add_constraint(self, expression: Element) -> Element:
+        with self._profiler.measure(engine=self._engine_name, phase="engine.add_constraint"):
+            return self._engine.add_constraint(expression=expression)
+
+    def set_objective(self, opt_type: OptimizationType, expression: Element) -> Element:
+        with self._profiler.measure(engine=self._engine_name, phase="engine.set_objective"):
+            return self._engine.set_objective(opt_type=opt_type, expression=expression)
+
+    def get_variable_key(self, variable: Variable) -> Any:
+        return self._engine.get_variable_key(variable=variable)
+
+    def get_linear_constraint(self, expression: Element) -> Tuple[List[Any], List[float], float, float]:
+        with self._profiler.measure(engine=self._engine_name, phase="engine.get_linear_constraint"):
+            return self._engine.get_linear_constraint(expression=expression)
+
+    def get_range_constraint(self, expression: Element, lower_bound: float, upper_bound: float) -> Element:
+        return self._engine.get_range_constraint(
+            expression=expression, lower_bound=lower_bound, upper_bound=upper_bound
+        )
+
+    def iter_linear_constraints(self) -> Iterator[Tuple[List[Any], List[float], float, float]]:
+        return self._engine.iter_linear_constraints()
+
+    def get_linear_objective(self) -> Tuple[List[Any], List[float], float, OptimizationType]:
+        with self._profiler.measure(engine=self._engine_name, phase="engine.get_linear_objective"):
+            return self._engine.get_linear_objective()
+
+    def begin_batch(self) -> None:
+        self._engine.begin_batch()
+
+    def end_batch(self) -> None:
+        with self._profiler.measure(engine=self._engine_name, phase="engine.end_batch"):
+            self._engine.end_batch()
+
+    def set_variable_bounds(self, variable: Variable, lower_bound: float, upper_bound: float) -> None:
+        self._engine.set_variable_bounds(variable=variable, lower_bound=lower_bound, upper_bound=upper_bound)
+
+    def set_start_values(self, variables: Sequence[Variable], values: Sequence[float]) -> None:
+        self._engine.set_start_values(variables=variables, values=values)
+
+    def get_reduced_costs(self, variables: Sequence[Variable]) -> List[float]:
+        return self._engine.get_reduced_costs(variables=variables)
+
+    def add_column(
+        self,
+        name: str | None,
+        value_type: ValueType,
+        lower_bound: float,
+        upper_bound: float,
+        objective_coefficient: float,
+        rows: Sequence[int],
+        coefficients: Sequence[float],
+    ) -> Variable:
+        with self._profiler.measure(engine=self._engine_name, phase="engine.add_column"):
+            return self._engine.add_column(
+                name=name,
+                value_type=value_type,
+                lower_bound=lower_bound,
+                upper_bound=upper_bound,
+                objective_coefficient=objective_coefficient,
+                rows=rows,
+                coefficients=coefficients,
+            )
+
+    def get_dual_values(self) -> List[float]:
+        return self._engine.get_dual_values()
+
+    def set_incumbent_callback(self, callback: Callable[[float], None] | None) -> None:
+        self._engine.set_incumbent_callback(callback=callback)
+
+    def set_lazy_constraint_callback(
+        self, callback: Callable[[Callable[[Sequence[Variable]], List[float]]], Sequence[Element]] | None
+    ) -> bool:
+        return self._engine.set_lazy_constraint_callback(callback=callback)
+
+    def solve(self) -> None:
+        with self._profiler.measure(engine=self._engine_name, phase="engine.solve"):
+            self._engine.solve()
@@ -0,0 +1,107 @@
+import json
+from contextlib import contextmanager
+from time import perf_counter, process_time
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from .profile_span import ProfileSpan
+
+
+class Profiler:
+    """
+    Represents a profiler of the phases of a model.
+
+    The `Profiler` class accumulates the number of calls, the wall time and the CPU time of each phase, grouped by
+    engine. Phases prefixed with 'model.' measure the public methods of the model, including the time spent in
+    PyORlib, while phases prefixed with 'engine.' only measure the calls to the engine, so the difference between
+    both is the overhead of the wrapper. A profiler can be shared by several models, and is enabled on a model by
+    passing it to its constructor or assigning it to its `profiler` property. Models without a profiler do not
+    measure anything.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_sink", "_phases"]
+
+    @property
+    def sink(self) -> Callable[[ProfileSpan], None] | None:
+        """
+        Retrieves the callable that receives each measured span, if any.
+        :return: The sink of the profiler, or None if spans are only accumulated.
+        """
+        return self._sink
+
+    def __init__(self, sink: Callable[[ProfileSpan], None] | None = None):
+        """
+        Initializes a new Profiler instance.
+        :param sink: An optional callable invoked with each measured span, for example to forward spans to a
+            tracing system. Defaults to None.
+        """
+        # Instance attributes
+        self._sink: Callable[[ProfileSpan], None] | None = sink
+        """ The callable that receives each measured span. """
+
+        self._phases: Dict[Tuple[str, str], List[float]] = {}
+        """ The number of calls, the wall time and the CPU time of each phase, by engine and phase name. """
+
+    def record(self, engine: str, phase: str, start: float, end: float, cpu_time: float) -> None:
+        """
+        Records a measured call of a phase.
+        :param engine: The name of the engine of the profiled model.
+        :param phase: The name of the phase.
+        :param start: The value of `time.perf_counter` when the call started.
+        :param end: The value of `time.perf_counter` when the call ended.
+        :param cpu_time: The CPU time spent during the call, in seconds.
+        :return: None.
+        """
+        totals: List[float] | None = self._phases.get((engine, phase))
+        if totals is None:
+            self._phases[(engine, phase)] = [1, end - start, cpu_time]
+        else:
+            totals[0] += 1
+            totals[1] += end - start
+            totals[2] += cpu_time
+
+        if self._sink is not None:
+            self._sink(ProfileSpan(engine=engine, phase=phase, start=start, end=end, cpu_time=cpu_time))
+
+    @contextmanager
+    def measure(self, engine: str, phase: str) -> Iterator[None]:
+        """
+        Measures the wall and CPU time of a block of code as a call of a phase.
+        :param engine: The name of the engine of the profiled model.
+        :param phase: The name of the phase.
+        :return: A context manager that records the call when the block exits.
+        """
+        start: float = perf_counter()
+        cpu_start: float = process_time()
+        try:
+            yield
+        finally:
+            self.record(
+                engine=engine, phase=phase, start=start, end=perf_counter(), cpu_time=process_time() - cpu_start
+            )
+
+    def report(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Builds a structured report of the recorded phases.
+        :return: A dictionary with the phases of each engine, where each phase maps to its number of calls,
+            its total wall time and its total CPU time in seconds.
+        """
+        report: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (engine, phase), (calls, wall_time, cpu_time) in sorted(self._phases.items()):
+            report.setdefault(engine, {})[phase] = {"calls": int(calls), "wall_time": wall_time, "cpu_time": cpu_time}
+        return report
+
+    def to_json(self, indent: int | None = None) -> str:
+        """
+        Serializes the report of the recorded phases to JSON.
+        :param indent: The indentation of the JSON document. Defaults to None, for a compact document.
+        :return: A string with the report in JSON format.
+        """
+        return json.dumps(self.report(), indent=indent)
+
+    def reset(self) -> None:
+        """
+        Discards all recorded phases.
+        :return: None.
+        """
+        self._phases.clear()
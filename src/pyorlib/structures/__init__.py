@@ -3,14 +3,17 @@ The Structures module in PyORlib provides a set of classes for managing and mani
 in optimization modeling.
 """
 
-from .definitions import DimensionDefinition, ParameterDefinition, TermDefinition
+from .definitions import DimensionDefinition, NameTemplate, ParameterDefinition, TermDefinition
 from .parameters import MultiValueParameter, Parameter, SingleValueParameter
+from .sets import IndexSet
 
 __all__ = [
     "DimensionDefinition",
+    "NameTemplate",
     "ParameterDefinition",
     "TermDefinition",
     "MultiValueParameter",
     "Parameter",
     "SingleValueParameter",
+    "IndexSet",
 ]
@@ -6,5 +6,6 @@ ensure consistency and extensibility throughout your optimization process.
 """
 
 from .dimension_definition import DimensionDefinition
+from .name_template import NameTemplate
 from .parameter_definition import ParameterDefinition
 from .term_definition import TermDefinition
@@ -0,0 +1,99 @@
+from string import Formatter
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class NameTemplate:
+    """
+    Represents a compiled template for the names of indexed terms.
+
+    A template is a string with replacement fields, such as `"x_{i}_{j}"` or `"y_{i:03d}"`, which are filled with
+    the indices of a term in order of appearance, whatever their names. Numbered fields, such as `"x_{1}_{0}"`,
+    are filled with the index at their position instead, as in `str.format`. The template is parsed once into a
+    positional format string, so rendering a name is a single `str.format` call instead of an interpreted
+    callable per index. Templates are callable, so they can be used as the `name` of term and parameter
+    definitions, and models in anonymous mode keep them to render the names of their terms only on demand.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_template", "_num_fields", "_format"]
+
+    @property
+    def template(self) -> str:
+        """
+        Retrieves the template as it was given.
+        :return: A string with the template.
+        """
+        return self._template
+
+    @property
+    def num_fields(self) -> int:
+        """
+        Retrieves the number of distinct replacement fields of the template.
+        :return: An integer with the number of indices used to render a name.
+        """
+        return self._num_fields
+
+    def __init__(self, template: str):
+        """
+        Initializes a new NameTemplate instance.
+        :param template: The template of the names, with one replacement field per index. Fields with the same
+            name refer to the same index, and empty fields refer to the next index. Numbered fields refer to the
+            index at their position, and cannot be mixed with named or empty fields.
+        """
+        # Applies validations
+        if not template:
+            raise ValueError("Name templates cannot be empty.")
+
+        positions: Dict[str, int] = {}
+        parts: List[str] = []
+        num_fields: int = 0
+        numbered: bool | None = None
+        for literal, field, spec, conversion in Formatter().parse(template):
+            parts.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+            if spec and "{" in spec:
+                raise ValueError("Name templates cannot have nested replacement fields.")
+            if numbered is None:
+                numbered = field.isdigit()
+            elif numbered != field.isdigit():
+                raise ValueError("Name templates cannot mix numbered fields with named or empty fields.")
+            if numbered:
+                position: int | None = int(field)
+                num_fields = max(num_fields, int(field) + 1)
+            elif field:
+                position = positions.get(field)
+                if position is None:
+                    position = positions[field] = num_fields
+                    num_fields += 1
+            else:
+                position = num_fields
+                num_fields += 1
+            parts.append(f"{{{position}{'!' + conversion if conversion else ''}{':' + spec if spec else ''}}}")
+
+        if num_fields == 0:
+            raise ValueError("Name templates must have at least one replacement field.")
+
+        # Instance attributes
+        self._template: str = template
+        """ The template as it was given. """
+
+        self._num_fields: int = num_fields
+        """ The number of distinct replacement fields of the template. """
+
+        self._format: Callable[..., str] = "".join(parts).format
+        """ The bound format method of the compiled positional template. """
+
+    def __call__(self, *indices: Any) -> str:
+        return self._format(*indices)
+
+    def __repr__(self) -> str:
+        return f"NameTemplate({self._template!r})"
+
+    def render(self, index: Tuple[Any, ...]) -> str:
+        """
+        Renders the name of a term from its index.
+        :param index: The indices of the term, in order.
+        :return: The name of the term.
+        """
+        return self._format(*index)
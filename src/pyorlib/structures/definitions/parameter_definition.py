@@ -15,7 +15,8 @@ class ParameterDefinition:
     name: Callable[..., str] | str
     """ 
     The name of the parameter. It can be a callable that returns the indexed name
-    of the parameter (e.g., `lambda` i, j: 'c_i_j'), or a string with the name itself.
+    of the parameter (e.g., `lambda` i, j: 'c_i_j', or a compiled `NameTemplate("c_{i}_{j}")`),
+    or a string with the name itself.
     """
 
     parameter_types: Set[ParameterType]
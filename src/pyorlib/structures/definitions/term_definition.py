@@ -14,7 +14,8 @@ class TermDefinition:
     name: Callable[..., str] | str
     """ 
     The name of the term. It can be a callable that returns the indexed name
-    of the term (e.g., `lambda` i, j: 'x_i_j'), or a string with the name itself.
+    of the term (e.g., `lambda` i, j: 'x_i_j', or a compiled `NameTemplate("x_{i}_{j}")`),
+    or a string with the name itself.
     """
 
     set_name: str | None = None
@@ -1,12 +1,32 @@
 from dataclasses import dataclass
-from typing import Tuple
+from functools import cached_property
+from typing import Any, Sequence, Tuple
 
 from .parameter import Parameter
 from ...enums import ParameterType, ValueType
 from ...validators import ValueTypeValidator
 
 
-@dataclass(frozen=True)
+def _read_only(sequence: Sequence[float] | None) -> Sequence[float] | None:
+    """
+    Retrieves a sequence with the same values that cannot be modified, so that values derived from it can be cached.
+    :param sequence: The sequence of values, or None.
+    :return: The sequence itself if it is a tuple or a read-only NumPy array, a read-only copy of a writeable
+        NumPy array, or a tuple with the values of any other sequence.
+    """
+    if sequence is None or isinstance(sequence, tuple):
+        return sequence
+    array: Any = sequence
+    if hasattr(array, "flags") and hasattr(array, "setflags"):
+        if not array.flags.writeable:
+            return sequence
+        array = array.copy()
+        array.setflags(write=False)
+        return array  # type: ignore[no-any-return]
+    return tuple(sequence)
+
+
+@dataclass(frozen=True, eq=False)
 class MultiValueParameter(Parameter):
     """
     A data class representing a multi-value parameter in an optimization model.
@@ -14,18 +34,64 @@ class MultiValueParameter(Parameter):
     The `MultiValueParameter` class is a subclass of `Parameter` and is used to represent parameters with multiple
     values in an optimization model. It provides properties to access the set of parameter values, lower bounds,
     and upper bounds.
+
+    The values and bounds can be tuples or any array-backed sequence, such as NumPy arrays or `array.array`
+    objects, and they are validated as a whole rather than element by element. NumPy arrays are kept as read-only
+    copies (or as they are, if already read-only) and other mutable sequences are converted to tuples, so that
+    the parameter is immutable and its smallest and largest values are computed once and cached. Parameters are compared and hashed by their
+    values, regardless of the type of sequence that holds them, since arrays cannot be compared or hashed
+    directly.
     """
 
-    values: Tuple[float, ...] | None = None
-    """ A tuple containing the parameter values, or None if no values are specified. """
+    values: Sequence[float] | None = None
+    """ A sequence containing the parameter values, or None if no values are specified. """
+
+    lower_bounds: Sequence[float] | None = None
+    """ A sequence containing the lower bounds for each parameter value, or None if no lower bounds are specified. """
+
+    upper_bounds: Sequence[float] | None = None
+    """ A sequence containing the upper bounds for each parameter value, or None if no upper bounds are specified. """
 
-    lower_bounds: Tuple[float, ...] | None = None
-    """ A tuple containing the lower bounds for each parameter value, or None if no lower bounds are specified. """
+    @cached_property
+    def min_value(self) -> float:
+        if self.is_bounded:
+            return ValueTypeValidator.extremes(self.lower_bounds)[0]  # type: ignore[arg-type]
+        return ValueTypeValidator.extremes(self.values)[0]  # type: ignore[arg-type]
 
-    upper_bounds: Tuple[float, ...] | None = None
-    """ A tuple containing the upper bounds for each parameter value, or None if no upper bounds are specified. """
+    @cached_property
+    def max_value(self) -> float:
+        if self.is_bounded:
+            return ValueTypeValidator.extremes(self.upper_bounds)[1]  # type: ignore[arg-type]
+        return ValueTypeValidator.extremes(self.values)[1]  # type: ignore[arg-type]
+
+    @cached_property
+    def _key(self) -> Tuple[Any, ...]:
+        """
+        Retrieves the fields of the parameter as a hashable tuple, with its sequences converted to tuples.
+        :return: A tuple with the types, values and bounds of the parameter.
+        """
+        return (
+            self.parameter_type,
+            self.value_type,
+            *(
+                None if sequence is None else tuple(sequence)
+                for sequence in (self.values, self.lower_bounds, self.upper_bounds)
+            ),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MultiValueParameter):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
 
     def __post_init__(self) -> None:
+        # The sequences are replaced by read-only ones before any value is cached.
+        for field_name in ("values", "lower_bounds", "upper_bounds"):
+            object.__setattr__(self, field_name, _read_only(getattr(self, field_name)))
+
         # Parameter Validations
         if self.value_type is None:
             raise ValueError("Parameter value type is required.")
@@ -35,15 +101,14 @@ class MultiValueParameter(Parameter):
                 raise ValueError("Parameters with values cannot have bounds.")
             if len(self.values) == 0:
                 raise ValueError("Parameter values cannot be empty.")
-            for val in self.values:
-                if val >= 1e20 or val <= -1e20:
-                    raise ValueError("Parameter values cannot be [+/-]infinity.")
-
-                # Value and Value Type validations
-                if self.value_type == ValueType.BINARY and not ValueTypeValidator.is_binary(val):
-                    raise ValueError("Parameter set values must be valid integer numbers.")
-                elif self.value_type == ValueType.INTEGER and not ValueTypeValidator.is_integer(val):
-                    raise ValueError("Parameter set values must be valid integer numbers.")
+            if self.max_value >= 1e20 or self.min_value <= -1e20:
+                raise ValueError("Parameter values cannot be [+/-]infinity.")
+
+            # Value and Value Type validations
+            if self.value_type == ValueType.BINARY and not ValueTypeValidator.are_binary(self.values):
+                raise ValueError("Parameter set values must be valid integer numbers.")
+            elif self.value_type == ValueType.INTEGER and not ValueTypeValidator.are_integer(self.values):
+                raise ValueError("Parameter set values must be valid integer numbers.")
         elif (
             self.parameter_type == ParameterType.BOUNDED
             and self.lower_bounds is not None
@@ -55,23 +120,21 @@ class MultiValueParameter(Parameter):
                 raise ValueError("Parameters bounds must have the same length.")
             if len(self.lower_bounds) == 0:
                 raise ValueError("Parameters bounds cannot be empty.")
-            for i in range(0, len(self.lower_bounds)):
-                lb = self.lower_bounds[i]
-                ub = self.upper_bounds[i]
-                if lb > ub:
-                    raise ValueError("Parameters lower bounds cannot be greater than upper bounds.")
-
-                if ub >= 1e20 or lb < -1e20:
-                    raise ValueError("Parameter upper and lower bounds cannot be [+/-]infinity.")
-
-                # lb and ub values and value type validation
-                if self.value_type == ValueType.BINARY and (
-                    not ValueTypeValidator.is_binary(lb) or not ValueTypeValidator.is_binary(ub)
-                ):
-                    raise ValueError("Parameter lower and upper bound values must be valid binary numbers.")
-                elif self.value_type == ValueType.INTEGER and (
-                    not ValueTypeValidator.is_integer(lb) or not ValueTypeValidator.is_integer(ub)
-                ):
-                    raise ValueError("Parameter lower and upper bound values must be valid integer numbers.")
+            if not ValueTypeValidator.are_ordered(self.lower_bounds, self.upper_bounds):
+                raise ValueError("Parameters lower bounds cannot be greater than upper bounds.")
+            if self.max_value >= 1e20 or self.min_value < -1e20:
+                raise ValueError("Parameter upper and lower bounds cannot be [+/-]infinity.")
+
+            # lb and ub values and value type validation
+            if self.value_type == ValueType.BINARY and (
+                not ValueTypeValidator.are_binary(self.lower_bounds)
+                or not ValueTypeValidator.are_binary(self.upper_bounds)
+            ):
+                raise ValueError("Parameter lower and upper bound values must be valid binary numbers.")
+            elif self.value_type == ValueType.INTEGER and (
+                not ValueTypeValidator.are_integer(self.lower_bounds)
+                or not ValueTypeValidator.are_integer(self.upper_bounds)
+            ):
+                raise ValueError("Parameter lower and upper bound values must be valid integer numbers.")
         else:
             raise ValueError("Invalid parameter")
@@ -1,4 +1,4 @@
-from abc import ABC
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 from ...enums import ValueType, ParameterType
@@ -26,3 +26,21 @@ class Parameter(ABC):
         :return: `True` if the parameter is bounded, `False` otherwise.
         """
         return self.parameter_type == ParameterType.BOUNDED
+
+    @property
+    @abstractmethod
+    def min_value(self) -> float:
+        """
+        Returns the smallest value the parameter can take: its lowest value, or its lowest lower bound.
+        :return: A float with the smallest value of the parameter.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def max_value(self) -> float:
+        """
+        Returns the largest value the parameter can take: its highest value, or its highest upper bound.
+        :return: A float with the largest value of the parameter.
+        """
+        pass
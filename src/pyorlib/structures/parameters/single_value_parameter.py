@@ -23,6 +23,14 @@ class SingleValueParameter(Parameter):
     upper_bound: float | None = None
     """ The upper bound of the parameter, or None if no upper bound is specified. """
 
+    @property
+    def min_value(self) -> float:
+        return self.lower_bound if self.is_bounded else self.value  # type: ignore[return-value]
+
+    @property
+    def max_value(self) -> float:
+        return self.upper_bound if self.is_bounded else self.value  # type: ignore[return-value]
+
     def __post_init__(self) -> None:
         # Parameter Validations
         if self.value_type is None:
@@ -0,0 +1,6 @@
+"""
+The Sets module in PyORlib provides classes to describe the index domains of an optimization model, such as the
+sparse combinations of indices over which terms are defined and summed, in a compact columnar form.
+"""
+
+from .index_set import IndexSet
@@ -0,0 +1,303 @@
+from array import array
+from itertools import chain, compress, product, repeat
+from math import prod
+from operator import itemgetter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Sequence, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+
+class IndexSet:
+    """
+    Represents a set of index tuples, used as the domain of term sets and summations.
+
+    An index set is either dense, the Cartesian product of integer ranges, or sparse, an arbitrary set of tuples
+    such as the arcs of a network or the valid (plant, product, period) combinations of a model. Sparse sets are
+    stored column by column in typed integer arrays (8 bytes per index) instead of one tuple object per member,
+    and dense sets only keep their ranges. Index sets support filtering, projections and hash joins that build
+    the result column by column, so sparse domains can be derived from each other without materializing and
+    pruning full Cartesian products. Iterating an index set yields its members as tuples, in insertion order for
+    sparse sets and in lexicographic order for dense ones, so they can be used directly with
+    `Model.add_variables_to_set`, and with `select` to retrieve the terms of a summation.
+    """
+
+    # Strict class attributes.
+    __slots__ = ["_arity", "_ranges", "_columns", "_members"]
+
+    @property
+    def arity(self) -> int:
+        """
+        Retrieves the number of indices of each member of the set.
+        :return: An integer with the arity of the set.
+        """
+        return self._arity
+
+    @property
+    def is_dense(self) -> bool:
+        """
+        Determines whether the set is the Cartesian product of ranges.
+        :return: `True` if the set is dense, `False` otherwise.
+        """
+        return self._ranges is not None
+
+    def __init__(self, members: Iterable[Sequence[int]], arity: int | None = None):
+        """
+        Initializes a new sparse IndexSet instance.
+        :param members: The index tuples of the set. Repeated tuples are kept once, in order of first appearance.
+        :param arity: The number of indices of each member. Defaults to None, for the length of the first member,
+            and it is required for empty sets.
+        """
+        unique: Dict[Tuple[int, ...], None] = dict.fromkeys(tuple(member) for member in members)
+
+        if arity is None:
+            if not unique:
+                raise ValueError("The arity of an empty index set must be given.")
+            arity = len(next(iter(unique)))
+        if arity < 1:
+            raise ValueError("The arity of an index set must be a positive integer.")
+        if any(len(member) != arity for member in unique):
+            raise ValueError(f"All members of the index set must have {arity} indices.")
+
+        columns: Tuple[array[int], ...] = (
+            tuple(array("q", column) for column in zip(*unique)) if unique else tuple(array("q") for _ in range(arity))
+        )
+
+        # Instance attributes
+        self._arity: int = arity
+        """ The number of indices of each member of the set. """
+
+        self._ranges: Tuple[range, ...] | None = None
+        """ The range of each index of dense sets, or None for sparse sets. """
+
+        self._columns: Tuple[array[int], ...] | None = columns
+        """ The values of each index of the members of sparse sets, or None for dense sets until required. """
+
+        self._members: FrozenSet[Tuple[int, ...]] | None = None
+        """ The members of sparse sets as tuples, built on the first membership test. """
+
+    @classmethod
+    def dense(cls, *dimensions: int | range) -> "IndexSet":
+        """
+        Creates a dense index set, the Cartesian product of ranges.
+        :param dimensions: The range of each index, or its size for ranges starting at 0.
+        :return: A new dense index set.
+        """
+        if not dimensions:
+            raise ValueError("Dense index sets must have at least one dimension.")
+        ranges: Tuple[range, ...] = tuple(
+            dimension if isinstance(dimension, range) else range(dimension) for dimension in dimensions
+        )
+        index_set: IndexSet = cls.__new__(cls)
+        index_set._arity = len(ranges)
+        index_set._ranges = ranges
+        index_set._columns = None
+        index_set._members = None
+        return index_set
+
+    @classmethod
+    def _from_columns(cls, columns: Tuple["array[int]", ...]) -> "IndexSet":
+        """
+        Creates a sparse index set from columns whose members are known to be unique.
+        :param columns: The values of each index of the members.
+        :return: A new sparse index set.
+        """
+        index_set: IndexSet = cls.__new__(cls)
+        index_set._arity = len(columns)
+        index_set._ranges = None
+        index_set._columns = columns
+        index_set._members = None
+        return index_set
+
+    def __len__(self) -> int:
+        if self._ranges is not None:
+            return prod(len(dimension) for dimension in self._ranges)
+        return len(self.__all_columns()[0])
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        if self._ranges is not None:
+            return product(*self._ranges)
+        return zip(*self.__all_columns())
+
+    def __contains__(self, index: Any) -> bool:
+        if not isinstance(index, tuple) or len(index) != self._arity:
+            return False
+        if self._ranges is not None:
+            return all(value in dimension for value, dimension in zip(index, self._ranges))
+        if self._members is None:
+            self._members = frozenset(zip(*self.__all_columns()))
+        return index in self._members
+
+    def __repr__(self) -> str:
+        return f"IndexSet(arity={self._arity}, size={len(self)}, {'dense' if self.is_dense else 'sparse'})"
+
+    def column(self, position: int) -> Sequence[int]:
+        """
+        Retrieves the values of an index of all the members of the set, in iteration order.
+        :param position: The position of the index within the members.
+        :return: A typed integer array with the values of the index.
+        """
+        self.__validate_positions(positions=(position,))
+        if self._columns is not None:
+            return self._columns[position]
+
+        # The columns of dense sets repeat each value of their range once per combination of the following
+        # ranges, and the whole pattern once per combination of the preceding ones.
+        ranges: Tuple[range, ...] = self._ranges or ()
+        inner: int = prod(len(dimension) for dimension in ranges[position + 1 :])
+        outer: int = prod(len(dimension) for dimension in ranges[:position])
+        return array("q", chain.from_iterable(repeat(value, inner) for value in ranges[position])) * outer
+
+    def filter(self, predicate: Callable[..., bool]) -> "IndexSet":
+        """
+        Retrieves the members of the set that satisfy a predicate.
+        :param predicate: A callable that receives the indices of a member as arguments and determines whether
+            the member is kept.
+        :return: A new sparse index set with the members that satisfy the predicate, in the same order.
+        """
+        mask: List[bool] = [bool(predicate(*index)) for index in self]
+        return self.__compress(mask=mask)
+
+    def where(self, position: int, values: int | Iterable[int]) -> "IndexSet":
+        """
+        Retrieves the members of the set whose index at a position takes one of the given values. The test
+        runs over the column of the index, without building the members.
+        :param position: The position of the index within the members.
+        :param values: The accepted value, or values, of the index.
+        :return: A new sparse index set with the matching members, in the same order.
+        """
+        accepted: FrozenSet[int] = frozenset((values,) if isinstance(values, int) else values)
+        mask: List[bool] = list(map(accepted.__contains__, self.column(position=position)))
+        return self.__compress(mask=mask)
+
+    def project(self, *positions: int) -> "IndexSet":
+        """
+        Retrieves the distinct values of some indices of the members of the set.
+        :param positions: The positions of the indices to be kept, in the order of the new members.
+        :return: A new index set with the projected members, dense if this set is dense.
+        """
+        self.__validate_positions(positions=positions)
+        if not positions:
+            raise ValueError("Projections must keep at least one index.")
+        if self._ranges is not None:
+            return IndexSet.dense(*(self._ranges[position] for position in positions))
+        columns: Tuple[array[int], ...] = self.__all_columns()
+        return IndexSet(zip(*(columns[position] for position in positions)), arity=len(positions))
+
+    def join(self, other: "IndexSet", on: Sequence[Tuple[int, int]] | None = None) -> "IndexSet":
+        """
+        Joins the set with another index set, like a relational equi-join.
+
+        Each member of the result is a member of this set followed by the indices of a matching member of the
+        other set that are not part of the join. Joining arcs `(i, j)` with arcs `(j, k)` on their last and
+        first indices, for instance, produces the paths `(i, j, k)`, and joining without positions produces the
+        Cartesian product of both sets. The join hashes the members of the other set once and builds the result
+        column by column.
+        :param other: The index set to be joined with.
+        :param on: The pairs of positions, in this set and in the other set, whose indices must be equal.
+            Defaults to None, for the last index of this set and the first index of the other set.
+        :return: A new sparse index set with the joined members.
+        """
+        pairs: Sequence[Tuple[int, int]] = on if on is not None else [(self._arity - 1, 0)]
+        self.__validate_positions(positions=[position for position, _ in pairs])
+        other.__validate_positions(positions=[position for _, position in pairs])
+
+        own_key: Callable[[Tuple[int, ...]], Tuple[int, ...]] = self.__key_getter([p for p, _ in pairs])
+        other_key: Callable[[Tuple[int, ...]], Tuple[int, ...]] = other.__key_getter([p for _, p in pairs])
+        joined: FrozenSet[int] = frozenset(position for _, position in pairs)
+        rest: Callable[[Tuple[int, ...]], Tuple[int, ...]] = other.__key_getter(
+            [position for position in range(other._arity) if position not in joined]
+        )
+
+        matches: Dict[Tuple[int, ...], List[Tuple[int, ...]]] = {}
+        for index in other:
+            matches.setdefault(other_key(index), []).append(rest(index))
+
+        arity: int = self._arity + other._arity - len(joined)
+        columns: Tuple[array[int], ...] = tuple(array("q") for _ in range(arity))
+        members: List[Tuple[int, ...]] = []
+        for index in self:
+            for remainder in matches.get(own_key(index), ()):
+                members.append(index + remainder)
+            if len(members) >= 4096:
+                self.__extend_columns(columns=columns, members=members)
+                members.clear()
+        self.__extend_columns(columns=columns, members=members)
+        return IndexSet._from_columns(columns=columns)
+
+    def group_by(self, *positions: int) -> Dict[Tuple[int, ...], List[Tuple[int, ...]]]:
+        """
+        Groups the members of the set by the values of some of their indices, in a single pass. Grouping arcs
+        `(i, j)` by their first index, for instance, retrieves the outgoing arcs of each node.
+        :param positions: The positions of the indices that identify each group.
+        :return: A dictionary with the members of each group, by the values of the grouping indices.
+        """
+        self.__validate_positions(positions=positions)
+        key: Callable[[Tuple[int, ...]], Tuple[int, ...]] = self.__key_getter(list(positions))
+        groups: Dict[Tuple[int, ...], List[Tuple[int, ...]]] = {}
+        for index in self:
+            groups.setdefault(key(index), []).append(index)
+        return groups
+
+    def select(self, values: Mapping[Tuple[int, ...], _T]) -> Iterator[_T]:
+        """
+        Retrieves the values of a mapping for each member of the set, such as the variables of a term set to be
+        summed (e.g. `Expression.sum(arcs.select(x))`).
+        :param values: A mapping with a value for each member of the set.
+        :return: An iterator of the values, in iteration order.
+        """
+        return map(values.__getitem__, self)
+
+    def __all_columns(self) -> Tuple["array[int]", ...]:
+        """
+        Retrieves the columns of the set, materializing them for dense sets.
+        :return: A tuple with the values of each index of the members.
+        """
+        if self._columns is not None:
+            return self._columns
+        return tuple(array("q", self.column(position=position)) for position in range(self._arity))
+
+    def __compress(self, mask: List[bool]) -> "IndexSet":
+        """
+        Retrieves the members of the set selected by a mask.
+        :param mask: Whether each member of the set, in iteration order, is kept.
+        :return: A new sparse index set with the selected members.
+        """
+        return IndexSet._from_columns(
+            columns=tuple(array("q", compress(column, mask)) for column in self.__all_columns())
+        )
+
+    def __key_getter(self, positions: List[int]) -> Callable[[Tuple[int, ...]], Tuple[int, ...]]:
+        """
+        Builds a function that retrieves the indices at some positions of a member, as a tuple.
+        :param positions: The positions of the indices.
+        :return: A callable that receives a member and returns the tuple of its indices at the positions.
+        """
+        if not positions:
+            return lambda index: ()
+        if len(positions) == 1:
+            position: int = positions[0]
+            return lambda index: (index[position],)
+        getter: Callable[[Tuple[int, ...]], Tuple[int, ...]] = itemgetter(*positions)
+        return getter
+
+    def __validate_positions(self, positions: Iterable[int]) -> None:
+        """
+        Validates that the positions refer to indices of the members of the set.
+        :param positions: The positions to be validated.
+        :return: None.
+        """
+        for position in positions:
+            if not 0 <= position < self._arity:
+                raise ValueError(f"Invalid index position {position} for an index set of arity {self._arity}.")
+
+    @staticmethod
+    def __extend_columns(columns: Tuple["array[int]", ...], members: List[Tuple[int, ...]]) -> None:
+        """
+        Appends members to the columns of a set.
+        :param columns: The columns of the set.
+        :param members: The members to be appended.
+        :return: None.
+        """
+        if members:
+            for column, values in zip(columns, zip(*members)):
+                column.extend(values)
@@ -129,26 +129,16 @@ class ParameterField(FieldValidator[Parameter]):
             raise ValueError(f"{self._public_name} does not support {value.value_type.name}")
 
         # Checks for SingleValueParameter and MultiValueParameter types
-        if isinstance(value, MultiValueParameter):
-            if value.is_bounded:
-                if self._min is not None or self._max is not None:
-                    for i in range(0, len(value.lower_bounds)):  # type: ignore[arg-type]
-                        lb = value.lower_bounds[i]  # type: ignore[index]
-                        ub = value.upper_bounds[i]  # type: ignore[index]
-                        self._validate_bounds(lb, ub)
-            else:
-                if self._min is not None or self._max is not None:
-                    for val in value.values:  # type: ignore[union-attr]
-                        self._validate_value(val)
-        elif isinstance(value, SingleValueParameter):
+        if not isinstance(value, (MultiValueParameter, SingleValueParameter)):
+            raise TypeError(f"{self._public_name} invalid parameter type")  # pragma: no cover
+
+        # Checks the range using the extremes of the parameter, which are cached on multi-value parameters.
+        if self._min is not None or self._max is not None:
             if value.is_bounded:
-                if self._min is not None or self._max is not None:
-                    self._validate_bounds(value.lower_bound, value.upper_bound)  # type: ignore[arg-type]
+                self._validate_bounds(value.min_value, value.max_value)
             else:
-                if self._min is not None or self._max is not None:
-                    self._validate_value(value.value)  # type: ignore[arg-type]
-        else:
-            raise TypeError(f"{self._public_name} invalid parameter type")  # pragma: no cover
+                self._validate_value(value.min_value)
+                self._validate_value(value.max_value)
 
     def _validate_bounds(self, lower_bound: float, upper_bound: float) -> None:
         """
@@ -1,4 +1,20 @@
-from math import inf
+from functools import lru_cache
+from importlib import import_module
+from math import inf, isnan, nan
+from types import ModuleType
+from typing import Any, List, Sequence, Tuple
+
+
+@lru_cache(maxsize=None)
+def _load_numpy() -> ModuleType | None:
+    """
+    Imports NumPy on first use, so that it is only loaded when large sequences are validated.
+    :return: The NumPy module, or None if it is not installed.
+    """
+    try:
+        return import_module("numpy")
+    except ImportError:  # pragma: no cover
+        return None
 
 
 class ValueTypeValidator:
@@ -6,8 +22,35 @@ class ValueTypeValidator:
     This class has two static methods to validate if a
     given "float" or "int" number is a valid binary or
     integer number.
+
+    It also provides vectorised counterparts that validate whole sequences of numbers at once (tuples, lists,
+    `array.array` objects, NumPy arrays or any other buffer). When NumPy is installed, these checks run as
+    array operations on large sequences; otherwise, they fall back to plain Python loops.
     """
 
+    _VECTORISE_THRESHOLD: int = 512
+    """ The minimum sequence length for which the vectorised checks use NumPy. """
+
+    _BLOCK_SIZE: int = 1 << 20
+    """ The number of values checked at once, which bounds the size of the temporary arrays. """
+
+    @staticmethod
+    def _as_blocks(nums: Sequence[float]) -> List[Any] | None:
+        """
+        Splits a large sequence into one-dimensional NumPy views of at most `_BLOCK_SIZE` values.
+        Arrays, memory maps and other buffers are not copied.
+        :param nums: sequence of float/int numbers
+        :return: A list of NumPy views, or None if the sequence is small or NumPy is not installed
+        """
+        if len(nums) < ValueTypeValidator._VECTORISE_THRESHOLD:
+            return None
+        np: ModuleType | None = _load_numpy()
+        if np is None:  # pragma: no cover
+            return None
+        array: Any = np.asarray(nums).reshape(-1)
+        size: int = ValueTypeValidator._BLOCK_SIZE
+        return [array[start : start + size] for start in range(0, len(array), size)]
+
     @staticmethod
     def is_binary(num: float | int) -> bool:
         """
@@ -25,3 +68,64 @@ class ValueTypeValidator:
         :return: True if the given float/int number is an integer else False
         """
         return num is not None and (num == inf or num == -inf or isinstance(num, int) or float(num).is_integer())
+
+    @staticmethod
+    def are_binary(nums: Sequence[float]) -> bool:
+        """
+        This method checks if all the numbers of the given sequence are binary.
+        :param nums: sequence of float/int numbers to be checked
+        :return: True if all the numbers are binary else False
+        """
+        blocks: List[Any] | None = ValueTypeValidator._as_blocks(nums)
+        if blocks is not None:
+            return all(bool(((block == 0) | (block == 1)).all()) for block in blocks)
+        return all(num == 0 or num == 1 for num in nums)
+
+    @staticmethod
+    def are_integer(nums: Sequence[float]) -> bool:
+        """
+        This method checks if all the numbers of the given sequence are valid integers.
+        :param nums: sequence of float/int numbers to be checked
+        :return: True if all the numbers are integers else False
+        """
+        blocks: List[Any] | None = ValueTypeValidator._as_blocks(nums)
+        if blocks is not None:
+            return all(
+                block.dtype.kind in "biu" or bool(((block == block.round()) | (abs(block) == inf)).all())
+                for block in blocks
+            )
+        return all(ValueTypeValidator.is_integer(num) for num in nums)
+
+    @staticmethod
+    def extremes(nums: Sequence[float]) -> Tuple[float, float]:
+        """
+        This method retrieves the smallest and the largest numbers of the given non-empty sequence.
+        :param nums: sequence of float/int numbers
+        :return: A tuple with the smallest and the largest numbers
+        """
+        blocks: List[Any] | None = ValueTypeValidator._as_blocks(nums)
+        if blocks is not None:
+            lows: List[float] = [float(block.min()) for block in blocks]
+            highs: List[float] = [float(block.max()) for block in blocks]
+            # NaN values propagate to both extremes, as they do in a single NumPy reduction.
+            if any(isnan(value) for value in lows + highs):
+                return nan, nan
+            return min(lows), max(highs)
+        if any(num != num for num in nums):
+            return nan, nan
+        return min(nums), max(nums)
+
+    @staticmethod
+    def are_ordered(lower: Sequence[float], upper: Sequence[float]) -> bool:
+        """
+        This method checks if every number of a sequence is less than or equal to
+        the number at the same position in another sequence of the same length.
+        :param lower: sequence of float/int numbers expected to be the smaller ones
+        :param upper: sequence of float/int numbers expected to be the larger ones
+        :return: True if every lower number is less than or equal to its upper number else False
+        """
+        lower_blocks: List[Any] | None = ValueTypeValidator._as_blocks(lower)
+        upper_blocks: List[Any] | None = ValueTypeValidator._as_blocks(upper)
+        if lower_blocks is not None and upper_blocks is not None:
+            return all(bool((lb <= ub).all()) for lb, ub in zip(lower_blocks, upper_blocks))
+        return all(lb <= ub for lb, ub in zip(lower, upper))
@@ -0,0 +1,104 @@
+from math import inf
+
+import numpy as np
+from pytest import raises
+
+from pyorlib.algebra import Expression
+from pyorlib.algebra.arrays import ConstantArray
+from pyorlib.enums import ValueType
+from tests.fixtures import EngineFixtures
+
+
+class TestConstantArray:
+
+    def test_creation(self):
+        values = np.arange(6, dtype=np.float64).reshape(2, 3)
+        array: ConstantArray = ConstantArray(name="c_i_j", value_type=ValueType.INTEGER, values=values)
+
+        assert array.name == "c_i_j"
+        assert array.value_type == ValueType.INTEGER
+        assert array.values.dtype == np.int64
+        assert array.shape == (2, 3) and array.ndim == 2 and array.size == 6 and len(array) == 2
+
+        # Validates that the values are copied and read-only
+        values[0, 0] = 10
+        assert array[0, 0] == 0
+        with raises(ValueError):
+            array.values[0, 0] = 1
+
+        # Validates typed storage per value type
+        assert ConstantArray(name="b", value_type=ValueType.BINARY, values=[0, 1]).values.dtype == np.int8
+        assert ConstantArray(name="c", value_type=ValueType.CONTINUOUS, values=[1, 2]).values.dtype == np.float64
+
+        # Validates slots
+        assert not hasattr(array, "__dict__")
+
+    def test_validations(self):
+        # Validates empty name, value type and values
+        with raises(Exception):
+            ConstantArray(name="", value_type=ValueType.INTEGER, values=[1])
+        with raises(Exception):
+            ConstantArray(name="c", value_type=None, values=[1])
+        with raises(Exception):
+            ConstantArray(name="c", value_type=ValueType.INTEGER, values=None)
+
+        # Validates non-numeric and zero-dimensional values
+        with raises(Exception):
+            ConstantArray(name="c", value_type=ValueType.CONTINUOUS, values=["a", "b"])
+        with raises(Exception):
+            ConstantArray(name="c", value_type=ValueType.CONTINUOUS, values=5)
+
+        # Validates infinity and NaN
+        with raises(Exception):
+            ConstantArray(name="c", value_type=ValueType.CONTINUOUS, values=[1, inf])
+        with raises(Exception):
+            ConstantArray(name="c", value_type=ValueType.CONTINUOUS, values=[1, np.nan])
+
+        # Validates binary and integer values
+        with raises(Exception):
+            ConstantArray(name="c", value_type=ValueType.BINARY, values=[0, 1, 2])
+        with raises(Exception):
+            ConstantArray(name="c", value_type=ValueType.INTEGER, values=[[1, 2.5]])
+
+    def test_indexing(self):
+        array: ConstantArray = ConstantArray(name="c", value_type=ValueType.CONTINUOUS, values=[[1, 2], [3, 4]])
+
+        # Validates scalars
+        assert array[1, 0] == 3 and isinstance(array[1, 0], float)
+
+        # Validates views
+        row: ConstantArray = array[1]
+        assert isinstance(row, ConstantArray)
+        assert row.shape == (2,) and row.name == "c" and row.value_type == ValueType.CONTINUOUS
+        assert np.shares_memory(row.values, array.values)
+        assert np.asarray(array).sum() == 10
+
+    def test_dot(self):
+        array: ConstantArray = ConstantArray(name="c", value_type=ValueType.INTEGER, values=[2, 0, 3])
+
+        expression: Expression = array.dot([Expression(expression=1), 5, Expression(expression=4)])
+        assert isinstance(expression, Expression)
+        assert expression.raw == 14
+
+        # Validates shape mismatches
+        with raises(Exception):
+            array.dot([1, 2])
+        with raises(Exception):
+            ConstantArray(name="c", value_type=ValueType.INTEGER, values=[[1]]).dot([1])
+
+    def test_matmul(self):
+        engine = EngineFixtures.get_pulp_engine()
+        x = [engine.add_variable(name=f"x_{j}", value_type=ValueType.CONTINUOUS) for j in range(3)]
+        array: ConstantArray = ConstantArray(name="a", value_type=ValueType.INTEGER, values=[[1, 0, 2], [0, 0, 0]])
+
+        rows = array.matmul(x)
+        assert len(rows) == 2
+        assert all(isinstance(row, Expression) for row in rows)
+        assert dict(rows[0].raw.items()) == {x[0].raw: 1, x[2].raw: 2}
+        assert rows[1].raw == 0
+
+        # Validates shape mismatches
+        with raises(Exception):
+            array.matmul(x[:2])
+        with raises(Exception):
+            array[0].matmul(x)
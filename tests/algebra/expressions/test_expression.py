@@ -118,3 +118,25 @@ class TestExpression:
         assert isinstance(expr2, Expression)
         assert expr1.raw == 27
         assert expr2.raw == 4
+
+    def test_slots(self):
+        expr1: Expression = Expression(expression=5)
+
+        assert not hasattr(expr1, "__dict__")
+        with raises(AttributeError):
+            expr1.other = 1
+
+    def test_sum_operation(self):
+        # Test creation
+        expr1: Expression = Expression(expression=3)
+        expr2: Expression = Expression(expression=-1)
+
+        # Test sum of expressions and numbers
+        expr3 = Expression.sum([expr1, 2, expr2])
+
+        assert isinstance(expr3, Expression)
+        assert expr3.raw == 4
+        assert expr1.raw == 3 and expr2.raw == -1
+
+        # Test empty sum
+        assert Expression.sum([]).raw == 0
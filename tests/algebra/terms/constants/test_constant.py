@@ -122,3 +122,10 @@ class TestConstant:
         # Validates +infinity
         with raises(Exception):
             Constant(name=constant_name_1, value_type=ValueType.INTEGER, value=inf)
+
+    def test_slots(self):
+        const1: Constant = Constant(name="c_1", value_type=ValueType.CONTINUOUS, value=5)
+
+        assert not hasattr(const1, "__dict__")
+        with raises(AttributeError):
+            const1.other = 1
@@ -141,3 +141,14 @@ class TestTerm:
         assert isinstance(term2, Expression)
         assert term1.raw == 27
         assert term2.raw == 4
+
+    def test_shared_metadata(self):
+        # Test creation
+        term1: Term = Constant(name="c_1", value_type=ValueType.CONTINUOUS, value=3)
+        term2: Term = Constant(name="c_2", value_type=ValueType.CONTINUOUS, value=9)
+        term3: Term = Constant(name="c_3", value_type=ValueType.INTEGER, value=9)
+
+        # Validates that terms of the same kind reference a single metadata instance
+        assert term1._metadata is term2._metadata
+        assert term1._metadata is not term3._metadata
+        assert term3.value_type == ValueType.INTEGER and term3.is_constant
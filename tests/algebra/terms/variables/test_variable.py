@@ -2,7 +2,7 @@ from math import inf
 
 from pytest import raises
 
-from pyorlib.algebra import Term, Variable
+from pyorlib.algebra import Element, Expression, Term, Variable
 from pyorlib.engines import Engine
 from pyorlib.enums import ValueType, TermType
 from tests.fixtures import EngineFixtures
@@ -224,3 +224,60 @@ class TestVariable:
 
         def test_creation_pulp(self):
             self.assertions(solver=EngineFixtures.get_pulp_engine())
+
+    class TestVariableLayout:
+        def assertions(self, solver: Engine):
+            variables = [solver.add_variable(name=f"x_{i}", value_type=ValueType.CONTINUOUS) for i in range(3)]
+
+            # Validates that identifiers are assigned sequentially in creation order
+            assert [variable.id for variable in variables] == [0, 1, 2]
+
+            # Validates that a failed creation does not consume an identifier
+            with raises(Exception):
+                solver.add_variable(name="", value_type=ValueType.CONTINUOUS)
+            assert solver.add_variable(name="x_3", value_type=ValueType.CONTINUOUS).id == 3
+
+            # Validates the slotted layout
+            assert not hasattr(variables[0], "__dict__")
+            with raises(AttributeError):
+                variables[0].other = 1
+
+        def test_layout_cplex(self):
+            self.assertions(solver=EngineFixtures.get_cplex_engine())
+
+        def test_layout_gurobi(self):
+            self.assertions(solver=EngineFixtures.get_gurobi_engine())
+
+        def test_layout_or_tools(self):
+            self.assertions(solver=EngineFixtures.get_or_tools_engine())
+
+        def test_layout_pulp(self):
+            self.assertions(solver=EngineFixtures.get_pulp_engine())
+
+    class TestVariableComparisons:
+        def assertions(self, solver: Engine):
+            var1: Term = solver.add_variable(name="x_1", value_type=ValueType.CONTINUOUS)
+            var2: Term = solver.add_variable(name="x_2", value_type=ValueType.CONTINUOUS)
+
+            # Validates that equality comparisons build constraints instead of identity checks
+            for constraint in [var1 == 5, 5 == var1, var1 == var2]:
+                assert isinstance(constraint, Element)
+                assert not isinstance(constraint.raw, bool)
+
+            # Validates in-place operations on terms return new expressions
+            expr: Element = var1
+            expr += var2
+            assert isinstance(expr, Expression)
+            assert isinstance(var1, Variable)
+
+        def test_comparisons_cplex(self):
+            self.assertions(solver=EngineFixtures.get_cplex_engine())
+
+        def test_comparisons_gurobi(self):
+            self.assertions(solver=EngineFixtures.get_gurobi_engine())
+
+        def test_comparisons_or_tools(self):
+            self.assertions(solver=EngineFixtures.get_or_tools_engine())
+
+        def test_comparisons_pulp(self):
+            self.assertions(solver=EngineFixtures.get_pulp_engine())
@@ -0,0 +1,140 @@
+from typing import Callable, List
+
+from pytest import approx, raises
+
+from pyorlib import Engine, Model
+from pyorlib.algebra import Expression
+from pyorlib.algorithms import RollingHorizon, RollingWindow, WindowResult
+from pyorlib.enums import OptimizationType, SolutionStatus, ValueType
+from pyorlib.exceptions import AlgorithmException
+from pyorlib.profiling import Profiler
+from tests.fixtures import EngineFixtures
+
+
+class TestRollingHorizon:
+    costs: List[float] = [1, 3, 1, 3, 1, 3, 1, 3]
+    """ The production cost of each period of the planning horizon. """
+
+    @staticmethod
+    def build(model: Model, num_periods: int) -> None:
+        model.add_variable("initial_inventory", ValueType.CONTINUOUS, 0, 0)
+        for set_name, value_type, upper_bound in [("x", ValueType.INTEGER, 10), ("I", ValueType.CONTINUOUS, 100)]:
+            for t in range(num_periods):
+                model.add_variable_to_set(set_name, (t,), None, value_type, 0, upper_bound)
+        for t in range(num_periods):
+            model.add_variable_to_set("d", (t,), None, ValueType.CONTINUOUS, 0, 0)
+
+        x, inventory, demand = model.term_sets["x"], model.term_sets["I"], model.term_sets["d"]
+        for t in range(num_periods):
+            previous = inventory[t - 1,] if t > 0 else model.get_term_by_name("initial_inventory")
+            model.add_constraint(inventory[t,] == previous + x[t,] - demand[t,])
+
+    @staticmethod
+    def planning(engine_factory: Callable[[], Engine], fixed_periods: int, demand: float = 6, **kwargs):
+        def update(model: Model, window: RollingWindow) -> None:
+            initial: float = horizon.solution["I"].get((window.start - 1,), 0)
+            model.set_variable_bounds(model.get_term_by_name("initial_inventory"), initial, initial)
+            x, inventory = model.term_sets["x"], model.term_sets["I"]
+            for t, term in model.term_sets["d"].items():
+                model.set_variable_bounds(term, demand, demand)
+            model.set_objective(
+                OptimizationType.MINIMIZE,
+                Expression.sum(
+                    TestRollingHorizon.costs[window.to_absolute(t)] * x[t,] + 0.5 * inventory[t,]
+                    for t in range(window.num_periods)
+                ),
+            )
+
+        horizon: RollingHorizon = RollingHorizon(
+            engine_factory=engine_factory,
+            build=TestRollingHorizon.build,
+            update=update,
+            horizon=8,
+            window=4,
+            step=2,
+            periodic_sets=["x", "I"],
+            fixed_periods=fixed_periods,
+            **kwargs,
+        )
+        return horizon
+
+    def test_windows(self):
+        with raises(AlgorithmException):
+            RollingHorizon(EngineFixtures.get_cplex_engine, self.build, lambda m, w: None, 8, 2, 3, ["x"])
+        with raises(AlgorithmException):
+            RollingHorizon(EngineFixtures.get_cplex_engine, self.build, lambda m, w: None, 0, 2, 1, ["x"])
+
+        windows: List[RollingWindow] = TestRollingHorizon.planning(EngineFixtures.get_cplex_engine, 1).windows()
+        assert [(w.start, w.end, w.commit_start, w.commit_end) for w in windows] == [
+            (0, 4, 0, 2),
+            (1, 6, 2, 4),
+            (3, 8, 4, 6),
+            (5, 8, 6, 8),
+        ]
+        assert [w.num_periods for w in windows] == [4, 5, 5, 3]
+        assert windows[0].num_fixed_periods == 0 and windows[1].num_fixed_periods == 1
+        assert windows[2].to_absolute(period=2) == 5
+
+    @staticmethod
+    def rolling_horizon_assertions(engine_factory: Callable[[], Engine]):
+        for fixed_periods, shapes in [(0, {4, 2}), (1, {4, 5, 3})]:
+            profiler: Profiler = Profiler()
+            horizon: RollingHorizon = TestRollingHorizon.planning(engine_factory, fixed_periods, profiler=profiler)
+            results: List[WindowResult] = horizon.run()
+
+            # One model per window shape is built and reused by the windows of the same shape
+            assert set(horizon.models) == shapes
+            assert [result.status for result in results] == [SolutionStatus.OPTIMAL] * 4
+            assert [span.phase for span in results[0].spans] == [
+                "rolling_horizon.build",
+                "rolling_horizon.update",
+                "rolling_horizon.solve",
+            ]
+            assert all(result.wall_time >= 0 for result in results)
+            report = profiler.report()[results[0].spans[0].engine]
+            assert report["rolling_horizon.solve"]["calls"] == 4
+            assert report["rolling_horizon.build"]["calls"] == len(shapes)
+
+            # The committed plan produces ahead in the cheap periods
+            x, inventory = horizon.solution["x"], horizon.solution["I"]
+            assert sorted(x) == [(t,) for t in range(8)]
+            assert [x[t,] for t in range(8)] == approx([10, 2] * 4)
+            cost: float = sum(TestRollingHorizon.costs[t] * x[t,] + 0.5 * inventory[t,] for t in range(8))
+            assert cost == approx(72)
+
+            # The decisions fixed in a window are released afterwards
+            if fixed_periods:
+                assert horizon.models[5].term_sets["x"][0,].upper_bound == approx(10)
+
+                # Even when the window fails
+                def fail() -> None:
+                    raise RuntimeError("solve failed")
+
+                horizon.models[5].solve = fail
+                with raises(RuntimeError):
+                    horizon.run()
+                assert horizon.models[5].term_sets["x"][0,].lower_bound == approx(0)
+                assert horizon.models[5].term_sets["x"][0,].upper_bound == approx(10)
+                assert profiler.report()[results[0].spans[0].engine]["rolling_horizon.solve"]["calls"] == 6
+
+        # The run stops at the first window without a solution
+        infeasible: RollingHorizon = TestRollingHorizon.planning(engine_factory, 0, demand=20)
+        results = infeasible.run()
+        assert len(results) == 1 and results[0].objective_value is None
+        assert results[0].status not in (SolutionStatus.OPTIMAL, SolutionStatus.FEASIBLE)
+
+    class TestRollingHorizonWithCplex:
+        def test_rolling_horizon(self):
+            TestRollingHorizon.rolling_horizon_assertions(engine_factory=EngineFixtures.get_cplex_engine)
+
+    class TestRollingHorizonWithGurobi:
+        def test_rolling_horizon(self):
+            TestRollingHorizon.rolling_horizon_assertions(engine_factory=EngineFixtures.get_gurobi_engine)
+
+    class TestRollingHorizonWithORTools:
+        def test_rolling_horizon(self):
+            TestRollingHorizon.rolling_horizon_assertions(engine_factory=EngineFixtures.get_or_tools_engine)
+
+    class TestRollingHorizonWithPuLP:
+        def test_rolling_horizon(self):
+            TestRollingHorizon.rolling_horizon_assertions(engine_factory=EngineFixtures.get_pulp_engine)
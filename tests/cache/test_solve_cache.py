@@ -0,0 +1,75 @@
+import os
+
+from pytest import raises
+
+from pyorlib.cache import ModelFingerprint, Solution, SolveCache
+from pyorlib.enums import OptimizationType, SolutionStatus, ValueType
+
+
+class TestSolveCache:
+
+    def test_solution(self):
+        solution: Solution = Solution(status=SolutionStatus.OPTIMAL, objective_value=3.5, values=(1.0, 2.5))
+        assert Solution.from_dict(solution.to_dict()) == solution
+        infeasible: Solution = Solution(status=SolutionStatus.INFEASIBLE, objective_value=None)
+        assert Solution.from_dict(infeasible.to_dict()) == infeasible
+
+    def test_fingerprint(self):
+        def build(upper_bound: float) -> ModelFingerprint:
+            fingerprint = ModelFingerprint()
+            fingerprint.add_variable(value_type=ValueType.CONTINUOUS, lower_bound=0, upper_bound=upper_bound)
+            fingerprint.add_constraint(keys=[0], coefficients=[2.0], lower=-float("inf"), upper=4.0)
+            return fingerprint
+
+        first, second = build(upper_bound=10), build(upper_bound=10)
+        assert first.digest == second.digest != build(upper_bound=5).digest
+
+        first.set_objective(opt_type=OptimizationType.MAXIMIZE, text="x")
+        digest: str = first.digest
+        first.set_objective(opt_type=OptimizationType.MINIMIZE, text="x")
+        assert first.digest != digest
+        first.set_objective(opt_type=OptimizationType.MAXIMIZE, text="x")
+        assert first.digest == digest
+
+        # Objectives and constraints without a linear decomposition make the fingerprint uncacheable
+        first.set_objective(opt_type=OptimizationType.MAXIMIZE, text=None)
+        assert not first.cacheable
+        first.set_objective(opt_type=OptimizationType.MAXIMIZE, text="x")
+        assert first.cacheable
+        first.add_nonlinear_constraint()
+        assert not first.cacheable and first.digest != digest
+
+    def test_memory_lru(self):
+        with raises(ValueError):
+            SolveCache(max_entries=0)
+
+        cache: SolveCache = SolveCache(max_entries=2)
+        assert cache.key("model", "engine") == cache.key("model", "engine") != cache.key("model", "other")
+        assert SolveCache(parameters={"gap": 0.1}).key("model", "engine") != cache.key("model", "engine")
+
+        solutions = [Solution(status=SolutionStatus.OPTIMAL, objective_value=i, values=(i,)) for i in range(3)]
+        cache.put("a", solutions[0])
+        cache.put("b", solutions[1])
+        assert cache.get("a") is solutions[0]
+        cache.put("c", solutions[2])
+        assert cache.get("b") is None and cache.get("a") is solutions[0] and cache.get("c") is solutions[2]
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_disk_store(self, tmp_path):
+        solution: Solution = Solution(status=SolutionStatus.OPTIMAL, objective_value=1.0, values=(1.0,) * 100)
+        cache: SolveCache = SolveCache(path=tmp_path / "cache")
+        cache.put("a", solution)
+        assert os.path.isfile(tmp_path / "cache" / "a.json")
+        assert SolveCache(path=tmp_path / "cache").get("a") == solution
+
+        # The least recently used files are removed when the store exceeds its size
+        size: int = os.path.getsize(tmp_path / "cache" / "a.json")
+        small_cache: SolveCache = SolveCache(path=tmp_path / "small", max_bytes=2 * size)
+        for time, key in enumerate(["a", "b"]):
+            small_cache.put(key, solution)
+            os.utime(tmp_path / "small" / f"{key}.json", (time, time))
+        small_cache.put("c", solution)
+        assert sorted(os.listdir(tmp_path / "small")) == ["b.json", "c.json"]
+
+        cache.clear()
+        assert os.listdir(tmp_path / "cache") == [] and cache.get("a") is None
@@ -1,4 +1,7 @@
-from pyorlib.core.loggers import Logger
+import json
+from io import StringIO
+
+from pyorlib.core.loggers import LazyMessage, Logger, StdOutLogger, stdout_logger
 
 
 class TestLogger:
@@ -14,3 +17,44 @@ class TestLogger:
         logger.debug("Test debug log")
         logger.error("Test error log")
         logger.warning("Test warning log")
+
+    def test_lazy_arguments(self, caplog):
+        # Arrange
+        calls = []
+
+        def message() -> str:
+            calls.append(1)
+            return "Lazy"
+
+        # Act
+        Logger(name="Disabled Logger", debug=False).debug("Test %s debug log", LazyMessage(message))
+        disabled_calls = len(calls)
+        Logger(name="Enabled Logger", debug=True).debug("Test %s debug log", LazyMessage(message))
+
+        # Assert
+        assert disabled_calls == 0 and calls
+        assert "Test Lazy debug log" in caplog.messages
+
+    def test_asynchronous_json_output_with_sampling(self, monkeypatch):
+        # Arrange
+        logger = Logger(name="Json Logger", debug=True)
+        stream = StringIO()
+        monkeypatch.setattr(stdout_logger, "stdout", stream)
+        StdOutLogger.configure(asynchronous=True, json_output=True, sample_rate=3)
+
+        try:
+            # Act
+            for index in range(7):
+                logger.debug("Row %d", index, action="Row added: ")
+                logger.warning("Warning %d", index)
+            StdOutLogger.flush()
+            lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        finally:
+            monkeypatch.undo()
+            StdOutLogger.configure()
+
+        # Assert
+        debug_lines = [line for line in lines if line["level"] == "DEBUG"]
+        assert [line["message"] for line in debug_lines] == ["Row 0", "Row 3", "Row 6"]
+        assert all(line["name"] == "Json Logger" and line["action"] == "Row added" for line in debug_lines)
+        assert len([line for line in lines if line["level"] == "WARNING"]) == 7
@@ -0,0 +1,146 @@
+from typing import Callable, List, Sequence
+
+from pytest import approx, raises
+
+from pyorlib import Engine, Model
+from pyorlib.algebra import Element, Expression
+from pyorlib.algebra.terms.variables import Variable
+from pyorlib.decomposition.benders import Benders, BendersResult
+from pyorlib.engines.ortools import ORToolsEngine
+from pyorlib.enums import OptimizationType, SolutionStatus, ValueType
+from pyorlib.exceptions import AlgorithmException
+from tests.fixtures import EngineFixtures
+
+capacity_costs: List[float] = [3, 2]
+""" The cost of each unit of capacity of each facility. """
+
+production_costs: List[float] = [1, 4]
+""" The cost of each unit produced by each facility. """
+
+demands: List[float] = [8, 12, 16]
+""" The demand of each equally likely scenario. """
+
+
+def get_glop_engine() -> Engine:
+    return ORToolsEngine.from_option("GLOP")
+
+
+def build_subproblem(model: Model, index: int, capacities: Sequence[Variable]) -> Element:
+    production: List[Variable] = [
+        model.add_variable_to_set(f"y_{index}", (i,), None, ValueType.CONTINUOUS, 0, 100)
+        for i in range(len(capacities))
+    ]
+    for y, capacity in zip(production, capacities):
+        model.add_constraint(y - capacity <= 0)
+    model.add_constraint(Expression.sum(production) >= demands[index])
+    return Expression.sum(c / len(demands) * y for c, y in zip(production_costs, production))
+
+
+class TestBenders:
+
+    @staticmethod
+    def build_master(engine: Engine) -> Model:
+        master: Model = Model(engine=engine)
+        for i in range(len(capacity_costs)):
+            master.add_variable_to_set("x", (i,), None, ValueType.INTEGER, 0, 20)
+        return master
+
+    @staticmethod
+    def monolithic_objective(engine: Engine) -> float:
+        model: Model = TestBenders.build_master(engine=engine)
+        x: List[Variable] = list(model.term_sets["x"].values())
+        cost: Element = Expression.sum(c * v for c, v in zip(capacity_costs, x))
+        for k in range(len(demands)):
+            capacities: List[Variable] = []
+            for i, v in enumerate(x):
+                capacities.append(model.add_variable_to_set(f"link_{k}", (i,), None, ValueType.CONTINUOUS, 0, 100))
+                model.add_constraint(capacities[i] == v)
+            cost = cost + build_subproblem(model=model, index=k, capacities=capacities)
+        model.set_objective(OptimizationType.MINIMIZE, cost)
+        model.solve()
+        return model.objective_value
+
+    def test_validations(self):
+        with raises(AlgorithmException):
+            Benders(self.build_master(EngineFixtures.get_cplex_engine()), [], 0, build_subproblem, 0, get_glop_engine)
+        with raises(AlgorithmException):
+            Benders(
+                self.build_master(EngineFixtures.get_cplex_engine()), [], 0, build_subproblem, 1, get_glop_engine, -1
+            )
+
+    def test_time_limit(self):
+        master: Model = TestBenders.build_master(engine=EngineFixtures.get_cplex_engine())
+        x: List[Variable] = list(master.term_sets["x"].values())
+        result: BendersResult = Benders(
+            master, x, 0, build_subproblem, len(demands), EngineFixtures.get_cplex_engine, time_limit=0
+        ).run()
+        assert len(result.iterations) == 1 and result.status == SolutionStatus.NOT_SOLVED
+        assert result.objective_value is None and result.values == ()
+
+    def test_parallel_workers(self):
+        TestBenders.benders_assertions(
+            master_engine=EngineFixtures.get_cplex_engine(),
+            engine_factory=EngineFixtures.get_cplex_engine,
+            workers=2,
+        )
+
+    @staticmethod
+    def benders_assertions(master_engine: Engine, engine_factory: Callable[[], Engine], workers: int = 0):
+        master: Model = TestBenders.build_master(engine=master_engine)
+        x: List[Variable] = list(master.term_sets["x"].values())
+        benders: Benders = Benders(
+            master=master,
+            first_stage=x,
+            first_stage_cost=Expression.sum(c * v for c, v in zip(capacity_costs, x)),
+            subproblem=build_subproblem,
+            num_subproblems=len(demands),
+            engine_factory=engine_factory,
+            workers=workers,
+        )
+        result: BendersResult = benders.run()
+
+        # The bounds converge to the optimal value of the monolithic model
+        assert result.status == SolutionStatus.OPTIMAL
+        assert result.objective_value == approx(60) and result.gap == approx(0, abs=1e-4)
+        assert result.lower_bound == approx(TestBenders.monolithic_objective(engine=engine_factory()))
+        assert sum(result.values) == approx(16)
+
+        # The initial master solution is infeasible for the subproblems, which are then refined
+        assert result.iterations[0].feasibility_cuts > 0
+        assert sum(iteration.optimality_cuts for iteration in result.iterations) > 0
+        lower_bounds: List[float] = [iteration.lower_bound for iteration in result.iterations]
+        assert lower_bounds == sorted(lower_bounds)
+        assert result.iterations[-1].upper_bound == approx(result.objective_value)
+
+        # Feasibility cuts make the master infeasible when the capacity cannot cover the demand
+        limited: Model = TestBenders.build_master(engine=master_engine.__class__())
+        capacities: List[Variable] = list(limited.term_sets["x"].values())
+        limited.add_constraint(Expression.sum(capacities) <= 10)
+        assert (
+            Benders(limited, capacities, 0, build_subproblem, len(demands), engine_factory).run().status
+            == SolutionStatus.INFEASIBLE
+        )
+
+    class TestBendersWithCplex:
+        def test_benders(self):
+            TestBenders.benders_assertions(
+                master_engine=EngineFixtures.get_cplex_engine(), engine_factory=EngineFixtures.get_cplex_engine
+            )
+
+    class TestBendersWithGurobi:
+        def test_benders(self):
+            TestBenders.benders_assertions(
+                master_engine=EngineFixtures.get_gurobi_engine(), engine_factory=EngineFixtures.get_gurobi_engine
+            )
+
+    class TestBendersWithORTools:
+        def test_benders(self):
+            TestBenders.benders_assertions(
+                master_engine=EngineFixtures.get_or_tools_engine(), engine_factory=get_glop_engine
+            )
+
+    class TestBendersWithPuLP:
+        def test_benders(self):
+            TestBenders.benders_assertions(
+                master_engine=EngineFixtures.get_pulp_engine(), engine_factory=EngineFixtures.get_pulp_engine
+            )
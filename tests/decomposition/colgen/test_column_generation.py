@@ -0,0 +1,141 @@
+from itertools import product
+from typing import Callable, List, Sequence, Tuple
+
+from pytest import approx, raises
+
+from pyorlib import Engine, Model
+from pyorlib.algebra import Expression
+from pyorlib.algebra.terms.variables import Variable
+from pyorlib.decomposition.colgen import Column, ColumnGeneration, ColumnGenerationResult
+from pyorlib.engines.ortools import ORToolsEngine
+from pyorlib.enums import OptimizationType, SolutionStatus, ValueType
+from pyorlib.exceptions import AlgorithmException
+from tests.fixtures import EngineFixtures
+
+roll_widths: List[int] = [10, 13]
+""" The width of each type of roll. """
+
+roll_costs: List[float] = [1.0, 1.25]
+""" The cost of each type of roll. """
+
+item_widths: List[int] = [3, 4, 5]
+""" The width of each item. """
+
+item_demands: List[int] = [30, 20, 16]
+""" The number of pieces demanded of each item. """
+
+
+def get_glop_engine() -> Engine:
+    return ORToolsEngine.from_option("GLOP")
+
+
+def price_pattern(index: int, duals: Sequence[float]) -> List[Column]:
+    # Unbounded knapsack over the capacity of the roll, maximizing the dual value of the pattern.
+    best: List[Tuple[float, Tuple[int, ...]]] = [(0.0, (0,) * len(item_widths))]
+    for capacity in range(1, roll_widths[index] + 1):
+        value, pattern = best[capacity - 1]
+        for item, width in enumerate(item_widths):
+            if width <= capacity and best[capacity - width][0] + duals[item] > value:
+                value = best[capacity - width][0] + duals[item]
+                pattern = tuple(n + (i == item) for i, n in enumerate(best[capacity - width][1]))
+        best.append((value, pattern))
+
+    pattern = best[-1][1]
+    rows: Tuple[int, ...] = tuple(item for item, count in enumerate(pattern) if count)
+    return [Column(roll_costs[index], rows, tuple(float(pattern[item]) for item in rows), data=(index, pattern))]
+
+
+class TestColumnGeneration:
+
+    @staticmethod
+    def build_master(engine: Engine, patterns: Sequence[Tuple[float, Sequence[int]]]) -> Model:
+        master: Model = Model(engine=engine, collect_stats=True)
+        variables: List[Variable] = [
+            master.add_variable(f"pattern_{p}", ValueType.CONTINUOUS, 0, 1000) for p in range(len(patterns))
+        ]
+        for item, demand in enumerate(item_demands):
+            master.add_constraint(
+                Expression.sum(pattern[item] * x for (_, pattern), x in zip(patterns, variables) if pattern[item])
+                >= demand
+            )
+        master.set_objective(OptimizationType.MINIMIZE, Expression.sum(c * x for (c, _), x in zip(patterns, variables)))
+        return master
+
+    @staticmethod
+    def initial_patterns() -> List[Tuple[float, Sequence[int]]]:
+        return [
+            (roll_costs[0], [roll_widths[0] // width if i == item else 0 for i in range(len(item_widths))])
+            for item, width in enumerate(item_widths)
+        ]
+
+    @staticmethod
+    def all_patterns() -> List[Tuple[float, Sequence[int]]]:
+        patterns: List[Tuple[float, Sequence[int]]] = []
+        for cost, roll_width in zip(roll_costs, roll_widths):
+            for pattern in product(*(range(roll_width // width + 1) for width in item_widths)):
+                if 0 < sum(n * w for n, w in zip(pattern, item_widths)) <= roll_width:
+                    patterns.append((cost, pattern))
+        return patterns
+
+    def test_column(self):
+        column: Column = Column(cost=1.0, rows=(0, 2), coefficients=(2.0, 1.0))
+        assert column.reduced_cost(duals=[0.25, 5.0, 0.1]) == approx(0.4)
+        with raises(AlgorithmException):
+            ColumnGeneration(master=Model(engine=get_glop_engine()), pricing=price_pattern, num_pricing=0)
+
+    def test_parallel_pricing(self):
+        TestColumnGeneration.column_generation_assertions(engine_factory=EngineFixtures.get_cplex_engine, workers=2)
+
+    @staticmethod
+    def column_generation_assertions(engine_factory: Callable[[], Engine], workers: int = 0):
+        master: Model = TestColumnGeneration.build_master(
+            engine=engine_factory(), patterns=TestColumnGeneration.initial_patterns()
+        )
+        column_generation: ColumnGeneration = ColumnGeneration(
+            master=master, pricing=price_pattern, num_pricing=len(roll_widths), workers=workers
+        )
+        result: ColumnGenerationResult = column_generation.run()
+
+        # The restricted master reaches the linear relaxation over all the patterns
+        full: Model = TestColumnGeneration.build_master(
+            engine=engine_factory(), patterns=TestColumnGeneration.all_patterns()
+        )
+        full.solve()
+        assert result.status == SolutionStatus.OPTIMAL
+        assert result.objective_value == approx(full.objective_value)
+        assert result.objective_value < result.iterations[0].objective_value
+
+        # Columns are added to the existing constraints, and the last iteration proposes no column
+        assert len(result.columns) == len(result.values) == len(column_generation.columns) > 0
+        assert {column.data[0] for column in result.columns} == {0, 1}
+        assert result.iterations[-1].columns_added == 0
+        assert all(iteration.min_reduced_cost < 0 for iteration in result.iterations[:-1])
+        assert master.stats().num_variables == len(item_widths) + len(result.columns)
+
+        # The demand is covered by the initial and generated patterns
+        covered: List[float] = [0.0] * len(item_widths)
+        for column, value in zip(result.columns, result.values):
+            for row, coefficient in zip(column.rows, column.coefficients):
+                covered[row] += coefficient * value
+        initial: List[float] = master.get_values(
+            [master.get_term_by_name(f"pattern_{p}") for p in range(len(item_widths))]
+        )
+        for item, (_, pattern) in enumerate(TestColumnGeneration.initial_patterns()):
+            covered[item] += pattern[item] * initial[item]
+        assert all(c >= d - 1e-6 for c, d in zip(covered, item_demands))
+
+    class TestColumnGenerationWithCplex:
+        def test_column_generation(self):
+            TestColumnGeneration.column_generation_assertions(engine_factory=EngineFixtures.get_cplex_engine)
+
+    class TestColumnGenerationWithGurobi:
+        def test_column_generation(self):
+            TestColumnGeneration.column_generation_assertions(engine_factory=EngineFixtures.get_gurobi_engine)
+
+    class TestColumnGenerationWithORTools:
+        def test_column_generation(self):
+            TestColumnGeneration.column_generation_assertions(engine_factory=get_glop_engine)
+
+    class TestColumnGenerationWithPuLP:
+        def test_column_generation(self):
+            TestColumnGeneration.column_generation_assertions(engine_factory=EngineFixtures.get_pulp_engine)
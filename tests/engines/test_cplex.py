@@ -32,3 +32,6 @@ class TestCplexEngine:
         TestEngine.objective_function_assertions(
             engine=EngineFixtures.get_cplex_engine(), expected_exception=EngineFixtures.get_cplex_exception_cls()
         )
+
+    def test_create_assertions(self):
+        TestEngine.create_assertions(backend="cplex", engine_cls=EngineFixtures.get_cplex_engine_cls())
@@ -1,12 +1,12 @@
-from typing import Type, Any
+from typing import Type, Any, List
 
 import pytest
 
 from pyorlib.algebra import Variable
 from pyorlib.core.exceptions import PyORlibException
 from pyorlib.engines import Engine
-from pyorlib.enums import ValueType
-from pyorlib.exceptions import TermException
+from pyorlib.enums import SolutionStatus, ValueType
+from pyorlib.exceptions import EngineException, TermException
 
 
 class TestEngine:
@@ -22,6 +22,45 @@ class TestEngine:
         with pytest.raises(expected_exception):
             engine.set_objective(opt_type=None, expression=var1 <= 3)
 
+    @staticmethod
+    def create_assertions(backend: str, engine_cls: Type[Engine]) -> None:
+        engine: Engine = Engine.create(backend)
+        assert type(engine) is engine_cls
+        assert type(Engine.create(f" {backend.upper()} ")) is engine_cls
+        with pytest.raises(EngineException):
+            Engine.create(f"{backend}_unknown")
+
+    def test_minimal_engine(self):
+        class MinimalEngine(Engine):
+            name: str = "Minimal Engine"
+            constraints: List[Any] = []
+            objective_value: float | None = None
+            objective_expr: Any = None
+            solution_status: SolutionStatus = SolutionStatus.NOT_SOLVED
+
+            def add_variable(self, name, value_type, lower_bound=0, upper_bound=float("inf")):
+                raise NotImplementedError
+
+            def add_constraint(self, expression):
+                raise NotImplementedError
+
+            def set_objective(self, opt_type, expression):
+                raise NotImplementedError
+
+            def solve(self):
+                pass
+
+        # Engines that only implement the core methods can be instantiated, and the optional hooks raise
+        engine: Engine = MinimalEngine()
+        with pytest.raises(EngineException):
+            engine.get_variable_key(variable=None)
+        with pytest.raises(EngineException):
+            engine.get_linear_constraint(expression=None)
+        with pytest.raises(EngineException):
+            engine.iter_linear_constraints()
+        with pytest.raises(EngineException):
+            engine.get_linear_objective()
+
 
 class TestEngineVariable:
 
@@ -32,3 +32,6 @@ class TestGurobiEngine:
         TestEngine.objective_function_assertions(
             engine=EngineFixtures.get_gurobi_engine(), expected_exception=EngineFixtures.get_gurobi_exception_cls()
         )
+
+    def test_create_assertions(self):
+        TestEngine.create_assertions(backend="gurobi", engine_cls=EngineFixtures.get_gurobi_engine_cls())
@@ -1,7 +1,8 @@
 import pytest
 
 from pyorlib.enums import ValueType, SolutionStatus
-from pyorlib.exceptions import TermException
+from pyorlib.engines import Engine
+from pyorlib.exceptions import EngineException, TermException
 from tests.engines.test_engine import TestEngine, TestEngineVariable
 from tests.fixtures import EngineFixtures
 
@@ -70,3 +71,12 @@ class TestORToolsEngine:
         TestEngine.objective_function_assertions(
             engine=EngineFixtures.get_or_tools_engine(), expected_exception=EngineFixtures.get_or_tools_exception_cls()
         )
+
+    def test_create_assertions(self):
+        TestEngine.create_assertions(backend="ortools", engine_cls=EngineFixtures.get_or_tools_engine_cls())
+
+    def test_create_with_option(self):
+        engine = Engine.create("ortools:GLOP")
+        assert engine.name == EngineFixtures.get_or_tools_engine().name
+        with pytest.raises(EngineException):
+            Engine.create("ortools:Unknown")
@@ -1,6 +1,9 @@
 import pytest
+from pulp import LpProblem
 
-from pyorlib.exceptions import TermException
+from pyorlib.engines import Engine
+from pyorlib.enums import OptimizationType, ValueType
+from pyorlib.exceptions import EngineException, TermException
 from tests.engines.test_engine import TestEngineVariable, TestEngine
 from tests.fixtures import EngineFixtures
 
@@ -38,3 +41,28 @@ class TestPuLPEngine:
         TestEngine.objective_function_assertions(
             engine=EngineFixtures.get_pulp_engine(), expected_exception=EngineFixtures.get_pulp_exception_cls()
         )
+
+    def test_create_assertions(self):
+        TestEngine.create_assertions(backend="pulp", engine_cls=EngineFixtures.get_pulp_engine_cls())
+
+    def test_create_with_option(self):
+        with pytest.raises(EngineException):
+            Engine.create("pulp:CBC")
+
+    def test_start_values(self, monkeypatch):
+        solvers = []
+        engine = EngineFixtures.get_pulp_engine()
+        x = engine.add_variable("x", ValueType.INTEGER, 0, 10)
+        y = engine.add_variable("y", ValueType.CONTINUOUS, 0, 5)
+        engine.add_constraint(x + y <= 12)
+        engine.set_objective(OptimizationType.MAXIMIZE, 2 * x + y)
+
+        # Start values are the initial values of the variables, from which CBC is warm-started
+        solve = LpProblem.solve
+        monkeypatch.setattr(
+            LpProblem, "solve", lambda problem, solver: solvers.append(solver) or solve(problem, solver)
+        )
+        engine.set_start_values([x, y], [4, 5])
+        assert x.raw.varValue == 4 and y.raw.varValue == 5
+        engine.solve()
+        assert solvers[0].optionsDict["warmStart"] and engine.objective_value == pytest.approx(22)
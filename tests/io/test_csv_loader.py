@@ -0,0 +1,106 @@
+from array import array
+
+from pytest import raises
+
+from pyorlib.enums import ParameterType, ValueType
+from pyorlib.io import CSVLoader
+from pyorlib.structures import DimensionDefinition, MultiValueParameter, ParameterDefinition
+
+
+class TestCSVLoader:
+    definition: ParameterDefinition = ParameterDefinition(
+        name="c_i",
+        parameter_types={ParameterType.FIXED, ParameterType.BOUNDED},
+        value_types={ValueType.INTEGER},
+        min=0,
+        max=100,
+    )
+
+    def test_load_values(self, tmp_path):
+        path = tmp_path / "costs.csv"
+        path.write_text("id,cost\n" + "".join(f"{i},{i % 50}\n" for i in range(1000)))
+
+        loader: CSVLoader = CSVLoader(path=path, chunk_size=64)
+        values = loader.load_values(value_type=ValueType.INTEGER, column="cost", definition=self.definition)
+
+        assert isinstance(values, array)
+        assert len(values) == 1000 and values[999] == 49
+        assert loader.load_values(value_type=ValueType.INTEGER, column=0)[10] == 10
+
+        # Validates dimensions
+        i: DimensionDefinition = DimensionDefinition(name="i")
+        j: DimensionDefinition = DimensionDefinition(name="j", max=10)
+        assert len(loader.load_values(value_type=ValueType.INTEGER, column="cost", dimensions={i: 100, j: 10})) == 1000
+        with raises(Exception):
+            loader.load_values(value_type=ValueType.INTEGER, column="cost", dimensions={i: 100, j: 11})
+        with raises(Exception):
+            loader.load_values(value_type=ValueType.INTEGER, column="cost", dimensions={i: 10, j: 10})
+        with raises(Exception):
+            loader.load_values(value_type=ValueType.INTEGER, column="cost", dimensions={i: 0, j: 10})
+
+    def test_load_parameter(self, tmp_path):
+        path = tmp_path / "bounds.csv"
+        path.write_text("1;3\n2;2\n0;5\n")
+
+        loader: CSVLoader = CSVLoader(path=path, delimiter=";", header=False)
+
+        fixed: MultiValueParameter = loader.load_parameter(value_type=ValueType.INTEGER, definition=self.definition)
+        assert fixed.parameter_type == ParameterType.FIXED and list(fixed.values) == [1, 2, 0]
+
+        bounded: MultiValueParameter = loader.load_parameter(
+            value_type=ValueType.INTEGER, definition=self.definition, lower_bound_column=0, upper_bound_column=1
+        )
+        assert bounded.parameter_type == ParameterType.BOUNDED
+        assert bounded.min_value == 0 and bounded.max_value == 5
+
+        # Validates incomplete bounds and unordered bounds
+        with raises(Exception):
+            loader.load_parameter(value_type=ValueType.INTEGER, lower_bound_column=0)
+        with raises(Exception):
+            loader.load_parameter(value_type=ValueType.INTEGER, lower_bound_column=1, upper_bound_column=0)
+
+    def test_validations(self, tmp_path):
+        path = tmp_path / "values.csv"
+
+        # Validates the loader options
+        with raises(Exception):
+            CSVLoader(path="")
+        with raises(Exception):
+            CSVLoader(path=path, chunk_size=0)
+
+        # Validates the values against the definition and the value type
+        path.write_text("value\n1\n101\n")
+        with raises(Exception):
+            CSVLoader(path=path).load_values(value_type=ValueType.INTEGER, definition=self.definition)
+        with raises(Exception):
+            CSVLoader(path=path).load_values(value_type=ValueType.CONTINUOUS, definition=self.definition)
+        with raises(Exception):
+            CSVLoader(path=path).load_values(value_type=ValueType.BINARY)
+
+        path.write_text("value\n1\n2.5\n")
+        with raises(Exception):
+            CSVLoader(path=path).load_values(value_type=ValueType.INTEGER)
+
+        # Validates malformed, infinite, missing and empty values
+        for content in ["value\n1\nabc\n", "value\n1\ninf\n", "other,value\n2,1\n3\n", "value\n"]:
+            path.write_text(content)
+            with raises(Exception):
+                CSVLoader(path=path).load_values(value_type=ValueType.CONTINUOUS, column="value")
+
+        # Validates unknown columns
+        path.write_text("value\n1\n")
+        with raises(Exception):
+            CSVLoader(path=path).load_values(value_type=ValueType.CONTINUOUS, column="cost")
+        with raises(Exception):
+            CSVLoader(path=path, header=False).load_values(value_type=ValueType.CONTINUOUS, column="value")
+
+    def test_load_array(self, tmp_path):
+        path = tmp_path / "matrix.csv"
+        path.write_text("value\n" + "".join(f"{v}\n" for v in range(6)))
+
+        i: DimensionDefinition = DimensionDefinition(name="i")
+        j: DimensionDefinition = DimensionDefinition(name="j")
+        values = CSVLoader(path=path).load_array(value_type=ValueType.CONTINUOUS, dimensions={i: 2, j: 3})
+
+        assert values.shape == (2, 3) and values[1, 2] == 5
+        assert not values.flags.writeable
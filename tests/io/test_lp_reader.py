@@ -0,0 +1,93 @@
+from math import inf
+
+import cplex
+from pytest import raises
+
+from pyorlib.enums import OptimizationType, ValueType
+from pyorlib.io import LPReader, ModelRecord
+
+
+class TestLPReader:
+
+    LP: str = """\\ Problem name: sample
+Maximize
+ obj: 2 x - 3.5 y
+   + z + 4
+Subject To
+ c1: x + y <= 10
+ c2: - x + 2 y
+     >= -4
+ x - z = 0 \\ An unnamed constraint
+ c4: 3 x + 1e2 y - 2 >= 1
+Bounds
+ -inf <= x <= 5
+ y free
+ z >= -1e30
+ 1 <= w <= 1e+20
+Binaries
+ b
+Generals
+ y
+End
+"""
+
+    def test_read(self, tmp_path):
+        path = tmp_path / "model.lp"
+        path.write_text(self.LP)
+
+        record: ModelRecord = LPReader(path=path).read()
+        assert record.name == "sample" and record.opt_type == OptimizationType.MAXIMIZE
+        assert record.objective_constant == 4
+        assert record.column_names == ["x", "y", "z", "w", "b"]
+        assert list(record.objective) == [2, -3.5, 1, 0, 0]
+        assert list(record.column_types) == [
+            ValueType.CONTINUOUS,
+            ValueType.INTEGER,
+            ValueType.CONTINUOUS,
+            ValueType.CONTINUOUS,
+            ValueType.BINARY,
+        ]
+        assert list(record.column_lower_bounds) == [-inf, -inf, -inf, 1, 0]
+        assert list(record.column_upper_bounds) == [5, inf, inf, inf, 1]
+
+        rows = [(list(columns), list(values), lower, upper) for columns, values, lower, upper in record.iter_rows()]
+        assert rows == [
+            ([0, 1], [1, 1], -inf, 10),
+            ([0, 1], [-1, 2], -4, inf),
+            ([0, 2], [1, -1], 0, 0),
+            ([0, 1], [3, 100], 3, inf),
+        ]
+
+    def test_read_cplex_output(self, tmp_path):
+        problem = cplex.Cplex()
+        problem.set_results_stream(None)
+        problem.objective.set_sense(problem.objective.sense.minimize)
+        problem.variables.add(obj=[1, -2], lb=[0, -1], ub=[4, cplex.infinity], types="IC", names=["a", "b"])
+        problem.linear_constraints.add(
+            lin_expr=[cplex.SparsePair(ind=[0, 1], val=[1, 1])], senses="G", rhs=[1], names=["r"]
+        )
+        path = str(tmp_path / "model.lp")
+        problem.write(path)
+
+        record: ModelRecord = LPReader(path=path).read()
+        assert record.opt_type == OptimizationType.MINIMIZE
+        assert record.column_names == ["a", "b"]
+        assert list(record.objective) == [1, -2]
+        assert list(record.column_types) == [ValueType.INTEGER, ValueType.CONTINUOUS]
+        assert list(record.column_lower_bounds) == [0, -1] and list(record.column_upper_bounds) == [4, inf]
+        assert record.row(0)[2:] == (1, inf)
+
+    def test_read_errors(self, tmp_path):
+        path = tmp_path / "model.lp"
+        for content in [
+            "x + y\n",
+            "Minimize\n obj: x\nSubject To\n c1: x + y <= 2 y\nEnd\n",
+            "Minimize\n obj: x\nSubject To\n c1: 0 <= x + y <= 2\nEnd\n",
+            "Minimize\n obj: [ x ^ 2 ]\nEnd\n",
+            "Minimize\n obj: x\nSubject To\n c1: x + y\nEnd\n",
+            "Minimize\n obj: x\nSOS\n s1: S1:: x:1\nEnd\n",
+            "Minimize\n obj: x\nBounds\n x <=\nEnd\n",
+        ]:
+            path.write_text(content)
+            with raises(Exception):
+                LPReader(path=path).read()
@@ -0,0 +1,79 @@
+from math import inf
+
+import cplex
+from pytest import raises
+
+from pyorlib.enums import OptimizationType, ValueType
+from pyorlib.io import LPWriter
+from tests.fixtures import EngineFixtures
+
+
+class TestLPWriter:
+
+    def test_write(self, tmp_path):
+        engine = EngineFixtures.get_pulp_engine()
+        x = engine.add_variable(name="x", value_type=ValueType.CONTINUOUS, lower_bound=-inf, upper_bound=4)
+        y = engine.add_variable(name="y", value_type=ValueType.INTEGER, lower_bound=1)
+        z = engine.add_variable(name="z", value_type=ValueType.BINARY)
+
+        path = str(tmp_path / "model.lp")
+        LPWriter(path=path).write(
+            name="model",
+            variables=[x, y, z],
+            objective=([0, 1], [1.0, -2.5], -3.0, OptimizationType.MINIMIZE),
+            rows=[
+                ([0, 1], [1.0, 2.0], -inf, 10.0),
+                ([1, 2], [-1.0, 1.0], 1.0, 4.0),
+                ([], [], -inf, inf),
+            ],
+        )
+
+        with open(path) as file:
+            content: str = file.read()
+        assert " obj: x - 2.5 y - 3 Constant\n" in content
+        assert " c0: x + 2 y <= 10\n" in content
+        assert " c1: - y + z - Rgc1 = 1\n" in content
+
+        # Validates the model read back by CPLEX
+        problem = cplex.Cplex()
+        problem.set_results_stream(None)
+        problem.read(path)
+        names = ["x", "y", "z", "Constant"]
+        assert problem.variables.get_lower_bounds(names) == [-cplex.infinity, 1, 0, 1]
+        assert problem.variables.get_upper_bounds(names) == [4, cplex.infinity, 1, 1]
+        assert problem.variables.get_types(names) == ["C", "I", "B", "C"]
+        assert problem.linear_constraints.get_num() == 3
+
+    def test_generated_names(self, tmp_path):
+        engine = EngineFixtures.get_pulp_engine()
+        x = engine.add_variable(name="c0", value_type=ValueType.CONTINUOUS, upper_bound=4)
+        y = engine.add_variable(name="Rg_c1", value_type=ValueType.CONTINUOUS, upper_bound=4)
+
+        path = str(tmp_path / "model.lp")
+        LPWriter(path=path).write(
+            name="model",
+            variables=[x, y],
+            objective=([0, 1], [1.0, 1.0], 0.0, OptimizationType.MAXIMIZE),
+            rows=[([0, 1], [1.0, 1.0], -inf, 6.0), ([0, 1], [1.0, -1.0], 1.0, 2.0)],
+        )
+
+        # Rows and range columns are renamed to avoid the names of the variables
+        with open(path) as file:
+            content: str = file.read()
+        assert " _c0: c0 + Rg_c1 <= 6\n" in content
+        assert " _c1: c0 - Rg_c1 - _Rg_c1 = 1\n" in content
+
+        problem = cplex.Cplex()
+        problem.set_results_stream(None)
+        problem.read(path)
+        assert problem.variables.get_num() == 3 and problem.linear_constraints.get_num() == 2
+        assert problem.variables.get_upper_bounds("_Rg_c1") == 1
+
+    def test_validations(self, tmp_path):
+        engine = EngineFixtures.get_pulp_engine()
+        x = engine.add_variable(name="1x", value_type=ValueType.CONTINUOUS)
+
+        with raises(Exception):
+            LPWriter(path=tmp_path / "model.lp").write(
+                name="model", variables=[x], objective=([], [], 0, OptimizationType.MINIMIZE), rows=[]
+            )
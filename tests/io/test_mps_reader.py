@@ -0,0 +1,129 @@
+from math import inf
+
+import cplex
+from pytest import raises
+
+from pyorlib.enums import OptimizationType, ValueType
+from pyorlib.io import ModelRecord, MPSReader
+
+
+class TestMPSReader:
+
+    FREE_MPS: str = """* A small problem in free MPS format
+NAME sample
+OBJSENSE
+    MAX
+ROWS
+ N  obj
+ L  lim
+ G  cover
+ E  balance
+ E  window
+ N  unused
+COLUMNS
+    x  obj  1  lim  1
+    x  cover  2  unused  9
+    MARKER  'MARKER'  'INTORG'
+    y  obj  -3  lim  4
+    y  window  1
+    MARKER  'MARKER'  'INTEND'
+    z  balance  1
+RHS
+    RHS  obj  -5  lim  10
+    cover  2
+    RHS  balance  3
+    RHS  window  1
+RANGES
+    RNG  cover  4  window  -2
+BOUNDS
+ UP BND  x  -1
+ UI BND  y  8
+ BV BND  z
+ENDATA
+"""
+
+    FIXED_MPS: str = """NAME          fixed model
+ROWS
+ N  cost
+ L  row one
+COLUMNS
+    var a     cost               1.5   row one              2
+    var b     row one              1
+RHS
+              row one              4
+BOUNDS
+ FX BND       var b                3
+ENDATA
+"""
+
+    def test_read_free(self, tmp_path):
+        path = tmp_path / "model.mps"
+        path.write_text(self.FREE_MPS)
+
+        record: ModelRecord = MPSReader(path=path).read()
+        assert record.name == "sample" and record.opt_type == OptimizationType.MAXIMIZE
+        assert record.objective_constant == 5
+        assert record.column_names == ["x", "y", "z"]
+        assert list(record.column_types) == [ValueType.CONTINUOUS, ValueType.INTEGER, ValueType.BINARY]
+        assert list(record.column_lower_bounds) == [-inf, 0, 0]
+        assert list(record.column_upper_bounds) == [-1, 8, 1]
+        assert list(record.objective) == [1, -3, 0]
+
+        assert record.num_rows == 4 and record.num_nonzeros == 5
+        rows = [(list(columns), list(values), lower, upper) for columns, values, lower, upper in record.iter_rows()]
+        assert rows == [
+            ([0, 1], [1, 4], -inf, 10),
+            ([0], [2], 2, 6),
+            ([2], [1], 3, 3),
+            ([1], [1], -1, 1),
+        ]
+
+    def test_read_fixed(self, tmp_path):
+        path = tmp_path / "model.mps"
+        path.write_text(self.FIXED_MPS)
+
+        record: ModelRecord = MPSReader(path=path, fixed=True).read()
+        assert record.name == "fixed model" and record.opt_type == OptimizationType.MINIMIZE
+        assert record.column_names == ["var a", "var b"]
+        assert list(record.objective) == [1.5, 0]
+        assert list(record.column_lower_bounds) == [0, 3] and list(record.column_upper_bounds) == [inf, 3]
+        columns, values, lower_bound, upper_bound = record.row(0)
+        assert list(columns) == [0, 1] and list(values) == [2, 1]
+        assert lower_bound == -inf and upper_bound == 4
+
+    def test_read_cplex_output(self, tmp_path):
+        problem = cplex.Cplex()
+        problem.set_results_stream(None)
+        problem.variables.add(obj=[1, 2], lb=[0, -1], ub=[4, cplex.infinity], types="IC", names=["a", "b"])
+        problem.linear_constraints.add(
+            lin_expr=[cplex.SparsePair(ind=[0, 1], val=[1, 1])], senses="R", rhs=[1], range_values=[2], names=["r"]
+        )
+        path = str(tmp_path / "model.mps")
+        problem.write(path)
+
+        record: ModelRecord = MPSReader(path=path).read()
+        assert record.column_names == ["a", "b"]
+        assert list(record.column_types) == [ValueType.INTEGER, ValueType.CONTINUOUS]
+        assert list(record.column_lower_bounds) == [0, -1] and list(record.column_upper_bounds) == [4, inf]
+        assert record.row(0)[2:] == (1, 3)
+
+    def test_read_errors(self, tmp_path):
+        path = tmp_path / "model.mps"
+        with raises(Exception):
+            MPSReader(path="")
+
+        path.write_text("NAME bad\nROWS\n N  obj\nCOLUMNS\n    x  missing  1\nENDATA\n")
+        with raises(Exception):
+            MPSReader(path=path).read()
+
+        path.write_text("NAME bad\nROWS\n N  obj\nCOLUMNS\n    x  obj  one\nENDATA\n")
+        with raises(Exception):
+            MPSReader(path=path).read()
+
+        path.write_text("NAME bad\nROWS\n N  obj\nCOLUMNS\n    x  obj  1\nBOUNDS\n SC BND  x  1\nENDATA\n")
+        with raises(Exception):
+            MPSReader(path=path).read()
+
+        path.write_text("NAME bad\nQUADOBJ\n    x  x  1\nENDATA\n")
+        with raises(Exception):
+            MPSReader(path=path).read()
@@ -0,0 +1,71 @@
+import gzip
+from math import inf
+
+import cplex
+from pytest import raises
+
+from pyorlib.enums import OptimizationType, ValueType
+from pyorlib.io import MPSWriter
+from tests.fixtures import EngineFixtures
+
+
+class TestMPSWriter:
+
+    @staticmethod
+    def read(path: str) -> cplex.Cplex:
+        problem = cplex.Cplex()
+        problem.set_results_stream(None)
+        problem.set_log_stream(None)
+        problem.read(path)
+        return problem
+
+    def test_write(self, tmp_path):
+        engine = EngineFixtures.get_pulp_engine()
+        x = engine.add_variable(name="x", value_type=ValueType.CONTINUOUS, lower_bound=-inf, upper_bound=inf)
+        y = engine.add_variable(name="y", value_type=ValueType.INTEGER, lower_bound=-2, upper_bound=5)
+        z = engine.add_variable(name="z", value_type=ValueType.BINARY)
+
+        path = str(tmp_path / "model.mps.gz")
+        writer: MPSWriter = MPSWriter(path=path)
+        assert writer.compress and writer.path == path
+
+        writer.write(
+            name="model",
+            variables=[x, y, z],
+            objective=([1, 2], [3.0, -1.0], 4.0, OptimizationType.MAXIMIZE),
+            rows=[
+                ([0, 1], [1.0, 2.0], -inf, 10.0),
+                ([1, 2], [1.0, 1.0], 1.0, inf),
+                ([0, 2], [2.0, -1.5], 3.0, 3.0),
+                ([0], [1.0], -1.0, 2.0),
+            ],
+        )
+
+        with gzip.open(path, "rt") as file:
+            content: str = file.read()
+        assert content.startswith("NAME model\nOBJSENSE\n    MAX\n")
+        assert content.count("'INTORG'") == 1 and content.endswith("ENDATA\n")
+
+        # Validates the model read back by CPLEX
+        problem = self.read(path)
+        assert problem.variables.get_names() == ["x", "y", "z"]
+        assert problem.variables.get_types() == ["C", "I", "B"]
+        assert problem.variables.get_lower_bounds() == [-cplex.infinity, -2, 0]
+        assert problem.variables.get_upper_bounds() == [cplex.infinity, 5, 1]
+        assert problem.linear_constraints.get_senses() == ["L", "G", "E", "R"]
+        assert problem.linear_constraints.get_rhs() == [10, 1, 3, -1]
+        assert problem.linear_constraints.get_range_values() == [0, 0, 0, 3]
+        assert problem.objective.get_linear() == [0, 3, -1]
+        assert problem.objective.get_offset() == 4
+        assert problem.objective.get_sense() == problem.objective.sense.maximize
+
+    def test_validations(self, tmp_path):
+        engine = EngineFixtures.get_or_tools_engine()
+        x = engine.add_variable(name="x y", value_type=ValueType.CONTINUOUS)
+
+        with raises(Exception):
+            MPSWriter(path="")
+        with raises(Exception):
+            MPSWriter(path=tmp_path / "model.mps").write(
+                name="model", variables=[x], objective=([], [], 0, OptimizationType.MINIMIZE), rows=[]
+            )
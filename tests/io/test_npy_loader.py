@@ -0,0 +1,53 @@
+import numpy as np
+from pytest import raises
+
+from pyorlib.algebra.arrays import ConstantArray
+from pyorlib.enums import ValueType
+from pyorlib.io.npy import NpyLoader
+from pyorlib.structures import DimensionDefinition
+
+
+class TestNpyLoader:
+
+    def test_load(self, tmp_path):
+        path = tmp_path / "matrix.npy"
+        np.save(path, np.arange(2000, dtype=np.float64).reshape(1000, 2))
+
+        loader: NpyLoader = NpyLoader(path=path, chunk_size=128)
+
+        # Validates that the values are read-only views of the memory-mapped file
+        values = loader.load_values(value_type=ValueType.CONTINUOUS)
+        assert isinstance(values, np.memmap) and not values.flags.writeable
+        assert len(values) == 2000 and values[1999] == 1999
+        assert list(loader.load_values(value_type=ValueType.INTEGER, column=1)[:3]) == [1, 3, 5]
+
+        # Validates that constant arrays share the memory-mapped values
+        i: DimensionDefinition = DimensionDefinition(name="i")
+        j: DimensionDefinition = DimensionDefinition(name="j")
+        array = loader.load_array(value_type=ValueType.CONTINUOUS, dimensions={i: 1000, j: 2})
+        constants: ConstantArray = ConstantArray(name="c", value_type=ValueType.CONTINUOUS, values=array)
+        assert constants.shape == (1000, 2)
+        assert np.shares_memory(constants.values, array)
+
+    def test_structured(self, tmp_path):
+        path = tmp_path / "bounds.npy"
+        data = np.zeros(3, dtype=[("lb", np.float64), ("ub", np.float64)])
+        data["ub"] = [1, 2, 3]
+        np.save(path, data)
+
+        parameter = NpyLoader(path=path).load_parameter(
+            value_type=ValueType.INTEGER, lower_bound_column="lb", upper_bound_column="ub"
+        )
+        assert parameter.min_value == 0 and parameter.max_value == 3
+
+    def test_validations(self, tmp_path):
+        path = tmp_path / "values.npy"
+        np.save(path, np.array([1.0, np.nan]))
+
+        # Validates NaN values, unknown columns and fields
+        with raises(Exception):
+            NpyLoader(path=path).load_values(value_type=ValueType.CONTINUOUS)
+        with raises(Exception):
+            NpyLoader(path=path).load_values(value_type=ValueType.CONTINUOUS, column=0)
+        with raises(Exception):
+            NpyLoader(path=path).load_values(value_type=ValueType.CONTINUOUS, column="lb")
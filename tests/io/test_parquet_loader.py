@@ -0,0 +1,53 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pytest import raises
+
+from pyorlib.algebra.arrays import ConstantArray
+from pyorlib.enums import ParameterType, ValueType
+from pyorlib.io.parquet import ParquetLoader
+from pyorlib.structures import DimensionDefinition, MultiValueParameter
+
+
+class TestParquetLoader:
+
+    def test_load(self, tmp_path):
+        path = tmp_path / "data.parquet"
+        table = pa.table({"lb": np.arange(5000), "ub": np.arange(5000) + 0.5, "name": ["x"] * 5000})
+        pq.write_table(table, path, row_group_size=1000)
+
+        loader: ParquetLoader = ParquetLoader(path=path, chunk_size=700)
+
+        values = loader.load_values(value_type=ValueType.INTEGER, column="lb")
+        assert isinstance(values, np.ndarray) and values.dtype == np.int64
+        assert len(values) == 5000 and values[4999] == 4999
+
+        bounded: MultiValueParameter = loader.load_parameter(
+            value_type=ValueType.CONTINUOUS, lower_bound_column="lb", upper_bound_column=1
+        )
+        assert bounded.parameter_type == ParameterType.BOUNDED and bounded.max_value == 4999.5
+
+        i: DimensionDefinition = DimensionDefinition(name="i")
+        j: DimensionDefinition = DimensionDefinition(name="j")
+        array = loader.load_array(value_type=ValueType.INTEGER, column="lb", dimensions={i: 50, j: 100})
+        constants: ConstantArray = ConstantArray(name="c", value_type=ValueType.INTEGER, values=array)
+        assert constants[49, 99] == 4999
+        assert np.shares_memory(constants.values, array)
+
+    def test_validations(self, tmp_path):
+        path = tmp_path / "data.parquet"
+        pq.write_table(pa.table({"a": [1.0, None, 2.0], "b": [1.0, 2.5, 3.0], "name": ["x", "y", "z"]}), path)
+
+        loader: ParquetLoader = ParquetLoader(path=path)
+
+        # Validates null, non-numeric, non-integer and unknown columns
+        with raises(Exception):
+            loader.load_values(value_type=ValueType.CONTINUOUS, column="a")
+        with raises(Exception):
+            loader.load_values(value_type=ValueType.CONTINUOUS, column="name")
+        with raises(Exception):
+            loader.load_values(value_type=ValueType.INTEGER, column="b")
+        with raises(Exception):
+            loader.load_values(value_type=ValueType.CONTINUOUS, column="c")
+        with raises(Exception):
+            loader.load_values(value_type=ValueType.CONTINUOUS, column=3)
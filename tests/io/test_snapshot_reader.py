@@ -0,0 +1,75 @@
+from math import inf
+
+from pytest import raises
+
+from pyorlib.enums import OptimizationType, ValueType
+from pyorlib.io import ModelRecord, SnapshotReader, SnapshotWriter
+from tests.fixtures import EngineFixtures
+
+
+class TestSnapshotReader:
+
+    def test_read(self, tmp_path):
+        engine = EngineFixtures.get_pulp_engine()
+        x = engine.add_variable(name="x", value_type=ValueType.CONTINUOUS, lower_bound=-inf, upper_bound=inf)
+        y = engine.add_variable(name="y", value_type=ValueType.INTEGER, lower_bound=-2, upper_bound=5)
+        z = engine.add_variable(name="z", value_type=ValueType.BINARY)
+
+        path = str(tmp_path / "model.snapshot")
+        writer: SnapshotWriter = SnapshotWriter(path=path, term_sets={"v": {(1, 2): y, (2, 1): z}}, dimensions={"n": 2})
+        writer.write(
+            name="model with spaces",
+            variables=[x, y, z],
+            objective=([1, 2], [3.0, -1.0], 4.0, OptimizationType.MAXIMIZE),
+            rows=[
+                ([0, 1], [1.0, 2.0], -inf, 10.0),
+                ([1, 2], [1.0, 1.0], 1.0, inf),
+                ([], [], -inf, inf),
+            ],
+        )
+
+        record: ModelRecord = SnapshotReader(path=path).read()
+        assert record.name == "model with spaces" and record.opt_type == OptimizationType.MAXIMIZE
+        assert record.objective_constant == 4
+        assert record.column_names == ["x", "y", "z"]
+        assert list(record.column_types) == [ValueType.CONTINUOUS, ValueType.INTEGER, ValueType.BINARY]
+        assert list(record.column_lower_bounds) == [-inf, -2, 0]
+        assert list(record.column_upper_bounds) == [inf, 5, 1]
+        assert list(record.objective) == [0, 3, -1]
+        assert record.term_sets == {"v": {(1, 2): 1, (2, 1): 2}} and record.dimensions == {"n": 2}
+
+        # Validates that the arrays are read-only views of the mapped file
+        assert isinstance(record.row_values, memoryview) and record.row_values.readonly
+        rows = [(list(columns), list(values), lower, upper) for columns, values, lower, upper in record.iter_rows()]
+        assert rows == [([0, 1], [1, 2], -inf, 10), ([1, 2], [1, 1], 1, inf), ([], [], -inf, inf)]
+
+    def test_read_empty_model(self, tmp_path):
+        path = str(tmp_path / "model.snapshot")
+        SnapshotWriter(path=path).write(
+            name="", variables=[], objective=([], [], 0, OptimizationType.MINIMIZE), rows=[]
+        )
+
+        record: ModelRecord = SnapshotReader(path=path).read()
+        assert record.num_columns == 0 and record.num_rows == 0 and record.num_nonzeros == 0
+
+    def test_validations(self, tmp_path):
+        with raises(Exception):
+            SnapshotWriter(path=str(tmp_path / "model.snapshot.gz"))
+
+        path = tmp_path / "model.snapshot"
+        for content in [b"", b"short", b"NOTASNAPSHOT" * 8]:
+            path.write_bytes(content)
+            with raises(Exception):
+                SnapshotReader(path=path).read()
+
+        # Validates unsupported versions and truncated files
+        SnapshotWriter(path=path).write(
+            name="model", variables=[], objective=([], [], 0, OptimizationType.MINIMIZE), rows=[([], [], 0, 1)]
+        )
+        content = path.read_bytes()
+        path.write_bytes(content[:8] + (99).to_bytes(4, "little") + content[12:])
+        with raises(Exception):
+            SnapshotReader(path=path).read()
+        path.write_bytes(content[:-20])
+        with raises(Exception):
+            SnapshotReader(path=path).read()
@@ -1,11 +1,21 @@
+import gc
+from contextlib import redirect_stdout
+from io import StringIO
 from math import inf
-from typing import List
+from typing import Callable, List
 
-from pytest import raises
+import cplex
+from pytest import approx, raises
 
 from pyorlib import Model, Engine
-from pyorlib.algebra import Term, Element
+from pyorlib.engines.ortools import ORToolsEngine
+from pyorlib.model import ConstraintIndex, LazyTermSet, ModelObserver, ModelStats, Scenario
+from pyorlib.profiling import ProfiledEngine, Profiler
+from pyorlib.structures import IndexSet, NameTemplate
+from pyorlib.algebra import Term, Element, Expression
+from pyorlib.cache import SolveCache
 from pyorlib.enums import ValueType, TermType, OptimizationType, SolutionStatus
+from pyorlib.exceptions import ModelException
 from tests.fixtures import EngineFixtures
 
 
@@ -229,6 +239,36 @@ class TestModel:
         assert model.term_sets[variables_set_name] == model.get_term_set_by_name(name=variables_set_name)
         assert len(model.term_sets) == 1
 
+    @staticmethod
+    def constant_arrays_assertions(engine: Engine):
+        model: Model = Model(engine=engine)
+
+        # Validates creation and retrieval
+        costs = model.add_constant_array(set_name="c_i_j", values=[[4, 2], [1, 3]], value_type=ValueType.INTEGER)
+        demands = model.add_constant_array(set_name="b_j", values=[1, 2], value_type=ValueType.INTEGER)
+        assert model.get_constant_array_by_name(name="c_i_j") is model.constant_arrays["c_i_j"] is costs
+        assert model.get_constant_array_by_name(name="None") is None
+        assert len(model.constant_arrays) == 2 and len(model.terms) == 0
+
+        # Validates duplicate set names
+        with raises(Exception):
+            model.add_constant_array(set_name="c_i_j", values=[1], value_type=ValueType.INTEGER)
+        with raises(Exception):
+            model.add_variable_to_set(set_name="b_j", set_index=(1,), var_name="b_1", value_type=ValueType.BINARY)
+
+        # Validates arrays as coefficient sources: min sum(c_i_j * x_i_j) s.t. sum_i x_i_j >= b_j
+        x = [[model.add_variable(name=f"x_{i}_{j}", value_type=ValueType.INTEGER) for j in range(2)] for i in range(2)]
+        model.set_objective(
+            opt_type=OptimizationType.MINIMIZE,
+            expression=costs[0].dot(x[0]) + costs[1].dot(x[1]),
+        )
+        for j in range(2):
+            model.add_constraint(expression=x[0][j] + x[1][j] >= demands[j])
+        model.solve()
+
+        assert model.solution_status == SolutionStatus.OPTIMAL
+        assert model.objective_value == 5
+
     @staticmethod
     def constraint_assertions(engine: Engine):
         model: Model = Model(engine=engine)
@@ -317,6 +357,750 @@ class TestModel:
         # Validate solution
         assert model.solution_status == SolutionStatus.INFEASIBLE
 
+    @staticmethod
+    def write_assertions(engine: Engine, tmp_path):
+        model: Model = Model(engine=engine, name="model")
+
+        x = model.add_variable("x", ValueType.INTEGER, 0, inf)
+        y = model.add_variable("y", ValueType.INTEGER, 0, inf)
+        z = model.add_variable("z", ValueType.CONTINUOUS, -inf, 4)
+        model.add_constraint(x + 7 * y <= 17.5)
+        model.add_constraint(x <= 3.5)
+        model.add_constraint(z - x >= -10)
+        model.set_objective(OptimizationType.MAXIMIZE, x + 10 * y - 2 * z + 3)
+
+        # Validates that the written files describe the same problem
+        for file_name in ["model.mps", "model.lp", "model.mps.gz"]:
+            path = str(tmp_path / file_name)
+            model.write(path=path)
+
+            problem = cplex.Cplex()
+            problem.set_results_stream(None)
+            problem.set_log_stream(None)
+            problem.read(path)
+            problem.solve()
+            assert problem.solution.get_objective_value() == 43
+
+        # Validates unsupported formats
+        with raises(Exception):
+            model.write(path=str(tmp_path / "model.txt"))
+
+    @staticmethod
+    def read_assertions(engine_factory: Callable[[], Engine], tmp_path):
+        model: Model = Model(engine=engine_factory(), name="model")
+
+        x = model.add_variable("x", ValueType.INTEGER, 0, inf)
+        y = model.add_variable("y", ValueType.INTEGER, 0, inf)
+        z = model.add_variable("z", ValueType.CONTINUOUS, -inf, 4)
+        b = model.add_variable("b", ValueType.BINARY, 0, 1)
+        model.add_constraint(x + 7 * y <= 17.5)
+        model.add_constraint(x <= 3.5)
+        model.add_constraint(z - x >= -10)
+        model.add_constraint(x + b == 3)
+        model.set_objective(OptimizationType.MAXIMIZE, x + 10 * y - 2 * z + b + 3)
+
+        # Validates that the models read back solve to the same objective
+        for file_name in ["model.mps", "model.lp", "model.mps.gz"]:
+            path = str(tmp_path / file_name)
+            model.write(path=path)
+
+            progress = []
+            read_model: Model = Model.read(
+                path=path,
+                engine=engine_factory(),
+                chunk_size=2,
+                on_progress=lambda done, total: progress.append((done, total)),
+            )
+            assert read_model.name == "model"
+            assert read_model.term_sets["x"][(0,)].name == "x"
+            assert read_model.term_sets["x"][(3,)].value_type == ValueType.BINARY
+            assert progress[-1][0] == progress[-1][1]
+
+            read_model.solve()
+            assert read_model.solution_status == SolutionStatus.OPTIMAL
+            assert read_model.objective_value == approx(42)
+
+        # Validates unsupported formats
+        with raises(Exception):
+            Model.read(path=str(tmp_path / "model.txt"), engine=engine_factory())
+
+    @staticmethod
+    def ranged_rows_assertions(engine_factory: Callable[[], Engine], tmp_path, num_constraints: int):
+        path = tmp_path / "ranged.mps"
+        path.write_text(
+            "NAME ranged\nOBJSENSE\n MAX\nROWS\n N obj\n L c1\n G c2\n E c3\nCOLUMNS\n"
+            " x obj 1 c1 1\n x c2 1\n y obj 1 c1 1\n y c2 1 c3 1\n"
+            "RHS\n rhs c1 8 c2 2\n rhs c3 1\nRANGES\n rng c2 3\nENDATA\n"
+        )
+
+        # Ranged rows are added as a single constraint on the engines that support range constraints
+        model: Model = Model.read(path=str(path), engine=engine_factory())
+        assert len(model.constraints) == num_constraints
+        model.solve()
+        assert model.objective_value == approx(5)
+
+        # Ranges survive a round trip through the engine
+        model.write(path=str(tmp_path / "copy.mps"))
+        copy: Model = Model.read(path=str(tmp_path / "copy.mps"), engine=engine_factory())
+        assert len(copy.constraints) == num_constraints
+        copy.solve()
+        assert copy.objective_value == approx(5)
+
+    @staticmethod
+    def snapshot_assertions(engine_factory: Callable[[], Engine], tmp_path):
+        model: Model = Model(engine=engine_factory(), name="snapshot model")
+        model.add_dimension("n", 2)
+
+        x = model.add_variable("x", ValueType.INTEGER, 0, inf)
+        for i in range(1, 3):
+            for j in range(1, 3):
+                model.add_variable_to_set("y", (i, j), f"y_{i}_{j}", ValueType.BINARY)
+        model.add_constant_to_set("c", (1,), "c_1", ValueType.INTEGER, 5)
+        y = model.term_sets["y"]
+        model.add_constraint(x + y[1, 1] + y[2, 2] <= 4.5)
+        model.add_constraint(y[1, 2] + y[2, 1] == 1)
+        model.set_objective(OptimizationType.MAXIMIZE, 2 * x + y[1, 1] - y[1, 2] + 3)
+
+        path = tmp_path / "model.snapshot"
+        model.save_snapshot(path=path)
+
+        progress = []
+        loaded_model: Model = Model.load_snapshot(
+            path=path,
+            engine=engine_factory(),
+            chunk_size=1,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+        assert loaded_model.name == "snapshot model" and loaded_model.dimensions == {"n": 2}
+        assert loaded_model.get_term_by_name("x").value_type == ValueType.INTEGER
+        assert set(loaded_model.term_sets) == {"y"}
+        assert loaded_model.term_sets["y"][2, 1].name == "y_2_1"
+        assert progress == [(1, 2), (2, 2)]
+
+        loaded_model.solve()
+        assert loaded_model.solution_status == SolutionStatus.OPTIMAL
+        assert loaded_model.objective_value == approx(11)
+
+    @staticmethod
+    def constraint_index_assertions(engine: Engine):
+        model: Model = Model(engine=engine, constraint_index=ConstraintIndex())
+        x = model.add_variable("x", ValueType.CONTINUOUS, 0, inf)
+        y = model.add_variable("y", ValueType.CONTINUOUS, 0, inf)
+        z = model.add_variable("z", ValueType.CONTINUOUS, 0, inf)
+
+        kept = model.add_constraint(x + 2 * y <= 10)
+        assert model.add_constraint(2 * y + x <= 10) is kept
+        assert model.add_constraint(2 * x + 4 * y + 3 <= 23) is kept
+        assert model.add_constraint(x + 2 * y <= 12) is kept
+        assert model.add_constraint(-x - 2 * y >= -10) is kept
+        model.add_constraint(x + 2 * y >= 4)
+        assert model.add_constraint(x + 2 * y >= 1) is not None
+        model.add_constraint(x + y <= 10)
+        model.add_constraint(x + z <= y)
+        assert model.add_constraint(x - y + z <= 0) is not None
+        assert model.add_constraint(x + 2 * y <= 8) is not kept
+        model.set_objective(OptimizationType.MAXIMIZE, x + y)
+
+        assert len(model.constraints) == 5
+        assert model.constraint_index.stats == {
+            "indexed_rows": 3,
+            "duplicate_rows": 4,
+            "dominated_rows": 2,
+            "merged_rows": 2,
+        }
+        assert model.constraint_index.num_removed_rows == 6
+        with raises(Exception):
+            ConstraintIndex(tolerance=0)
+
+        model.solve()
+        assert model.solution_status == SolutionStatus.OPTIMAL
+        assert model.objective_value == approx(16 / 3)
+
+        # Columns would change indexed rows, so later constraints would be compared against stale rows
+        with raises(ModelException):
+            model.add_column("w", ValueType.CONTINUOUS, -5, -5, 0, [0], [1])
+        assert "w" not in model.terms and len(model.constraints) == 5
+
+    @staticmethod
+    def stats_assertions(engine: Engine):
+        model: Model = Model(engine=engine, constraint_index=ConstraintIndex(), collect_stats=True)
+        model.add_constant("c", ValueType.CONTINUOUS, 4)
+        x = model.add_variable("x", ValueType.CONTINUOUS, 0, 1e7)
+        y = model.add_variable("y", ValueType.INTEGER, -2, 5)
+        for i in range(1, 3):
+            model.add_variable_to_set("z", (i,), f"z_{i}", ValueType.BINARY)
+        z = model.term_sets["z"]
+
+        model.add_constraint(x + 2 * y <= 10)
+        model.add_constraint(x + 2 * y <= 10)
+        model.add_constraint(x - 1e6 * z[1,] <= 0)
+        model.add_constraint(0.5 * y + z[2,] >= 1)
+        model.add_constraint(z[1,] + z[2,] == 1)
+        model.set_objective(OptimizationType.MAXIMIZE, 3 * x + y + 2)
+
+        stats: ModelStats = model.stats()
+        assert stats.num_constants == 1 and stats.num_variables == 4
+        assert stats.variables_by_type == {"BINARY": 2, "INTEGER": 1, "CONTINUOUS": 1}
+        assert stats.num_constraints == 4 and stats.num_nonzeros == 8
+        assert stats.constraints_by_sense == {"<=": 2, ">=": 1, "==": 1, "range": 0, "nonlinear": 0}
+        assert stats.coefficient_range == (0.5, 1e6) and stats.coefficient_ratio == approx(2e6)
+        assert stats.objective_range == (1, 3) and stats.num_objective_nonzeros == 2
+        assert stats.bound_range == (1, 1e7) and stats.rhs_range == (1, 10)
+        assert stats.big_m_rows == 1 and stats.big_m_bounds == 1
+        assert stats.estimated_memory == {"variables": 100, "constraints": 224, "objective": 32, "names": 9}
+
+        # The statistics returned are a copy
+        model.add_constraint(x <= 5)
+        assert stats.num_constraints == 4 and stats.constraints_by_sense["<="] == 2
+        assert model.stats().num_constraints == 5
+
+        with raises(Exception):
+            Model(engine=engine).stats()
+
+    def test_undecomposable_constraints(self, monkeypatch):
+        def get_linear_constraint(engine, expression):
+            raise AttributeError("The expression of the constraint is not available.")
+
+        # Constraints that the engine fails to decompose are added and recorded as nonlinear
+        monkeypatch.setattr(ORToolsEngine, "get_linear_constraint", get_linear_constraint)
+        model: Model = Model(engine=EngineFixtures.get_or_tools_engine(), collect_stats=True)
+        x = model.add_variable("x", ValueType.CONTINUOUS, 0, 10)
+        model.add_constraint(x <= 5)
+        assert len(model.constraints) == 1 and model.stats().constraints_by_sense["nonlinear"] == 1
+
+    def test_read_batches(self, monkeypatch, tmp_path):
+        batches = []
+        model: Model = Model(engine=EngineFixtures.get_or_tools_engine())
+        x = model.add_variable("x", ValueType.CONTINUOUS, 0, 10)
+        y = model.add_variable("y", ValueType.CONTINUOUS, 0, 10)
+        for bound in range(1, 6):
+            model.add_constraint(x + bound * y <= 10)
+        model.write(path=str(tmp_path / "model.lp"))
+
+        # The rows of a model read are added to the engine in batches of chunk_size rows
+        def end_batch(engine):
+            batches.append(len(engine.constraints))
+
+        monkeypatch.setattr(ORToolsEngine, "end_batch", end_batch)
+        read_model: Model = Model.read(
+            path=str(tmp_path / "model.lp"), engine=EngineFixtures.get_or_tools_engine(), chunk_size=2
+        )
+        assert batches == [2, 4, 5] and len(read_model.constraints) == 5
+
+    @staticmethod
+    def profiler_assertions(engine_factory: Callable[[], Engine]):
+        spans = []
+        profiler: Profiler = Profiler(sink=spans.append)
+        engine: Engine = engine_factory()
+        model: Model = Model(engine=engine, profiler=profiler)
+        assert model.profiler is profiler
+
+        x = model.add_variable("x", ValueType.INTEGER, 0, 10)
+        for i in range(1, 4):
+            model.add_variable_to_set("y", (i,), f"y_{i}", ValueType.BINARY)
+        y = model.term_sets["y"]
+        for i in range(1, 4):
+            model.add_constraint(x + 5 * y[i,] <= 12)
+        model.set_objective(OptimizationType.MAXIMIZE, x + 2 * y[1,] + 2 * y[2,] + 2 * y[3,])
+        model.solve()
+        assert model.get_values([x, y[1,]]) == [approx(7), approx(1)]
+
+        phases = profiler.report()[engine.name]
+        assert phases["model.add_variable"]["calls"] == 1
+        assert phases["model.add_variable_to_set"]["calls"] == 3
+        assert phases["engine.add_variable"]["calls"] == 4
+        assert phases["model.add_constraint"]["calls"] == phases["engine.add_constraint"]["calls"] == 3
+        assert phases["model.solve"]["calls"] == phases["engine.solve"]["calls"] == 1
+        assert phases["model.get_values"]["calls"] == 1
+        assert phases["model.solve"]["wall_time"] >= phases["engine.solve"]["wall_time"]
+        assert len(spans) == sum(phase["calls"] for phase in phases.values())
+
+        # Disabling the profiler restores the engine and stops recording
+        with raises(Exception):
+            model.presolve(engine=engine)
+        model.profiler = None
+        assert model.profiler is None and not isinstance(model._engine, ProfiledEngine)
+        model.add_constraint(x <= 9)
+        assert profiler.report()[engine.name]["model.add_constraint"]["calls"] == 3
+
+    @staticmethod
+    def observer_assertions(engine: Engine, reports_incumbents: bool):
+        class RecordingObserver(ModelObserver):
+            def __init__(self):
+                self.events = []
+
+            def on_variable_added(self, model, variable):
+                self.events.append(("variable", variable.name))
+
+            def on_constraint_added(self, model, constraint):
+                self.events.append(("constraint", None))
+
+            def on_objective_set(self, model, objective):
+                self.events.append(("objective", None))
+
+            def on_solve_started(self, model):
+                self.events.append(("started", None))
+
+            def on_incumbent_found(self, model, objective_value):
+                self.events.append(("incumbent", objective_value))
+
+            def on_solve_finished(self, model):
+                self.events.append(("finished", model.solution_status))
+
+        class SolveObserver(ModelObserver):
+            def __init__(self):
+                self.solves = 0
+
+            def on_solve_finished(self, model):
+                self.solves += 1
+
+        model: Model = Model(engine=engine, constraint_index=ConstraintIndex())
+        observer, solve_observer = RecordingObserver(), SolveObserver()
+        model.add_observer(observer)
+        model.add_observer(solve_observer)
+        assert model.observers == (observer, solve_observer)
+        with raises(Exception):
+            model.add_observer(observer)
+        with raises(Exception):
+            model.add_observer(None)
+
+        weights, values = [12, 7, 11, 8, 9, 6, 14, 5], [24, 13, 23, 15, 16, 11, 27, 9]
+        for i in range(len(weights)):
+            model.add_variable_to_set("x", (i,), f"x_{i}", ValueType.BINARY)
+        x = model.term_sets["x"]
+        model.add_constraint(Expression.sum(weights[i] * x[i,] for i in range(len(weights))) <= 26)
+        model.add_constraint(Expression.sum(weights[i] * x[i,] for i in range(len(weights))) <= 26)
+        model.set_objective(OptimizationType.MAXIMIZE, Expression.sum(values[i] * x[i,] for i in range(len(weights))))
+        model.solve()
+
+        assert [name for event, name in observer.events[:8]] == [f"x_{i}" for i in range(8)]
+        assert observer.events[8:11] == [("constraint", None), ("objective", None), ("started", None)]
+        assert observer.events[-1] == ("finished", SolutionStatus.OPTIMAL)
+        incumbents = [value for event, value in observer.events if event == "incumbent"]
+        if reports_incumbents:
+            assert incumbents and incumbents[-1] == approx(model.objective_value)
+        else:
+            assert not incumbents
+        assert solve_observer.solves == 1
+
+        model.remove_observer(observer)
+        model.solve()
+        assert observer.events[-1] == ("finished", SolutionStatus.OPTIMAL) and solve_observer.solves == 2
+        with raises(Exception):
+            model.remove_observer(observer)
+
+    @staticmethod
+    def bulk_assertions(engine_factory: Callable[[], Engine]):
+        class VariableObserver(ModelObserver):
+            def __init__(self):
+                self.variables = []
+
+            def on_variable_added(self, model, variable):
+                self.variables.append(variable.name)
+
+        model: Model = Model(engine=engine_factory(), collect_stats=True)
+        observer = VariableObserver()
+        model.add_observer(observer)
+        model.add_variable("z", ValueType.CONTINUOUS, 0, 10)
+
+        weights, values = [12, 7, 11, 8, 9, 6, 14, 5], [24, 13, 23, 15, 16, 11, 27, 9]
+        with model.bulk() as bulk_model:
+            assert bulk_model is model and not gc.isenabled()
+            with model.bulk():
+                model.add_constant("capacity", ValueType.INTEGER, 26)
+            for i in range(len(weights)):
+                model.add_variable_to_set("x", (i,), f"x_{i}", ValueType.BINARY)
+            x = model.term_sets["x"]
+            capacity = model.get_term_by_name("capacity")
+            model.add_constraint(Expression.sum(weights[i] * x[i,] for i in range(len(weights))) <= capacity)
+            model.set_objective(
+                OptimizationType.MAXIMIZE, Expression.sum(values[i] * x[i,] for i in range(len(weights)))
+            )
+        assert gc.isenabled()
+        assert observer.variables == ["z"]
+        assert model.get_term_by_name("x_3") is x[3,] and len(model.terms) == 10
+        assert model.stats().num_variables == 9 and model.stats().num_constants == 1
+        assert model.stats().variables_by_type["BINARY"] == 8 and model.stats().num_nonzeros == 8
+
+        model.solve()
+        assert model.solution_status == SolutionStatus.OPTIMAL
+        assert model.objective_value == approx(51)
+
+        model.add_variable("w", ValueType.CONTINUOUS)
+        assert observer.variables == ["z", "w"]
+
+        # Duplicates are reported when the bulk build ends.
+        with raises(Exception):
+            with model.bulk():
+                model.add_variable("y", ValueType.CONTINUOUS)
+                model.add_variable("z", ValueType.CONTINUOUS)
+        assert gc.isenabled()
+
+        duplicate_model: Model = Model(engine=engine_factory())
+        with raises(Exception):
+            with duplicate_model.bulk():
+                duplicate_model.add_variable_to_set("x", (1,), "x_1", ValueType.CONTINUOUS)
+                duplicate_model.add_variable_to_set("x", (1,), "x_2", ValueType.CONTINUOUS)
+
+    @staticmethod
+    def naming_assertions(engine_factory: Callable[[], Engine], tmp_path):
+        # Names are rendered from templates, or default to the set name and the indices
+        model: Model = Model(engine=engine_factory())
+        model.add_variable_to_set("x", (1, 2), NameTemplate("x_{i}_{j}"), ValueType.CONTINUOUS)
+        model.add_variable_to_set("y", (3,), None, ValueType.BINARY)
+        assert model.get_term_by_name("x_1_2") is model.term_sets["x"][1, 2]
+        assert model.get_term_by_name("y_3") is model.term_sets["y"][3,]
+        assert model.get_set_term_name("y", (3,)) == "y_3"
+        with raises(Exception):
+            model.add_variable_to_set("z", (1, 2), NameTemplate("x_{i}_{j}"), ValueType.CONTINUOUS)
+
+        # Anonymous models only name their set variables on demand
+        template: NameTemplate = NameTemplate("x_{i}_{j}")
+        anonymous_model: Model = Model(engine=engine_factory(), anonymous=True, collect_stats=True)
+        assert anonymous_model.anonymous and not model.anonymous
+        z = anonymous_model.add_variable("z", ValueType.CONTINUOUS, 0, 5)
+        for i in range(2):
+            for j in range(2):
+                anonymous_model.add_variable_to_set("x", (i, j), template, ValueType.CONTINUOUS, 0, 10)
+        with anonymous_model.bulk():
+            anonymous_model.add_variable_to_set("y", (0,), None, ValueType.INTEGER, 0, 3)
+        with raises(Exception):
+            anonymous_model.add_variable_to_set("x", (2, 2), "x_2_2", ValueType.CONTINUOUS)
+        with raises(ModelException):
+            anonymous_model.add_variable_to_set("x", (2, 2), NameTemplate("w_{i}_{j}"), ValueType.CONTINUOUS)
+        with raises(ModelException):
+            anonymous_model.add_variable_to_set("x", (2, 2), None, ValueType.CONTINUOUS)
+        anonymous_model.add_variable_to_set("x", (2, 2), NameTemplate("x_{i}_{j}"), ValueType.CONTINUOUS, 0, 0)
+        with raises(Exception):
+            anonymous_model.get_set_term_name("x", (5, 5))
+
+        x = anonymous_model.term_sets["x"]
+        y = anonymous_model.term_sets["y"]
+        assert list(anonymous_model.terms) == ["z"]
+        assert anonymous_model.get_set_term_name("x", (1, 0)) == "x_1_0"
+        assert anonymous_model.get_set_term_name("y", (0,)) == "y_0"
+        assert anonymous_model.stats().num_variables == 7 and anonymous_model.stats().name_bytes == 1
+
+        anonymous_model.add_constraint(Expression.sum(x.values()) + y[0,] <= 12)
+        anonymous_model.set_objective(OptimizationType.MAXIMIZE, Expression.sum(x.values()) + 2 * y[0,] + z)
+        anonymous_model.write(tmp_path / "anonymous.lp")
+        content: str = (tmp_path / "anonymous.lp").read_text()
+        assert all(name in content for name in ["x_0_0", "x_0_1", "x_1_0", "x_1_1", "y_0", " z"])
+
+        anonymous_model.solve()
+        assert anonymous_model.solution_status == SolutionStatus.OPTIMAL
+        assert anonymous_model.objective_value == approx(20)
+
+        # Exported models keep the rendered names
+        read_model: Model = Model.read(tmp_path / "anonymous.lp", engine=engine_factory())
+        assert read_model.get_term_by_name("x_1_1") is not None and read_model.get_term_by_name("y_0") is not None
+
+    @staticmethod
+    def index_set_assertions(engine: Engine):
+        # A shortest path from node 1 to node 4 over a sparse set of arcs
+        model: Model = Model(engine=engine)
+        arcs: IndexSet = IndexSet([(1, 2), (1, 3), (2, 3), (2, 4), (3, 4)])
+        costs = {(1, 2): 1, (1, 3): 4, (2, 3): 1, (2, 4): 5, (3, 4): 1}
+        x = model.add_variables_to_set("x", arcs, NameTemplate("x_{i}_{j}"), ValueType.BINARY)
+        assert len(x) == len(arcs) and model.get_term_by_name("x_2_3") is x[2, 3]
+        assert (1, 4) not in x
+
+        outgoing, incoming = arcs.group_by(0), arcs.group_by(1)
+        for node in range(1, 5):
+            balance = 1 if node == 1 else -1 if node == 4 else 0
+            flow_out = Expression.sum(x[arc] for arc in outgoing.get((node,), []))
+            flow_in = Expression.sum(x[arc] for arc in incoming.get((node,), []))
+            model.add_constraint(flow_out - flow_in == balance)
+        model.set_objective(
+            OptimizationType.MINIMIZE, Expression.sum(costs[arc] * term for arc, term in zip(arcs, arcs.select(x)))
+        )
+
+        model.solve()
+        assert model.solution_status == SolutionStatus.OPTIMAL
+        assert model.objective_value == approx(3)
+        assert [arc for arc in arcs if x[arc].value > 0.5] == [(1, 2), (2, 3), (3, 4)]
+
+        # Dense sets create every combination of their ranges
+        y = model.add_variables_to_set("y", IndexSet.dense(range(1, 3), 2), None, ValueType.CONTINUOUS, 0, 1)
+        assert list(y) == [(1, 0), (1, 1), (2, 0), (2, 1)] and model.get_term_by_name("y_2_1") is y[2, 1]
+
+    @staticmethod
+    def lazy_term_set_assertions(engine: Engine):
+        model: Model = Model(engine=engine, collect_stats=True)
+        x: LazyTermSet = model.add_lazy_variables_to_set(
+            "x", IndexSet.dense(10**6, 10**6), NameTemplate("x_{i}_{j}"), ValueType.CONTINUOUS, 0, 10
+        )
+        assert model.lazy_term_sets["x"] is x and x.domain.is_dense
+        assert x.materialized_count == 0 and len(x) == 0 and (1, 2) not in x
+        with raises(Exception):
+            model.add_lazy_variables_to_set("x", IndexSet.dense(2), None, ValueType.CONTINUOUS)
+
+        # Variables are created on first access only
+        model.add_constraint(x[1, 2] + x[3, 4] <= 15)
+        model.set_objective(OptimizationType.MAXIMIZE, x[1, 2] + 2 * x[3, 4] + x[5, 6])
+        assert x[1, 2] is model.term_sets["x"][1, 2] and model.get_term_by_name("x_3_4") is x[3, 4]
+        assert x.materialized_count == 3 and list(x) == [(1, 2), (3, 4), (5, 6)]
+        assert model.stats().num_variables == 3
+        with raises(KeyError):
+            x[10**6, 0]
+
+        # Read-only lookups do not create variables
+        assert x.get((9, 9)) is None and x.get((9, 9), 0) == 0 and x.materialized_count == 3
+
+        # Frozen sets do not create variables
+        x.freeze()
+        assert x.frozen
+        with raises(Exception):
+            x[7, 8]
+        assert x.get((1, 2)) is model.term_sets["x"][1, 2]
+
+        model.solve()
+        assert model.solution_status == SolutionStatus.OPTIMAL
+        assert model.objective_value == approx(35)
+        assert x.materialized_count == 3
+
+        x.unfreeze()
+        assert x[7, 8] is not None and x.materialized_count == 4
+
+    @staticmethod
+    def scenario_assertions(engine_factory: Callable[[], Engine]):
+        model: Model = Model(engine=engine_factory(), name="base model")
+        model.add_constant("capacity", ValueType.INTEGER, 4)
+        model.add_constant_to_set("c", (1,), "c_1", ValueType.CONTINUOUS, 3)
+        model.add_variable_to_set("v", (1,), "x", ValueType.CONTINUOUS, 0, 3)
+        x = model.term_sets["v"][1,]
+        y = model.add_variable("y", ValueType.CONTINUOUS, 0, inf)
+        model.add_constraint(x + y <= model.get_term_by_name("capacity"))
+        model.add_constraint(x + 3 * y <= 6)
+        model.set_objective(OptimizationType.MAXIMIZE, model.term_sets["c"][1,] * x + 2 * y)
+
+        # Clones are independent copies on new engines
+        clone: Model = model.clone()
+        assert clone is not model and clone.name == "base model"
+        assert type(clone._engine) is type(model._engine)
+        assert clone.get_term_by_name("capacity").value == 4 and clone.term_sets["c"][1,].value == 3
+        assert clone.term_sets["v"][1,].name == "x" and clone.get_term_by_name("y") is not None
+        clone.solve()
+        assert clone.objective_value == approx(11)
+        assert model.solution_status == SolutionStatus.NOT_SOLVED
+        assert model.clone(engine=engine_factory(), name="copy").name == "copy"
+
+        # Scenarios only record their changes on top of a shared base
+        base: Scenario = model.scenario()
+        assert base.name == "base model" and base.num_changes == 0
+        relaxed: Scenario = base.fork(name="relaxed").set_variable_bounds("x", upper_bound=4)
+        shifted: Scenario = relaxed.fork(name="shifted").set_coefficient(0, "y", 2).set_objective_coefficient("y", 10)
+        tightened: Scenario = shifted.fork(name="tightened").set_constraint_bounds(1, upper_bound=3)
+        assert relaxed.base is base.base is tightened.base
+        assert (relaxed.num_changes, shifted.num_changes, tightened.num_changes) == (1, 3, 4)
+        with raises(Exception):
+            base.set_variable_bounds("z", 0, 1)
+        with raises(Exception):
+            base.set_constraint_bounds(2, 0, 1)
+
+        expected = {"base model": 11, "relaxed": 12, "shifted": 20, "tightened": 10}
+        for scenario in [base, relaxed, shifted, tightened]:
+            scenario_model: Model = Model.from_scenario(scenario=scenario, engine=engine_factory())
+            assert scenario_model.name == scenario.name
+            scenario_model.solve()
+            assert scenario_model.solution_status == SolutionStatus.OPTIMAL
+            assert scenario_model.objective_value == approx(expected[scenario.name])
+        assert list(base.base.column_upper_bounds) == [3, inf] and base.to_record().row_values == base.base.row_values
+
+    @staticmethod
+    def variable_bounds_assertions(engine: Engine):
+        model: Model = Model(engine=engine)
+        x = model.add_variable("x", ValueType.INTEGER, 0, 10)
+        y = model.add_variable("y", ValueType.CONTINUOUS, 0, 5)
+        model.add_constraint(x + y <= 12)
+        model.set_objective(OptimizationType.MAXIMIZE, 2 * x + y)
+        model.solve()
+        assert model.objective_value == approx(22)
+
+        # Bounds are changed in place, and the model can be warm-started and solved again
+        model.set_variable_bounds(x, 2, 4)
+        model.set_variable_bounds(y, 1, inf)
+        assert x.lower_bound == approx(2) and x.upper_bound == approx(4) and y.upper_bound >= 1e20
+        model.set_start_values([x, y], [4, 8])
+        model.solve()
+        assert model.objective_value == approx(16)
+        assert model.get_values([x, y]) == approx([4, 8])
+
+        with raises(ModelException):
+            model.set_variable_bounds(x, 3, 2)
+        with raises(ModelException):
+            model.set_start_values([x, y], [1])
+
+    def reduced_costs_assertions(engine: Engine):
+        model: Model = Model(engine=engine)
+        parameter = model.add_variable("parameter", ValueType.CONTINUOUS, 3, 3)
+        y = model.add_variable("y", ValueType.CONTINUOUS, 0, inf)
+        model.add_constraint(y + 2 * parameter >= 10)
+        model.set_objective(OptimizationType.MINIMIZE, 5 * y)
+        model.solve()
+
+        # The reduced cost of a fixed variable is the rate of change of the objective value with its value
+        assert model.objective_value == approx(20)
+        assert model.get_reduced_costs([parameter, y]) == approx([-10, 0])
+
+    def column_assertions(engine: Engine):
+        model: Model = Model(engine=engine, collect_stats=True)
+        x = model.add_variable("x", ValueType.CONTINUOUS, 0, inf)
+        model.add_constraint(x >= 2)
+        model.add_constraint(x <= 10)
+        model.set_objective(OptimizationType.MINIMIZE, 3 * x)
+        model.solve()
+        assert model.objective_value == approx(6)
+        assert model.get_dual_values() == approx([3, 0])
+
+        # A column joins the existing constraints and the objective, replacing the more expensive variable
+        y = model.add_column("y", ValueType.CONTINUOUS, 0, inf, 1, [0], [2])
+        assert model.get_term_by_name("y") is y and model.stats().num_variables == 2
+        model.solve()
+        assert model.objective_value == approx(1)
+        assert model.get_values([x, y]) == approx([0, 1])
+        assert model.get_dual_values() == approx([0.5, 0])
+
+        with raises(ModelException):
+            model.add_column("y", ValueType.CONTINUOUS, 0, inf, 1, [0], [2])
+        with raises(ModelException):
+            model.add_column("z", ValueType.CONTINUOUS, 0, inf, 1, [0, 1], [2])
+
+    @staticmethod
+    def lazy_constraints_assertions(engine: Engine, native: bool):
+        model: Model = Model(engine=engine)
+        x = model.add_variable("x", ValueType.INTEGER, 0, 10)
+        y = model.add_variable("y", ValueType.INTEGER, 0, 10)
+        model.add_constraint(x + y <= 8)
+        model.set_objective(OptimizationType.MAXIMIZE, 3 * x + 2 * y)
+
+        def separator(get_values: Callable[[List[Term]], List[float]]) -> List[Element]:
+            x_value, y_value = get_values([x, y])
+            cuts: List[Element] = []
+            if x_value > 5 + 1e-6:
+                cuts.append(x <= 5)
+            if 2 * x_value + y_value > 12 + 1e-6:
+                cuts.append(2 * x + y <= 12)
+            return cuts
+
+        # Without the lazy constraints, the optimal solution is x = 8, y = 0
+        report = model.solve_with_lazy_constraints(separator=separator)
+        assert report.native is native and report.converged
+        assert report.status == model.solution_status == SolutionStatus.OPTIMAL
+        assert report.num_cuts > 0 and report.num_rounds == len(report.rounds) > 0
+        assert report.wall_time >= sum(lazy_round.wall_time for lazy_round in report.rounds)
+        assert model.objective_value == approx(20)
+        assert model.get_values([x, y]) == approx([4, 4])
+
+        # Native lazy constraints are kept by the solver only, while re-solves add them to the model
+        assert len(model.constraints) == (1 if native else 1 + report.num_cuts)
+        with raises(ModelException):
+            model.solve_with_lazy_constraints(separator=separator, max_rounds=0)
+
+        # When the round limit is reached, the model is solved once more with the constraints of the last round
+        # (the separator reads the new x and y)
+        if not native:
+            limited: Model = Model(engine=type(engine)())
+            x = limited.add_variable("x", ValueType.INTEGER, 0, 10)
+            y = limited.add_variable("y", ValueType.INTEGER, 0, 10)
+            limited.add_constraint(x + y <= 8)
+            limited.set_objective(OptimizationType.MAXIMIZE, 3 * x + 2 * y)
+            report = limited.solve_with_lazy_constraints(separator=separator, max_rounds=1)
+            assert not report.converged and report.num_rounds == 1 and report.num_cuts == 2
+            assert limited.solution_status == SolutionStatus.OPTIMAL and limited.objective_value == approx(20)
+            assert limited.get_values([x, y]) == approx([4, 4])
+
+    def solve_cache_assertions(engine_factory: Callable[[], Engine], tmp_path):
+        def build(cache: SolveCache, capacity: int = 10) -> Model:
+            model: Model = Model(engine=engine_factory(), solve_cache=cache)
+            x = model.add_variable("x", ValueType.INTEGER, 0, 8)
+            model.add_variables_to_set("y", [(1,), (2,)], None, ValueType.CONTINUOUS, 0, 5)
+            y = model.term_sets["y"]
+            model.add_constraint(x + y[1,] + y[2,] <= capacity)
+            model.set_objective(OptimizationType.MAXIMIZE, 3 * x + y[1,] + 2 * y[2,])
+            return model
+
+        assert Model(engine=engine_factory()).fingerprint is None
+        cache: SolveCache = SolveCache(path=tmp_path / "cache")
+        first: Model = build(cache=cache)
+        assert first.solve_cache is cache and first.solution is None
+        first.solve()
+        assert first.solution_status == SolutionStatus.OPTIMAL and first.objective_value == approx(28)
+        assert first.solution is not None and cache.misses == 1
+
+        # An identical model is answered by the cache, without solving it
+        second: Model = build(cache=cache)
+        assert second.fingerprint == first.fingerprint != build(cache=cache, capacity=9).fingerprint
+        second.solve()
+        assert cache.hits == 1 and second._engine.solution_status == SolutionStatus.NOT_SOLVED
+        assert second.solution_status == SolutionStatus.OPTIMAL and second.objective_value == approx(28)
+        assert second.get_values([second.get_term_by_name("x"), *second.term_sets["y"].values()]) == approx([8, 0, 2])
+
+        # The solution printed is the cached one, since the variables of the engine have no values
+        with redirect_stdout(StringIO()) as output:
+            second.print_solution()
+        assert "Terms:" in output.getvalue() and "(N/A)" not in output.getvalue()
+
+        # The on-disk store survives the cache instance, and modified models are solved again
+        third: Model = build(cache=SolveCache(path=tmp_path / "cache"))
+        third.solve()
+        assert third.solve_cache.hits == 1 and third.objective_value == approx(28)
+        third.add_constraint(third.get_term_by_name("x") <= 6)
+        assert third.solution is None
+        third.solve()
+        assert third.solve_cache.misses == 1 and third.objective_value == approx(26)
+
+    @staticmethod
+    def nonlinear_solve_cache_assertions(engine_factory: Callable[[], Engine]):
+        def solve(cache: SolveCache, coefficient: float) -> Model:
+            model: Model = Model(engine=engine_factory(), solve_cache=cache)
+            x = model.add_variable("x", ValueType.CONTINUOUS, 0, 10)
+            y = model.add_variable("y", ValueType.CONTINUOUS, 0, 10)
+            model.add_constraint(coefficient * x * x + y * y <= 4)
+            model.set_objective(OptimizationType.MAXIMIZE, x)
+            model.solve()
+            return model
+
+        # Models with constraints that have no linear decomposition are always solved, since solvers print their
+        # coefficients rounded and near-equal models would otherwise share a fingerprint
+        cache: SolveCache = SolveCache()
+        first: Model = solve(cache=cache, coefficient=1.0001)
+        second: Model = solve(cache=cache, coefficient=1.0004)
+        assert cache.hits == 0 and first.solution is None and second.solution is None
+        assert first.objective_value == approx(2 / 1.0001**0.5, rel=1e-4)
+        assert second.objective_value == approx(2 / 1.0004**0.5, rel=1e-4)
+
+    @staticmethod
+    def presolve_assertions(engine_factory: Callable[[], Engine]):
+        engine: Engine = engine_factory()
+        model: Model = Model(engine=engine, name="presolve model")
+        x = model.add_variable("x", ValueType.CONTINUOUS, 2, 2)
+        for i in range(1, 4):
+            model.add_variable_to_set("y", (i,), f"y_{i}", ValueType.INTEGER, 0, inf)
+        y = model.term_sets["y"]
+        model.add_constraint(3 * x == 6)
+        model.add_constraint(x + y[1,] + y[2,] <= 10)
+        model.add_constraint(2 * y[1,] + 2 * y[2,] <= 20)
+        model.add_constraint(2 * y[3,] <= 5)
+        model.set_objective(OptimizationType.MAXIMIZE, x + y[1,] + 2 * y[2,] + y[3,])
+
+        with raises(Exception):
+            model.presolve(engine=engine)
+
+        presolved_model: Model = model.presolve(engine=engine_factory())
+        assert presolved_model.name == "presolve model" and model.postsolve_map is None
+        assert presolved_model.postsolve_map.is_removed(0)
+        assert presolved_model.postsolve_map.stats["duplicate_rows"] == 1
+        assert presolved_model.get_term_by_name("x").term_type == TermType.CONSTANT
+        assert presolved_model.get_term_by_name("x").value == 2
+        assert presolved_model.term_sets["y"][3,].upper_bound == 2
+        assert len(presolved_model.constraints) == 1
+
+        presolved_model.solve()
+        assert presolved_model.solution_status == SolutionStatus.OPTIMAL
+        assert presolved_model.objective_value == approx(20)
+        assert presolved_model.term_sets["y"][2,].value == approx(8)
+
     class TestModelWithCplex:
         def test_model_name(self):
             TestModel.name_assertions(engine=EngineFixtures.get_cplex_engine())
@@ -336,6 +1120,9 @@ class TestModel:
         def test_variable_term_sets(self):
             TestModel.variable_term_sets_assertions(engine=EngineFixtures.get_cplex_engine())
 
+        def test_constant_arrays(self):
+            TestModel.constant_arrays_assertions(engine=EngineFixtures.get_cplex_engine())
+
         def test_constraints(self):
             TestModel.constraint_assertions(engine=EngineFixtures.get_cplex_engine())
 
@@ -351,6 +1138,68 @@ class TestModel:
         def test_infeasible_resolution(self):
             TestModel.infeasible_resolution_assertions(engine=EngineFixtures.get_cplex_engine())
 
+        def test_write(self, tmp_path):
+            TestModel.write_assertions(engine=EngineFixtures.get_cplex_engine(), tmp_path=tmp_path)
+
+        def test_read(self, tmp_path):
+            TestModel.read_assertions(engine_factory=EngineFixtures.get_cplex_engine, tmp_path=tmp_path)
+
+        def test_ranged_rows(self, tmp_path):
+            TestModel.ranged_rows_assertions(
+                engine_factory=EngineFixtures.get_cplex_engine, tmp_path=tmp_path, num_constraints=3
+            )
+
+        def test_snapshot(self, tmp_path):
+            TestModel.snapshot_assertions(engine_factory=EngineFixtures.get_cplex_engine, tmp_path=tmp_path)
+
+        def test_presolve(self):
+            TestModel.presolve_assertions(engine_factory=EngineFixtures.get_cplex_engine)
+
+        def test_constraint_index(self):
+            TestModel.constraint_index_assertions(engine=EngineFixtures.get_cplex_engine())
+
+        def test_stats(self):
+            TestModel.stats_assertions(engine=EngineFixtures.get_cplex_engine())
+
+        def test_profiler(self):
+            TestModel.profiler_assertions(engine_factory=EngineFixtures.get_cplex_engine)
+
+        def test_observers(self):
+            TestModel.observer_assertions(engine=EngineFixtures.get_cplex_engine(), reports_incumbents=True)
+
+        def test_bulk(self):
+            TestModel.bulk_assertions(engine_factory=EngineFixtures.get_cplex_engine)
+
+        def test_naming(self, tmp_path):
+            TestModel.naming_assertions(engine_factory=EngineFixtures.get_cplex_engine, tmp_path=tmp_path)
+
+        def test_index_sets(self):
+            TestModel.index_set_assertions(engine=EngineFixtures.get_cplex_engine())
+
+        def test_lazy_term_sets(self):
+            TestModel.lazy_term_set_assertions(engine=EngineFixtures.get_cplex_engine())
+
+        def test_scenarios(self):
+            TestModel.scenario_assertions(engine_factory=EngineFixtures.get_cplex_engine)
+
+        def test_solve_cache(self, tmp_path):
+            TestModel.solve_cache_assertions(engine_factory=EngineFixtures.get_cplex_engine, tmp_path=tmp_path)
+
+        def test_nonlinear_solve_cache(self):
+            TestModel.nonlinear_solve_cache_assertions(engine_factory=EngineFixtures.get_cplex_engine)
+
+        def test_variable_bounds(self):
+            TestModel.variable_bounds_assertions(engine=EngineFixtures.get_cplex_engine())
+
+        def test_reduced_costs(self):
+            TestModel.reduced_costs_assertions(engine=EngineFixtures.get_cplex_engine())
+
+        def test_columns(self):
+            TestModel.column_assertions(engine=EngineFixtures.get_cplex_engine())
+
+        def test_lazy_constraints(self):
+            TestModel.lazy_constraints_assertions(engine=EngineFixtures.get_cplex_engine(), native=True)
+
     class TestModelWithGurobi:
         def test_model_name(self):
             TestModel.name_assertions(engine=EngineFixtures.get_gurobi_engine())
@@ -370,6 +1219,9 @@ class TestModel:
         def test_variable_term_sets(self):
             TestModel.variable_term_sets_assertions(engine=EngineFixtures.get_gurobi_engine())
 
+        def test_constant_arrays(self):
+            TestModel.constant_arrays_assertions(engine=EngineFixtures.get_gurobi_engine())
+
         def test_constraints(self):
             TestModel.constraint_assertions(engine=EngineFixtures.get_gurobi_engine())
 
@@ -389,6 +1241,68 @@ class TestModel:
         def test_infeasible_resolution(self):
             TestModel.infeasible_resolution_assertions(engine=EngineFixtures.get_gurobi_engine())
 
+        def test_write(self, tmp_path):
+            TestModel.write_assertions(engine=EngineFixtures.get_gurobi_engine(), tmp_path=tmp_path)
+
+        def test_read(self, tmp_path):
+            TestModel.read_assertions(engine_factory=EngineFixtures.get_gurobi_engine, tmp_path=tmp_path)
+
+        def test_ranged_rows(self, tmp_path):
+            TestModel.ranged_rows_assertions(
+                engine_factory=EngineFixtures.get_gurobi_engine, tmp_path=tmp_path, num_constraints=4
+            )
+
+        def test_snapshot(self, tmp_path):
+            TestModel.snapshot_assertions(engine_factory=EngineFixtures.get_gurobi_engine, tmp_path=tmp_path)
+
+        def test_presolve(self):
+            TestModel.presolve_assertions(engine_factory=EngineFixtures.get_gurobi_engine)
+
+        def test_constraint_index(self):
+            TestModel.constraint_index_assertions(engine=EngineFixtures.get_gurobi_engine())
+
+        def test_stats(self):
+            TestModel.stats_assertions(engine=EngineFixtures.get_gurobi_engine())
+
+        def test_profiler(self):
+            TestModel.profiler_assertions(engine_factory=EngineFixtures.get_gurobi_engine)
+
+        def test_observers(self):
+            TestModel.observer_assertions(engine=EngineFixtures.get_gurobi_engine(), reports_incumbents=True)
+
+        def test_bulk(self):
+            TestModel.bulk_assertions(engine_factory=EngineFixtures.get_gurobi_engine)
+
+        def test_naming(self, tmp_path):
+            TestModel.naming_assertions(engine_factory=EngineFixtures.get_gurobi_engine, tmp_path=tmp_path)
+
+        def test_index_sets(self):
+            TestModel.index_set_assertions(engine=EngineFixtures.get_gurobi_engine())
+
+        def test_lazy_term_sets(self):
+            TestModel.lazy_term_set_assertions(engine=EngineFixtures.get_gurobi_engine())
+
+        def test_scenarios(self):
+            TestModel.scenario_assertions(engine_factory=EngineFixtures.get_gurobi_engine)
+
+        def test_solve_cache(self, tmp_path):
+            TestModel.solve_cache_assertions(engine_factory=EngineFixtures.get_gurobi_engine, tmp_path=tmp_path)
+
+        def test_nonlinear_solve_cache(self):
+            TestModel.nonlinear_solve_cache_assertions(engine_factory=EngineFixtures.get_gurobi_engine)
+
+        def test_variable_bounds(self):
+            TestModel.variable_bounds_assertions(engine=EngineFixtures.get_gurobi_engine())
+
+        def test_reduced_costs(self):
+            TestModel.reduced_costs_assertions(engine=EngineFixtures.get_gurobi_engine())
+
+        def test_columns(self):
+            TestModel.column_assertions(engine=EngineFixtures.get_gurobi_engine())
+
+        def test_lazy_constraints(self):
+            TestModel.lazy_constraints_assertions(engine=EngineFixtures.get_gurobi_engine(), native=True)
+
     class TestModelWithORTools:
         def test_model_name(self):
             TestModel.name_assertions(engine=EngineFixtures.get_or_tools_engine())
@@ -408,6 +1322,9 @@ class TestModel:
         def test_variable_term_sets(self):
             TestModel.variable_term_sets_assertions(engine=EngineFixtures.get_or_tools_engine())
 
+        def test_constant_arrays(self):
+            TestModel.constant_arrays_assertions(engine=EngineFixtures.get_or_tools_engine())
+
         def test_constraints(self):
             TestModel.constraint_assertions(engine=EngineFixtures.get_or_tools_engine())
 
@@ -427,6 +1344,65 @@ class TestModel:
         def test_infeasible_resolution(self):
             TestModel.infeasible_resolution_assertions(engine=EngineFixtures.get_or_tools_engine())
 
+        def test_write(self, tmp_path):
+            TestModel.write_assertions(engine=EngineFixtures.get_or_tools_engine(), tmp_path=tmp_path)
+
+        def test_read(self, tmp_path):
+            TestModel.read_assertions(engine_factory=EngineFixtures.get_or_tools_engine, tmp_path=tmp_path)
+
+        def test_ranged_rows(self, tmp_path):
+            TestModel.ranged_rows_assertions(
+                engine_factory=EngineFixtures.get_or_tools_engine, tmp_path=tmp_path, num_constraints=3
+            )
+
+        def test_snapshot(self, tmp_path):
+            TestModel.snapshot_assertions(engine_factory=EngineFixtures.get_or_tools_engine, tmp_path=tmp_path)
+
+        def test_presolve(self):
+            TestModel.presolve_assertions(engine_factory=EngineFixtures.get_or_tools_engine)
+
+        def test_constraint_index(self):
+            TestModel.constraint_index_assertions(engine=EngineFixtures.get_or_tools_engine())
+
+        def test_stats(self):
+            TestModel.stats_assertions(engine=EngineFixtures.get_or_tools_engine())
+
+        def test_profiler(self):
+            TestModel.profiler_assertions(engine_factory=EngineFixtures.get_or_tools_engine)
+
+        def test_observers(self):
+            TestModel.observer_assertions(engine=EngineFixtures.get_or_tools_engine(), reports_incumbents=False)
+
+        def test_bulk(self):
+            TestModel.bulk_assertions(engine_factory=EngineFixtures.get_or_tools_engine)
+
+        def test_naming(self, tmp_path):
+            TestModel.naming_assertions(engine_factory=EngineFixtures.get_or_tools_engine, tmp_path=tmp_path)
+
+        def test_index_sets(self):
+            TestModel.index_set_assertions(engine=EngineFixtures.get_or_tools_engine())
+
+        def test_lazy_term_sets(self):
+            TestModel.lazy_term_set_assertions(engine=EngineFixtures.get_or_tools_engine())
+
+        def test_scenarios(self):
+            TestModel.scenario_assertions(engine_factory=EngineFixtures.get_or_tools_engine)
+
+        def test_solve_cache(self, tmp_path):
+            TestModel.solve_cache_assertions(engine_factory=EngineFixtures.get_or_tools_engine, tmp_path=tmp_path)
+
+        def test_variable_bounds(self):
+            TestModel.variable_bounds_assertions(engine=EngineFixtures.get_or_tools_engine())
+
+        def test_reduced_costs(self):
+            TestModel.reduced_costs_assertions(engine=ORToolsEngine.from_option("GLOP"))
+
+        def test_columns(self):
+            TestModel.column_assertions(engine=ORToolsEngine.from_option("GLOP"))
+
+        def test_lazy_constraints(self):
+            TestModel.lazy_constraints_assertions(engine=EngineFixtures.get_or_tools_engine(), native=False)
+
     class TestModelWithPuLP:
         def test_model_name(self):
             TestModel.name_assertions(engine=EngineFixtures.get_pulp_engine())
@@ -446,6 +1422,9 @@ class TestModel:
         def test_variable_term_sets(self):
             TestModel.variable_term_sets_assertions(engine=EngineFixtures.get_pulp_engine())
 
+        def test_constant_arrays(self):
+            TestModel.constant_arrays_assertions(engine=EngineFixtures.get_pulp_engine())
+
         def test_constraints(self):
             TestModel.constraint_assertions(engine=EngineFixtures.get_pulp_engine())
 
@@ -460,3 +1439,62 @@ class TestModel:
 
         def test_infeasible_resolution(self):
             TestModel.infeasible_resolution_assertions(engine=EngineFixtures.get_pulp_engine())
+
+        def test_write(self, tmp_path):
+            TestModel.write_assertions(engine=EngineFixtures.get_pulp_engine(), tmp_path=tmp_path)
+
+        def test_read(self, tmp_path):
+            TestModel.read_assertions(engine_factory=EngineFixtures.get_pulp_engine, tmp_path=tmp_path)
+
+        def test_ranged_rows(self, tmp_path):
+            TestModel.ranged_rows_assertions(
+                engine_factory=EngineFixtures.get_pulp_engine, tmp_path=tmp_path, num_constraints=4
+            )
+
+        def test_snapshot(self, tmp_path):
+            TestModel.snapshot_assertions(engine_factory=EngineFixtures.get_pulp_engine, tmp_path=tmp_path)
+
+        def test_presolve(self):
+            TestModel.presolve_assertions(engine_factory=EngineFixtures.get_pulp_engine)
+
+        def test_constraint_index(self):
+            TestModel.constraint_index_assertions(engine=EngineFixtures.get_pulp_engine())
+
+        def test_stats(self):
+            TestModel.stats_assertions(engine=EngineFixtures.get_pulp_engine())
+
+        def test_profiler(self):
+            TestModel.profiler_assertions(engine_factory=EngineFixtures.get_pulp_engine)
+
+        def test_observers(self):
+            TestModel.observer_assertions(engine=EngineFixtures.get_pulp_engine(), reports_incumbents=False)
+
+        def test_bulk(self):
+            TestModel.bulk_assertions(engine_factory=EngineFixtures.get_pulp_engine)
+
+        def test_naming(self, tmp_path):
+            TestModel.naming_assertions(engine_factory=EngineFixtures.get_pulp_engine, tmp_path=tmp_path)
+
+        def test_index_sets(self):
+            TestModel.index_set_assertions(engine=EngineFixtures.get_pulp_engine())
+
+        def test_lazy_term_sets(self):
+            TestModel.lazy_term_set_assertions(engine=EngineFixtures.get_pulp_engine())
+
+        def test_scenarios(self):
+            TestModel.scenario_assertions(engine_factory=EngineFixtures.get_pulp_engine)
+
+        def test_solve_cache(self, tmp_path):
+            TestModel.solve_cache_assertions(engine_factory=EngineFixtures.get_pulp_engine, tmp_path=tmp_path)
+
+        def test_variable_bounds(self):
+            TestModel.variable_bounds_assertions(engine=EngineFixtures.get_pulp_engine())
+
+        def test_reduced_costs(self):
+            TestModel.reduced_costs_assertions(engine=EngineFixtures.get_pulp_engine())
+
+        def test_columns(self):
+            TestModel.column_assertions(engine=EngineFixtures.get_pulp_engine())
+
+        def test_lazy_constraints(self):
+            TestModel.lazy_constraints_assertions(engine=EngineFixtures.get_pulp_engine(), native=False)
@@ -0,0 +1,126 @@
+from array import array
+from math import inf
+
+from pytest import approx, raises
+
+from pyorlib.enums import OptimizationType, ValueType
+from pyorlib.exceptions import PresolveException
+from pyorlib.io import ModelRecord
+from pyorlib.presolve import PostsolveMap, Presolver
+
+
+class TestPresolver:
+
+    @staticmethod
+    def build_record(columns, rows, objective=None) -> ModelRecord:
+        """
+        Builds a record from (name, type, lower bound, upper bound) columns and (entries, lower, upper) rows.
+        """
+        record = ModelRecord(name="model", opt_type=OptimizationType.MAXIMIZE)
+        for name, value_type, lower_bound, upper_bound in columns:
+            record.column_names.append(name)
+            record.column_types.append(value_type)
+            record.column_lower_bounds.append(lower_bound)
+            record.column_upper_bounds.append(upper_bound)
+        record.objective = array("d", objective or [0.0] * len(columns))
+        for entries, lower_bound, upper_bound in rows:
+            for column, coefficient in entries:
+                record.row_columns.append(column)
+                record.row_values.append(coefficient)
+            record.row_starts.append(len(record.row_columns))
+            record.row_lower_bounds.append(lower_bound)
+            record.row_upper_bounds.append(upper_bound)
+        return record
+
+    def test_fixed_columns_and_small_rows(self):
+        record = self.build_record(
+            columns=[
+                ("x", ValueType.CONTINUOUS, 2, 2),
+                ("y", ValueType.INTEGER, 0, inf),
+                ("z", ValueType.CONTINUOUS, 0, inf),
+            ],
+            rows=[
+                ([(0, 1), (1, 2), (2, 1)], -inf, 20),
+                ([(0, 3)], 6, 6),
+                ([(0, 1), (1, -2)], -inf, 1.5),
+            ],
+            objective=[3, 1, 1],
+        )
+
+        reduced, postsolve_map = Presolver(tighten_bounds=False).presolve(record=record)
+        assert postsolve_map.is_removed(0) and list(postsolve_map.column_map) == [-1, 0, 1]
+        assert reduced.objective_constant == 6 and list(reduced.objective) == [0, 1, 1]
+        assert postsolve_map.stats["fixed_columns"] == 1
+        assert postsolve_map.stats["empty_rows"] == 1 and postsolve_map.stats["singleton_rows"] == 1
+
+        # The singleton row -2 y <= -0.5 becomes the bound y >= 1 after rounding
+        assert reduced.column_lower_bounds[1] == 1
+        assert reduced.num_rows == 1
+        columns, values, lower_bound, upper_bound = reduced.row(0)
+        assert list(columns) == [1, 2] and list(values) == [2, 1] and upper_bound == 18
+
+        assert postsolve_map.postsolve([4, 5]) == [2, 4, 5]
+        with raises(PresolveException):
+            postsolve_map.postsolve([1])
+
+        # The original record is left untouched
+        assert record.num_rows == 3 and record.column_lower_bounds[1] == 0
+
+    def test_duplicate_rows(self):
+        record = self.build_record(
+            columns=[("x", ValueType.CONTINUOUS, 0, inf), ("y", ValueType.CONTINUOUS, 0, inf)],
+            rows=[
+                ([(0, 1), (1, 1)], -inf, 10),
+                ([(1, 2), (0, 2)], -inf, 16),
+                ([(0, -1), (1, -1)], -inf, -2),
+                ([(0, 1), (1, 2)], -inf, 10),
+            ],
+        )
+
+        reduced, postsolve_map = Presolver(tighten_bounds=False).presolve(record=record)
+        assert postsolve_map.stats["duplicate_rows"] == 2 and reduced.num_rows == 2
+        assert reduced.row(0)[2:] == (2, 8)
+        assert reduced.row(1)[2:] == (-inf, 10)
+
+    def test_bound_tightening(self):
+        record = self.build_record(
+            columns=[
+                ("x", ValueType.INTEGER, 0, inf),
+                ("y", ValueType.CONTINUOUS, 1, 3),
+                ("b", ValueType.BINARY, 0, 1),
+            ],
+            rows=[
+                ([(0, 2), (1, 1)], -inf, 10),
+                ([(1, 1), (2, 4)], 5, inf),
+                ([(0, 1), (1, 1)], -inf, 100),
+            ],
+        )
+
+        reduced, postsolve_map = Presolver().presolve(record=record)
+        # 2 x <= 10 - 1 gives x <= 4, and 4 b >= 5 - 3 fixes b at 1
+        assert reduced.column_upper_bounds[0] == 4
+        assert postsolve_map.is_removed(2) and postsolve_map.fixed_values[2] == 1
+        assert postsolve_map.stats["redundant_rows"] >= 1
+        assert all(upper_bound != 100 for _, _, _, upper_bound in reduced.iter_rows())
+
+    def test_infeasibilities(self):
+        for rows in [
+            [([(0, 1), (1, 1)], 10, inf)],
+            [([(0, 1), (1, 0)], -inf, -1)],
+            [([(0, 1), (1, 1)], -inf, 1), ([(0, 2), (1, 2)], 4, inf)],
+        ]:
+            record = self.build_record(
+                columns=[("x", ValueType.CONTINUOUS, 0, 2), ("y", ValueType.CONTINUOUS, 0, 2)], rows=rows
+            )
+            with raises(PresolveException):
+                Presolver().presolve(record=record)
+
+        with raises(PresolveException):
+            Presolver(max_passes=0)
+        with raises(PresolveException):
+            Presolver(tolerance=-1)
+
+    def test_postsolve_map(self):
+        postsolve_map = PostsolveMap(column_map=array("q", [0, -1, 1]), fixed_values=array("d", [0, 7.5, 0]))
+        assert postsolve_map.num_columns == 3 and postsolve_map.num_removed_columns == 1
+        assert postsolve_map.postsolve([1, 2]) == [1, approx(7.5), 2]
@@ -0,0 +1,39 @@
+import json
+
+from pytest import raises
+
+from pyorlib.profiling import ProfileSpan, Profiler
+
+
+class TestProfiler:
+
+    def test_record_and_report(self):
+        spans = []
+        profiler = Profiler(sink=spans.append)
+        profiler.record(engine="A", phase="engine.solve", start=1.0, end=3.5, cpu_time=2.0)
+        profiler.record(engine="A", phase="engine.solve", start=4.0, end=4.5, cpu_time=0.25)
+        profiler.record(engine="B", phase="model.add_constraint", start=0.0, end=0.125, cpu_time=0.125)
+
+        assert profiler.report() == {
+            "A": {"engine.solve": {"calls": 2, "wall_time": 3.0, "cpu_time": 2.25}},
+            "B": {"model.add_constraint": {"calls": 1, "wall_time": 0.125, "cpu_time": 0.125}},
+        }
+        assert json.loads(profiler.to_json(indent=2)) == profiler.report()
+
+        assert profiler.sink is not None and len(spans) == 3
+        assert spans[0] == ProfileSpan(engine="A", phase="engine.solve", start=1.0, end=3.5, cpu_time=2.0)
+        assert spans[1].wall_time == 0.5
+
+        profiler.reset()
+        assert profiler.report() == {}
+
+    def test_measure(self):
+        profiler = Profiler()
+        with profiler.measure(engine="A", phase="extraction"):
+            sum(range(1000))
+        with raises(ValueError):
+            with profiler.measure(engine="A", phase="extraction"):
+                raise ValueError()
+
+        phase = profiler.report()["A"]["extraction"]
+        assert phase["calls"] == 2 and phase["wall_time"] >= 0 and phase["cpu_time"] >= 0
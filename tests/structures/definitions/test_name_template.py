@@ -0,0 +1,35 @@
+from pytest import raises
+
+from pyorlib.structures import NameTemplate
+
+
+class TestNameTemplate:
+
+    def test_render(self):
+        template: NameTemplate = NameTemplate("x_{i}_{j}")
+        assert template.template == "x_{i}_{j}" and template.num_fields == 2
+        assert template(1, 2) == "x_1_2"
+        assert template.render((3, 4)) == "x_3_4"
+
+    def test_fields(self):
+        # Fields with the same name share an index, and empty fields take the next one
+        assert NameTemplate("y_{i}_{j}_{i}").render((1, 2)) == "y_1_2_1"
+        assert NameTemplate("z_{}_{}").render((5, 6)) == "z_5_6"
+        assert NameTemplate("w_{i:03d}").render((7,)) == "w_007"
+        assert NameTemplate("{{v}}_{i}").render((8,)) == "{v}_8"
+
+        # Numbered fields are filled with the index at their position
+        assert NameTemplate("x_{1}_{0}")(7, 9) == "x_9_7"
+        assert NameTemplate("x_{1}_{0}_{1}").num_fields == 2
+
+    def test_validations(self):
+        with raises(ValueError):
+            NameTemplate("")
+        with raises(ValueError):
+            NameTemplate("x")
+        with raises(ValueError):
+            NameTemplate("x_{i:{width}}")
+        with raises(ValueError):
+            NameTemplate("x_{0}_{i}")
+        with raises(ValueError):
+            NameTemplate("x_{}_{1}")
@@ -1,5 +1,7 @@
+from array import array
 from math import inf
 
+import numpy as np
 from pytest import raises
 
 from pyorlib.enums import ParameterType, ValueType
@@ -263,3 +265,82 @@ class TestMultiValueParameter:
                 lower_bounds=(0.1, 2.956, 10, -1.5, 0, 7, 75.00001),
                 upper_bounds=(0.2, 2.958, 10, -1.7, 0, 7.5, 75),
             )
+
+    def test_creation_with_array_values(self):
+        size: int = 100_000
+
+        # Validates NumPy and array.array values
+        param_set1 = MultiValueParameter(
+            parameter_type=ParameterType.FIXED,
+            value_type=ValueType.INTEGER,
+            values=np.arange(size, dtype=np.float64),
+        )
+        param_set2 = MultiValueParameter(
+            parameter_type=ParameterType.BOUNDED,
+            value_type=ValueType.BINARY,
+            lower_bounds=array("d", [0] * size),
+            upper_bounds=array("d", [1] * size),
+        )
+
+        assert len(param_set1.values) == len(param_set2.lower_bounds) == size
+        assert param_set1.min_value == 0 and param_set1.max_value == size - 1
+        assert param_set2.min_value == 0 and param_set2.max_value == 1
+
+        # Validates vectorised checks on large arrays
+        with raises(ValueError):
+            MultiValueParameter(
+                parameter_type=ParameterType.FIXED,
+                value_type=ValueType.INTEGER,
+                values=np.append(np.arange(size, dtype=np.float64), 0.5),
+            )
+        with raises(ValueError):
+            MultiValueParameter(
+                parameter_type=ParameterType.FIXED,
+                value_type=ValueType.CONTINUOUS,
+                values=np.append(np.zeros(size), inf),
+            )
+        with raises(ValueError):
+            MultiValueParameter(
+                parameter_type=ParameterType.BOUNDED,
+                value_type=ValueType.BINARY,
+                lower_bounds=array("d", [1] * size),
+                upper_bounds=array("d", [0] * size),
+            )
+
+    def test_equality_with_array_values(self):
+        # Arrange
+        param_set1 = MultiValueParameter(
+            parameter_type=ParameterType.FIXED, value_type=ValueType.INTEGER, values=np.arange(600)
+        )
+        param_set2 = MultiValueParameter(
+            parameter_type=ParameterType.FIXED, value_type=ValueType.INTEGER, values=tuple(range(600))
+        )
+        param_set3 = MultiValueParameter(
+            parameter_type=ParameterType.FIXED, value_type=ValueType.INTEGER, values=np.arange(1, 601)
+        )
+
+        # Assert (parameters are compared and hashed by their values, whatever sequence holds them)
+        assert param_set1 == param_set2 and hash(param_set1) == hash(param_set2)
+        assert param_set1 != param_set3
+        assert len({param_set1, param_set2, param_set3}) == 2
+
+    def test_array_values_are_copied(self):
+        # Arrange
+        values = np.array([1, 2, 3])
+        read_only_values = np.array([1, 2, 3])
+        read_only_values.setflags(write=False)
+        param_set = MultiValueParameter(parameter_type=ParameterType.FIXED, value_type=ValueType.INTEGER, values=values)
+        read_only_param_set = MultiValueParameter(
+            parameter_type=ParameterType.FIXED, value_type=ValueType.INTEGER, values=read_only_values
+        )
+        param_hash = hash(param_set)
+
+        # Act
+        values[0], values[2] = -7, 99
+
+        # Assert (the parameter keeps a read-only copy, so its cached values cannot go stale)
+        assert param_set.min_value == 1 and param_set.max_value == 3 and hash(param_set) == param_hash
+        assert list(param_set.values) == [1, 2, 3] and not param_set.values.flags.writeable
+        assert read_only_param_set.values is read_only_values
+        with raises(ValueError):
+            param_set.values[0] = 5
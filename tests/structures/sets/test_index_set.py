@@ -0,0 +1,65 @@
+from pytest import raises
+
+from pyorlib.structures import IndexSet
+
+
+class TestIndexSet:
+
+    def test_sparse_creation(self):
+        arcs: IndexSet = IndexSet([(1, 2), (1, 3), (2, 3), (1, 2)])
+        assert arcs.arity == 2 and not arcs.is_dense and len(arcs) == 3
+        assert list(arcs) == [(1, 2), (1, 3), (2, 3)]
+        assert (1, 3) in arcs and (3, 1) not in arcs and (1,) not in arcs
+        assert list(arcs.column(1)) == [2, 3, 3]
+
+        assert len(IndexSet([], arity=2)) == 0
+        with raises(ValueError):
+            IndexSet([])
+        with raises(ValueError):
+            IndexSet([(1, 2), (3,)])
+        with raises(ValueError):
+            arcs.column(2)
+
+    def test_dense_creation(self):
+        grid: IndexSet = IndexSet.dense(range(1, 3), 3)
+        assert grid.arity == 2 and grid.is_dense and len(grid) == 6
+        assert list(grid) == [(1, 0), (1, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+        assert (2, 2) in grid and (0, 0) not in grid
+        assert list(grid.column(0)) == [1, 1, 1, 2, 2, 2]
+        assert list(grid.column(1)) == [0, 1, 2, 0, 1, 2]
+        with raises(ValueError):
+            IndexSet.dense()
+
+    def test_filter_and_where(self):
+        grid: IndexSet = IndexSet.dense(3, 3)
+        upper: IndexSet = grid.filter(lambda i, j: i < j)
+        assert list(upper) == [(0, 1), (0, 2), (1, 2)] and not upper.is_dense
+        assert list(upper.where(1, 2)) == [(0, 2), (1, 2)]
+        assert list(grid.where(0, [0, 2]).where(1, 1)) == [(0, 1), (2, 1)]
+
+    def test_project(self):
+        triples: IndexSet = IndexSet([(1, 1, 5), (1, 2, 5), (2, 1, 6)])
+        assert list(triples.project(0)) == [(1,), (2,)]
+        assert list(triples.project(2, 0)) == [(5, 1), (6, 2)]
+        assert IndexSet.dense(2, 3).project(1).is_dense
+        with raises(ValueError):
+            triples.project()
+
+    def test_join(self):
+        arcs: IndexSet = IndexSet([(1, 2), (2, 3), (2, 4), (3, 4)])
+        paths: IndexSet = arcs.join(arcs)
+        assert list(paths) == [(1, 2, 3), (1, 2, 4), (2, 3, 4)]
+
+        products: IndexSet = IndexSet([(10,), (20,)])
+        supply: IndexSet = IndexSet([(1, 10), (2, 20), (2, 10)])
+        assert list(supply.join(products, on=[(1, 0)])) == [(1, 10), (2, 20), (2, 10)]
+        assert len(products.join(IndexSet.dense(3), on=[])) == 6
+        with raises(ValueError):
+            arcs.join(products, on=[(2, 0)])
+
+    def test_group_by_and_select(self):
+        arcs: IndexSet = IndexSet([(1, 2), (1, 3), (2, 3)])
+        assert arcs.group_by(0) == {(1,): [(1, 2), (1, 3)], (2,): [(2, 3)]}
+        assert arcs.group_by(1, 0)[(3, 2)] == [(2, 3)]
+        costs = {(1, 2): 4, (1, 3): 7, (2, 3): 1}
+        assert list(arcs.select(costs)) == [4, 7, 1]
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+from ast import literal_eval
+
+IMPORT_TIME_BUDGET: float = 0.3
+""" The maximum number of seconds that a cold `import pyorlib` may take, about twice the time it took before the
+optional features were added, with compiled bytecode. """
+
+IMPORT_TIME_RUNS: int = 3
+""" The number of measured imports, of which the fastest one is checked, to absorb the noise of the machine. """
+
+LAZY_MODULES = [
+    "cplex",
+    "docplex",
+    "gurobipy",
+    "ortools",
+    "pulp",
+    "numpy",
+    "json",
+    "logging.handlers",
+    "pyorlib.cache",
+    "pyorlib.io",
+    "pyorlib.presolve",
+    "pyorlib.profiling",
+]
+""" The modules that must not be imported until they are used. """
+
+
+class TestImportTime:
+
+    def test_cold_import(self, tmp_path):
+        # Arrange
+        script = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import pyorlib\n"
+            "elapsed = time.perf_counter() - start\n"
+            f"print(repr([elapsed, [name for name in {LAZY_MODULES!r} if name in sys.modules]]))\n"
+        )
+        env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+        env["PYTHONPYCACHEPREFIX"] = str(tmp_path)
+
+        # Act
+        measurements = []
+        for _ in range(IMPORT_TIME_RUNS + 1):
+            output = subprocess.run(
+                [sys.executable, "-c", script], capture_output=True, check=True, text=True, env=env
+            ).stdout
+            measurements.append(literal_eval(output))
+
+        # Assert (the first import compiles the bytecode, so it is not measured)
+        elapsed = min(elapsed for elapsed, _ in measurements[1:])
+        assert all(imported_modules == [] for _, imported_modules in measurements)
+        assert elapsed < IMPORT_TIME_BUDGET
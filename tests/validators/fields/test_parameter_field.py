@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+import numpy as np
 from pytest import raises
 
 from pyorlib.enums import ParameterType, ValueType
@@ -309,3 +310,35 @@ class TestParameterField:
                 values=(6, 7, 10),
             )
         assert params.param6 == param6
+
+    def test_parameter_field_with_array_values(self):
+        @dataclass
+        class ParameterSchema:
+            param1: MultiValueParameter = ParameterField(
+                parameter_types={ParameterType.FIXED},
+                value_types={ValueType.CONTINUOUS},
+                min=0,
+                max=1,
+            )
+
+        param1 = MultiValueParameter(
+            parameter_type=ParameterType.FIXED,
+            value_type=ValueType.CONTINUOUS,
+            values=np.linspace(0, 1, 10_000),
+        )
+
+        # Validates that the extremes are computed once and cached on the parameter
+        assert "min_value" in param1.__dict__ and "max_value" in param1.__dict__
+
+        params = ParameterSchema(param1=param1)
+        params.param1 = param1
+        assert params.param1 is param1
+
+        # Validates the range of array values
+        with raises(ValueError):
+            params.param1 = MultiValueParameter(
+                parameter_type=ParameterType.FIXED,
+                value_type=ValueType.CONTINUOUS,
+                values=np.linspace(0, 1.5, 10_000),
+            )
+        assert params.param1 is param1
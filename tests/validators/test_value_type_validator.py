@@ -1,5 +1,8 @@
+from array import array
 from math import inf
 
+import numpy as np
+
 from pyorlib.validators import ValueTypeValidator
 
 
@@ -29,3 +32,18 @@ class TestValueTypeValidator:
         assert not ValueTypeValidator.is_integer(-0.1)
         assert not ValueTypeValidator.is_integer(1.1)
         assert not ValueTypeValidator.is_integer(None)
+
+    def test_sequence_value_type_validators(self):
+        # Validates both the Python fallback (short sequences) and the NumPy path (long sequences)
+        for size in [4, ValueTypeValidator._VECTORISE_THRESHOLD]:
+            binaries = array("d", [0, 1] * (size // 2))
+            integers = np.arange(size, dtype=np.float64)
+
+            assert ValueTypeValidator.are_binary(binaries)
+            assert not ValueTypeValidator.are_binary(tuple(integers))
+            assert ValueTypeValidator.are_integer(integers)
+            assert ValueTypeValidator.are_integer(tuple(integers[:-1]) + (inf,))
+            assert not ValueTypeValidator.are_integer(integers + 0.5)
+            assert ValueTypeValidator.extremes(integers) == (0, size - 1)
+            assert ValueTypeValidator.are_ordered(integers, integers + 1)
+            assert not ValueTypeValidator.are_ordered(integers + 1, integers)